@@ -0,0 +1,47 @@
+"""021: Add input_fingerprint + result_source_run_id to run_snapshots.
+
+Content-addressed run cache: identical engine inputs (model checksum,
+shocks, deflators, satellite coefficients, engine version) reuse the
+result sets of the original run instead of recomputing and rewriting
+them. Each reuse still creates its own run snapshot.
+
+Revision ID: 021_run_snapshot_input_fingerprint
+Revises: 020_chat_sessions_messages
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "021_run_snapshot_input_fingerprint"
+down_revision = "020_chat_sessions_messages"
+branch_labels = None
+depends_on = None
+
+FlexUUID = postgresql.UUID(as_uuid=True).with_variant(sa.String(36), "sqlite")
+
+
+def upgrade() -> None:
+    op.add_column(
+        "run_snapshots",
+        sa.Column("input_fingerprint", sa.String(80), nullable=True),
+    )
+    op.add_column(
+        "run_snapshots",
+        sa.Column("result_source_run_id", FlexUUID, nullable=True),
+    )
+    op.create_index(
+        "ix_run_snapshots_input_fingerprint",
+        "run_snapshots",
+        ["input_fingerprint"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_run_snapshots_input_fingerprint",
+        table_name="run_snapshots",
+    )
+    op.drop_column("run_snapshots", "result_source_run_id")
+    op.drop_column("run_snapshots", "input_fingerprint")
@@ -0,0 +1,54 @@
+"""022: Monte Carlo seed on run_snapshots + mc_* result_sets series kinds.
+
+Monte Carlo runs record their seed and draw count on the run snapshot so
+the sampled confidence bands are reproducible. Percentile summaries are
+stored as result_sets rows with series_kind 'mc_cumulative' (cumulative
+bands through the horizon year) or 'mc_annual' (per-year bands).
+
+Revision ID: 022_monte_carlo_series
+Revises: 021_run_snapshot_input_fingerprint
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "022_monte_carlo_series"
+down_revision = "021_run_snapshot_input_fingerprint"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "run_snapshots",
+        sa.Column("monte_carlo_seed", sa.BigInteger(), nullable=True),
+    )
+    op.add_column(
+        "run_snapshots",
+        sa.Column("monte_carlo_draws", sa.Integer(), nullable=True),
+    )
+
+    # Widen series_kind CHECK constraint — Postgres only
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute("ALTER TABLE result_sets DROP CONSTRAINT IF EXISTS chk_series_kind")
+        op.execute(
+            "ALTER TABLE result_sets ADD CONSTRAINT chk_series_kind "
+            "CHECK (series_kind IN ('annual', 'peak', 'delta', 'mc_cumulative', 'mc_annual') "
+            "OR series_kind IS NULL)"
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute("DELETE FROM result_sets WHERE series_kind IN ('mc_cumulative', 'mc_annual')")
+        op.execute("ALTER TABLE result_sets DROP CONSTRAINT IF EXISTS chk_series_kind")
+        op.execute(
+            "ALTER TABLE result_sets ADD CONSTRAINT chk_series_kind "
+            "CHECK (series_kind IN ('annual', 'peak', 'delta') OR series_kind IS NULL)"
+        )
+
+    op.drop_column("run_snapshots", "monte_carlo_draws")
+    op.drop_column("run_snapshots", "monte_carlo_seed")
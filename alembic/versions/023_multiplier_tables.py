@@ -0,0 +1,49 @@
+"""023: multiplier_tables — precomputed Type I/II multipliers per model.
+
+Multiplier tables are column reductions of the Leontief inverse combined
+with satellite coefficients. They are immutable for a given (model,
+coefficient hash, table version) and are served with a strong ETag.
+
+Revision ID: 023_multiplier_tables
+Revises: 022_monte_carlo_series
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "023_multiplier_tables"
+down_revision = "022_monte_carlo_series"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "multiplier_tables",
+        sa.Column("multiplier_table_id", sa.Uuid(), nullable=False),
+        sa.Column("model_version_id", sa.Uuid(), nullable=False),
+        sa.Column("model_checksum", sa.String(100), nullable=False),
+        sa.Column("coefficients_hash", sa.String(64), nullable=False),
+        sa.Column("table_version", sa.String(20), nullable=False),
+        sa.Column("content_hash", sa.String(64), nullable=False),
+        sa.Column(
+            "payload",
+            postgresql.JSONB(astext_type=sa.Text()).with_variant(sa.JSON(), "sqlite"),
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("multiplier_table_id"),
+        sa.ForeignKeyConstraint(
+            ["model_version_id"], ["model_versions.model_version_id"],
+        ),
+        sa.UniqueConstraint(
+            "model_version_id", "coefficients_hash", "table_version",
+            name="uq_multiplier_table_model_coefficients",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("multiplier_tables")
@@ -0,0 +1,35 @@
+"""024: Composite indexes for governance status and claim listing.
+
+Governance status counts assumptions per status for one workspace with a
+single GROUP BY, served by (workspace_id, status). Claim listing joins
+claims to run_snapshots on run_id and keyset-paginates by
+(created_at, claim_id), served by (run_id, created_at, claim_id).
+
+Revision ID: 024_governance_query_indexes
+Revises: 023_multiplier_tables
+"""
+
+from alembic import op
+
+revision = "024_governance_query_indexes"
+down_revision = "023_multiplier_tables"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_assumptions_workspace_status",
+        "assumptions",
+        ["workspace_id", "status"],
+    )
+    op.create_index(
+        "ix_claims_run_created",
+        "claims",
+        ["run_id", "created_at", "claim_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_claims_run_created", table_name="claims")
+    op.drop_index("ix_assumptions_workspace_status", table_name="assumptions")
@@ -0,0 +1,61 @@
+"""025: Chat session summary columns and keyset index for history windows.
+
+Chat turns load only the last N messages by (created_at, message_id)
+keyset; older turns are folded into chat_sessions.context_summary, with
+summary_through_at/summary_through_message_id marking the last folded
+message. The session index gains message_id so the window query is an
+index-only range scan with a deterministic tie-break.
+
+Revision ID: 025_chat_history_window
+Revises: 024_governance_query_indexes
+"""
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "025_chat_history_window"
+down_revision = "024_governance_query_indexes"
+branch_labels = None
+depends_on = None
+
+# Match ORM FlexJSON: JSONB on Postgres, JSON on SQLite
+FlexJSON = postgresql.JSONB(astext_type=sa.Text()).with_variant(sa.JSON(), "sqlite")
+
+
+def upgrade() -> None:
+    op.add_column(
+        "chat_sessions",
+        sa.Column("context_summary", sa.Text, nullable=True),
+    )
+    op.add_column(
+        "chat_sessions",
+        sa.Column("summary_through_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "chat_sessions",
+        sa.Column("summary_through_message_id", sa.Uuid, nullable=True),
+    )
+    op.add_column(
+        "chat_sessions",
+        sa.Column("summary_token_usage", FlexJSON, nullable=True),
+    )
+    op.drop_index("ix_chat_messages_session", table_name="chat_messages")
+    op.create_index(
+        "ix_chat_messages_session",
+        "chat_messages",
+        ["session_id", "created_at", "message_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_chat_messages_session", table_name="chat_messages")
+    op.create_index(
+        "ix_chat_messages_session",
+        "chat_messages",
+        ["session_id", "created_at"],
+    )
+    op.drop_column("chat_sessions", "summary_token_usage")
+    op.drop_column("chat_sessions", "summary_through_message_id")
+    op.drop_column("chat_sessions", "summary_through_at")
+    op.drop_column("chat_sessions", "context_summary")
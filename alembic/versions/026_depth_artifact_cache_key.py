@@ -0,0 +1,35 @@
+"""026: Depth artifact cache key for reusing unchanged step outputs.
+
+Each depth step artifact records a sha256 over (step, prompt pack version,
+classification, generation mode, workspace, step inputs). Re-running a
+plan whose scenario inputs are unchanged looks the key up and reuses the
+stored payload instead of re-running the step.
+
+Revision ID: 026_depth_artifact_cache_key
+Revises: 025_chat_history_window
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "026_depth_artifact_cache_key"
+down_revision = "025_chat_history_window"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "depth_artifacts",
+        sa.Column("cache_key", sa.String(64), nullable=True),
+    )
+    op.create_index(
+        "ix_depth_artifacts_cache_key",
+        "depth_artifacts",
+        ["cache_key"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_depth_artifacts_cache_key", table_name="depth_artifacts")
+    op.drop_column("depth_artifacts", "cache_key")
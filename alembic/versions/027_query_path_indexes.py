@@ -0,0 +1,37 @@
+"""027: Composite indexes for run result and run listing query paths.
+
+Every run view, feasibility solve, workforce compute, path analysis and
+portfolio optimization loads result sets by run_id (optionally filtered
+by series_kind), which had no index: served by
+(run_id, series_kind, year). Run listing filters by workspace and
+keyset-paginates by (created_at, run_id), served by
+(workspace_id, created_at, run_id).
+
+Revision ID: 027_query_path_indexes
+Revises: 026_depth_artifact_cache_key
+"""
+
+from alembic import op
+
+revision = "027_query_path_indexes"
+down_revision = "026_depth_artifact_cache_key"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_result_sets_run_series_year",
+        "result_sets",
+        ["run_id", "series_kind", "year"],
+    )
+    op.create_index(
+        "ix_run_snapshots_workspace_created",
+        "run_snapshots",
+        ["workspace_id", "created_at", "run_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_run_snapshots_workspace_created", table_name="run_snapshots")
+    op.drop_index("ix_result_sets_run_series_year", table_name="result_sets")
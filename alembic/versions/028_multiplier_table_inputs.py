@@ -0,0 +1,37 @@
+"""028: multiplier_tables.employment_row_id — cheap current-table lookup.
+
+A model's multiplier table depends on the (immutable) model data and the
+latest employment coefficients for that model. Recording which
+employment_coefficients row a table was built from lets unpinned reads
+find the current table without loading Z to recompute the coefficient
+hash.
+
+Revision ID: 028_multiplier_table_inputs
+Revises: 027_query_path_indexes
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "028_multiplier_table_inputs"
+down_revision = "027_query_path_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "multiplier_tables",
+        sa.Column("employment_row_id", sa.Integer(), nullable=True),
+    )
+    op.create_index(
+        "ix_multiplier_tables_model_inputs",
+        "multiplier_tables",
+        ["model_version_id", "table_version", "employment_row_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_multiplier_tables_model_inputs", table_name="multiplier_tables")
+    op.drop_column("multiplier_tables", "employment_row_id")
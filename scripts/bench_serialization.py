@@ -0,0 +1,177 @@
+"""Batch response serialization benchmark.
+
+Builds a synthetic batch result (default: 100 runs x 45 sectors, 6
+legacy metrics plus annual series) and compares the default FastAPI
+response path with the fast path used by the run/batch endpoints:
+
+- baseline: validated Pydantic construction, jsonable_encoder, json.dumps
+  (what returning a ``response_model`` object costs)
+- fast:     model_construct + orjson (src/api/fast_json.py)
+
+It also reports the bytes on the wire raw, gzip-compressed and, when
+``brotli`` is installed, brotli-compressed, as CompressionMiddleware
+would send them.
+
+Usage:
+    python -m scripts.bench_serialization
+    python -m scripts.bench_serialization --runs 200 --sectors 20 --years 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+from uuid import UUID
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+from src.api import compression
+from src.api.fast_json import dumps
+from src.api.runs import BatchResponse, ResultSetResponse, RunResponse, SnapshotResponse
+
+METRICS: tuple[str, ...] = (
+    "total_output", "direct_output", "indirect_output", "employment", "imports", "value_added",
+)
+_M = TypeVar("_M", bound=BaseModel)
+
+# Fixed, so both render paths (and repeated runs) encode the same document.
+BATCH_ID = UUID(int=1)
+
+
+@dataclass(frozen=True)
+class SerializationProfile:
+    """Median timings (seconds) and payload sizes (bytes) for one batch."""
+
+    baseline_seconds: float
+    fast_seconds: float
+    raw_bytes: int
+    gzip_bytes: int
+    brotli_bytes: int | None
+
+    @property
+    def speedup(self) -> float:
+        return self.baseline_seconds / self.fast_seconds if self.fast_seconds else 0.0
+
+
+def synthetic_runs(runs: int, sectors: int, years: int) -> list[dict[str, Any]]:
+    """Plain engine-style output: one dict per run, result set dicts inside."""
+    codes = [f"S{i:02d}" for i in range(sectors)]
+    ids = iter(range(2, 2**63))
+
+    def next_id() -> str:
+        return str(UUID(int=next(ids)))
+
+    out: list[dict[str, Any]] = []
+    for r in range(runs):
+        result_sets: list[dict[str, Any]] = []
+        for m, metric in enumerate(METRICS):
+            base = {code: (r + 1) * (m + 1) * (i + 0.123456) for i, code in enumerate(codes)}
+            result_sets.append({
+                "result_id": next_id(), "metric_type": metric, "values": base,
+                "year": None, "series_kind": None,
+            })
+            for y in range(years):
+                result_sets.append({
+                    "result_id": next_id(), "metric_type": metric,
+                    "values": {k: v * (1.01 ** y) for k, v in base.items()},
+                    "year": 2026 + y, "series_kind": "annual",
+                })
+        out.append({
+            "run_id": next_id(),
+            "model_version_id": next_id(),
+            "result_sets": result_sets,
+        })
+    return out
+
+
+def _build(runs: list[dict[str, Any]], *, construct: bool) -> BatchResponse:
+    def make(cls: type[_M], **kwargs: object) -> _M:
+        return cls.model_construct(None, **kwargs) if construct else cls(**kwargs)
+
+    return make(
+        BatchResponse,
+        batch_id=str(BATCH_ID),
+        status="COMPLETED",
+        results=[
+            make(
+                RunResponse,
+                run_id=run["run_id"],
+                result_sets=[make(ResultSetResponse, **rs) for rs in run["result_sets"]],
+                snapshot=make(
+                    SnapshotResponse,
+                    run_id=run["run_id"], model_version_id=run["model_version_id"],
+                ),
+            )
+            for run in runs
+        ],
+    )
+
+
+def baseline_render(runs: list[dict[str, Any]]) -> bytes:
+    """Validated models -> jsonable_encoder -> json.dumps (Starlette JSONResponse)."""
+    content = jsonable_encoder(_build(runs, construct=False))
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def fast_render(runs: list[dict[str, Any]]) -> bytes:
+    """model_construct -> orjson (FastJSONResponse)."""
+    return dumps(_build(runs, construct=True))
+
+
+def _median_seconds(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def measure(
+    *, runs: int = 100, sectors: int = 45, years: int = 10, repeat: int = 5,
+) -> SerializationProfile:
+    data = synthetic_runs(runs, sectors, years)
+    body = fast_render(data)
+    return SerializationProfile(
+        baseline_seconds=_median_seconds(lambda: baseline_render(data), repeat),
+        fast_seconds=_median_seconds(lambda: fast_render(data), repeat),
+        raw_bytes=len(body),
+        gzip_bytes=len(compression.compress(body, "gzip")),
+        brotli_bytes=(
+            len(compression.compress(body, "br"))
+            if compression.negotiate_encoding("br") == "br" else None
+        ),
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare batch response serialization paths.")
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--sectors", type=int, default=45)
+    parser.add_argument("--years", type=int, default=10, help="Annual series years per metric.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    profile = measure(runs=args.runs, sectors=args.sectors, years=args.years, repeat=args.repeat)
+    print(f"batch: {args.runs} runs x {args.sectors} sectors, {args.years} series years")
+    print(f"  baseline (validated + jsonable_encoder): {profile.baseline_seconds * 1000:8.1f} ms")
+    print(f"  fast     (model_construct + orjson):     {profile.fast_seconds * 1000:8.1f} ms")
+    print(f"  speedup: {profile.speedup:.1f}x")
+    print(f"  bytes raw:    {profile.raw_bytes:>12,}")
+    print(f"  bytes gzip:   {profile.gzip_bytes:>12,}")
+    if profile.brotli_bytes is not None:
+        print(f"  bytes brotli: {profile.brotli_bytes:>12,}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
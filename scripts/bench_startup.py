@@ -0,0 +1,133 @@
+"""Startup import benchmark.
+
+Imports each entry point in a fresh interpreter under
+``python -X importtime`` and reports the total import time, the slowest
+top-level packages and whether any deferred heavy dependency was loaded.
+
+Usage:
+    python -m scripts.bench_startup
+    python -m scripts.bench_startup --entry worker --top 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+ENTRY_POINTS: dict[str, str] = {
+    "api": "src.api.main",
+    "worker": "src.ingestion.tasks",
+}
+
+# Imported on first use only; none of these may load at startup.
+DEFERRED_MODULES: tuple[str, ...] = (
+    "anthropic",
+    "camelot",
+    "openai",
+    "openpyxl",
+    "pdfplumber",
+    "pptx",
+    "pytesseract",
+)
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    """Result of importing one entry point in a fresh interpreter."""
+
+    module: str
+    total_us: int
+    wall_seconds: float
+    loaded: frozenset[str]
+    slowest: list[tuple[str, int]] = field(default_factory=list)
+
+    @property
+    def deferred_loaded(self) -> list[str]:
+        return sorted(m for m in DEFERRED_MODULES if m in self.loaded)
+
+
+def parse_importtime(stderr: str) -> tuple[int, dict[str, int]]:
+    """Sum ``self`` times and collect cumulative time per top-level package."""
+    total = 0
+    cumulative: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, raw_name = line.removeprefix("import time:").split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # header row
+        total += int(self_us)
+        name = raw_name.strip()
+        if len(raw_name) - len(raw_name.lstrip()) == 1:  # not nested under another import
+            cumulative[name] = max(cumulative.get(name, 0), int(cumulative_us))
+    return total, cumulative
+
+
+def measure(module: str, *, top: int = 10) -> ImportProfile:
+    """Import ``module`` in a subprocess and profile it."""
+    code = f"import sys, json, {module}; print(json.dumps(sorted(sys.modules)))"
+    started = time.perf_counter()
+    # Fixed argv: our own interpreter and a module name chosen by the caller.
+    proc = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    wall = time.perf_counter() - started
+    if proc.returncode != 0:
+        msg = f"Importing {module} failed:\n{proc.stderr[-2000:]}"
+        raise RuntimeError(msg)
+
+    total, cumulative = parse_importtime(proc.stderr)
+    loaded = frozenset(name.split(".")[0] for name in json.loads(proc.stdout))
+    slowest = sorted(cumulative.items(), key=lambda kv: kv[1], reverse=True)[:top]
+    return ImportProfile(
+        module=module,
+        total_us=total,
+        wall_seconds=wall,
+        loaded=loaded,
+        slowest=slowest,
+    )
+
+
+def _print_profile(name: str, profile: ImportProfile) -> None:
+    print(f"{name} ({profile.module})")
+    print(f"  import total: {profile.total_us / 1000:8.1f} ms")
+    print(f"  wall time:    {profile.wall_seconds * 1000:8.1f} ms")
+    deferred = ", ".join(profile.deferred_loaded) or "none"
+    print(f"  deferred deps loaded: {deferred}")
+    for pkg, us in profile.slowest:
+        print(f"    {us / 1000:8.1f} ms  {pkg}")
+    print()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Report startup import cost.")
+    parser.add_argument(
+        "--entry",
+        choices=sorted(ENTRY_POINTS),
+        action="append",
+        help="Entry point to measure (repeatable; default: all).",
+    )
+    parser.add_argument("--top", type=int, default=10, help="Slowest packages to list.")
+    args = parser.parse_args()
+
+    failed = False
+    for name in args.entry or sorted(ENTRY_POINTS):
+        profile = measure(ENTRY_POINTS[name], top=args.top)
+        _print_profile(name, profile)
+        failed = failed or bool(profile.deferred_loaded)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
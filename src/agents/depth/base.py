@@ -4,6 +4,7 @@ Each step agent is stateless. It takes context + optional LLM client,
 returns a typed dict payload. No side effects.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 
 from src.agents.llm_client import LLMClient
@@ -18,6 +19,10 @@ class DepthStepAgent(ABC):
     1. Checks if LLM is available for the given classification
     2. If yes: builds prompt, calls LLM, parses structured output
     3. If no: returns deterministic fallback output
+
+    The orchestrator awaits `arun()`, which by default runs `run()` in a
+    worker thread so independent steps can execute concurrently. Agents
+    with a native async LLM path override `arun()` directly.
     """
 
     step_name: DepthStepName
@@ -42,6 +47,25 @@ class DepthStepAgent(ABC):
         """
         ...
 
+    async def arun(
+        self,
+        *,
+        context: dict,
+        llm_client: LLMClient | None = None,
+        classification: DataClassification = DataClassification.INTERNAL,
+    ) -> dict:
+        """Async entry point used by the orchestrator.
+
+        Same contract as `run()`; the default offloads the synchronous
+        implementation to a thread so it does not block the event loop.
+        """
+        return await asyncio.to_thread(
+            self.run,
+            context=context,
+            llm_client=llm_client,
+            classification=classification,
+        )
+
     def _can_use_llm(
         self,
         llm_client: LLMClient | None,
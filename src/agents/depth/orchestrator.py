@@ -1,11 +1,14 @@
-"""Depth Engine Orchestrator — sequential 5-step pipeline.
+"""Depth Engine Orchestrator — dependency-scheduled 5-step pipeline.
 
 The Al-Muhasabi structured reasoning methodology and framework are the
 intellectual property of Salim Al-Barami, licensed to Strategic Gears
 for use within ImpactOS. The software implementation, prompt engineering,
 and system integration are part of the ImpactOS platform.
 
-Runs all 5 Al-Muhasabi steps in order, persisting each artifact.
+Runs all 5 Al-Muhasabi steps in dependency waves, persisting each artifact.
+Steps whose inputs are independent run concurrently; each step's artifact
+is cached by a hash of its inputs so re-running an unchanged scenario
+reuses earlier payloads instead of regenerating them.
 Supports partial failure: if step N fails, steps 1..N-1 are preserved.
 
 Status semantics:
@@ -17,6 +20,7 @@ MVP-9 Amendment 9: Per-step metadata (StepMetadata) is captured for
 each step execution and stored on the DepthPlan for audit.
 """
 
+import asyncio
 import hashlib
 import json
 import logging
@@ -56,6 +60,22 @@ _STEP_NUMBER: dict[DepthStepName, int] = {
 }
 
 
+# Upstream steps whose output each step reads (mirrors the context keys
+# consumed by the step agents and their prompts). Steps whose dependencies
+# are all complete run concurrently in the same wave.
+_STEP_DEPENDENCIES: dict[DepthStepName, tuple[DepthStepName, ...]] = {
+    DepthStepName.KHAWATIR: (),
+    DepthStepName.MURAQABA: (DepthStepName.KHAWATIR,),
+    DepthStepName.MUJAHADA: (DepthStepName.KHAWATIR, DepthStepName.MURAQABA),
+    DepthStepName.MUHASABA: (DepthStepName.KHAWATIR, DepthStepName.MUJAHADA),
+    DepthStepName.SUITE_PLANNING: (
+        DepthStepName.KHAWATIR,
+        DepthStepName.MUJAHADA,
+        DepthStepName.MUHASABA,
+    ),
+}
+
+
 def _get_step_agent(step: DepthStepName) -> DepthStepAgent:
     """Get the agent for a given step."""
     agents: dict[DepthStepName, type[DepthStepAgent]] = {
@@ -74,13 +94,72 @@ def _compute_context_hash(context: dict) -> str:
     return hashlib.sha256(serialized.encode()).hexdigest()[:16]
 
 
+def _step_waves(steps: list[DepthStepName]) -> list[list[DepthStepName]]:
+    """Group steps into waves whose dependencies are all in earlier waves.
+
+    Order within a wave follows ``steps`` so persistence stays stable.
+    """
+    waves: list[list[DepthStepName]] = []
+    done: set[DepthStepName] = set()
+    remaining = list(steps)
+    while remaining:
+        wave = [
+            s for s in remaining
+            if all(d in done or d not in steps for d in _STEP_DEPENDENCIES[s])
+        ]
+        if not wave:
+            raise ValueError("Cyclic depth step dependencies")
+        waves.append(wave)
+        done.update(wave)
+        remaining = [s for s in remaining if s not in done]
+    return waves
+
+
+def _step_cache_key(
+    step: DepthStepName,
+    *,
+    base_context: dict,
+    upstream: dict[DepthStepName, dict],
+    prompt_pack_version: str,
+    classification: DataClassification,
+    generation_mode: str,
+    provider: str,
+    model: str,
+) -> str:
+    """Full sha256 over everything that determines a step's output.
+
+    Covers the scenario context (including workspace_id), the provider
+    and model that would generate it, plus only the upstream payloads the
+    step actually reads, so an unchanged scenario maps every step to the
+    same key across plans.
+    """
+    serialized = json.dumps(
+        {
+            "step": step.value,
+            "prompt_pack_version": prompt_pack_version,
+            "classification": classification.value,
+            "generation_mode": generation_mode,
+            "provider": provider,
+            "model": model,
+            "context": base_context,
+            "upstream": {
+                d.value: upstream.get(d) for d in _STEP_DEPENDENCIES[step]
+            },
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
 class DepthOrchestrator:
-    """Sequential 5-step pipeline with persistence and partial failure handling.
+    """5-step pipeline with persistence and partial failure handling.
 
     MVP-9 enhancements:
     - Captures StepMetadata per step (provider, tokens, duration)
     - Tracks prompt_pack_version for reproducibility
     - Returns enriched step_metadata list alongside status
+    - Reuses cached step artifacts keyed by step input hash
     """
 
     STEPS = [
@@ -103,148 +182,226 @@ class DepthOrchestrator:
         artifact_repo: DepthArtifactRepository,
         prompt_pack_version: str = PROMPT_PACK_VERSION,
         environment: str = "dev",
+        use_cache: bool = True,
     ) -> DepthPlanStatus:
         """Execute the full 5-step depth engine pipeline.
 
-        Each step:
+        Steps are scheduled in waves (see ``_STEP_DEPENDENCIES``); every
+        step in a wave runs concurrently. For each step:
         1. Update plan status -> RUNNING, current_step
-        2. Run step agent (LLM or fallback)
-        3. Capture per-step metadata (Amendment 9)
-        4. Persist artifact with metadata
-        5. Feed output into accumulated context for next step
+        2. Look up a cached artifact by input cache key (if ``use_cache``)
+        3. On miss: run step agent (LLM or fallback)
+        4. Capture per-step metadata (Amendment 9) incl. cache_hit
+        5. Persist artifact with metadata and cache key
+        6. Feed output into accumulated context for downstream steps
 
         On failure: log error, record degraded_step, continue.
         Final status: COMPLETED if suite plan exists, PARTIAL otherwise.
         """
         degraded_steps: list[str] = []
         step_errors: dict[str, str] = {}
-        step_metadata_list: list[dict] = []
-        accumulated_context = dict(context)
-        accumulated_context["workspace_id"] = str(workspace_id)
+        step_metadata: dict[DepthStepName, dict] = {}
+        runs: dict[DepthStepName, dict] = {}
+        outputs: dict[DepthStepName, dict] = {}
+        base_context = dict(context)
+        base_context["workspace_id"] = str(workspace_id)
+        accumulated_context = dict(base_context)
         has_suite_plan = False
         fail_closed = False
 
+        can_use_llm = (
+            llm_client is not None
+            and llm_client.is_available_for(classification)
+        )
+        generation_mode = "LLM" if can_use_llm else "FALLBACK"
+
+        # Determine provider/model info (both feed the step cache key)
+        provider = "none"
+        model = "fallback"
+        if can_use_llm and llm_client is not None:
+            selected, model = llm_client.route_for(classification)
+            provider = selected.value
+
         # Mark plan as RUNNING
         await plan_repo.update_status(
             plan_id, DepthPlanStatus.RUNNING.value,
             current_step=self.STEPS[0].value,
         )
 
-        for step in self.STEPS:
-            try:
-                # Update current step
-                await plan_repo.update_status(
-                    plan_id, DepthPlanStatus.RUNNING.value,
-                    current_step=step.value,
+        for wave in _step_waves(self.STEPS):
+            # I17-2: Fail closed in non-dev if step uses fallback
+            if generation_mode == "FALLBACK" and environment in ("staging", "prod"):
+                step = wave[0]
+                reason = (
+                    f"DEPTH_STEP_NO_LLM_BACKING: {step.value} would use "
+                    f"deterministic fallback in {environment}"
                 )
-
-                agent = _get_step_agent(step)
-                can_use_llm = (
-                    llm_client is not None
-                    and llm_client.is_available_for(classification)
+                logger.error(
+                    "Depth plan %s: step %s fail-closed in %s — %s",
+                    plan_id, step.value, environment, reason,
                 )
-                generation_mode = "LLM" if can_use_llm else "FALLBACK"
+                degraded_steps.append(step.value)
+                step_errors[step.value] = reason
+                fail_closed = True
+                break
 
-                # I17-2: Fail closed in non-dev if step uses fallback
-                if generation_mode == "FALLBACK" and environment in ("staging", "prod"):
-                    reason = (
-                        f"DEPTH_STEP_NO_LLM_BACKING: {step.value} would use "
-                        f"deterministic fallback in {environment}"
-                    )
-                    logger.error(
-                        "Depth plan %s: step %s fail-closed in %s — %s",
-                        plan_id, step.value, environment, reason,
-                    )
-                    degraded_steps.append(step.value)
-                    step_errors[step.value] = reason
-                    fail_closed = True
-                    break
-
-                # Determine provider/model info
-                provider = "none"
-                model = "fallback"
-                if can_use_llm and llm_client is not None:
-                    try:
-                        selected = llm_client._router.select_provider(classification)
-                        provider = selected.value if selected else "none"
-                        model = "default"
-                    except Exception:
-                        provider = "none"
-                        model = "fallback"
+            await plan_repo.update_status(
+                plan_id, DepthPlanStatus.RUNNING.value,
+                current_step=wave[0].value,
+            )
 
-                # Run the step with timing (Amendment 9)
-                start_time = time.monotonic()
-                payload = agent.run(
-                    context=accumulated_context,
-                    llm_client=llm_client,
+            # Resolve cache hits first; only misses are executed.
+            cache_keys: dict[DepthStepName, str] = {}
+            pending: list[DepthStepName] = []
+            for step in wave:
+                cache_keys[step] = _step_cache_key(
+                    step,
+                    base_context=base_context,
+                    upstream=outputs,
+                    prompt_pack_version=prompt_pack_version,
                     classification=classification,
+                    generation_mode=generation_mode,
+                    provider=provider,
+                    model=model,
                 )
+                start_time = time.monotonic()
+                cached = None
+                if use_cache:
+                    try:
+                        cached = await artifact_repo.get_by_cache_key(cache_keys[step])
+                    except Exception:
+                        logger.warning(
+                            "Depth plan %s: cache lookup failed for %s",
+                            plan_id, step.value, exc_info=True,
+                        )
+                if cached is None:
+                    pending.append(step)
+                    continue
                 duration_ms = int((time.monotonic() - start_time) * 1000)
+                outputs[step] = dict(cached.payload)
+                runs[step] = {
+                    "payload": outputs[step],
+                    "duration_ms": duration_ms,
+                    "cache_hit": True,
+                    "input_tokens": 0,
+                    "output_tokens": 0,
+                }
 
-                if not can_use_llm:
+            # Run cache misses concurrently. Each agent sees the same
+            # snapshot of upstream outputs; DB writes stay serialized on
+            # the shared session below.
+            usage_before = (
+                llm_client.cumulative_usage()
+                if can_use_llm and llm_client is not None else None
+            )
+            results = await asyncio.gather(
+                *(
+                    self._run_step(
+                        step,
+                        context=dict(accumulated_context),
+                        llm_client=llm_client,
+                        classification=classification,
+                    )
+                    for step in pending
+                ),
+                return_exceptions=True,
+            )
+            input_tokens = 0
+            output_tokens = 0
+            if usage_before is not None and llm_client is not None:
+                # Token usage is only attributable per wave; single-step
+                # waves (the current pipeline) get exact per-step counts.
+                usage_after = llm_client.cumulative_usage()
+                input_tokens = usage_after.input_tokens - usage_before.input_tokens
+                output_tokens = usage_after.output_tokens - usage_before.output_tokens
+
+            for step, result in zip(pending, results, strict=True):
+                if isinstance(result, BaseException):
+                    logger.error(
+                        "Depth plan %s: step %s failed: %s",
+                        plan_id, step.value, result,
+                        exc_info=(type(result), result, result.__traceback__),
+                    )
                     degraded_steps.append(step.value)
-
-                # Capture token usage from LLM client if available
-                input_tokens = 0
-                output_tokens = 0
-                if can_use_llm and llm_client is not None:
-                    usage = llm_client.cumulative_usage()
-                    input_tokens = usage.input_tokens
-                    output_tokens = usage.output_tokens
-
-                # Build per-step metadata (Amendment 9)
-                step_meta = StepMetadata(
-                    step=_STEP_NUMBER[step],
-                    step_name=step,
-                    prompt_pack_version=prompt_pack_version,
-                    provider=provider,
-                    model=model,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    duration_ms=duration_ms,
-                    generation_mode=generation_mode,
-                )
-                step_metadata_list.append(step_meta.model_dump(mode="json"))
-
-                # Build audit metadata (enriched with Amendment 9 fields)
-                metadata = {
-                    "generation_mode": generation_mode,
-                    "context_hash": _compute_context_hash(accumulated_context),
-                    "classification": classification.value,
-                    "prompt_pack_version": prompt_pack_version,
+                    step_errors[step.value] = str(result)
+                    continue
+                payload, duration_ms = result
+                outputs[step] = payload
+                runs[step] = {
+                    "payload": payload,
                     "duration_ms": duration_ms,
-                    "provider": provider,
-                    "model": model,
+                    "cache_hit": False,
+                    "input_tokens": input_tokens,
+                    "output_tokens": output_tokens,
                 }
 
-                # Persist artifact
-                await artifact_repo.create(
-                    artifact_id=new_uuid7(),
-                    plan_id=plan_id,
-                    step=step.value,
-                    payload=payload,
-                    disclosure_tier=_STEP_DISCLOSURE[step].value,
-                    metadata_json=metadata,
-                )
+            # Persist in pipeline order and feed downstream context.
+            for step in wave:
+                run_info = runs.get(step)
+                if run_info is None:
+                    continue
+                try:
+                    step_meta = StepMetadata(
+                        step=_STEP_NUMBER[step],
+                        step_name=step,
+                        prompt_pack_version=prompt_pack_version,
+                        provider=provider,
+                        model=model,
+                        input_tokens=run_info["input_tokens"],
+                        output_tokens=run_info["output_tokens"],
+                        duration_ms=run_info["duration_ms"],
+                        generation_mode=generation_mode,
+                        cache_hit=run_info["cache_hit"],
+                        cache_key=cache_keys[step],
+                    )
+                    step_metadata[step] = step_meta.model_dump(mode="json")
+
+                    # Build audit metadata (enriched with Amendment 9 fields)
+                    metadata = {
+                        "generation_mode": generation_mode,
+                        "context_hash": _compute_context_hash(accumulated_context),
+                        "classification": classification.value,
+                        "prompt_pack_version": prompt_pack_version,
+                        "duration_ms": run_info["duration_ms"],
+                        "provider": provider,
+                        "model": model,
+                        "cache_hit": run_info["cache_hit"],
+                    }
+
+                    await artifact_repo.create(
+                        artifact_id=new_uuid7(),
+                        plan_id=plan_id,
+                        step=step.value,
+                        payload=run_info["payload"],
+                        disclosure_tier=_STEP_DISCLOSURE[step].value,
+                        metadata_json=metadata,
+                        cache_key=cache_keys[step],
+                    )
+                except Exception as exc:
+                    logger.exception(
+                        "Depth plan %s: step %s failed: %s",
+                        plan_id, step.value, exc,
+                    )
+                    step_metadata.pop(step, None)
+                    outputs.pop(step, None)
+                    degraded_steps.append(step.value)
+                    step_errors[step.value] = str(exc)
+                    continue
+
+                if not can_use_llm:
+                    degraded_steps.append(step.value)
 
-                # Feed output into accumulated context for next step
-                self._merge_step_output(accumulated_context, step, payload)
+                self._merge_step_output(accumulated_context, step, outputs[step])
 
                 if step == DepthStepName.SUITE_PLANNING:
                     has_suite_plan = True
 
                 logger.info(
-                    "Depth plan %s: step %s completed (%s, %dms)",
-                    plan_id, step.value, generation_mode, duration_ms,
-                )
-
-            except Exception as exc:
-                logger.exception(
-                    "Depth plan %s: step %s failed: %s",
-                    plan_id, step.value, exc,
+                    "Depth plan %s: step %s completed (%s, %dms%s)",
+                    plan_id, step.value, generation_mode,
+                    run_info["duration_ms"],
+                    ", cached" if run_info["cache_hit"] else "",
                 )
-                degraded_steps.append(step.value)
-                step_errors[step.value] = str(exc)
 
         # Determine final status
         if fail_closed:
@@ -270,11 +427,31 @@ class DepthOrchestrator:
             error_message=error_msg,
             degraded_steps=degraded_steps,
             step_errors=step_errors,
-            step_metadata=step_metadata_list,
+            step_metadata=[
+                step_metadata[step] for step in self.STEPS if step in step_metadata
+            ],
         )
 
         return final_status
 
+    async def _run_step(
+        self,
+        step: DepthStepName,
+        *,
+        context: dict,
+        llm_client: LLMClient | None,
+        classification: DataClassification,
+    ) -> tuple[dict, int]:
+        """Run one step agent, returning (payload, duration_ms)."""
+        agent = _get_step_agent(step)
+        start_time = time.monotonic()
+        payload = await agent.arun(
+            context=context,
+            llm_client=llm_client,
+            classification=classification,
+        )
+        return payload, int((time.monotonic() - start_time) * 1000)
+
     def _merge_step_output(
         self,
         context: dict,
@@ -11,10 +11,16 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from typing import Any
 
-from src.agents.llm_client import LLMClient, LLMRequest, ProviderUnavailableError
+from src.agents.llm_client import (
+    LLMClient,
+    LLMRequest,
+    LLMResponse,
+    ProviderUnavailableError,
+)
 from src.models.common import DataClassification
 from src.agents.prompts.economist_copilot_v1 import (
     COPILOT_PROMPT_VERSION,
@@ -28,6 +34,9 @@ _logger = logging.getLogger(__name__)
 # Tools that require user confirmation before execution
 _GATED_TOOLS = frozenset({"build_scenario", "run_engine"})
 
+# Upper bound on a running conversation summary (characters)
+_SUMMARY_MAX_CHARS = 4000
+
 # Valid tool names
 _VALID_TOOLS = frozenset({"lookup_data", "build_scenario", "run_engine", "narrate_results", "create_export"})
 
@@ -66,6 +75,14 @@ class CopilotResponse:
     token_usage: TokenUsage = field(default_factory=TokenUsage)
 
 
+@dataclass
+class CopilotStreamChunk:
+    """Streamed copilot output: a text delta, or the final parsed response."""
+
+    delta: str = ""
+    response: CopilotResponse | None = None
+
+
 def parse_tool_calls(content: str) -> list[dict]:
     """Extract tool call JSON objects from LLM response content.
 
@@ -198,14 +215,49 @@ class EconomistCopilot:
             ProviderUnavailableError: If no LLM provider is available.
         """
         ctx = context or {}
+        request = self._build_turn_request(messages, user_message, ctx)
+        response = await self._llm.call_unstructured(
+            request,
+            classification=ctx.get("classification", DataClassification.INTERNAL),
+        )
+        return self._finalize_turn(response, ctx)
+
+    async def stream_turn(
+        self,
+        messages: list[dict[str, str]],
+        user_message: str,
+        context: dict[str, Any] | None = None,
+    ) -> AsyncIterator[CopilotStreamChunk]:
+        """Streaming variant of process_turn.
+
+        Yields text deltas as the LLM produces them, then one chunk whose
+        ``response`` is the CopilotResponse process_turn would return.
+        Tool calls and the confirmation gate are evaluated on the full
+        content, so they only appear in the final chunk.
+        """
+        ctx = context or {}
+        request = self._build_turn_request(messages, user_message, ctx)
+        async for chunk in self._llm.stream_unstructured(
+            request,
+            classification=ctx.get("classification", DataClassification.INTERNAL),
+        ):
+            if chunk.response is not None:
+                yield CopilotStreamChunk(response=self._finalize_turn(chunk.response, ctx))
+            elif chunk.delta:
+                yield CopilotStreamChunk(delta=chunk.delta)
+
+    def _build_turn_request(
+        self,
+        messages: list[dict[str, str]],
+        user_message: str,
+        ctx: dict[str, Any],
+    ) -> LLMRequest:
         system_prompt = build_system_prompt(ctx)
 
         # Build full conversation history for LLM
         llm_messages = list(messages) + [{"role": "user", "content": user_message}]
 
-        classification = ctx.get("classification", DataClassification.INTERNAL)
-
-        request = LLMRequest(
+        return LLMRequest(
             system_prompt=system_prompt,
             user_prompt=user_message,
             messages=llm_messages,
@@ -213,10 +265,8 @@ class EconomistCopilot:
             model=ctx.get("model", ""),
         )
 
-        response = await self._llm.call_unstructured(
-            request, classification=classification,
-        )
-
+    def _finalize_turn(self, response: LLMResponse, ctx: dict[str, Any]) -> CopilotResponse:
+        """Parse tool calls and apply the confirmation gate to a full response."""
         # Extract content and usage from normalized LLMResponse
         content = response.content
         usage = TokenUsage(
@@ -308,3 +358,88 @@ class EconomistCopilot:
             _logger.warning("Narrative enrichment failed, using baseline", exc_info=True)
             return baseline
 
+    async def summarize_history(
+        self,
+        previous_summary: str | None,
+        messages: list[dict[str, str]],
+    ) -> tuple[str, TokenUsage]:
+        """Fold older turns into the running conversation summary.
+
+        Only the turns that just left the history window are sent, along
+        with the previous summary, so the cost per call stays flat as the
+        session grows. On LLM failure, falls back to a deterministic
+        compaction (zero token usage) so context is never silently lost.
+        """
+        if not messages:
+            return previous_summary or "", TokenUsage()
+
+        transcript = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+        summary_prompt = (
+            "Update the running summary of an economist's conversation with an "
+            "impact-analysis assistant. Keep scenario names, sectors, shock "
+            "magnitudes, confirmed decisions, run/scenario IDs and open questions. "
+            "Do NOT invent numbers. Reply with the updated summary only, "
+            "at most 200 words.\n\n"
+            f"Current summary:\n{previous_summary or '(none)'}\n\n"
+            f"New turns:\n{transcript}"
+        )
+
+        try:
+            request = LLMRequest(
+                system_prompt="You maintain concise conversation summaries for Strategic Gears.",
+                user_prompt=summary_prompt,
+                max_tokens=512,
+            )
+            response = await self._llm.call_unstructured(request)
+            summary = response.content.strip()
+            if summary:
+                # The prompt asks for <= 200 words; this only guards a runaway
+                # reply, and keeps its opening (the oldest context) intact.
+                return _clip(summary, _SUMMARY_MAX_CHARS), TokenUsage(
+                    input_tokens=response.usage.input_tokens,
+                    output_tokens=response.usage.output_tokens,
+                )
+        except Exception:
+            _logger.warning("History summarization failed, compacting", exc_info=True)
+        return compact_history(previous_summary, messages), TokenUsage()
+
+
+def _clip(text: str, limit: int) -> str:
+    """Cut text to at most limit characters at a word boundary, marking the cut."""
+    if len(text) <= limit:
+        return text
+    head = text[: limit - 1]
+    if " " in head:
+        head = head.rsplit(" ", 1)[0]
+    return head.rstrip() + "…"
+
+
+def compact_history(
+    previous_summary: str | None,
+    messages: list[dict[str, str]],
+) -> str:
+    """Deterministic summary fallback: truncated turns appended to the summary.
+
+    Bounded by _SUMMARY_MAX_CHARS. The previous summary (the oldest
+    context, already condensed) keeps up to half of the budget; the new
+    turns fill the rest, newest first, and any turns that do not fit are
+    replaced by an explicit "earlier turns omitted" line.
+    """
+    head = _clip(previous_summary, _SUMMARY_MAX_CHARS // 2) if previous_summary else ""
+    turn_lines = [
+        f"- {m['role']}: {' '.join(m['content'].split())[:200]}" for m in messages
+    ]
+    marker_room = 40
+    budget = _SUMMARY_MAX_CHARS - len(head) - 1 - marker_room
+    kept: list[str] = []
+    for line in reversed(turn_lines):
+        budget -= len(line) + 1
+        if budget < 0:
+            break
+        kept.append(line)
+    lines = [head] if head else []
+    omitted = len(turn_lines) - len(kept)
+    if omitted:
+        lines.append(f"- ({omitted} earlier turns omitted)")
+    lines.extend(reversed(kept))
+    return "\n".join(lines)
@@ -7,6 +7,8 @@ Unified interface for Anthropic/OpenAI/OpenRouter with:
 - Structured JSON output with Pydantic validation
 - Retry with exponential backoff
 - Token usage tracking and provider observability
+- Token-delta streaming for free-form calls (LOCAL streams scripted
+  replies so streaming paths are testable offline)
 
 Agents use this client — they NEVER compute economic results.
 """
@@ -16,6 +18,7 @@ import json
 import logging
 import re
 import time
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
 from enum import StrEnum
 from typing import Any, TypeVar
@@ -23,6 +26,7 @@ from typing import Any, TypeVar
 from pydantic import BaseModel
 
 from src.models.common import DataClassification
+from src.observability.instrumentation import LLM_CALL_SECONDS, LLM_TOKENS_TOTAL
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -125,6 +129,22 @@ class LLMResponse:
     usage: TokenUsage
 
 
+@dataclass
+class LLMStreamChunk:
+    """One streamed piece of a free-form response.
+
+    Text chunks carry ``delta``; the last chunk carries the complete
+    ``response`` (full content, model and token usage).
+    """
+
+    delta: str = ""
+    response: LLMResponse | None = None
+
+
+# Word-sized pieces (trailing whitespace attached) for LOCAL streaming
+_LOCAL_DELTA_RE = re.compile(r"\S+\s*|\s+")
+
+
 # ---------------------------------------------------------------------------
 # Provider routing
 # ---------------------------------------------------------------------------
@@ -187,6 +207,7 @@ class LLMClient:
         model_openai: str = "gpt-4o",
         model_openrouter: str = "anthropic/claude-sonnet-4-20250514",
         routing_table: dict[DataClassification, LLMProvider] | None = None,
+        local_responses: Sequence[str] | None = None,
     ) -> None:
         self._anthropic_key = anthropic_key
         self._openai_key = openai_key
@@ -199,6 +220,10 @@ class LLMClient:
         self._model_openrouter = model_openrouter
         self._router = ProviderRouter(routing_table=routing_table)
         self._usage_log: list[TokenUsage] = []
+        # Scripted free-form LOCAL replies (fake provider for offline tests);
+        # the last reply repeats once the script runs out
+        self._local_responses = list(local_responses or [])
+        self._local_index = 0
 
     # ----- Structured output parsing -----
 
@@ -235,6 +260,20 @@ class LLMClient:
         needed = self._router.select(classification)
         return needed in self.available_providers()
 
+    def route_for(self, classification: DataClassification) -> tuple[LLMProvider, str]:
+        """Return the provider and default model a call would be routed to.
+
+        Raises ProviderUnavailableError if the routed provider has no API key.
+        """
+        provider = self._select_provider(classification)
+        models: dict[LLMProvider, str] = {
+            LLMProvider.ANTHROPIC: self._model_anthropic,
+            LLMProvider.OPENAI: self._model_openai,
+            LLMProvider.OPENROUTER: self._model_openrouter,
+            LLMProvider.LOCAL: "local-deterministic",
+        }
+        return provider, models[provider]
+
     # ----- Retry / backoff -----
 
     def compute_backoff_delays(self) -> list[float]:
@@ -275,15 +314,12 @@ class LLMClient:
             ProviderUnavailableError: When the required provider is not
                 available or all retries are exhausted.
         """
-        provider = self._router.select(classification)
-
-        # Hard guard: RESTRICTED must NEVER reach external providers
-        if classification == DataClassification.RESTRICTED:
-            provider = LLMProvider.LOCAL
+        provider = self._select_provider(classification)
 
         # LOCAL path — deterministic, always available, no network
         if provider == LLMProvider.LOCAL:
             response = self._call_local(request)
+            _record_token_metrics(provider, response)
             _logger.info(
                 "LLM call complete: classification=%s provider=%s model=%s "
                 "input_tokens=%d output_tokens=%d latency_ms=0",
@@ -292,18 +328,21 @@ class LLMClient:
             )
             return response
 
-        # Availability check before attempting external call
-        if provider not in self.available_providers():
-            raise ProviderUnavailableError(
-                f"Provider {provider} required for classification "
-                f"{classification} but no API key configured"
-            )
-
         t0 = time.monotonic()
-        response = await self._call_external_with_retry(
-            request, provider=provider,
-        )
+        try:
+            response = await self._call_external_with_retry(
+                request, provider=provider,
+            )
+        except Exception:
+            LLM_CALL_SECONDS.observe(
+                time.monotonic() - t0, provider=provider.value, outcome="error",
+            )
+            raise
         latency_ms = (time.monotonic() - t0) * 1000
+        LLM_CALL_SECONDS.observe(
+            latency_ms / 1000, provider=provider.value, outcome="ok",
+        )
+        _record_token_metrics(provider, response)
 
         _logger.info(
             "LLM call complete: classification=%s provider=%s model=%s "
@@ -327,18 +366,101 @@ class LLMClient:
         without Pydantic validation.  All other request parameters
         (messages, temperature, max_tokens, etc.) are preserved.
         """
-        unstructured_request = LLMRequest(
-            system_prompt=request.system_prompt,
-            user_prompt=request.user_prompt,
-            messages=request.messages,
-            output_schema=None,
-            max_tokens=request.max_tokens,
-            temperature=request.temperature,
-            structured=False,
-            model=request.model,
-        )
         cls = classification if classification is not None else DataClassification.INTERNAL
-        return await self.call(unstructured_request, classification=cls)
+        return await self.call(_as_unstructured(request), classification=cls)
+
+    async def stream_unstructured(
+        self,
+        request: LLMRequest,
+        *,
+        classification: DataClassification | None = None,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Stream a free-form response as text deltas.
+
+        Same routing and RESTRICTED guard as ``call``. Yields chunks with
+        ``delta`` text, then one final chunk with the complete
+        LLMResponse. Connection failures before the first delta are
+        retried with backoff; a failure mid-stream raises
+        ProviderUnavailableError (partial output cannot be replayed).
+        """
+        cls = classification if classification is not None else DataClassification.INTERNAL
+        unstructured_request = _as_unstructured(request)
+        provider = self._select_provider(cls)
+
+        if provider == LLMProvider.LOCAL:
+            response = self._call_local(unstructured_request)
+            for piece in _LOCAL_DELTA_RE.findall(response.content):
+                yield LLMStreamChunk(delta=piece)
+            yield LLMStreamChunk(response=response)
+            return
+
+        dispatch: dict[LLMProvider, Any] = {
+            LLMProvider.ANTHROPIC: self._stream_anthropic,
+            LLMProvider.OPENAI: self._stream_openai,
+            LLMProvider.OPENROUTER: self._stream_openrouter,
+        }
+        stream_fn = dispatch[provider]
+        delays = self.compute_backoff_delays()
+
+        t0 = time.monotonic()
+        last_error: Exception | None = None
+        for attempt in range(self.max_retries):
+            started = False
+            try:
+                async for chunk in stream_fn(unstructured_request):
+                    started = True
+                    if chunk.response is not None:
+                        self.record_usage(chunk.response.usage)
+                        LLM_CALL_SECONDS.observe(
+                            time.monotonic() - t0, provider=provider.value, outcome="ok",
+                        )
+                        _record_token_metrics(provider, chunk.response)
+                        _logger.info(
+                            "LLM stream complete: classification=%s provider=%s model=%s "
+                            "input_tokens=%d output_tokens=%d latency_ms=%.1f",
+                            cls, provider, chunk.response.model,
+                            chunk.response.usage.input_tokens,
+                            chunk.response.usage.output_tokens,
+                            (time.monotonic() - t0) * 1000,
+                        )
+                    yield chunk
+                return
+            except Exception as exc:
+                if started:
+                    raise ProviderUnavailableError(
+                        f"Stream from {provider} failed mid-response: {exc}"
+                    ) from exc
+                last_error = exc
+                _logger.warning(
+                    "Provider %s stream attempt %d/%d failed: %s",
+                    provider, attempt + 1, self.max_retries, exc,
+                )
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(delays[attempt])
+
+        LLM_CALL_SECONDS.observe(
+            time.monotonic() - t0, provider=provider.value, outcome="error",
+        )
+        raise ProviderUnavailableError(
+            f"All {self.max_retries} retries exhausted for {provider}: "
+            f"{last_error}"
+        )
+
+    def _select_provider(self, classification: DataClassification) -> LLMProvider:
+        """Route by classification, enforcing the RESTRICTED guard and key checks."""
+        provider = self._router.select(classification)
+
+        # Hard guard: RESTRICTED must NEVER reach external providers
+        if classification == DataClassification.RESTRICTED:
+            return LLMProvider.LOCAL
+
+        # Availability check before attempting external call
+        if provider != LLMProvider.LOCAL and provider not in self.available_providers():
+            raise ProviderUnavailableError(
+                f"Provider {provider} required for classification "
+                f"{classification} but no API key configured"
+            )
+        return provider
 
     async def _call_external_with_retry(
         self,
@@ -386,16 +508,34 @@ class LLMClient:
         workspaces and as dev/test fallback.
 
         When ``output_schema`` is *None* (unstructured mode) a simple
-        placeholder string is returned instead of schema-derived defaults.
+        placeholder string is returned instead of schema-derived defaults,
+        or the next scripted reply when ``local_responses`` was given
+        (usage counted in words).
         """
         schema = request.output_schema
         if schema is None or not request.structured:
+            if not self._local_responses:
+                return LLMResponse(
+                    content="",
+                    parsed=None,
+                    provider=LLMProvider.LOCAL,
+                    model="local-deterministic",
+                    usage=TokenUsage(input_tokens=0, output_tokens=0),
+                )
+            index = min(self._local_index, len(self._local_responses) - 1)
+            self._local_index += 1
+            content = self._local_responses[index]
+            prompt_words = sum(
+                len(m["content"].split()) for m in (request.messages or [])
+            ) or len(request.user_prompt.split())
             return LLMResponse(
-                content="",
+                content=content,
                 parsed=None,
                 provider=LLMProvider.LOCAL,
-                model="local-deterministic",
-                usage=TokenUsage(input_tokens=0, output_tokens=0),
+                model="local-scripted",
+                usage=TokenUsage(
+                    input_tokens=prompt_words, output_tokens=len(content.split()),
+                ),
             )
 
         defaults: dict[str, Any] = {}
@@ -540,3 +680,160 @@ class LLMClient:
             )
             resp.raise_for_status()
             return resp
+
+    # ----- Provider streaming -----
+
+    async def _stream_anthropic(self, request: LLMRequest) -> AsyncIterator[LLMStreamChunk]:
+        """Stream from Anthropic via the SDK's messages.stream helper."""
+        import anthropic
+
+        client = anthropic.AsyncAnthropic(
+            api_key=self._anthropic_key,
+            timeout=self._request_timeout,
+        )
+        msgs = request.messages if request.messages else [
+            {"role": "user", "content": request.user_prompt},
+        ]
+        model = request.model or self._model_anthropic
+        async with client.messages.stream(
+            model=model,
+            max_tokens=request.max_tokens,
+            temperature=request.temperature,
+            system=request.system_prompt,
+            messages=msgs,
+        ) as stream:
+            parts: list[str] = []
+            async for text in stream.text_stream:
+                parts.append(text)
+                yield LLMStreamChunk(delta=text)
+            final = await stream.get_final_message()
+        yield LLMStreamChunk(response=LLMResponse(
+            content="".join(parts),
+            parsed=None,
+            provider=LLMProvider.ANTHROPIC,
+            model=final.model,
+            usage=TokenUsage(
+                input_tokens=final.usage.input_tokens,
+                output_tokens=final.usage.output_tokens,
+            ),
+        ))
+
+    async def _stream_openai(self, request: LLMRequest) -> AsyncIterator[LLMStreamChunk]:
+        """Stream from OpenAI chat completions (usage in the last chunk)."""
+        import openai
+
+        client = openai.AsyncOpenAI(
+            api_key=self._openai_key,
+            timeout=self._request_timeout,
+        )
+        msgs = request.messages if request.messages else [
+            {"role": "user", "content": request.user_prompt},
+        ]
+        full_msgs = [{"role": "system", "content": request.system_prompt}] + msgs
+        model = request.model or self._model_openai
+        stream = await client.chat.completions.create(
+            model=model,
+            max_tokens=request.max_tokens,
+            temperature=request.temperature,
+            messages=full_msgs,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        parts: list[str] = []
+        usage = TokenUsage()
+        async for chunk in stream:
+            model = chunk.model or model
+            if chunk.usage is not None:
+                usage = TokenUsage(
+                    input_tokens=chunk.usage.prompt_tokens,
+                    output_tokens=chunk.usage.completion_tokens,
+                )
+            if chunk.choices and chunk.choices[0].delta.content:
+                text = chunk.choices[0].delta.content
+                parts.append(text)
+                yield LLMStreamChunk(delta=text)
+        yield LLMStreamChunk(response=LLMResponse(
+            content="".join(parts),
+            parsed=None,
+            provider=LLMProvider.OPENAI,
+            model=model,
+            usage=usage,
+        ))
+
+    async def _stream_openrouter(self, request: LLMRequest) -> AsyncIterator[LLMStreamChunk]:
+        """Stream from OpenRouter's OpenAI-compatible SSE endpoint via httpx."""
+        import httpx
+
+        msgs = request.messages if request.messages else [
+            {"role": "user", "content": request.user_prompt},
+        ]
+        full_msgs = [{"role": "system", "content": request.system_prompt}] + msgs
+        model = request.model or self._model_openrouter
+
+        parts: list[str] = []
+        usage = TokenUsage()
+        async with httpx.AsyncClient(timeout=self._request_timeout) as http:
+            async with http.stream(
+                "POST",
+                "https://openrouter.ai/api/v1/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {self._openrouter_key}",
+                    "Content-Type": "application/json",
+                },
+                json={
+                    "model": model,
+                    "max_tokens": request.max_tokens,
+                    "temperature": request.temperature,
+                    "messages": full_msgs,
+                    "stream": True,
+                },
+            ) as resp:
+                resp.raise_for_status()
+                async for line in resp.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue  # blank separators and ": keep-alive" comments
+                    payload = line[len("data:"):].strip()
+                    if payload == "[DONE]":
+                        break
+                    data = json.loads(payload)
+                    model = data.get("model", model)
+                    if data.get("usage"):
+                        usage = TokenUsage(
+                            input_tokens=data["usage"].get("prompt_tokens", 0),
+                            output_tokens=data["usage"].get("completion_tokens", 0),
+                        )
+                    choices = data.get("choices") or []
+                    text = choices[0].get("delta", {}).get("content") if choices else None
+                    if text:
+                        parts.append(text)
+                        yield LLMStreamChunk(delta=text)
+        yield LLMStreamChunk(response=LLMResponse(
+            content="".join(parts),
+            parsed=None,
+            provider=LLMProvider.OPENROUTER,
+            model=model,
+            usage=usage,
+        ))
+
+
+def _record_token_metrics(provider: LLMProvider, response: LLMResponse) -> None:
+    LLM_TOKENS_TOTAL.inc(
+        response.usage.input_tokens, provider=provider.value, direction="input",
+    )
+    LLM_TOKENS_TOTAL.inc(
+        response.usage.output_tokens, provider=provider.value, direction="output",
+    )
+
+
+def _as_unstructured(request: LLMRequest) -> LLMRequest:
+    """Copy of a request with structured output disabled."""
+    return LLMRequest(
+        system_prompt=request.system_prompt,
+        user_prompt=request.user_prompt,
+        messages=request.messages,
+        output_schema=None,
+        max_tokens=request.max_tokens,
+        temperature=request.temperature,
+        structured=False,
+        model=request.model,
+    )
@@ -44,18 +44,25 @@ def build_system_prompt(context: dict | None = None) -> str:
 
     Args:
         context: Optional dict with keys like 'workspace_description',
-                 'available_model_versions', etc.
+                 'available_model_versions', 'conversation_summary', etc.
 
     Returns:
         Complete system prompt string.
     """
     ctx = context or {}
     ws_desc = ctx.get("workspace_description", "Economic impact assessment")
+    summary = ctx.get("conversation_summary")
 
     sector_list = "\n".join(
         f"  {code}: {name}" for code, name in _ISIC_SECTIONS.items()
     )
     shock_list = "\n".join(f"  - {s}" for s in _SHOCK_TYPES)
+    summary_block = (
+        "\nEARLIER IN THIS CONVERSATION (summary of turns no longer shown verbatim):\n"
+        f"{summary}\n"
+        if summary
+        else ""
+    )
 
     return f"""You are the Economist Copilot inside ImpactOS, built for Strategic Gears consultants.
 
@@ -111,6 +118,8 @@ You have 5 tools. Call them by outputting JSON in this format:
 Tools:
 1. lookup_data — Query curated datasets (I/O tables, multipliers, employment, macro indicators)
    Arguments: {{"dataset_id": "string", "sector_codes": ["A", "B"], "year": 2023}}
+   For multipliers pass {{"dataset_id": "multipliers", "model_version_id": "uuid"}}
+   (precomputed Type I/II tables, no engine run needed)
 
 2. build_scenario — Construct a ScenarioSpec with shock items (REQUIRES prior confirmation)
    Arguments: {{"name": "string", "base_year": 2023, "shock_items": [...]}}
@@ -146,7 +155,7 @@ GUARDRAILS:
 - If data unavailable for sector/year: state the gap, suggest nearest vintage
 - If economist overrides your sector mapping: accept immediately
 - Keep responses concise, use tables for sector breakdowns
-"""
+{summary_block}"""
 
 
 def get_tool_definitions() -> list[dict]:
@@ -160,6 +169,7 @@ def get_tool_definitions() -> list[dict]:
             "description": "Query curated datasets (I/O tables, multipliers, employment coefficients, macro indicators)",
             "parameters": {
                 "dataset_id": {"type": "string", "required": True},
+                "model_version_id": {"type": "string", "required": False},
                 "sector_codes": {"type": "array", "items": "string", "required": False},
                 "year": {"type": "integer", "required": False},
             },
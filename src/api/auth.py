@@ -3,14 +3,20 @@
 Dev-only authentication for frontend development.
 Returns 404 in staging/prod environments.
 Gets replaced by SSO in production.
+
+GET /v1/auth/cache/stats is available in every environment (global
+admin only) and reports auth cache hit rates and latency.
 """
 
 from datetime import UTC, datetime, timedelta
+from uuid import uuid4
 
 import jwt
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 
+from src.api.auth_cache import auth_cache_counters, get_membership_cache
+from src.api.auth_deps import AuthPrincipal, require_global_role
 from src.config.settings import get_settings
 
 router = APIRouter(prefix="/v1/auth", tags=["auth"])
@@ -70,6 +76,20 @@ class MeResponse(BaseModel):
     workspace_ids: list[str]
 
 
+class AuthCacheStatsResponse(BaseModel):
+    """Process-wide auth cache counters and mean auth latency."""
+
+    claims_hits: int
+    claims_misses: int
+    claims_hit_rate: float
+    membership_hits: int
+    membership_misses: int
+    membership_hit_rate: float
+    membership_backend: str
+    principal_mean_ms: float
+    membership_mean_ms: float
+
+
 def _check_dev_mode() -> None:
     """Raise 404 if not running in dev environment."""
     settings = get_settings()
@@ -86,6 +106,9 @@ def _create_token(user_id: str, username: str, role: str = "viewer") -> str:
         "role": role,
         "exp": datetime.now(UTC) + timedelta(hours=24),
         "iat": datetime.now(UTC),
+        # Unique per login: without it, tokens minted in the same second
+        # are identical and logging one out revokes the other.
+        "jti": uuid4().hex,
     }
     return jwt.encode(payload, settings.SECRET_KEY, algorithm="HS256")
 
@@ -151,3 +174,28 @@ async def logout(request: Request) -> dict[str, str]:
     token = _extract_token(request)
     _revoked_tokens.add(token)
     return {"status": "logged_out"}
+
+
+@router.get("/cache/stats", response_model=AuthCacheStatsResponse)
+async def auth_cache_stats(
+    principal: AuthPrincipal = Depends(require_global_role("admin")),
+) -> AuthCacheStatsResponse:
+    """Auth cache hit rates and mean latency. Global admin only."""
+    stats = auth_cache_counters.snapshot()
+    return AuthCacheStatsResponse(
+        claims_hits=stats.claims_hits,
+        claims_misses=stats.claims_misses,
+        claims_hit_rate=stats.claims_hit_rate,
+        membership_hits=stats.membership_hits,
+        membership_misses=stats.membership_misses,
+        membership_hit_rate=stats.membership_hit_rate,
+        membership_backend=get_membership_cache().backend,
+        principal_mean_ms=(
+            stats.principal_seconds * 1000 / stats.principal_count
+            if stats.principal_count else 0.0
+        ),
+        membership_mean_ms=(
+            stats.membership_seconds * 1000 / stats.membership_count
+            if stats.membership_count else 0.0
+        ),
+    )
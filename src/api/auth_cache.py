@@ -0,0 +1,345 @@
+"""Short-TTL caches for request authentication and workspace membership.
+
+Workspace-scoped routes resolve the principal (JWT decode) and then
+check ``workspace_memberships`` on every request; chat and workshop UIs
+issue dozens of calls per minute per user. Two caches take that off the
+hot path:
+
+- ClaimsCache: verified JWT claims memoized by sha256(environment, token)
+  until the token's ``exp`` (capped at AUTH_CLAIMS_CACHE_TTL_SECONDS).
+  In-process only; the raw token is never stored.
+- MembershipCache: (user_id, workspace_id) -> role, in-process or Redis,
+  with AUTH_MEMBERSHIP_CACHE_TTL_SECONDS. Only *allow* decisions are
+  cached — a deny always goes to the database, so a revoked membership
+  can never be answered from a stale entry after invalidation, and a new
+  membership is visible immediately. Membership writes call
+  ``invalidate()``; any cache error falls back to the database.
+
+Counters (hit rates, auth latency) follow the snapshot()/reset() style
+used by the other process-wide caches.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+_logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Counters
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class AuthCacheStats:
+    """Point-in-time auth cache counters and latency totals."""
+
+    claims_hits: int
+    claims_misses: int
+    membership_hits: int
+    membership_misses: int
+    principal_count: int
+    principal_seconds: float
+    membership_count: int
+    membership_seconds: float
+
+    @property
+    def claims_hit_rate(self) -> float:
+        total = self.claims_hits + self.claims_misses
+        return self.claims_hits / total if total else 0.0
+
+    @property
+    def membership_hit_rate(self) -> float:
+        total = self.membership_hits + self.membership_misses
+        return self.membership_hits / total if total else 0.0
+
+
+class AuthCacheCounters:
+    """Process-wide, thread-safe auth cache counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def record_claims(self, *, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._claims_hits += 1
+            else:
+                self._claims_misses += 1
+
+    def record_membership(self, *, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._membership_hits += 1
+            else:
+                self._membership_misses += 1
+
+    def record_principal_latency(self, seconds: float) -> None:
+        with self._lock:
+            self._principal_count += 1
+            self._principal_seconds += seconds
+
+    def record_membership_latency(self, seconds: float) -> None:
+        with self._lock:
+            self._membership_count += 1
+            self._membership_seconds += seconds
+
+    def snapshot(self) -> AuthCacheStats:
+        with self._lock:
+            return AuthCacheStats(
+                claims_hits=self._claims_hits,
+                claims_misses=self._claims_misses,
+                membership_hits=self._membership_hits,
+                membership_misses=self._membership_misses,
+                principal_count=self._principal_count,
+                principal_seconds=self._principal_seconds,
+                membership_count=self._membership_count,
+                membership_seconds=self._membership_seconds,
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._claims_hits = self._claims_misses = 0
+            self._membership_hits = self._membership_misses = 0
+            self._principal_count = self._membership_count = 0
+            self._principal_seconds = self._membership_seconds = 0.0
+
+
+auth_cache_counters = AuthCacheCounters()
+
+
+# ---------------------------------------------------------------------------
+# In-process TTL store
+# ---------------------------------------------------------------------------
+
+
+class _TTLStore:
+    """Bounded LRU dict with per-entry absolute expiry (monotonic clock)."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        if ttl_seconds <= 0 or self._max_entries <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# ---------------------------------------------------------------------------
+# Claims cache
+# ---------------------------------------------------------------------------
+
+
+class ClaimsCache:
+    """Memoizes verified JWT claims by token hash until token expiry."""
+
+    def __init__(self, *, max_ttl_seconds: float, max_entries: int) -> None:
+        self._max_ttl = max_ttl_seconds
+        self._store = _TTLStore(max_entries)
+
+    @staticmethod
+    def _key(environment: str, token: str) -> str:
+        return hashlib.sha256(f"{environment}\x00{token}".encode()).hexdigest()
+
+    def get(self, environment: str, token: str) -> dict[str, Any] | None:
+        claims = self._store.get(self._key(environment, token))
+        auth_cache_counters.record_claims(hit=claims is not None)
+        return claims
+
+    def put(self, environment: str, token: str, claims: dict[str, Any]) -> None:
+        ttl = self._max_ttl
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            ttl = min(ttl, exp - time.time())
+        self._store.set(self._key(environment, token), claims, ttl)
+
+    def discard(self, environment: str, token: str) -> None:
+        self._store.delete(self._key(environment, token))
+
+    def clear(self) -> None:
+        self._store.clear()
+
+
+# ---------------------------------------------------------------------------
+# Membership cache
+# ---------------------------------------------------------------------------
+
+
+def _membership_key(user_id: UUID, workspace_id: UUID) -> str:
+    return f"impactos:auth:membership:{user_id}:{workspace_id}"
+
+
+class MembershipCache:
+    """Caches workspace membership *allow* decisions (role) per user."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_entries: int,
+        backend: str = "memory",
+        redis_url: str = "",
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._backend = backend if ttl_seconds > 0 else "none"
+        self._redis_url = redis_url
+        self._redis: Any | None = None
+        self._store = _TTLStore(max_entries)
+        self._epoch = 0
+
+    @property
+    def backend(self) -> str:
+        return self._backend
+
+    @property
+    def epoch(self) -> int:
+        """Bumped by every invalidation; pass to put_role() as ``epoch``.
+
+        A lookup that started before an invalidation must not re-populate
+        the cache with the (possibly revoked) allow it read from the DB.
+        """
+        return self._epoch
+
+    def _redis_client(self) -> Any:
+        if self._redis is None:
+            import redis.asyncio as aioredis
+
+            self._redis = aioredis.from_url(
+                self._redis_url, socket_connect_timeout=1, socket_timeout=1,
+            )
+        return self._redis
+
+    async def get_role(self, user_id: UUID, workspace_id: UUID) -> str | None:
+        """Cached role for an allowed member, or None (caller checks DB)."""
+        if self._backend == "none":
+            return None
+        key = _membership_key(user_id, workspace_id)
+        role: str | None
+        if self._backend == "redis":
+            try:
+                raw = await self._redis_client().get(key)
+            except Exception:
+                _logger.warning("Membership cache read failed", exc_info=True)
+                return None
+            role = raw.decode() if isinstance(raw, bytes) else raw
+        else:
+            role = self._store.get(key)
+        auth_cache_counters.record_membership(hit=role is not None)
+        return role
+
+    async def put_role(
+        self,
+        user_id: UUID,
+        workspace_id: UUID,
+        role: str,
+        *,
+        epoch: int | None = None,
+    ) -> None:
+        if self._backend == "none":
+            return
+        if epoch is not None and epoch != self._epoch:
+            return
+        key = _membership_key(user_id, workspace_id)
+        if self._backend == "redis":
+            try:
+                await self._redis_client().set(key, role, ex=max(1, int(self._ttl)))
+            except Exception:
+                _logger.warning("Membership cache write failed", exc_info=True)
+            return
+        self._store.set(key, role, self._ttl)
+
+    async def invalidate(self, user_id: UUID, workspace_id: UUID) -> None:
+        """Drop a cached decision. Call after any membership change."""
+        key = _membership_key(user_id, workspace_id)
+        self._epoch += 1
+        self._store.delete(key)
+        if self._backend == "redis":
+            try:
+                await self._redis_client().delete(key)
+            except Exception:
+                _logger.warning("Membership cache invalidation failed", exc_info=True)
+
+    def clear(self) -> None:
+        self._store.clear()
+
+
+# ---------------------------------------------------------------------------
+# Process-wide instances
+# ---------------------------------------------------------------------------
+
+_lock = threading.Lock()
+_claims_cache: ClaimsCache | None = None
+_membership_cache: MembershipCache | None = None
+
+
+def get_claims_cache() -> ClaimsCache:
+    global _claims_cache
+    with _lock:
+        if _claims_cache is None:
+            from src.config.settings import get_settings
+
+            settings = get_settings()
+            _claims_cache = ClaimsCache(
+                max_ttl_seconds=settings.AUTH_CLAIMS_CACHE_TTL_SECONDS,
+                max_entries=settings.AUTH_CACHE_MAX_ENTRIES,
+            )
+        return _claims_cache
+
+
+def get_membership_cache() -> MembershipCache:
+    global _membership_cache
+    with _lock:
+        if _membership_cache is None:
+            from src.config.settings import get_settings
+
+            settings = get_settings()
+            _membership_cache = MembershipCache(
+                ttl_seconds=settings.AUTH_MEMBERSHIP_CACHE_TTL_SECONDS,
+                max_entries=settings.AUTH_CACHE_MAX_ENTRIES,
+                backend=settings.AUTH_MEMBERSHIP_CACHE_BACKEND,
+                redis_url=settings.REDIS_URL,
+            )
+        return _membership_cache
+
+
+def reset_auth_caches() -> None:
+    """Drop cached claims and memberships (tests, config reload)."""
+    global _claims_cache, _membership_cache
+    with _lock:
+        _claims_cache = None
+        _membership_cache = None
@@ -4,8 +4,9 @@ Provides:
 - AuthPrincipal: typed identity extracted from JWT claims
 - get_current_principal: FastAPI dependency for token validation (401)
   - dev: HS256 with SECRET_KEY (dev stub only)
-  - non-dev: RS256 with external IdP JWKS + issuer/audience validation
-- require_workspace_member: workspace membership check (404)
+  - non-dev: RS256 with external IdP JWKS (cached by kid) + issuer/audience
+- require_workspace_member: workspace membership check (404), with
+  short-TTL allow caching (see src/api/auth_cache.py)
 - require_role: workspace role policy gate factory (403)
 - require_global_role: global (non-workspace) role gate factory (403)
 
@@ -15,6 +16,7 @@ Secret safety: tokens and signing keys are never logged.
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
@@ -23,6 +25,12 @@ import jwt as pyjwt
 from fastapi import Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.api.auth_cache import (
+    auth_cache_counters,
+    get_claims_cache,
+    get_membership_cache,
+)
+from src.api.jwks import get_jwks_cache
 from src.config.settings import get_settings
 from src.db.session import get_async_session
 from src.db.tables import WorkspaceMembershipRow
@@ -83,7 +91,7 @@ def _validate_jwt_dev(token: str) -> dict[str, Any]:
     except pyjwt.InvalidTokenError:
         raise HTTPException(
             status_code=401, detail="Invalid or expired token",
-        )
+        ) from None
 
 
 # ---------------------------------------------------------------------------
@@ -91,35 +99,29 @@ def _validate_jwt_dev(token: str) -> dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
-def _fetch_jwks_public_key(jwks_url: str) -> bytes:
-    """Fetch the first RSA public key from a JWKS endpoint.
+async def _resolve_signing_key(token: str, jwks_url: str) -> Any:
+    """Resolve the RSA public key for ``token`` from the cached JWKS.
 
-    In production this would cache keys and handle rotation.
+    Keys are matched on the token's ``kid`` header (first RSA key when
+    absent). See src/api/jwks.py for refresh and rotation behaviour.
     Never logs the key material itself.
     """
-    import httpx
-
-    resp = httpx.get(jwks_url, timeout=10)
-    resp.raise_for_status()
-    jwks = resp.json()
-
-    from cryptography.hazmat.primitives import serialization
-    from jwt.algorithms import RSAAlgorithm
-
-    for key_data in jwks.get("keys", []):
-        if key_data.get("kty") == "RSA":
-            public_key = RSAAlgorithm.from_jwk(key_data)
-            return public_key.public_bytes(
-                serialization.Encoding.PEM,
-                serialization.PublicFormat.SubjectPublicKeyInfo,
-            )
+    try:
+        kid = pyjwt.get_unverified_header(token).get("kid")
+    except pyjwt.InvalidTokenError:
+        raise HTTPException(
+            status_code=401, detail="Invalid or expired token",
+        ) from None
 
-    raise HTTPException(
-        status_code=401, detail="No suitable RSA key in JWKS",
-    )
+    key = await get_jwks_cache(jwks_url).get_key(kid)
+    if key is None:
+        raise HTTPException(
+            status_code=401, detail="No suitable RSA key in JWKS",
+        )
+    return key
 
 
-def _validate_jwt_external(token: str) -> dict[str, Any]:
+async def _validate_jwt_external(token: str) -> dict[str, Any]:
     """Decode RS256 JWT using external IdP JWKS + issuer/audience.
 
     Fail-closed: missing JWKS_URL, JWT_ISSUER, or JWT_AUDIENCE → 401.
@@ -145,19 +147,19 @@ def _validate_jwt_external(token: str) -> dict[str, Any]:
         )
 
     try:
-        public_key_pem = _fetch_jwks_public_key(settings.JWKS_URL)
+        public_key = await _resolve_signing_key(token, settings.JWKS_URL)
     except HTTPException:
         raise
     except Exception:
         _logger.exception("Failed to fetch JWKS")
         raise HTTPException(
             status_code=401, detail="Auth service unavailable",
-        )
+        ) from None
 
     try:
         return pyjwt.decode(
             token,
-            public_key_pem,
+            public_key,
             algorithms=["RS256"],
             issuer=settings.JWT_ISSUER,
             audience=settings.JWT_AUDIENCE,
@@ -165,7 +167,7 @@ def _validate_jwt_external(token: str) -> dict[str, Any]:
     except pyjwt.InvalidTokenError:
         raise HTTPException(
             status_code=401, detail="Invalid or expired token",
-        )
+        ) from None
 
 
 # ---------------------------------------------------------------------------
@@ -178,9 +180,13 @@ async def get_current_principal(request: Request) -> AuthPrincipal:
 
     Dev: HS256 with SECRET_KEY + revocation check.
     Non-dev: RS256 with external IdP JWKS + issuer/audience.
+    Verified claims are memoized by token hash until expiry.
     """
+    started = time.perf_counter()
     token = _extract_bearer_token(request)
     settings = get_settings()
+    environment = str(settings.ENVIRONMENT)
+    claims_cache = get_claims_cache()
 
     if settings.ENVIRONMENT == "dev":
         from src.api.auth import _revoked_tokens
@@ -189,9 +195,14 @@ async def get_current_principal(request: Request) -> AuthPrincipal:
             raise HTTPException(
                 status_code=401, detail="Token revoked",
             )
-        claims = _validate_jwt_dev(token)
-    else:
-        claims = _validate_jwt_external(token)
+
+    claims = claims_cache.get(environment, token)
+    if claims is None:
+        if settings.ENVIRONMENT == "dev":
+            claims = _validate_jwt_dev(token)
+        else:
+            claims = await _validate_jwt_external(token)
+        claims_cache.put(environment, token, claims)
 
     user_id_str = claims.get("sub")
     username = claims.get("username", "")
@@ -202,11 +213,13 @@ async def get_current_principal(request: Request) -> AuthPrincipal:
             status_code=401, detail="Invalid token claims",
         )
 
-    return AuthPrincipal(
+    principal = AuthPrincipal(
         user_id=UUID(user_id_str),
         username=username,
         role=role,
     )
+    auth_cache_counters.record_principal_latency(time.perf_counter() - started)
+    return principal
 
 
 # ---------------------------------------------------------------------------
@@ -219,34 +232,50 @@ async def require_workspace_member(
     principal: AuthPrincipal = Depends(get_current_principal),
     session: AsyncSession = Depends(get_async_session),
 ) -> WorkspaceMember:
-    """Verify the principal is a workspace member. 404 if not."""
+    """Verify the principal is a workspace member. 404 if not.
+
+    Allow decisions are cached briefly per (user, workspace); denies are
+    always re-checked against the database.
+    """
     from sqlalchemy import select
 
-    stmt = select(WorkspaceMembershipRow).where(
-        WorkspaceMembershipRow.workspace_id == workspace_id,
-        WorkspaceMembershipRow.user_id == principal.user_id,
-    )
-    result = await session.execute(stmt)
-    membership = result.scalar_one_or_none()
+    started = time.perf_counter()
+    cache = get_membership_cache()
+    role = await cache.get_role(principal.user_id, workspace_id)
 
-    if membership is None:
-        _logger.info(
-            "Auth deny: user=%s workspace=%s reason=not_member",
-            principal.user_id, workspace_id,
-        )
-        raise HTTPException(
-            status_code=404, detail="Workspace not found",
+    if role is None:
+        epoch = cache.epoch
+        stmt = select(WorkspaceMembershipRow.role).where(
+            WorkspaceMembershipRow.workspace_id == workspace_id,
+            WorkspaceMembershipRow.user_id == principal.user_id,
         )
+        result = await session.execute(stmt)
+        role = result.scalar_one_or_none()
+
+        if role is None:
+            auth_cache_counters.record_membership_latency(
+                time.perf_counter() - started,
+            )
+            _logger.info(
+                "Auth deny: user=%s workspace=%s reason=not_member",
+                principal.user_id, workspace_id,
+            )
+            raise HTTPException(
+                status_code=404, detail="Workspace not found",
+            )
+
+        await cache.put_role(principal.user_id, workspace_id, role, epoch=epoch)
 
+    auth_cache_counters.record_membership_latency(time.perf_counter() - started)
     _logger.info(
         "Auth allow: user=%s workspace=%s role=%s",
-        principal.user_id, workspace_id, membership.role,
+        principal.user_id, workspace_id, role,
     )
 
     return WorkspaceMember(
         principal=principal,
         workspace_id=workspace_id,
-        role=membership.role,
+        role=role,
     )
 
 
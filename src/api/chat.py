@@ -4,15 +4,18 @@ POST   /v1/workspaces/{workspace_id}/chat/sessions              — create sessi
 GET    /v1/workspaces/{workspace_id}/chat/sessions               — list sessions
 GET    /v1/workspaces/{workspace_id}/chat/sessions/{session_id}  — get session + messages
 POST   /v1/workspaces/{workspace_id}/chat/sessions/{session_id}/messages — send message
+POST   /v1/workspaces/{workspace_id}/chat/sessions/{session_id}/messages/stream — SSE stream
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterator
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from src.agents.economist_copilot import EconomistCopilot
 from src.agents.llm_client import LLMClient, LLMProvider
@@ -78,6 +81,15 @@ def _get_chat_service(
             detail="Copilot unavailable: LLM provider not configured",
         )
 
+    # Read-only tool calls get their own sessions from the same engine.
+    # Sessions bound to a single connection (e.g. test savepoints) cannot
+    # be shared concurrently, so those keep sequential execution.
+    session_factory = None
+    if isinstance(session.bind, AsyncEngine):
+        session_factory = async_sessionmaker(
+            session.bind, class_=AsyncSession, expire_on_commit=False,
+        )
+
     return ChatService(
         session_repo=ChatSessionRepository(session),
         message_repo=ChatMessageRepository(session),
@@ -85,6 +97,9 @@ def _get_chat_service(
         max_tokens=settings.COPILOT_MAX_TOKENS,
         model=settings.COPILOT_MODEL,
         db_session=session,
+        history_window=settings.CHAT_HISTORY_WINDOW_MESSAGES,
+        history_token_budget=settings.CHAT_HISTORY_TOKEN_BUDGET,
+        session_factory=session_factory,
     )
 
 
@@ -163,4 +178,49 @@ async def send_message(
             confirm_scenario=body.confirm_scenario,
         )
     except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+
+@router.post("/{workspace_id}/chat/sessions/{session_id}/messages/stream")
+async def stream_message(
+    workspace_id: UUID,
+    session_id: UUID,
+    body: SendMessageRequest,
+    member: WorkspaceMember = Depends(require_workspace_member),
+    session: AsyncSession = Depends(get_async_session),
+) -> StreamingResponse:
+    """Send a user message and stream the turn as server-sent events.
+
+    Events: delta (LLM text), tool_start / tool_end (tool progress),
+    message (persisted assistant message, same shape as the non-streaming
+    response) and error. The turn commits once the stream completes.
+    """
+    svc = _get_chat_service(session)
+    try:
+        events = await svc.stream_message(
+            workspace_id=workspace_id,
+            session_id=session_id,
+            content=body.content,
+            confirm_scenario=body.confirm_scenario,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+    async def _sse() -> AsyncIterator[str]:
+        # Commit here rather than relying on the session dependency: its
+        # teardown may run before the response body is streamed
+        try:
+            async for event in events:
+                yield event.to_sse()
+            await session.commit()
+        except Exception:
+            _logger.exception(
+                "Chat stream failed: workspace=%s session=%s", workspace_id, session_id,
+            )
+            await session.rollback()
+
+    return StreamingResponse(
+        _sse(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,114 @@
+"""Response compression for large JSON payloads.
+
+Pure ASGI middleware that compresses complete ``application/json``
+responses of at least ``minimum_size`` bytes. It uses brotli when the
+optional ``brotli`` package is installed and the client accepts ``br``,
+and gzip otherwise. Streaming bodies (SSE chat, file downloads) and
+non-JSON content pass through untouched. ETags are left as they are,
+matching Starlette's GZipMiddleware.
+"""
+
+import gzip
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+GZIP_LEVEL = 6
+# Quality 4 is close to gzip -6 in speed with noticeably better ratios.
+BROTLI_QUALITY = 4
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """Pick ``br`` or ``gzip`` from an Accept-Encoding header, or None."""
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if token:
+            accepted[token.strip().lower()] = quality
+    if brotli is not None and accepted.get("br", 0.0) > 0:
+        return "br"
+    if accepted.get("gzip", 0.0) > 0:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        compressed: bytes = brotli.compress(body, quality=BROTLI_QUALITY)
+        return compressed
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+def _compressible(start: Message) -> bool:
+    if start["status"] in (204, 206, 304):
+        return False
+    headers = Headers(raw=start.get("headers", []))
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "").split(";", 1)[0].strip().lower()
+    return content_type == "application/json" or content_type.endswith("+json")
+
+
+class CompressionMiddleware:
+    """Compresses JSON responses of at least ``minimum_size`` bytes."""
+
+    def __init__(self, app: ASGIApp, *, minimum_size: int) -> None:
+        self.app = app
+        self._minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        passthrough = False
+
+        async def _send(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                if _compressible(message):
+                    start = message
+                else:
+                    passthrough = True
+                    await send(message)
+                return
+
+            if start is None:
+                raise RuntimeError("ASGI response body sent before http.response.start")
+            body = message.get("body", b"")
+            if message.get("more_body", False) or len(body) < self._minimum_size:
+                # Streaming or small: send as-is.
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            compressed = compress(body, encoding)
+            headers = MutableHeaders(raw=list(start.get("headers", [])))
+            headers["content-encoding"] = encoding
+            headers["content-length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            await send({**start, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, _send)
@@ -2,12 +2,16 @@
 
 Each factory takes AsyncSession via Depends(get_async_session) and returns
 a repository instance. API endpoints use these via Depends().
+
+``get_read_*`` factories take Depends(get_read_session) instead and may be
+served by the read replica (DATABASE_READ_REPLICA_URL); use them only on
+GET endpoints that tolerate replication lag.
 """
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.session import get_async_session
+from src.db.session import get_async_session, get_read_session
 from src.repositories.compiler import CompilationRepository, OverridePairRepository
 from src.repositories.data_quality import DataQualityRepository
 from src.repositories.depth import DepthArtifactRepository, DepthPlanRepository
@@ -20,6 +24,7 @@ from src.repositories.engine import (
     BatchRepository,
     ModelDataRepository,
     ModelVersionRepository,
+    MultiplierTableRepository,
     ResultSetRepository,
     RunSnapshotRepository,
 )
@@ -182,6 +187,12 @@ async def get_model_data_repo(
     return ModelDataRepository(session)
 
 
+async def get_multiplier_table_repo(
+    session: AsyncSession = Depends(get_async_session),
+) -> MultiplierTableRepository:
+    return MultiplierTableRepository(session)
+
+
 async def get_run_snapshot_repo(
     session: AsyncSession = Depends(get_async_session),
 ) -> RunSnapshotRepository:
@@ -200,6 +211,24 @@ async def get_batch_repo(
     return BatchRepository(session)
 
 
+async def get_read_run_snapshot_repo(
+    session: AsyncSession = Depends(get_read_session),
+) -> RunSnapshotRepository:
+    return RunSnapshotRepository(session)
+
+
+async def get_read_result_set_repo(
+    session: AsyncSession = Depends(get_read_session),
+) -> ResultSetRepository:
+    return ResultSetRepository(session)
+
+
+async def get_read_batch_repo(
+    session: AsyncSession = Depends(get_read_session),
+) -> BatchRepository:
+    return BatchRepository(session)
+
+
 # ---------------------------------------------------------------------------
 # Depth Engine
 # ---------------------------------------------------------------------------
@@ -347,6 +376,12 @@ async def get_portfolio_repo(
     return PortfolioRepository(session)
 
 
+async def get_read_portfolio_repo(
+    session: AsyncSession = Depends(get_read_session),
+) -> PortfolioRepository:
+    return PortfolioRepository(session)
+
+
 # ---------------------------------------------------------------------------
 # Workspaces
 # ---------------------------------------------------------------------------
@@ -7,6 +7,7 @@ POST /v1/workspaces/{workspace_id}/exports/variance-bridge                — va
 POST /v1/workspaces/{workspace_id}/variance-bridges                       — compute+persist bridge (S23)
 GET  /v1/workspaces/{workspace_id}/variance-bridges/{analysis_id}         — get bridge analysis (S23)
 GET  /v1/workspaces/{workspace_id}/variance-bridges                       — list bridge analyses (S23)
+GET  /v1/exports/render-cache/stats                                       — render cache counters
 
 S0-4: Workspace-scoped routes. NFF claims now fetched from DB (not empty).
 Deterministic — no LLM calls.
@@ -17,11 +18,13 @@ import json
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 from src.api.auth_deps import (
+    AuthPrincipal,
     WorkspaceMember,
+    require_global_role,
     require_role,
     require_workspace_member,
 )
@@ -36,14 +39,12 @@ from src.api.dependencies import (
     get_scenario_version_repo,
     get_variance_bridge_repo,
 )
-from src.api.runs import ALLOWED_RUNTIME_PROVENANCE
+from src.config.settings import get_settings
 from src.export.artifact_storage import ExportArtifactStorage
-from src.export.orchestrator import ExportOrchestrator, ExportRequest
+from src.export.render_cache import get_render_cache, render_cache_counters
 from src.export.variance_bridge import AdvancedVarianceBridge, VarianceBridge
-from src.models.common import ClaimStatus, ClaimType, DisclosureTier, ExportMode
+from src.models.common import ExportMode
 from src.models.export import BridgeReasonCode, VarianceBridgeAnalysis
-from src.models.governance import Claim
-from src.quality.models import RunQualityAssessment
 from src.repositories.data_quality import DataQualityRepository
 from src.repositories.engine import (
     ModelVersionRepository,
@@ -53,14 +54,20 @@ from src.repositories.engine import (
 from src.repositories.exports import ExportRepository, VarianceBridgeRepository
 from src.repositories.governance import ClaimRepository
 from src.repositories.scenarios import ScenarioVersionRepository
+from src.services.export_execution import (
+    ExportExecutionInput,
+    ExportExecutionService,
+    ExportRepositories,
+)
 
 router = APIRouter(prefix="/v1/workspaces", tags=["exports"])
+render_cache_router = APIRouter(prefix="/v1/exports", tags=["exports"])
 
 # ---------------------------------------------------------------------------
 # Stateless services (no DB needed)
 # ---------------------------------------------------------------------------
 
-_orchestrator = ExportOrchestrator()
+_export_service = ExportExecutionService()
 _bridge = VarianceBridge()
 
 _DOWNLOAD_NON_READY = frozenset({"BLOCKED", "FAILED", "PENDING", "GENERATING"})
@@ -104,6 +111,15 @@ class ExportStatusResponse(BaseModel):
     checksums: dict[str, str] = Field(default_factory=dict)
 
 
+class RenderCacheStatsResponse(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    hit_rate: float
+    bytes_used: int
+    max_bytes: int
+
+
 class VarianceBridgeRequest(BaseModel):
     run_a: dict
     run_b: dict
@@ -166,48 +182,6 @@ class BridgeErrorDetail(BaseModel):
     message: str
 
 
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-
-def _claim_row_to_model(row) -> Claim:
-    """Convert ClaimRow to Claim Pydantic model for NFF gate checks."""
-    return Claim(
-        claim_id=row.claim_id,
-        text=row.text,
-        claim_type=ClaimType(row.claim_type),
-        status=ClaimStatus(row.status),
-        disclosure_tier=DisclosureTier(row.disclosure_tier),
-        model_refs=[],
-        evidence_refs=[],
-        created_at=row.created_at,
-        updated_at=row.updated_at,
-    )
-
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-
-async def _check_model_provenance(
-    run_id: UUID, snap_repo, mv_repo,
-) -> bool:
-    """Check if the run's model has disallowed provenance.
-
-    Returns True if provenance_class is NOT in ALLOWED_RUNTIME_PROVENANCE.
-    """
-    snap_row = await snap_repo.get(run_id)
-    if snap_row is None:
-        return True
-    mv_row = await mv_repo.get(snap_row.model_version_id)
-    if mv_row is None:
-        return True
-    prov = getattr(mv_row, "provenance_class", "unknown")
-    return prov not in ALLOWED_RUNTIME_PROVENANCE
-
-
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
@@ -229,61 +203,34 @@ async def create_export(
 
     D-5.1: Computes effective_used_synthetic from quality payload AND
     model provenance_class. Does not trust quality payload alone.
-    """
-    request = ExportRequest(
-        run_id=UUID(body.run_id),
-        workspace_id=workspace_id,
-        mode=ExportMode(body.mode),
-        export_formats=body.export_formats,
-        pack_data=body.pack_data,
-    )
-
-    claim_rows = await claim_repo.get_by_run(UUID(body.run_id))
-    claims = [_claim_row_to_model(r) for r in claim_rows]
-
-    quality_assessment: RunQualityAssessment | None = None
-    quality_row = await quality_repo.get_by_run(UUID(body.run_id))
-    if quality_row is not None and quality_row.payload:
-        try:
-            quality_assessment = RunQualityAssessment.model_validate(
-                quality_row.payload,
-            )
-        except Exception:
-            pass
-
-    model_provenance_disallowed = await _check_model_provenance(
-        UUID(body.run_id), snap_repo, mv_repo,
-    )
-
-    record = _orchestrator.execute(
-        request=request,
-        claims=claims,
-        quality_assessment=quality_assessment,
-        model_provenance_disallowed=model_provenance_disallowed,
-    )
 
-    artifact_refs: dict[str, str] = {}
-    if record.artifacts:
-        for fmt, data in record.artifacts.items():
-            key = ExportArtifactStorage.build_key(str(record.export_id), fmt)
-            artifact_store.store(key, data)
-            artifact_refs[fmt] = key
-
-    await repo.create(
-        export_id=record.export_id,
-        run_id=record.run_id,
-        mode=record.mode.value,
-        status=record.status.value,
-        checksums_json=record.checksums,
-        blocked_reasons=record.blocking_reasons,
-        artifact_refs_json=artifact_refs or None,
+    The export row is created PENDING and generated as a job. With a
+    Celery broker the response is PENDING; poll the status endpoint.
+    Otherwise the local worker runs it and the final status is returned.
+    """
+    result = await _export_service.submit(
+        ExportExecutionInput(
+            workspace_id=workspace_id,
+            run_id=UUID(body.run_id),
+            mode=ExportMode(body.mode),
+            export_formats=body.export_formats,
+            pack_data=body.pack_data,
+        ),
+        ExportRepositories(
+            export_repo=repo,
+            claim_repo=claim_repo,
+            quality_repo=quality_repo,
+            snap_repo=snap_repo,
+            mv_repo=mv_repo,
+            artifact_store=artifact_store,
+        ),
     )
 
     return CreateExportResponse(
-        export_id=str(record.export_id),
-        status=record.status.value,
-        checksums=record.checksums,
-        blocking_reasons=record.blocking_reasons,
+        export_id=str(result.export_id),
+        status=result.status,
+        checksums=result.checksums,
+        blocking_reasons=result.blocking_reasons,
     )
 
 
@@ -319,7 +266,8 @@ async def download_export_artifact(
 ) -> Response:
     """B-12: Download a persisted export artifact by format (excel/pptx).
 
-    Returns the raw bytes with correct MIME type and Content-Disposition.
+    Streams the artifact in chunks with correct MIME type,
+    Content-Length and Content-Disposition.
     """
     row = await repo.get_for_workspace(export_id, workspace_id)
     if row is None:
@@ -340,7 +288,7 @@ async def download_export_artifact(
         )
 
     try:
-        data = artifact_store.retrieve(storage_key)
+        size = artifact_store.size(storage_key)
     except FileNotFoundError:
         raise HTTPException(
             status_code=404,
@@ -351,10 +299,33 @@ async def download_export_artifact(
     ext = _FORMAT_EXT.get(format, format)
     filename = f"export_{export_id}.{ext}"
 
-    return Response(
-        content=data,
+    return StreamingResponse(
+        artifact_store.iter_chunks(storage_key),
         media_type=mime,
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(size),
+        },
+    )
+
+
+@render_cache_router.get("/render-cache/stats", response_model=RenderCacheStatsResponse)
+async def get_render_cache_stats(
+    principal: AuthPrincipal = Depends(require_global_role("admin")),
+    artifact_store: ExportArtifactStorage = Depends(get_export_artifact_storage),
+) -> RenderCacheStatsResponse:
+    """Process-wide export render cache counters and size. Admin only."""
+    stats = render_cache_counters.snapshot()
+    cache = get_render_cache(
+        artifact_store, max_bytes=get_settings().EXPORT_RENDER_CACHE_MAX_BYTES,
+    )
+    return RenderCacheStatsResponse(
+        hits=stats.hits,
+        misses=stats.misses,
+        evictions=stats.evictions,
+        hit_rate=stats.hit_rate,
+        bytes_used=cache.bytes_used(),
+        max_bytes=cache.max_bytes,
     )
 
 
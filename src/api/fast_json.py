@@ -0,0 +1,46 @@
+"""orjson response for large engine payloads.
+
+Run, batch, path-analysis and workforce responses carry one float per
+sector per metric (per year with series), so a 100-run batch is tens of
+thousands of values. Returning a FastAPI ``response_model`` makes every
+one pass through three layers: response-model validation, then
+jsonable_encoder, then ``json.dumps``.
+
+FastJSONResponse skips all three for payloads we build ourselves: a
+Pydantic model (or list of them) returned inside it is dumped once and
+encoded by orjson. Endpoints keep ``response_model`` for the OpenAPI
+schema. Pair it with ``model_construct`` when the data is trusted engine
+or database output, so nothing is validated twice.
+
+orjson writes NaN/Infinity as ``null``; Starlette's JSONResponse
+(``json.dumps(..., allow_nan=False)``) raises ValueError on them instead.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        # JSON mode keeps Pydantic's wire format (UUIDs, "Z" datetimes).
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize models, dicts, numpy values, UUIDs and datetimes with orjson."""
+    return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
+
+class FastJSONResponse(Response):
+    """JSON response rendered by orjson; accepts Pydantic models (and lists of them)."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -9,6 +9,8 @@ POST /v1/workspaces/{workspace_id}/governance/assumptions/{id}/approve — appro
 POST /v1/workspaces/{workspace_id}/governance/assumptions/{id}/reject  — reject
 GET  /v1/workspaces/{workspace_id}/governance/status/{run_id}  — governance status
 GET  /v1/workspaces/{workspace_id}/governance/blocking-reasons/{run_id}
+GET  /v1/workspaces/{workspace_id}/governance/claims            — list claims
+       ?run_id=&limit=&cursor=
 GET  /v1/workspaces/{workspace_id}/governance/evidence          — browse evidence
        ?run_id=&claim_id=&source_id=&text_query=&limit=&offset=
 
@@ -16,9 +18,12 @@ S0-4: Workspace-scoped routes.
 Deterministic — no LLM calls.
 """
 
+import base64
+import binascii
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from pydantic import BaseModel
 
 from src.api.auth_deps import (
@@ -609,8 +614,7 @@ async def get_governance_status(
     }
     resolved = sum(1 for c in claims if c.status in resolved_states)
 
-    all_assumptions = await assumption_repo.list_all()
-    approved_count = sum(1 for a in all_assumptions if a.status == "APPROVED")
+    assumption_counts = await assumption_repo.count_by_status(workspace_id)
 
     gate_result = _gate.check(claims)
 
@@ -619,8 +623,8 @@ async def get_governance_status(
         claims_total=len(claims),
         claims_resolved=resolved,
         claims_unresolved=len(claims) - resolved,
-        assumptions_total=len(all_assumptions),
-        assumptions_approved=approved_count,
+        assumptions_total=sum(assumption_counts.values()),
+        assumptions_approved=assumption_counts.get("APPROVED", 0),
         nff_passed=gate_result.passed,
     )
 
@@ -662,22 +666,52 @@ async def get_blocking_reasons(
 # ---------------------------------------------------------------------------
 
 
+def _decode_claim_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        raw = base64.b64decode(cursor.encode("ascii"), validate=True).decode("utf-8")
+        created_at, claim_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(claim_id)
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise HTTPException(status_code=422, detail="Invalid cursor.") from exc
+
+
 @router.get("/{workspace_id}/governance/claims", response_model=ClaimListResponse)
 async def list_claims(
     workspace_id: UUID,
+    response: Response,
     member: WorkspaceMember = Depends(require_workspace_member),
     claim_repo: ClaimRepository = Depends(get_claim_repo),
     run_id: UUID | None = Query(default=None, description="Filter claims by run_id"),
+    limit: int | None = Query(default=None, ge=1, le=1000),
+    cursor: str | None = Query(default=None),
 ) -> ClaimListResponse:
     """List claims, optionally filtered by run_id.
 
     When run_id is provided, only claims whose run belongs to this workspace
-    are returned (workspace-safe join).
+    are returned (workspace-safe join). Without run_id, all claims on this
+    workspace's runs are listed, keyset-paginated by (created_at, claim_id)
+    when limit is given; the next page cursor is returned in X-Next-Cursor.
     """
     if run_id is not None:
         rows = await claim_repo.get_by_run_for_workspace(run_id, workspace_id)
+        total = len(rows)
     else:
-        rows = await claim_repo.list_all()
+        cursor_created_at: datetime | None = None
+        cursor_claim_id: UUID | None = None
+        if cursor:
+            cursor_created_at, cursor_claim_id = _decode_claim_cursor(cursor)
+        rows, total = await claim_repo.list_for_workspace(
+            workspace_id,
+            limit=limit,
+            cursor_created_at=cursor_created_at,
+            cursor_claim_id=cursor_claim_id,
+        )
+        if limit is not None and len(rows) == limit:
+            last = rows[-1]
+            raw = f"{last.created_at.isoformat()}|{last.claim_id}"
+            response.headers["X-Next-Cursor"] = base64.b64encode(
+                raw.encode("utf-8"),
+            ).decode("utf-8")
 
     items = [
         ClaimListItem(
@@ -691,7 +725,7 @@ async def list_claims(
         )
         for r in rows
     ]
-    return ClaimListResponse(items=items, total=len(items))
+    return ClaimListResponse(items=items, total=total)
 
 
 @router.get(
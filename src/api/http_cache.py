@@ -0,0 +1,160 @@
+"""HTTP validators and an in-process body cache for read endpoints.
+
+Run snapshots, their result sets and registered model versions never
+change once written, so their GET endpoints send a strong ETag derived
+from ids/checksums with ``Cache-Control: private, immutable`` and answer
+``If-None-Match`` with 304 before loading the payload. Append-only
+listings (runs, library versions) use ``no-cache`` with a strong ETag
+over (row count, newest id): any insert changes it, however close in
+time, which a one-second-resolution Last-Modified could not guarantee.
+
+ResponseCache keeps the serialized JSON of hot immutable resources
+keyed by ETag (LRU, bounded by HTTP_RESPONSE_CACHE_MAX_BYTES), so a
+cold client that polls a finished run is served without re-reading and
+re-encoding every result set. Entries never go stale: the key changes
+whenever the content could.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from fastapi import Request, Response
+
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+
+# ---------------------------------------------------------------------------
+# Validators
+# ---------------------------------------------------------------------------
+
+
+def strong_etag(*parts: object) -> str:
+    """Quoted strong ETag over ``parts`` (ids, checksums, flags)."""
+    digest = hashlib.sha256("\x1f".join(str(p) for p in parts).encode("utf-8"))
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    # If-None-Match uses weak comparison (RFC 9110 13.1.2).
+    return etag in candidates or f"W/{etag}" in candidates
+
+
+def cache_headers(*, cache_control: str, etag: str) -> dict[str, str]:
+    return {"Cache-Control": cache_control, "ETag": etag}
+
+
+def not_modified(request: Request, *, etag: str) -> bool:
+    """Whether a GET can be answered 304 (If-None-Match matches ``etag``)."""
+    return etag_matches(request.headers.get("if-none-match"), etag)
+
+
+def not_modified_response(headers: dict[str, str]) -> Response:
+    return Response(status_code=304, headers=headers)
+
+
+# ---------------------------------------------------------------------------
+# Serialized response cache
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class ResponseCacheStats:
+    """Point-in-time response cache counters."""
+
+    hits: int
+    misses: int
+    entries: int
+    bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache:
+    """Byte-bounded LRU of serialized JSON bodies keyed by strong ETag."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._data: OrderedDict[str, bytes] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_bytes > 0
+
+    def get(self, etag: str) -> bytes | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            body = self._data.get(etag)
+            if body is None:
+                self._misses += 1
+                return None
+            self._data.move_to_end(etag)
+            self._hits += 1
+            return body
+
+    def put(self, etag: str, body: bytes) -> None:
+        # A single body larger than the whole budget is not worth caching.
+        if not self.enabled or len(body) > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._data.pop(etag, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._data[etag] = body
+            self._bytes += len(body)
+            while self._bytes > self._max_bytes:
+                _, evicted = self._data.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def snapshot(self) -> ResponseCacheStats:
+        with self._lock:
+            return ResponseCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                entries=len(self._data),
+                bytes=self._bytes,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+            self._hits = self._misses = 0
+
+
+_lock = threading.Lock()
+_response_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache:
+    global _response_cache
+    with _lock:
+        if _response_cache is None:
+            from src.config.settings import get_settings
+
+            _response_cache = ResponseCache(get_settings().HTTP_RESPONSE_CACHE_MAX_BYTES)
+        return _response_cache
+
+
+def reset_response_cache() -> None:
+    """Drop the process-wide cache (tests, config reload)."""
+    global _response_cache
+    with _lock:
+        _response_cache = None
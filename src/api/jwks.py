@@ -0,0 +1,291 @@
+"""Cached JWKS key resolution for external IdP RS256 validation.
+
+Fetching the IdP's JWKS on every authenticated request put an IdP
+round-trip (and a blocking HTTP call) on the event loop for each API
+call. JWKSCache keeps the decoded RSA public keys indexed by ``kid``:
+
+- Fresh keys (age < ttl) are served from memory with no I/O.
+- Past ttl, cached keys are still served and a single background
+  refresh is started (stale-while-revalidate).
+- A token with an unknown ``kid`` triggers a refetch — so key rotation
+  is picked up immediately while garbage ``kid`` values cannot hammer
+  the IdP.
+- If the IdP is unreachable, keys up to ``max_stale`` old keep being
+  served (stale-while-error); beyond that, resolution fails closed.
+
+All refreshes are single-flight, and a new fetch starts at most once per
+``min_refresh_interval`` whatever triggered it, so a failing IdP is not
+retried on every request. Key material is never logged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+_logger = logging.getLogger(__name__)
+
+
+class JWKSUnavailableError(Exception):
+    """JWKS could not be fetched and no usable cached keys remain."""
+
+
+# ---------------------------------------------------------------------------
+# Fetch counters
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class JWKSCacheStats:
+    """Point-in-time JWKS cache counters."""
+
+    hits: int
+    fetches: int
+    fetch_errors: int
+    unknown_kid_refetches: int
+
+
+class JWKSCacheCounters:
+    """Process-wide, thread-safe JWKS cache counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._fetches = 0
+        self._fetch_errors = 0
+        self._unknown_kid_refetches = 0
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self._hits += 1
+
+    def record_fetch(self) -> None:
+        with self._lock:
+            self._fetches += 1
+
+    def record_fetch_error(self) -> None:
+        with self._lock:
+            self._fetch_errors += 1
+
+    def record_unknown_kid_refetch(self) -> None:
+        with self._lock:
+            self._unknown_kid_refetches += 1
+
+    def snapshot(self) -> JWKSCacheStats:
+        with self._lock:
+            return JWKSCacheStats(
+                hits=self._hits,
+                fetches=self._fetches,
+                fetch_errors=self._fetch_errors,
+                unknown_kid_refetches=self._unknown_kid_refetches,
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hits = self._fetches = 0
+            self._fetch_errors = self._unknown_kid_refetches = 0
+
+
+jwks_cache_counters = JWKSCacheCounters()
+
+
+# ---------------------------------------------------------------------------
+# Key parsing
+# ---------------------------------------------------------------------------
+
+
+def _parse_jwks(jwks: dict) -> tuple[dict[str, Any], Any | None]:
+    """Decode RSA keys from a JWKS document.
+
+    Returns (keys by kid, first RSA key). The first key is used for
+    tokens without a ``kid`` header, matching the previous behaviour.
+    """
+    from jwt.algorithms import RSAAlgorithm
+
+    by_kid: dict[str, Any] = {}
+    first: Any | None = None
+    for key_data in jwks.get("keys", []):
+        if key_data.get("kty") != "RSA":
+            continue
+        if key_data.get("use") not in (None, "sig"):
+            continue
+        public_key = RSAAlgorithm.from_jwk(key_data)
+        if first is None:
+            first = public_key
+        kid = key_data.get("kid")
+        if kid:
+            by_kid[kid] = public_key
+    return by_kid, first
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+
+class JWKSCache:
+    """In-memory JWKS cache for one IdP endpoint."""
+
+    def __init__(
+        self,
+        jwks_url: str,
+        *,
+        ttl_seconds: float = 300.0,
+        max_stale_seconds: float = 3600.0,
+        min_refresh_interval_seconds: float = 30.0,
+        timeout_seconds: float = 10.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+        counters: JWKSCacheCounters | None = None,
+    ) -> None:
+        self._url = jwks_url
+        self._ttl = ttl_seconds
+        self._max_stale = max_stale_seconds
+        self._min_refresh_interval = min_refresh_interval_seconds
+        self._timeout = timeout_seconds
+        self._transport = transport
+        self._counters = counters or jwks_cache_counters
+        self._keys: dict[str, Any] = {}
+        self._default_key: Any | None = None
+        self._fetched_at: float | None = None
+        self._last_attempt_at: float | None = None
+        self._inflight: asyncio.Task | None = None
+
+    @property
+    def jwks_url(self) -> str:
+        return self._url
+
+    async def get_key(self, kid: str | None) -> Any | None:
+        """Return the public key for ``kid`` (or the default key if None).
+
+        Returns None when the JWKS has no matching key even after a
+        permitted refetch. Raises JWKSUnavailableError when no fresh
+        enough key set can be obtained.
+        """
+        now = time.monotonic()
+        age = None if self._fetched_at is None else now - self._fetched_at
+
+        if age is None or age >= self._max_stale:
+            if not self._refreshing() and not self._may_refetch(now):
+                # The last attempt failed moments ago; don't retry per request.
+                raise JWKSUnavailableError("JWKS unavailable")
+            await self._refresh_or_keep_stale(now)
+        elif age >= self._ttl and not self._refreshing() and self._may_refetch(now):
+            self._start_refresh()
+
+        key = self._lookup(kid)
+        if key is not None:
+            self._counters.record_hit()
+            return key
+
+        if kid is not None and self._may_refetch(time.monotonic()):
+            self._counters.record_unknown_kid_refetch()
+            await self._refresh_or_keep_stale(time.monotonic())
+            return self._lookup(kid)
+        return None
+
+    async def refresh(self) -> None:
+        """Fetch the JWKS now (joins an in-flight refresh if there is one)."""
+        await asyncio.shield(self._start_refresh())
+
+    def _lookup(self, kid: str | None) -> Any | None:
+        if kid is None:
+            return self._default_key
+        return self._keys.get(kid)
+
+    def _refreshing(self) -> bool:
+        return self._inflight is not None and not self._inflight.done()
+
+    def _may_refetch(self, now: float) -> bool:
+        return (
+            self._last_attempt_at is None
+            or now - self._last_attempt_at >= self._min_refresh_interval
+        )
+
+    async def _refresh_or_keep_stale(self, now: float) -> None:
+        """Blocking refresh; on failure fall back to keys within max_stale."""
+        try:
+            await self.refresh()
+        except Exception as exc:
+            if self._fetched_at is not None and now - self._fetched_at < self._max_stale:
+                _logger.warning("JWKS refresh failed; serving cached keys")
+                return
+            raise JWKSUnavailableError("JWKS unavailable") from exc
+
+    def _start_refresh(self) -> asyncio.Task:
+        """Start a refresh unless one is already running on this loop."""
+        loop = asyncio.get_running_loop()
+        task = self._inflight
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(self._fetch())
+            task.add_done_callback(_consume_exception)
+            self._inflight = task
+        return task
+
+    async def _fetch(self) -> None:
+        self._last_attempt_at = time.monotonic()
+        self._counters.record_fetch()
+        try:
+            async with httpx.AsyncClient(
+                timeout=self._timeout, transport=self._transport,
+            ) as client:
+                resp = await client.get(self._url)
+                resp.raise_for_status()
+                jwks = resp.json()
+            keys, default_key = _parse_jwks(jwks)
+        except Exception:
+            self._counters.record_fetch_error()
+            _logger.warning("JWKS fetch failed for %s", self._url, exc_info=True)
+            raise
+        if default_key is None:
+            # Keep the previous key set rather than caching an empty one.
+            _logger.warning("JWKS from %s contains no RSA signing keys", self._url)
+            if self._fetched_at is None:
+                self._fetched_at = time.monotonic()
+            return
+        self._keys = keys
+        self._default_key = default_key
+        self._fetched_at = time.monotonic()
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    """Mark background refresh failures as retrieved (already logged)."""
+    if not task.cancelled():
+        task.exception()
+
+
+# ---------------------------------------------------------------------------
+# Process-wide caches
+# ---------------------------------------------------------------------------
+
+_caches: dict[str, JWKSCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_jwks_cache(jwks_url: str) -> JWKSCache:
+    """Return the process-wide cache for ``jwks_url``, creating it once."""
+    with _caches_lock:
+        cache = _caches.get(jwks_url)
+        if cache is None:
+            from src.config.settings import get_settings
+
+            settings = get_settings()
+            cache = JWKSCache(
+                jwks_url,
+                ttl_seconds=settings.JWKS_CACHE_TTL_SECONDS,
+                max_stale_seconds=settings.JWKS_MAX_STALE_SECONDS,
+                min_refresh_interval_seconds=settings.JWKS_MIN_REFRESH_INTERVAL_SECONDS,
+            )
+            _caches[jwks_url] = cache
+        return cache
+
+
+def reset_jwks_caches() -> None:
+    """Drop all cached key sets (tests, IdP reconfiguration)."""
+    with _caches_lock:
+        _caches.clear()
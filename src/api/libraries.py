@@ -29,7 +29,7 @@ import logging
 from enum import StrEnum
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field, field_validator
 
 from src.api.auth_deps import WorkspaceMember, require_workspace_member
@@ -38,6 +38,13 @@ from src.api.dependencies import (
     get_mapping_library_repo,
     get_scenario_pattern_repo,
 )
+from src.api.http_cache import (
+    REVALIDATE_CACHE_CONTROL,
+    cache_headers,
+    not_modified,
+    not_modified_response,
+    strong_etag,
+)
 from src.models.common import new_uuid7
 from src.repositories.libraries import (
     AssumptionLibraryRepository,
@@ -287,6 +294,42 @@ async def patch_mapping_entry_status(
 # ---------------------------------------------------------------------------
 
 
+# Published versions are append-only snapshots. "latest" moves when a new
+# version is published, so both lists and latest revalidate (no-cache)
+# and are answered 304 while nothing new has been published.
+
+
+def _versions_not_modified(
+    request: Request, response: Response, rows: list,
+) -> Response | None:
+    """304 for an unchanged version list; otherwise set ETag.
+
+    Versions are append-only: (count, newest version id) changes with
+    every publish.
+    """
+    if not rows:
+        return None
+    newest = max(rows, key=lambda r: (r.created_at, r.library_version_id))
+    etag = strong_etag("library-versions", len(rows), newest.library_version_id)
+    headers = cache_headers(cache_control=REVALIDATE_CACHE_CONTROL, etag=etag)
+    if not_modified(request, etag=etag):
+        return not_modified_response(headers)
+    response.headers.update(headers)
+    return None
+
+
+def _version_not_modified(
+    request: Request, response: Response, row,  # noqa: ANN001
+) -> Response | None:
+    """304 when the client already holds this version; otherwise set ETag."""
+    etag = strong_etag("library-version", row.library_version_id)
+    headers = cache_headers(cache_control=REVALIDATE_CACHE_CONTROL, etag=etag)
+    if not_modified(request, etag=etag):
+        return not_modified_response(headers)
+    response.headers.update(headers)
+    return None
+
+
 @router.post(
     "/{workspace_id}/libraries/mapping/versions",
     status_code=201,
@@ -326,10 +369,15 @@ async def publish_mapping_version(
 )
 async def list_mapping_versions(
     workspace_id: UUID,
+    request: Request,
+    response: Response,
     member: WorkspaceMember = Depends(require_workspace_member),
     repo: MappingLibraryRepository = Depends(get_mapping_library_repo),
-) -> list[MappingVersionResponse]:
+) -> list[MappingVersionResponse] | Response:
     rows = await repo.get_versions_by_workspace(workspace_id)
+    cached = _versions_not_modified(request, response, rows)
+    if cached is not None:
+        return cached
     return [_mapping_version_response(r) for r in rows]
 
 
@@ -339,12 +387,17 @@ async def list_mapping_versions(
 )
 async def get_latest_mapping_version(
     workspace_id: UUID,
+    request: Request,
+    response: Response,
     member: WorkspaceMember = Depends(require_workspace_member),
     repo: MappingLibraryRepository = Depends(get_mapping_library_repo),
-) -> MappingVersionResponse:
+) -> MappingVersionResponse | Response:
     row = await repo.get_latest_version(workspace_id)
     if row is None:
         raise HTTPException(status_code=404, detail="No versions found.")
+    cached = _version_not_modified(request, response, row)
+    if cached is not None:
+        return cached
     return _mapping_version_response(row)
 
 
@@ -482,10 +535,15 @@ async def publish_assumption_version(
 )
 async def list_assumption_versions(
     workspace_id: UUID,
+    request: Request,
+    response: Response,
     member: WorkspaceMember = Depends(require_workspace_member),
     repo: AssumptionLibraryRepository = Depends(get_assumption_library_repo),
-) -> list[AssumptionVersionResponse]:
+) -> list[AssumptionVersionResponse] | Response:
     rows = await repo.get_versions_by_workspace(workspace_id)
+    cached = _versions_not_modified(request, response, rows)
+    if cached is not None:
+        return cached
     return [_assumption_version_response(r) for r in rows]
 
 
@@ -495,12 +553,17 @@ async def list_assumption_versions(
 )
 async def get_latest_assumption_version(
     workspace_id: UUID,
+    request: Request,
+    response: Response,
     member: WorkspaceMember = Depends(require_workspace_member),
     repo: AssumptionLibraryRepository = Depends(get_assumption_library_repo),
-) -> AssumptionVersionResponse:
+) -> AssumptionVersionResponse | Response:
     row = await repo.get_latest_version(workspace_id)
     if row is None:
         raise HTTPException(status_code=404, detail="No versions found.")
+    cached = _version_not_modified(request, response, row)
+    if cached is not None:
+        return cached
     return _assumption_version_response(row)
 
 
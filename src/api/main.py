@@ -13,17 +13,21 @@ from sqlalchemy import text
 from src.api.auth import router as auth_router
 from src.api.chat import router as chat_router
 from src.api.compiler import router as compiler_router
+from src.api.compression import CompressionMiddleware
 from src.api.data_quality import router as data_quality_router
 from src.api.depth import router as depth_router
 from src.api.documents import router as documents_router
+from src.api.exports import render_cache_router as export_render_cache_router
 from src.api.exports import router as exports_router
 from src.api.feasibility import router as feasibility_router
 from src.api.governance import router as governance_router
 from src.api.libraries import router as libraries_router
+from src.api.metrics import prometheus_router
 from src.api.metrics import router as metrics_router
 from src.api.models import router as models_router
 from src.api.path_analytics import router as path_analytics_router
 from src.api.portfolio import router as portfolio_router
+from src.api.profiling import router as profiling_router
 from src.api.runs import models_router as engine_models_router
 from src.api.runs import router as engine_ws_router
 from src.api.scenarios import router as scenarios_router
@@ -32,6 +36,8 @@ from src.api.workforce import router as workforce_router
 from src.api.workshop import router as workshop_router
 from src.api.workspaces import router as workspaces_router
 from src.config.settings import Environment, Settings, get_settings, validate_settings_for_env
+from src.observability.instrumentation import registry as instrumentation_registry
+from src.observability.profiling import ProfilingMiddleware
 
 APP_VERSION = "0.1.0"
 
@@ -53,6 +59,7 @@ def _check_startup_config(s: Settings) -> None:
 
 
 _check_startup_config(settings)
+instrumentation_registry.enabled = settings.INSTRUMENTATION_ENABLED
 
 _LOG_NAME_TO_LEVEL: dict[str, int] = {
     "DEBUG": logging.DEBUG,
@@ -99,11 +106,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# --- Profiling middleware (opt-in; not installed unless enabled) ---
+if settings.PROFILING_ENABLED:
+    app.add_middleware(
+        ProfilingMiddleware,
+        interval_seconds=settings.PROFILING_SAMPLE_INTERVAL_MS / 1000,
+    )
+
+# --- Response compression (large JSON payloads: batch/run results) ---
+if settings.RESPONSE_COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.RESPONSE_COMPRESSION_MIN_BYTES,
+    )
+
 
 # --- Routers ---
 # Global routers (not workspace-scoped)
 app.include_router(auth_router)
 app.include_router(engine_models_router)
+app.include_router(export_render_cache_router)
+app.include_router(prometheus_router)
+app.include_router(profiling_router)
 app.include_router(workspaces_router)
 
 # Workspace-scoped routers (all under /v1/workspaces/{workspace_id}/...)
@@ -5,25 +5,38 @@ GET  /v1/workspaces/{workspace_id}/metrics/engagement/{id}     — engagement me
 GET  /v1/workspaces/{workspace_id}/metrics/dashboard           — dashboard (empty)
 POST /v1/workspaces/{workspace_id}/metrics/dashboard           — dashboard (data)
 POST /v1/workspaces/{workspace_id}/metrics/readiness           — readiness check
+GET  /metrics                                                  — Prometheus scrape
 
 S0-4: Workspace-scoped routes.
 Deterministic — no LLM calls.
 """
 
+import hmac
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 from uuid_extensions import uuid7
 
+from src.api.auth_cache import auth_cache_counters
 from src.api.auth_deps import WorkspaceMember, require_workspace_member
 from src.api.dependencies import get_metric_event_repo
+from src.api.http_cache import get_response_cache
+from src.api.jwks import jwks_cache_counters
+from src.config.settings import Environment, get_settings
+from src.engine.run_cache import run_cache_counters
+from src.export.render_cache import render_cache_counters
 from src.observability.dashboard import DashboardService, DashboardSummary
 from src.observability.health import HealthChecker
+from src.observability.instrumentation import CollectedMetric, registry
 from src.observability.metrics import MetricType
 from src.repositories.metrics import MetricEventRepository
 
 router = APIRouter(prefix="/v1/workspaces", tags=["metrics"])
+prometheus_router = APIRouter(tags=["metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
 
 # ---------------------------------------------------------------------------
 # Stateless services (no DB needed)
@@ -223,3 +236,84 @@ def _summary_to_response(summary: DashboardSummary) -> DashboardResponse:
         library_assumptions=summary.library_assumptions,
         library_patterns=summary.library_patterns,
     )
+
+
+# ---------------------------------------------------------------------------
+# Prometheus scrape endpoint
+# ---------------------------------------------------------------------------
+
+
+def _cache_counter_families() -> list[CollectedMetric]:
+    """Expose the process-wide cache counters alongside hot-path metrics."""
+    run = run_cache_counters.snapshot()
+    render = render_cache_counters.snapshot()
+    auth = auth_cache_counters.snapshot()
+    jwks = jwks_cache_counters.snapshot()
+    response = get_response_cache().snapshot()
+    return [
+        CollectedMetric(
+            "impactos_cache_lookups_total", "counter",
+            "Cache lookups by cache and result.",
+            [
+                ({"cache": "run", "result": "hit"}, run.hits),
+                ({"cache": "run", "result": "miss"}, run.misses),
+                ({"cache": "render", "result": "hit"}, render.hits),
+                ({"cache": "render", "result": "miss"}, render.misses),
+                ({"cache": "auth_claims", "result": "hit"}, auth.claims_hits),
+                ({"cache": "auth_claims", "result": "miss"}, auth.claims_misses),
+                ({"cache": "auth_membership", "result": "hit"}, auth.membership_hits),
+                ({"cache": "auth_membership", "result": "miss"}, auth.membership_misses),
+                ({"cache": "jwks", "result": "hit"}, jwks.hits),
+                ({"cache": "http_response", "result": "hit"}, response.hits),
+                ({"cache": "http_response", "result": "miss"}, response.misses),
+            ],
+        ),
+        CollectedMetric(
+            "impactos_jwks_fetches_total", "counter",
+            "JWKS fetches from the IdP, by outcome.",
+            [
+                ({"outcome": "attempt"}, jwks.fetches),
+                ({"outcome": "error"}, jwks.fetch_errors),
+            ],
+        ),
+        CollectedMetric(
+            "impactos_auth_seconds_total", "counter",
+            "Cumulative auth dependency time, by stage.",
+            [
+                ({"stage": "principal"}, auth.principal_seconds),
+                ({"stage": "membership"}, auth.membership_seconds),
+            ],
+        ),
+        CollectedMetric(
+            "impactos_auth_checks_total", "counter",
+            "Auth dependency evaluations, by stage.",
+            [
+                ({"stage": "principal"}, auth.principal_count),
+                ({"stage": "membership"}, auth.membership_count),
+            ],
+        ),
+    ]
+
+
+registry.register_collector(_cache_counter_families)
+
+
+@prometheus_router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics(request: Request) -> PlainTextResponse:
+    """Process metrics in Prometheus text format.
+
+    Requires ``Authorization: Bearer <METRICS_SCRAPE_TOKEN>``. An empty
+    token leaves the endpoint open in dev only; elsewhere it stays closed
+    (startup validation rejects that configuration anyway).
+    """
+    settings = get_settings()
+    token = settings.METRICS_SCRAPE_TOKEN
+    if token:
+        supplied = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        if not hmac.compare_digest(supplied.encode(), token.encode()):
+            raise HTTPException(status_code=401, detail="Missing or invalid token")
+    elif settings.ENVIRONMENT != Environment.DEV:
+        raise HTTPException(status_code=401, detail="Missing or invalid token")
+    return PlainTextResponse(
+        registry.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE,
+    )
@@ -6,6 +6,10 @@ B-15 coefficients are model-linked:
 - sector_codes, VA ratios, import ratios derived from persisted ModelDataRow (Z, x)
 - employment coefficients from EmploymentCoefficientsRow when registered
 - fallback to zero jobs_coeff when no employment coefficients exist for the model
+
+Multiplier tables (Type I/II by sector) are derived from the same
+coefficients, persisted per (model, coefficient hash) and served with a
+strong ETag; requests pinned by coefficients_hash are cache-immutable.
 """
 
 from __future__ import annotations
@@ -16,8 +20,7 @@ import tempfile
 from pathlib import Path
 from uuid import UUID
 
-import numpy as np
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile
 from pydantic import BaseModel, Field
 
 from src.api.auth_deps import WorkspaceMember, require_workspace_member
@@ -25,15 +28,34 @@ from src.api.dependencies import (
     get_employment_coefficients_repo,
     get_model_data_repo,
     get_model_version_repo,
+    get_multiplier_table_repo,
+)
+from src.api.http_cache import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    cache_headers,
+    not_modified,
+    not_modified_response,
+    strong_etag,
 )
+from src.api.runs import ensure_model_loaded
 from src.config.settings import Environment, get_settings
 from src.data.io_loader import validate_extended_model_artifacts
 from src.data.sg_model_adapter import SGImportError, extract_io_model
 from src.db.tables import ModelDataRow, ModelVersionRow
 from src.engine.model_store import ModelStore
+from src.engine.multipliers import MULTIPLIER_TABLE_VERSION
 from src.engine.parity_gate import run_parity_check
-from src.repositories.engine import ModelDataRepository, ModelVersionRepository
+from src.repositories.engine import (
+    ModelDataRepository,
+    ModelVersionRepository,
+    MultiplierTableRepository,
+)
 from src.repositories.workforce import EmploymentCoefficientsRepository
+from src.services.multiplier_tables import (
+    get_or_build_multiplier_table,
+    resolve_model_coefficients,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +109,18 @@ class CoefficientsResponse(BaseModel):
     sector_coefficients: list[SectorCoefficient]
 
 
+class MultiplierTableResponse(BaseModel):
+    model_version_id: str
+    table_version: str
+    model_checksum: str
+    coefficients_hash: str
+    coefficients_source: str
+    content_hash: str
+    sector_codes: list[str]
+    type_i: dict[str, list[float]]
+    type_ii: dict[str, list[float]] | None = None
+
+
 def _row_to_response(
     row: ModelVersionRow,
     model_data: ModelDataRow | None = None,
@@ -155,13 +189,23 @@ async def list_model_versions(
 async def get_model_version(
     workspace_id: UUID,  # noqa: ARG001
     model_version_id: UUID,
+    request: Request,
+    response: Response,
     member: WorkspaceMember = Depends(require_workspace_member),
     repo: ModelVersionRepository = Depends(get_model_version_repo),
     md_repo: ModelDataRepository = Depends(get_model_data_repo),
-) -> ModelVersionResponse:
+) -> ModelVersionResponse | Response:
+    """Model version detail. Immutable: revalidation skips the model data load."""
     row = await repo.get(model_version_id)
     if row is None:
         raise HTTPException(status_code=404, detail="Model version not found")
+    headers = cache_headers(
+        cache_control=IMMUTABLE_CACHE_CONTROL,
+        etag=strong_etag("model-version", row.model_version_id, row.checksum),
+    )
+    if not_modified(request, etag=headers["ETag"]):
+        return not_modified_response(headers)
+    response.headers.update(headers)
     model_data = await md_repo.get(model_version_id)
     return _row_to_response(row, model_data)
 
@@ -171,27 +215,6 @@ async def get_model_version(
 # ---------------------------------------------------------------------------
 
 
-def _compute_va_ratios(z_matrix: list[list[float]], x_vector: list[float]) -> np.ndarray:
-    """Compute value-added ratios from IO model: va_i = 1 - sum(A_col_i).
-
-    Same formula as satellite_coeff_loader._load_io_ratios().
-    """
-    z = np.array(z_matrix, dtype=np.float64)
-    x = np.array(x_vector, dtype=np.float64)
-    x_safe = np.where(x > 0, x, 1.0)
-    a_mat = z / x_safe[np.newaxis, :]
-    va = 1.0 - a_mat.sum(axis=0)
-    return np.clip(va, 0.0, 1.0)
-
-
-def _default_import_ratios(n: int) -> np.ndarray:
-    """Default import ratios when curated data unavailable.
-
-    Matches satellite_coeff_loader.py default (0.15 per sector).
-    """
-    return np.full(n, 0.15, dtype=np.float64)
-
-
 @router.get(
     "/versions/{model_version_id}/coefficients",
     response_model=CoefficientsResponse,
@@ -217,29 +240,15 @@ async def get_coefficients(
             detail="Model data not found for this version",
         )
 
-    sector_codes: list[str] = model_data.sector_codes
-    n = len(sector_codes)
-
-    # 3. Compute VA ratios from persisted IO model
-    va_ratios = _compute_va_ratios(model_data.z_matrix_json, model_data.x_vector_json)
-    import_ratios = _default_import_ratios(n)
-
-    # 4. Load employment coefficients linked to this model version (if any)
+    # 3. Resolve model-linked coefficients: VA ratios from persisted IO
+    #    model, default import ratios, latest employment coefficients
     ec_rows = await ec_repo.get_by_model_version(model_version_id)
-    jobs_by_sector: dict[str, float] = {}
-    source = "model-data"
-
+    resolved = resolve_model_coefficients(model_data, ec_rows)
     if ec_rows:
-        # Use the latest version's coefficients
         latest = ec_rows[0]  # already ordered by created_at desc
-        for coeff in latest.coefficients:
-            code = coeff.get("sector_code", "")
-            jobs = coeff.get("jobs_per_million_sar", 0.0)
-            jobs_by_sector[code] = jobs
-        source = "model-data+employment"
         logger.info(
             "Loaded %d employment coefficients for model %s (ec_id=%s, v%d)",
-            len(jobs_by_sector),
+            len(latest.coefficients),
             model_version_id,
             latest.employment_coefficients_id,
             latest.version,
@@ -251,24 +260,109 @@ async def get_coefficients(
             model_version_id,
         )
 
-    # 5. Build aligned response
+    # 4. Build aligned response
+    coeffs = resolved.coefficients
     coefficients = [
         SectorCoefficient(
             sector_code=code,
-            jobs_coeff=jobs_by_sector.get(code, 0.0),
-            import_ratio=float(import_ratios[i]),
-            va_ratio=float(va_ratios[i]),
+            jobs_coeff=float(coeffs.jobs_coeff[i]),
+            import_ratio=float(coeffs.import_ratio[i]),
+            va_ratio=float(coeffs.va_ratio[i]),
         )
-        for i, code in enumerate(sector_codes)
+        for i, code in enumerate(resolved.sector_codes)
     ]
 
     return CoefficientsResponse(
         model_version_id=str(model_version_id),
-        source=source,
+        source=resolved.source,
         sector_coefficients=coefficients,
     )
 
 
+# ---------------------------------------------------------------------------
+# Precomputed multiplier tables (immutable, ETag-cached)
+# ---------------------------------------------------------------------------
+
+# A table addressed by coefficients_hash never changes: cache it forever,
+# but only in the client (workspace-scoped, authenticated endpoint).
+# Unpinned requests track the model's current coefficients, so clients
+# must revalidate (cheap 304 via If-None-Match).
+
+
+@router.get(
+    "/versions/{model_version_id}/multipliers",
+    response_model=MultiplierTableResponse,
+)
+async def get_multipliers(
+    workspace_id: UUID,  # noqa: ARG001
+    model_version_id: UUID,
+    request: Request,
+    response: Response,
+    coefficients_hash: str | None = Query(default=None),
+    member: WorkspaceMember = Depends(require_workspace_member),
+    mv_repo: ModelVersionRepository = Depends(get_model_version_repo),
+    md_repo: ModelDataRepository = Depends(get_model_data_repo),
+    ec_repo: EmploymentCoefficientsRepository = Depends(get_employment_coefficients_repo),
+    mt_repo: MultiplierTableRepository = Depends(get_multiplier_table_repo),
+) -> MultiplierTableResponse | Response:
+    """Type I/II output, employment, income, import and VA multipliers by sector.
+
+    Computed once per (model checksum, coefficient hash) and persisted.
+    The strong ETag is the table's content hash. Pass the returned
+    coefficients_hash back as a query parameter to get an immutable URL.
+    """
+    mv_row = await mv_repo.get(model_version_id)
+    if mv_row is None:
+        raise HTTPException(status_code=404, detail="Model version not found")
+
+    row = None
+    if coefficients_hash is not None:
+        row = await mt_repo.get_for_model(
+            model_version_id, coefficients_hash, MULTIPLIER_TABLE_VERSION,
+        )
+    if row is None:
+        row = await get_or_build_multiplier_table(
+            model_version_id,
+            md_repo=md_repo, ec_repo=ec_repo, mt_repo=mt_repo,
+            load_model=lambda: ensure_model_loaded(model_version_id, mv_repo, md_repo),
+        )
+    if row is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Model data not found for this version",
+        )
+    if coefficients_hash is not None and row.coefficients_hash != coefficients_hash:
+        raise HTTPException(
+            status_code=404,
+            detail="No multiplier table for the requested coefficients_hash",
+        )
+
+    etag = f'"{row.content_hash}"'
+    headers = cache_headers(
+        cache_control=(
+            IMMUTABLE_CACHE_CONTROL if coefficients_hash is not None
+            else REVALIDATE_CACHE_CONTROL
+        ),
+        etag=etag,
+    )
+    if not_modified(request, etag=etag):
+        return not_modified_response(headers)
+    response.headers.update(headers)
+
+    payload = row.payload
+    return MultiplierTableResponse(
+        model_version_id=str(model_version_id),
+        table_version=row.table_version,
+        model_checksum=row.model_checksum,
+        coefficients_hash=row.coefficients_hash,
+        coefficients_source=payload.get("coefficients_source", "model-data"),
+        content_hash=row.content_hash,
+        sector_codes=payload["sector_codes"],
+        type_i=payload["type_i"],
+        type_ii=payload.get("type_ii"),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Sprint 18: SG Model Import with Parity Gate
 # ---------------------------------------------------------------------------
@@ -25,7 +25,8 @@ from src.api.dependencies import (
     get_result_set_repo,
     get_run_snapshot_repo,
 )
-from src.api.runs import _ensure_model_loaded
+from src.api.fast_json import FastJSONResponse
+from src.api.runs import ensure_model_loaded
 from src.db.tables import PathAnalysisRow
 from src.engine.structural_path import (
     SPAConfigError,
@@ -154,7 +155,7 @@ async def create_path_analysis(
     mv_repo: ModelVersionRepository = Depends(get_model_version_repo),
     md_repo: ModelDataRepository = Depends(get_model_data_repo),
     pa_repo: PathAnalysisRepository = Depends(get_path_analysis_repo),
-) -> PathAnalysisResponse | JSONResponse:
+) -> JSONResponse | FastJSONResponse:
     """Compute structural path analysis for an existing run.
 
     Idempotent: returns 200 with existing analysis if config_hash matches.
@@ -208,7 +209,7 @@ async def create_path_analysis(
 
     # 4. Load model data
     try:
-        loaded = await _ensure_model_loaded(
+        loaded = await ensure_model_loaded(
             snap_row.model_version_id,
             mv_repo,
             md_repo,
@@ -321,7 +322,7 @@ async def create_path_analysis(
         result_checksum=rc,
     )
 
-    return _row_to_response(row)
+    return FastJSONResponse(_row_to_response(row), status_code=201)
 
 
 # ---------------------------------------------------------------------------
@@ -338,7 +339,7 @@ async def get_path_analysis(
     analysis_id: UUID,
     member: WorkspaceMember = Depends(require_workspace_member),
     pa_repo: PathAnalysisRepository = Depends(get_path_analysis_repo),
-) -> PathAnalysisResponse:
+) -> FastJSONResponse:
     """Get a single path analysis by ID (workspace-scoped)."""
     row = await pa_repo.get_for_workspace(analysis_id, workspace_id)
     if row is None:
@@ -349,7 +350,7 @@ async def get_path_analysis(
                 "message": f"Analysis {analysis_id} not found in workspace {workspace_id}.",
             },
         )
-    return _row_to_response(row)
+    return FastJSONResponse(_row_to_response(row))
 
 
 # ---------------------------------------------------------------------------
@@ -21,6 +21,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.api.auth_deps import WorkspaceMember, require_workspace_member
 from src.api.dependencies import (
     get_portfolio_repo,
+    get_read_portfolio_repo,
     get_result_set_repo,
     get_run_snapshot_repo,
 )
@@ -214,9 +215,10 @@ async def create_portfolio(
         ) from exc
 
     # --- 4. Check all run_ids exist in workspace ---
+    snaps_by_id = await snap_repo.get_many(run_uuids)
     snap_rows = []
     for rid in run_uuids:
-        snap_row = await snap_repo.get(rid)
+        snap_row = snaps_by_id.get(rid)
         if snap_row is None or snap_row.workspace_id != workspace_id:
             raise HTTPException(
                 status_code=404,
@@ -243,9 +245,12 @@ async def create_portfolio(
     model_version_id = model_version_ids.pop()
 
     # --- 6. Check both metrics exist for every candidate ---
+    result_sets_by_run = await rs_repo.get_by_runs(
+        run_uuids, metric_types=[raw.objective_metric, raw.cost_metric],
+    )
     candidates: list[CandidateRun] = []
     for rid in run_uuids:
-        result_sets = await rs_repo.get_by_run(rid)
+        result_sets = result_sets_by_run[rid]
         metric_map: dict[str, float] = {}
         for rs in result_sets:
             if rs.metric_type == raw.objective_metric:
@@ -445,7 +450,7 @@ async def get_portfolio(
     workspace_id: UUID,
     portfolio_id: UUID,
     member: WorkspaceMember = Depends(require_workspace_member),
-    pf_repo: PortfolioRepository = Depends(get_portfolio_repo),
+    pf_repo: PortfolioRepository = Depends(get_read_portfolio_repo),
 ) -> PortfolioOptimizationResponse:
     """Get a single portfolio optimization by ID (workspace-scoped)."""
     row = await pf_repo.get_for_workspace(portfolio_id, workspace_id)
@@ -474,7 +479,7 @@ async def list_portfolios(
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
     member: WorkspaceMember = Depends(require_workspace_member),
-    pf_repo: PortfolioRepository = Depends(get_portfolio_repo),
+    pf_repo: PortfolioRepository = Depends(get_read_portfolio_repo),
 ) -> PortfolioListResponse:
     """List portfolio optimizations for a workspace (paginated)."""
     rows, total = await pf_repo.list_for_workspace(
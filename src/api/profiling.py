@@ -0,0 +1,111 @@
+"""Admin profiling endpoints — whole-process samples and stored profiles.
+
+POST /v1/profiling/sample            — sample all threads for N seconds
+GET  /v1/profiling/profiles          — list recent profiles (request + process)
+GET  /v1/profiling/profiles/{id}     — collapsed-stack text (flamegraph input)
+
+Global admin only. Every route returns 404 unless PROFILING_ENABLED;
+per-request profiles come from ProfilingMiddleware (X-Profile: 1).
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel
+
+from src.api.auth_deps import AuthPrincipal, require_global_role
+from src.config.settings import get_settings
+from src.observability.profiling import (
+    ProfileArtifact,
+    ProfilingBusyError,
+    get_profile_store,
+    sample_process,
+)
+
+router = APIRouter(prefix="/v1/profiling", tags=["profiling"])
+
+
+class ProfileResponse(BaseModel):
+    profile_id: str
+    kind: str
+    label: str
+    created_at: float
+    duration_seconds: float
+    sample_count: int
+
+
+class ProfileListResponse(BaseModel):
+    items: list[ProfileResponse]
+
+
+def _require_enabled() -> None:
+    if not get_settings().PROFILING_ENABLED:
+        raise HTTPException(status_code=404, detail="Profiling is disabled")
+
+
+def _to_response(artifact: ProfileArtifact) -> ProfileResponse:
+    return ProfileResponse(
+        profile_id=artifact.profile_id,
+        kind=artifact.kind,
+        label=artifact.label,
+        created_at=artifact.created_at,
+        duration_seconds=artifact.duration_seconds,
+        sample_count=artifact.sample_count,
+    )
+
+
+@router.post("/sample", response_model=ProfileResponse, status_code=201)
+async def sample(
+    seconds: float = Query(default=10.0, gt=0),
+    principal: AuthPrincipal = Depends(require_global_role("admin")),
+) -> ProfileResponse:
+    """Sample the whole process for ``seconds`` (capped by PROFILING_MAX_SECONDS)."""
+    _require_enabled()
+    settings = get_settings()
+    if seconds > settings.PROFILING_MAX_SECONDS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"seconds must be <= {settings.PROFILING_MAX_SECONDS:g}",
+        )
+    try:
+        artifact = await sample_process(
+            seconds,
+            interval_seconds=settings.PROFILING_SAMPLE_INTERVAL_MS / 1000,
+            store=get_profile_store(),
+        )
+    except ProfilingBusyError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    return _to_response(artifact)
+
+
+@router.get("/profiles", response_model=ProfileListResponse)
+async def list_profiles(
+    principal: AuthPrincipal = Depends(require_global_role("admin")),
+) -> ProfileListResponse:
+    """Recent profiles, newest first."""
+    _require_enabled()
+    return ProfileListResponse(
+        items=[_to_response(a) for a in get_profile_store().list()],
+    )
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+async def get_profile(
+    profile_id: str,
+    principal: AuthPrincipal = Depends(require_global_role("admin")),
+) -> PlainTextResponse:
+    """Collapsed stacks (``frame;frame;frame count`` per line)."""
+    _require_enabled()
+    store = get_profile_store()
+    artifact = store.get(profile_id)
+    if artifact is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    try:
+        body = store.read(artifact)
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail="Profile not found") from exc
+    return PlainTextResponse(
+        body,
+        headers={
+            "Content-Disposition": f'attachment; filename="{profile_id}.folded"',
+        },
+    )
@@ -1,6 +1,7 @@
 """FastAPI engine/run endpoints — MVP-3 Sections 6.2.9, 6.2.10.
 
 POST /v1/engine/models                                       — register (global)
+GET  /v1/engine/run-cache/stats                              — run cache counters (global)
 POST /v1/workspaces/{workspace_id}/engine/runs               — single run
 GET  /v1/workspaces/{workspace_id}/engine/runs/{run_id}      — get results
 POST /v1/workspaces/{workspace_id}/engine/batch              — batch runs
@@ -9,6 +10,14 @@ GET  /v1/workspaces/{workspace_id}/engine/batch/{batch_id}   — batch status
 S0-4: Workspace-scoped runs/batch. Model registration stays global.
 Batch status tracking (PENDING → RUNNING → COMPLETED/FAILED).
 
+Run cache: runs whose input fingerprint matches a stored run in the same
+workspace get their own RunSnapshot linked to the stored result sets
+(bypass_cache=true forces a recompute).
+
+Monte Carlo: an optional monte_carlo block samples shocks over approved
+assumption ranges (plus coefficient / A uncertainty) and stores seeded
+percentile bands as mc_cumulative / mc_annual series rows.
+
 S0-1: DB-fallback on ModelStore cache miss (restart survival).
        Checksum verification on rehydrate (Amendment 1).
        Concurrency guard with asyncio.Lock (Amendment 2).
@@ -20,11 +29,17 @@ DB repos persist model metadata, run snapshots, result sets, batches.
 """
 
 import asyncio
+import base64
+import binascii
 import logging
+import secrets
+import time
+from datetime import datetime
+from typing import TypeGuard
 from uuid import UUID
 
 import numpy as np
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field
 
 from src.api.auth_deps import (
@@ -34,17 +49,32 @@ from src.api.auth_deps import (
     require_workspace_member,
 )
 from src.api.dependencies import (
+    get_assumption_repo,
     get_batch_repo,
     get_model_data_repo,
     get_model_version_repo,
+    get_read_batch_repo,
+    get_read_result_set_repo,
+    get_read_run_snapshot_repo,
     get_result_set_repo,
     get_run_snapshot_repo,
 )
+from src.api.fast_json import FastJSONResponse, dumps
+from src.api.http_cache import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    cache_headers,
+    get_response_cache,
+    not_modified,
+    not_modified_response,
+    strong_etag,
+)
 from src.config.settings import get_settings
 from src.data.io_loader import (
     ModelArtifactValidationError,
     validate_extended_model_artifacts,
 )
+from src.db.tables import ResultSetRow, RunSnapshotRow
 from src.engine.batch import (
     BatchRequest,
     BatchRunner,
@@ -52,12 +82,21 @@ from src.engine.batch import (
     SingleRunResult,
 )
 from src.engine.model_store import LoadedModel, ModelStore, compute_model_checksum
+from src.engine.monte_carlo import (
+    DEFAULT_PERCENTILES,
+    MAX_DRAWS,
+    MonteCarloSpec,
+    MonteCarloValidationError,
+    ShockRange,
+)
+from src.engine.run_cache import run_cache_counters
 from src.engine.runseries_delta import RunSeriesValidationError
 from src.engine.satellites import SatelliteCoefficients
 from src.engine.type_ii_validation import TypeIIValidationError
 from src.engine.value_measures_validation import ValueMeasuresValidationError
 from src.models.common import new_uuid7
 from src.models.model_version import ModelVersion
+from src.observability.instrumentation import MODEL_LOAD_SECONDS, PERSIST_SECONDS
 from src.repositories.engine import (
     BatchRepository,
     ModelDataRepository,
@@ -65,6 +104,8 @@ from src.repositories.engine import (
     ResultSetRepository,
     RunSnapshotRepository,
 )
+from src.repositories.governance import AssumptionRepository
+from src.services.run_execution import resolve_cached_runs
 
 _logger = logging.getLogger(__name__)
 
@@ -76,7 +117,7 @@ router = APIRouter(prefix="/v1/workspaces", tags=["engine"])
 
 # ---------------------------------------------------------------------------
 # In-memory LRU cache for synchronous engine access (BatchRunner needs .get())
-# On cache miss, _ensure_model_loaded() rehydrates from DB (S0-1).
+# On cache miss, ensure_model_loaded() rehydrates from DB (S0-1).
 # ---------------------------------------------------------------------------
 
 _model_store = ModelStore()
@@ -121,6 +162,20 @@ class SatelliteCoeffsPayload(BaseModel):
     va_ratio: list[float]
 
 
+class MonteCarloShockAssumption(BaseModel):
+    assumption_id: str
+    sector_codes: list[str] = Field(default_factory=list)  # empty = all sectors
+
+
+class MonteCarloPayload(BaseModel):
+    draws: int = Field(default=1000, ge=1, le=MAX_DRAWS)
+    seed: int | None = Field(default=None, ge=0, lt=2**63)  # None = generated, recorded
+    shock_assumptions: list[MonteCarloShockAssumption] = Field(default_factory=list)
+    coefficient_uncertainty: float = Field(default=0.0, ge=0.0, lt=1.0)
+    a_perturbation: float = Field(default=0.0, ge=0.0, lt=1.0)
+    percentiles: list[float] = Field(default_factory=lambda: list(DEFAULT_PERCENTILES))
+
+
 class RunRequest(BaseModel):
     model_version_id: str
     annual_shocks: dict[str, list[float]]
@@ -128,6 +183,8 @@ class RunRequest(BaseModel):
     satellite_coefficients: SatelliteCoeffsPayload
     deflators: dict[str, float] | None = None
     baseline_run_id: str | None = None  # Sprint 17
+    bypass_cache: bool = False  # audits: always recompute
+    monte_carlo: MonteCarloPayload | None = None
 
 
 class ScenarioPayload(BaseModel):
@@ -137,12 +194,14 @@ class ScenarioPayload(BaseModel):
     deflators: dict[str, float] | None = None
     sensitivity_multipliers: list[float] | None = None
     baseline_run_id: str | None = None  # Sprint 17
+    monte_carlo: MonteCarloPayload | None = None
 
 
 class BatchRunRequest(BaseModel):
     model_version_id: str
     scenarios: list[ScenarioPayload]
     satellite_coefficients: SatelliteCoeffsPayload
+    bypass_cache: bool = False  # audits: always recompute
 
 
 # Confidence class derivation by metric_type (no DB schema change)
@@ -183,6 +242,7 @@ class RunSummary(BaseModel):
 
 class ListRunsResponse(BaseModel):
     runs: list[RunSummary]
+    next_cursor: str | None = None
 
 
 class BatchResponse(BaseModel):
@@ -191,12 +251,19 @@ class BatchResponse(BaseModel):
     results: list[RunResponse]
 
 
+class RunCacheStatsResponse(BaseModel):
+    hits: int
+    misses: int
+    bypassed: int
+    hit_rate: float
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-async def _ensure_model_loaded(
+async def ensure_model_loaded(
     model_version_id: UUID,
     mv_repo: ModelVersionRepository,
     md_repo: ModelDataRepository,
@@ -208,10 +275,14 @@ async def _ensure_model_loaded(
     Amendment 4: Uses cache_prevalidated() to store in ModelStore.
     """
     # Fast path: cache hit (no lock needed)
+    started = time.perf_counter()
     try:
-        return _model_store.get(model_version_id)
+        loaded = _model_store.get(model_version_id)
     except KeyError:
         pass
+    else:
+        MODEL_LOAD_SECONDS.observe(time.perf_counter() - started, source="cache")
+        return loaded
 
     # Cache miss — acquire per-model lock to prevent thundering herd
     async with _global_lock:
@@ -297,6 +368,7 @@ async def _ensure_model_loaded(
         )
         _model_store.cache_prevalidated(loaded)
         _logger.info("Rehydrated model %s from DB into cache", model_version_id)
+        MODEL_LOAD_SECONDS.observe(time.perf_counter() - started, source="db")
         return loaded
 
 
@@ -386,14 +458,72 @@ def _register_model_error_detail(exc: Exception) -> dict[str, str]:
     }
 
 
+async def _resolve_monte_carlo(
+    payload: MonteCarloPayload | None,
+    assumption_repo: AssumptionRepository,
+    workspace_id: UUID,
+) -> MonteCarloSpec | None:
+    """Build a MonteCarloSpec, sampling shocks over approved assumption ranges.
+
+    A missing seed is generated here so the RunSnapshot always records
+    the seed actually used.
+    """
+    if payload is None:
+        return None
+    shock_ranges: list[ShockRange] = []
+    for item in payload.shock_assumptions:
+        row = await assumption_repo.get(UUID(item.assumption_id))
+        if row is None or row.workspace_id not in (None, workspace_id):
+            raise HTTPException(
+                status_code=404,
+                detail={
+                    "reason_code": "MC_ASSUMPTION_NOT_FOUND",
+                    "message": f"Assumption {item.assumption_id} not found.",
+                },
+            )
+        if row.status != "APPROVED" or not row.range_json:
+            raise HTTPException(
+                status_code=422,
+                detail={
+                    "reason_code": "MC_ASSUMPTION_NOT_APPROVED",
+                    "message": (
+                        f"Assumption {item.assumption_id} must be APPROVED with a "
+                        f"sensitivity range to drive Monte Carlo sampling."
+                    ),
+                },
+            )
+        try:
+            shock_ranges.append(ShockRange.from_assumption(
+                value=row.value,
+                range_min=float(row.range_json["min"]),
+                range_max=float(row.range_json["max"]),
+                sector_codes=tuple(item.sector_codes),
+                assumption_id=row.assumption_id,
+            ))
+        except MonteCarloValidationError as exc:
+            raise HTTPException(
+                status_code=422,
+                detail={"reason_code": exc.reason_code, "message": str(exc)},
+            ) from exc
+    return MonteCarloSpec(
+        draws=payload.draws,
+        seed=payload.seed if payload.seed is not None else secrets.randbelow(2**63),
+        shock_ranges=tuple(shock_ranges),
+        coefficient_uncertainty=payload.coefficient_uncertainty,
+        a_perturbation=payload.a_perturbation,
+        percentiles=tuple(payload.percentiles),
+    )
+
+
 def _single_run_to_response(sr: SingleRunResult, *, include_series: bool = False) -> RunResponse:
+    # Engine output is trusted: model_construct skips per-value validation.
     rows = sr.result_sets
     if not include_series:
         rows = [r for r in rows if r.series_kind is None]
-    return RunResponse(
+    return RunResponse.model_construct(
         run_id=str(sr.snapshot.run_id),
         result_sets=[
-            ResultSetResponse(
+            ResultSetResponse.model_construct(
                 result_id=str(rs.result_id),
                 metric_type=rs.metric_type,
                 values=rs.values,
@@ -409,7 +539,7 @@ def _single_run_to_response(sr: SingleRunResult, *, include_series: bool = False
             )
             for rs in rows
         ],
-        snapshot=SnapshotResponse(
+        snapshot=SnapshotResponse.model_construct(
             run_id=str(sr.snapshot.run_id),
             model_version_id=str(sr.snapshot.model_version_id),
         ),
@@ -424,31 +554,60 @@ async def _persist_run_result(
     scenario_spec_id: UUID | None = None,
     scenario_spec_version: int | None = None,
 ) -> None:
-    """Persist a SingleRunResult to DB (snapshot + result sets)."""
+    """Persist a SingleRunResult to DB (snapshot + result sets).
+
+    Cache hits persist only the snapshot, linked to the source run's
+    result sets via result_source_run_id.
+    """
     snap = sr.snapshot
-    await snap_repo.create(
-        run_id=snap.run_id,
-        model_version_id=snap.model_version_id,
-        taxonomy_version_id=snap.taxonomy_version_id,
-        concordance_version_id=snap.concordance_version_id,
-        mapping_library_version_id=snap.mapping_library_version_id,
-        assumption_library_version_id=snap.assumption_library_version_id,
-        prompt_pack_version_id=snap.prompt_pack_version_id,
-        workspace_id=workspace_id,
-        scenario_spec_id=scenario_spec_id,
-        scenario_spec_version=scenario_spec_version,
-    )
-    for rs in sr.result_sets:
-        await rs_repo.create(
-            result_id=rs.result_id,
-            run_id=rs.run_id,
-            metric_type=rs.metric_type,
-            values=rs.values,
+    with PERSIST_SECONDS.time(entity="run_snapshot"):
+        await snap_repo.create(
+            run_id=snap.run_id,
+            model_version_id=snap.model_version_id,
+            taxonomy_version_id=snap.taxonomy_version_id,
+            concordance_version_id=snap.concordance_version_id,
+            mapping_library_version_id=snap.mapping_library_version_id,
+            assumption_library_version_id=snap.assumption_library_version_id,
+            prompt_pack_version_id=snap.prompt_pack_version_id,
             workspace_id=workspace_id,
-            year=rs.year,
-            series_kind=rs.series_kind,
-            baseline_run_id=rs.baseline_run_id,
+            scenario_spec_id=scenario_spec_id,
+            scenario_spec_version=scenario_spec_version,
+            input_fingerprint=sr.input_fingerprint,
+            result_source_run_id=sr.result_source_run_id,
+            monte_carlo_seed=snap.monte_carlo_seed,
+            monte_carlo_draws=snap.monte_carlo_draws,
         )
+    if sr.result_sets:
+        with PERSIST_SECONDS.time(entity="result_sets"):
+            for rs in sr.result_sets:
+                await rs_repo.create(
+                    result_id=rs.result_id,
+                    run_id=rs.run_id,
+                    metric_type=rs.metric_type,
+                    values=rs.values,
+                    sector_breakdowns=rs.sector_breakdowns,
+                    workspace_id=workspace_id,
+                    year=rs.year,
+                    series_kind=rs.series_kind,
+                    baseline_run_id=rs.baseline_run_id,
+                )
+
+
+async def _run_result_to_response(
+    sr: SingleRunResult,
+    snap_repo: RunSnapshotRepository,
+    rs_repo: ResultSetRepository,
+    workspace_id: UUID,
+) -> RunResponse:
+    """Response for a just-persisted run; cache hits read the linked result sets."""
+    if sr.result_source_run_id is None:
+        return _single_run_to_response(sr)
+    resp = await _load_run_response(
+        sr.snapshot.run_id, snap_repo, rs_repo, workspace_id=workspace_id,
+    )
+    if resp is None:  # pragma: no cover — snapshot was persisted just above
+        raise HTTPException(status_code=500, detail="Cached run could not be loaded.")
+    return resp
 
 
 async def _load_run_response(
@@ -465,19 +624,40 @@ async def _load_run_response(
     Sprint 17: include_series=False filters out series rows for backward compat.
     """
     snap_row = await snap_repo.get(run_id)
-    if snap_row is None:
+    if not _snapshot_visible(snap_row, workspace_id):
         return None
-    # Amendment 3: workspace scoping enforcement
+    rs_rows = await rs_repo.get_by_run(run_id)
+    return _build_run_response(snap_row, rs_rows, include_series=include_series)
+
+
+def _snapshot_visible(
+    snap_row: RunSnapshotRow | None, workspace_id: UUID | None,
+) -> TypeGuard[RunSnapshotRow]:
+    """Amendment 3: a snapshot is hidden from other workspaces."""
+    if snap_row is None:
+        return False
     if workspace_id is not None and hasattr(snap_row, "workspace_id"):
         if snap_row.workspace_id is not None and snap_row.workspace_id != workspace_id:
-            return None
-    rs_rows = await rs_repo.get_by_run(run_id)
+            return False
+    return True
+
+
+def _build_run_response(
+    snap_row: RunSnapshotRow,
+    rs_rows: list[ResultSetRow],
+    *,
+    include_series: bool = False,
+) -> RunResponse:
+    """Assemble a RunResponse from a snapshot and its stored result set rows.
+
+    Rows were validated when the run was persisted, so no re-validation.
+    """
     if not include_series:
         rs_rows = [r for r in rs_rows if r.series_kind is None]
-    return RunResponse(
+    return RunResponse.model_construct(
         run_id=str(snap_row.run_id),
         result_sets=[
-            ResultSetResponse(
+            ResultSetResponse.model_construct(
                 result_id=str(r.result_id),
                 metric_type=r.metric_type,
                 values=r.values,
@@ -495,7 +675,7 @@ async def _load_run_response(
             )
             for r in rs_rows
         ],
-        snapshot=SnapshotResponse(
+        snapshot=SnapshotResponse.model_construct(
             run_id=str(snap_row.run_id),
             model_version_id=str(snap_row.model_version_id),
         ),
@@ -569,6 +749,20 @@ async def register_model(
     )
 
 
+@models_router.get("/run-cache/stats", response_model=RunCacheStatsResponse)
+async def get_run_cache_stats(
+    principal: AuthPrincipal = Depends(require_global_role("admin")),
+) -> RunCacheStatsResponse:
+    """Process-wide run result cache hit-rate counters. Admin only."""
+    stats = run_cache_counters.snapshot()
+    return RunCacheStatsResponse(
+        hits=stats.hits,
+        misses=stats.misses,
+        bypassed=stats.bypassed,
+        hit_rate=stats.hit_rate,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Workspace-scoped Endpoints (runs / batch)
 # ---------------------------------------------------------------------------
@@ -583,11 +777,12 @@ async def create_run(
     rs_repo: ResultSetRepository = Depends(get_result_set_repo),
     mv_repo: ModelVersionRepository = Depends(get_model_version_repo),
     md_repo: ModelDataRepository = Depends(get_model_data_repo),
-) -> RunResponse:
-    """Execute a single scenario run."""
+    assumption_repo: AssumptionRepository = Depends(get_assumption_repo),
+) -> Response:
+    """Execute a single scenario run (optionally with Monte Carlo bands)."""
     model_version_id = UUID(body.model_version_id)
     await _enforce_model_provenance(model_version_id, mv_repo)
-    await _ensure_model_loaded(model_version_id, mv_repo, md_repo)
+    await ensure_model_loaded(model_version_id, mv_repo, md_repo)
 
     coeffs = _make_satellite_coefficients(body.satellite_coefficients)
 
@@ -638,6 +833,9 @@ async def create_run(
         deflators=_deflators_to_dict(body.deflators),
         baseline_run_id=baseline_run_id,
         baseline_annual_data=baseline_annual_data,
+        monte_carlo=await _resolve_monte_carlo(
+            body.monte_carlo, assumption_repo, workspace_id,
+        ),
     )
 
     settings = get_settings()
@@ -648,6 +846,11 @@ async def create_run(
         satellite_coefficients=coeffs,
         version_refs=_make_version_refs(),
     )
+    await resolve_cached_runs(
+        runner, request, snap_repo,
+        workspace_id=workspace_id,
+        bypass=body.bypass_cache,
+    )
 
     try:
         result = runner.run(request)
@@ -669,7 +872,7 @@ async def create_run(
                 "measure": exc.measure,
             },
         ) from exc
-    except RunSeriesValidationError as exc:
+    except (RunSeriesValidationError, MonteCarloValidationError) as exc:
         raise HTTPException(
             status_code=422,
             detail={
@@ -682,20 +885,61 @@ async def create_run(
     # Persist to DB (with workspace scoping — Amendment 3)
     await _persist_run_result(sr, snap_repo, rs_repo, workspace_id=workspace_id)
 
-    return _single_run_to_response(sr)
+    return FastJSONResponse(
+        await _run_result_to_response(sr, snap_repo, rs_repo, workspace_id),
+    )
+
+
+def _encode_run_cursor(row: RunSnapshotRow) -> str:
+    raw = f"{row.created_at.isoformat()}|{row.run_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_run_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, run_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(run_id)
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise HTTPException(status_code=422, detail="Invalid cursor.") from exc
 
 
 @router.get("/{workspace_id}/engine/runs", response_model=ListRunsResponse)
 async def list_runs(
     workspace_id: UUID,
+    request: Request,
+    response: Response,
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
     member: WorkspaceMember = Depends(require_workspace_member),
-    snap_repo: RunSnapshotRepository = Depends(get_run_snapshot_repo),
-) -> ListRunsResponse:
-    """List run snapshots for a workspace (newest first, paginated)."""
+    snap_repo: RunSnapshotRepository = Depends(get_read_run_snapshot_repo),
+) -> ListRunsResponse | Response:
+    """List run snapshots for a workspace (newest first, paginated).
+
+    Pass ``next_cursor`` from the previous page as ``cursor`` for keyset
+    pagination; ``offset`` is kept for existing clients. Runs are
+    append-only, so (run count, newest run) versions the listing and
+    If-None-Match polls get a 304 until a run is added.
+    """
+    count, newest = await snap_repo.listing_version(workspace_id)
+    headers = cache_headers(
+        cache_control=REVALIDATE_CACHE_CONTROL,
+        etag=strong_etag("runs", workspace_id, count, newest, request.url.query),
+    )
+    if not_modified(request, etag=headers["ETag"]):
+        return not_modified_response(headers)
+    response.headers.update(headers)
+    cursor_created_at: datetime | None = None
+    cursor_run_id: UUID | None = None
+    if cursor:
+        cursor_created_at, cursor_run_id = _decode_run_cursor(cursor)
     rows = await snap_repo.list_for_workspace(
-        workspace_id, limit=limit, offset=offset,
+        workspace_id,
+        limit=limit,
+        offset=offset,
+        cursor_created_at=cursor_created_at,
+        cursor_run_id=cursor_run_id,
     )
     return ListRunsResponse(
         runs=[
@@ -706,6 +950,7 @@ async def list_runs(
             )
             for row in rows
         ],
+        next_cursor=_encode_run_cursor(rows[-1]) if len(rows) == limit else None,
     )
 
 
@@ -713,23 +958,37 @@ async def list_runs(
 async def get_run_results(
     workspace_id: UUID,
     run_id: UUID,
+    request: Request,
     include_series: bool = Query(default=False),
     member: WorkspaceMember = Depends(require_workspace_member),
-    snap_repo: RunSnapshotRepository = Depends(get_run_snapshot_repo),
-    rs_repo: ResultSetRepository = Depends(get_result_set_repo),
-) -> RunResponse:
+    snap_repo: RunSnapshotRepository = Depends(get_read_run_snapshot_repo),
+    rs_repo: ResultSetRepository = Depends(get_read_result_set_repo),
+) -> Response:
     """Get results for a completed run (workspace-scoped — Amendment 3).
 
     Sprint 17: include_series=true returns annual/peak/delta rows.
+    A run's snapshot and result sets are immutable once persisted: the
+    response carries a strong ETag, If-None-Match revalidation returns
+    304 after only the snapshot lookup, and the serialized body is kept
+    in the process-wide response cache.
     """
-    resp = await _load_run_response(
-        run_id, snap_repo, rs_repo,
-        workspace_id=workspace_id,
-        include_series=include_series,
-    )
-    if resp is None:
+    snap_row = await snap_repo.get(run_id)
+    if not _snapshot_visible(snap_row, workspace_id):
         raise HTTPException(status_code=404, detail=f"Run {run_id} not found.")
-    return resp
+
+    etag = strong_etag("run", run_id, snap_row.result_source_run_id, include_series)
+    headers = cache_headers(cache_control=IMMUTABLE_CACHE_CONTROL, etag=etag)
+    if not_modified(request, etag=etag):
+        return not_modified_response(headers)
+
+    cache = get_response_cache()
+    body = cache.get(etag)
+    if body is None:
+        rs_rows = await rs_repo.get_by_run(run_id)
+        resp = _build_run_response(snap_row, rs_rows, include_series=include_series)
+        body = dumps(resp)
+        cache.put(etag, body)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.post("/{workspace_id}/engine/batch", response_model=BatchResponse)
@@ -742,11 +1001,12 @@ async def create_batch_run(
     batch_repo: BatchRepository = Depends(get_batch_repo),
     mv_repo: ModelVersionRepository = Depends(get_model_version_repo),
     md_repo: ModelDataRepository = Depends(get_model_data_repo),
-) -> BatchResponse:
+    assumption_repo: AssumptionRepository = Depends(get_assumption_repo),
+) -> Response:
     """Execute a batch of scenario runs with status tracking."""
     model_version_id = UUID(body.model_version_id)
     await _enforce_model_provenance(model_version_id, mv_repo)
-    await _ensure_model_loaded(model_version_id, mv_repo, md_repo)
+    await ensure_model_loaded(model_version_id, mv_repo, md_repo)
 
     batch_id = new_uuid7()
 
@@ -807,6 +1067,9 @@ async def create_batch_run(
             sensitivity_multipliers=sp.sensitivity_multipliers,
             baseline_run_id=sp_baseline_run_id,
             baseline_annual_data=sp_baseline_annual_data,
+            monte_carlo=await _resolve_monte_carlo(
+                sp.monte_carlo, assumption_repo, workspace_id,
+            ),
         ))
 
     settings = get_settings()
@@ -819,6 +1082,11 @@ async def create_batch_run(
     )
 
     try:
+        await resolve_cached_runs(
+            runner, request, snap_repo,
+            workspace_id=workspace_id,
+            bypass=body.bypass_cache,
+        )
         batch_result = runner.run(request)
 
         # Persist results
@@ -827,7 +1095,9 @@ async def create_batch_run(
         for sr in batch_result.run_results:
             await _persist_run_result(sr, snap_repo, rs_repo, workspace_id=workspace_id)
             run_ids.append(str(sr.snapshot.run_id))
-            responses.append(_single_run_to_response(sr))
+            responses.append(
+                await _run_result_to_response(sr, snap_repo, rs_repo, workspace_id),
+            )
 
         # Update batch to COMPLETED with run IDs
         batch_row = await batch_repo.get(batch_id)
@@ -836,7 +1106,11 @@ async def create_batch_run(
             batch_row.status = "COMPLETED"
             await batch_repo._session.flush()
 
-        return BatchResponse(batch_id=str(batch_id), status="COMPLETED", results=responses)
+        return FastJSONResponse(
+            BatchResponse.model_construct(
+                batch_id=str(batch_id), status="COMPLETED", results=responses,
+            ),
+        )
 
     except TypeIIValidationError as exc:
         await batch_repo.update_status(batch_id, "FAILED")
@@ -858,7 +1132,7 @@ async def create_batch_run(
                 "measure": exc.measure,
             },
         ) from exc
-    except RunSeriesValidationError as exc:
+    except (RunSeriesValidationError, MonteCarloValidationError) as exc:
         await batch_repo.update_status(batch_id, "FAILED")
         raise HTTPException(
             status_code=422,
@@ -878,10 +1152,10 @@ async def get_batch_status(
     batch_id: UUID,
     include_series: bool = Query(default=False),
     member: WorkspaceMember = Depends(require_workspace_member),
-    snap_repo: RunSnapshotRepository = Depends(get_run_snapshot_repo),
-    rs_repo: ResultSetRepository = Depends(get_result_set_repo),
-    batch_repo: BatchRepository = Depends(get_batch_repo),
-) -> BatchResponse:
+    snap_repo: RunSnapshotRepository = Depends(get_read_run_snapshot_repo),
+    rs_repo: ResultSetRepository = Depends(get_read_result_set_repo),
+    batch_repo: BatchRepository = Depends(get_read_batch_repo),
+) -> Response:
     """Get batch run status and results (workspace-scoped — Amendment 3).
 
     Sprint 17: include_series=true returns annual/peak/delta rows.
@@ -893,18 +1167,23 @@ async def get_batch_status(
     if batch_row.workspace_id is not None and batch_row.workspace_id != workspace_id:
         raise HTTPException(status_code=404, detail=f"Batch {batch_id} not found.")
 
-    responses: list[RunResponse] = []
-    for rid_str in batch_row.run_ids:
-        resp = await _load_run_response(
-            UUID(rid_str), snap_repo, rs_repo,
-            workspace_id=workspace_id,
-            include_series=include_series,
-        )
-        if resp is not None:
-            responses.append(resp)
-
-    return BatchResponse(
-        batch_id=str(batch_id),
-        status=batch_row.status,
-        results=responses,
+    # Constant query count regardless of batch size: one IN query for the
+    # snapshots and one (plus cache-link lookup) for their result sets.
+    run_ids = [UUID(rid_str) for rid_str in batch_row.run_ids]
+    snaps_by_id = await snap_repo.get_many(run_ids)
+    visible = [
+        rid for rid in run_ids if _snapshot_visible(snaps_by_id.get(rid), workspace_id)
+    ]
+    rs_by_run = await rs_repo.get_by_runs(visible)
+    responses = [
+        _build_run_response(snaps_by_id[rid], rs_by_run[rid], include_series=include_series)
+        for rid in visible
+    ]
+
+    return FastJSONResponse(
+        BatchResponse.model_construct(
+            batch_id=str(batch_id),
+            status=batch_row.status,
+            results=responses,
+        ),
     )
@@ -959,18 +959,18 @@ async def run_from_scenario(
     )
     from src.api.runs import (
         _enforce_model_provenance,
-        _ensure_model_loaded,
         _make_satellite_coefficients,
         _make_version_refs,
         _model_store,
         _persist_run_result,
         _single_run_to_response,
+        ensure_model_loaded,
     )
     from src.engine.batch import BatchRequest, BatchRunner, ScenarioInput
 
     model_version_id = row.base_model_version_id
     await _enforce_model_provenance(model_version_id, mv_repo)
-    loaded = await _ensure_model_loaded(model_version_id, mv_repo, md_repo)
+    loaded = await ensure_model_loaded(model_version_id, mv_repo, md_repo)
 
     annual_shocks = _shock_items_to_annual_shocks(
         row.shock_items, loaded.sector_codes,
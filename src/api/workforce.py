@@ -35,6 +35,7 @@ from src.api.dependencies import (
     get_sector_occupation_bridge_repo,
     get_workforce_result_repo,
 )
+from src.api.fast_json import FastJSONResponse
 from src.engine.workforce import compute_workforce_impact
 from src.models.common import new_uuid7
 from src.models.workforce import (
@@ -730,10 +731,10 @@ async def get_workforce_results(
     run_id: UUID,
     member: WorkspaceMember = Depends(require_workspace_member),
     result_repo: WorkforceResultRepository = Depends(get_workforce_result_repo),
-) -> list[WorkforceResultResponse]:
+) -> FastJSONResponse:
     """Get all workforce results for a run."""
     rows = await result_repo.get_by_run(run_id)
-    return [_row_to_response(r) for r in rows]
+    return FastJSONResponse([_row_to_response(r) for r in rows])
 
 
 def _row_to_response(r) -> WorkforceResultResponse:
@@ -4,11 +4,14 @@ POST /{workspace_id}/workshop/sessions              -- create (201 new / 200 ide
 GET  /{workspace_id}/workshop/sessions/{session_id}  -- get by ID
 GET  /{workspace_id}/workshop/sessions               -- paginated list
 POST /{workspace_id}/workshop/preview                -- ephemeral engine preview
+POST /{workspace_id}/workshop/preview/headline       -- incremental headline preview
 POST /{workspace_id}/workshop/sessions/{session_id}/commit  -- commit session
 POST /{workspace_id}/workshop/sessions/{session_id}/export  -- export gate
 
 Workspace-scoped, auth-gated, idempotent by config_hash.
 Preview is ephemeral (no persist). Commit creates a real RunSnapshot.
+Headline preview applies slider deltas to an in-memory baseline
+(WorkshopPreviewEngine) so slider moves skip the full batch engine.
 """
 
 import logging
@@ -32,11 +35,11 @@ from src.api.runs import (
     SatelliteCoeffsPayload,
     _annual_shocks_to_numpy,
     _deflators_to_dict,
-    _ensure_model_loaded,
     _make_satellite_coefficients,
     _make_version_refs,
     _model_store,
     _persist_run_result,
+    ensure_model_loaded,
 )
 from src.config.settings import get_settings
 from src.db.session import get_async_session
@@ -45,6 +48,7 @@ from src.engine.batch import BatchRequest, BatchRunner, ScenarioInput
 from src.engine.runseries_delta import RunSeriesValidationError
 from src.engine.type_ii_validation import TypeIIValidationError
 from src.engine.value_measures_validation import ValueMeasuresValidationError
+from src.engine.workshop_preview import WorkshopPreviewEngine
 from src.engine.workshop_transform import (
     SliderInput,
     WorkshopTransformError,
@@ -71,6 +75,9 @@ _logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/v1/workspaces", tags=["workshop"])
 
+# Per-session preview baselines share the engine's model cache.
+_preview_engine = WorkshopPreviewEngine(_model_store)
+
 
 # ---------------------------------------------------------------------------
 # Relaxed request schemas (bounds checked explicitly in endpoints)
@@ -157,6 +164,58 @@ def _raw_sliders_to_inputs(sliders: list[_SliderItemRaw]) -> list[SliderInput]:
     return [SliderInput(sector_code=s.sector_code, pct_delta=s.pct_delta) for s in sliders]
 
 
+async def _validate_preview_request(
+    workspace_id: UUID,
+    body: PreviewRequest,
+    snap_repo: RunSnapshotRepository,
+    md_repo: ModelDataRepository,
+) -> tuple[UUID, UUID, list[str], list[SliderInput]]:
+    """Validate a preview body.
+
+    Returns (baseline_run_id, model_version_id, sector_codes, sliders).
+    """
+    baseline_run_id = UUID(body.baseline_run_id)
+    snap_row = await snap_repo.get(baseline_run_id)
+    if snap_row is None or snap_row.workspace_id != workspace_id:
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "reason_code": "WORKSHOP_NO_BASELINE",
+                "message": (
+                    f"Baseline run {body.baseline_run_id} not found in workspace {workspace_id}."
+                ),
+            },
+        )
+
+    model_version_id = UUID(body.model_version_id)
+    sector_codes = await _get_sector_codes(model_version_id, md_repo)
+
+    slider_inputs = _raw_sliders_to_inputs(body.sliders)
+    try:
+        validate_sliders(slider_inputs, sector_codes)
+    except WorkshopTransformError as exc:
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "reason_code": exc.reason_code,
+                "message": exc.message,
+            },
+        ) from exc
+
+    try:
+        validate_base_shocks(body.base_shocks, sector_codes)
+    except WorkshopTransformError as exc:
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "reason_code": exc.reason_code,
+                "message": exc.message,
+            },
+        ) from exc
+
+    return baseline_run_id, model_version_id, sector_codes, slider_inputs
+
+
 # ---------------------------------------------------------------------------
 # POST /{workspace_id}/workshop/sessions  (create, idempotent)
 # ---------------------------------------------------------------------------
@@ -349,53 +408,17 @@ async def preview_workshop(
 
     Same engine path as POST /engine/runs but without storing RunSnapshot/ResultSet.
     """
-    # --- 1. Validate baseline ---
-    baseline_run_id = UUID(body.baseline_run_id)
-    snap_row = await snap_repo.get(baseline_run_id)
-    if snap_row is None or snap_row.workspace_id != workspace_id:
-        raise HTTPException(
-            status_code=422,
-            detail={
-                "reason_code": "WORKSHOP_NO_BASELINE",
-                "message": (
-                    f"Baseline run {body.baseline_run_id} not found in workspace {workspace_id}."
-                ),
-            },
-        )
-
-    # --- 2. Get sector_codes and validate ---
-    model_version_id = UUID(body.model_version_id)
-    sector_codes = await _get_sector_codes(model_version_id, md_repo)
-
-    slider_inputs = _raw_sliders_to_inputs(body.sliders)
-    try:
-        validate_sliders(slider_inputs, sector_codes)
-    except WorkshopTransformError as exc:
-        raise HTTPException(
-            status_code=422,
-            detail={
-                "reason_code": exc.reason_code,
-                "message": exc.message,
-            },
-        ) from exc
-
-    try:
-        validate_base_shocks(body.base_shocks, sector_codes)
-    except WorkshopTransformError as exc:
-        raise HTTPException(
-            status_code=422,
-            detail={
-                "reason_code": exc.reason_code,
-                "message": exc.message,
-            },
-        ) from exc
+    # --- 1-2. Validate baseline, sliders and base shocks ---
+    baseline_run_id, model_version_id, sector_codes, slider_inputs = (
+        await _validate_preview_request(workspace_id, body, snap_repo, md_repo)
+    )
 
     # --- 3. Transform ---
     transformed = transform_sliders(body.base_shocks, slider_inputs, sector_codes)
 
     # --- 4. Run engine (ephemeral) ---
     try:
-        await _ensure_model_loaded(model_version_id, mv_repo, md_repo)
+        await ensure_model_loaded(model_version_id, mv_repo, md_repo)
         coeffs = _make_satellite_coefficients(body.satellite_coefficients)
 
         scenario = ScenarioInput(
@@ -454,6 +477,72 @@ async def preview_workshop(
     }
 
 
+# ---------------------------------------------------------------------------
+# POST /{workspace_id}/workshop/preview/headline  (incremental, ephemeral)
+# ---------------------------------------------------------------------------
+
+
+@router.post(
+    "/{workspace_id}/workshop/preview/headline",
+    status_code=200,
+)
+async def preview_workshop_headline(
+    workspace_id: UUID,
+    body: PreviewRequest,
+    member: WorkspaceMember = Depends(require_workspace_member),
+    snap_repo: RunSnapshotRepository = Depends(get_run_snapshot_repo),
+    md_repo: ModelDataRepository = Depends(get_model_data_repo),
+    mv_repo: ModelVersionRepository = Depends(get_model_version_repo),
+) -> dict:
+    """Low-latency headline preview for interactive slider moves.
+
+    Applies slider deltas linearly to an in-memory baseline instead of
+    re-running the batch engine. Totals only -- use /workshop/preview for
+    full result sets; the governed run happens on commit.
+    """
+    baseline_run_id, model_version_id, _, slider_inputs = (
+        await _validate_preview_request(workspace_id, body, snap_repo, md_repo)
+    )
+
+    try:
+        await ensure_model_loaded(model_version_id, mv_repo, md_repo)
+        preview = _preview_engine.preview(
+            model_version_id=model_version_id,
+            baseline_run_id=baseline_run_id,
+            annual_shocks=_annual_shocks_to_numpy(body.base_shocks),
+            sliders=slider_inputs,
+            base_year=body.base_year,
+            coefficients=_make_satellite_coefficients(body.satellite_coefficients),
+            environment=get_settings().ENVIRONMENT.value,
+        )
+    except (TypeIIValidationError, ValueMeasuresValidationError) as exc:
+        raise HTTPException(
+            status_code=422,
+            detail={"reason_code": exc.reason_code, "message": str(exc)},
+        ) from exc
+    except Exception as exc:
+        _logger.exception("Workshop headline preview failure")
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "reason_code": "WORKSHOP_PREVIEW_FAILED",
+                "message": f"Engine preview failed: {exc}",
+            },
+        ) from exc
+
+    return {
+        "preview": True,
+        "headline": preview.headline,
+        "annual_total_output": {
+            str(year): total for year, total in preview.annual_total_output.items()
+        },
+        "peak_year": preview.peak_year,
+        "changed_sectors": preview.changed_sectors,
+        "baseline_cached": preview.baseline_cached,
+        "elapsed_ms": preview.elapsed_ms,
+    }
+
+
 # ---------------------------------------------------------------------------
 # POST /{workspace_id}/workshop/sessions/{session_id}/commit
 # ---------------------------------------------------------------------------
@@ -503,7 +592,7 @@ async def commit_workshop_session(
     # --- 3. Run engine with transformed_shocks_json from session ---
     model_version_id = UUID(body.model_version_id)
     try:
-        await _ensure_model_loaded(model_version_id, mv_repo, md_repo)
+        await ensure_model_loaded(model_version_id, mv_repo, md_repo)
         coeffs = _make_satellite_coefficients(body.satellite_coefficients)
 
         scenario = ScenarioInput(
@@ -11,6 +11,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.api.auth_cache import get_membership_cache
 from src.api.auth_deps import (
     AuthPrincipal,
     WorkspaceMember,
@@ -102,6 +103,7 @@ async def create_workspace(
     )
     session.add(membership)
     await session.flush()
+    await get_membership_cache().invalidate(principal.user_id, ws_id)
 
     return _row_to_response(row)
 
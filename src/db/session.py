@@ -3,16 +3,33 @@
 Provides:
 - Base: DeclarativeBase for all ORM models
 - engine: async engine configured from settings
+- read_engine: engine for read-only traffic (replica, or ``engine``)
 - async_session_factory: session maker bound to engine
 - get_async_session: FastAPI dependency with Unit-of-Work commit/rollback
+- get_read_session: FastAPI dependency for read-only endpoints
+
+Pool size/overflow/timeout/recycle and the asyncpg prepared-statement
+caches come from settings (DB_*). SQLite URLs keep SQLAlchemy's default
+pool and no extra options. Pool checkout wait time and utilization are
+exported on GET /metrics.
 """
 
+import time
 from collections.abc import AsyncGenerator
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
-from src.config.settings import get_settings
+from src.config.settings import Settings, get_settings
+from src.observability.instrumentation import DB_POOL_WAIT_SECONDS, CollectedMetric, registry
 
 
 class Base(DeclarativeBase):
@@ -21,12 +38,63 @@ class Base(DeclarativeBase):
     pass
 
 
+class _InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waits."""
+
+    role = "primary"
+
+    def _do_get(self):  # noqa: ANN202 — SQLAlchemy internal signature
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT_SECONDS.observe(time.perf_counter() - started, role=self.role)
+
+
+def _pool_class(role: str) -> type[_InstrumentedPool]:
+    # A subclass per role: Pool.recreate() rebuilds from the class, so a
+    # per-instance attribute would be lost after engine.dispose().
+    return type(f"_{role.title()}Pool", (_InstrumentedPool,), {"role": role})
+
+
+def engine_options(url: str, settings: Settings, *, role: str = "primary") -> dict[str, Any]:
+    """create_async_engine kwargs for ``url`` derived from settings."""
+    echo = settings.DB_ECHO if settings.DB_ECHO is not None else settings.ENVIRONMENT == "dev"
+    options: dict[str, Any] = {"echo": echo, "pool_pre_ping": True}
+
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        return options
+
+    options.update(
+        poolclass=_pool_class(role),
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    )
+    if parsed.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        }
+    return options
+
+
 _settings = get_settings()
 
 engine = create_async_engine(
     _settings.DATABASE_URL,
-    echo=(_settings.ENVIRONMENT == "dev"),
-    pool_pre_ping=True,
+    **engine_options(_settings.DATABASE_URL, _settings),
+)
+
+read_engine: AsyncEngine = (
+    create_async_engine(
+        _settings.DATABASE_READ_REPLICA_URL,
+        **engine_options(_settings.DATABASE_READ_REPLICA_URL, _settings, role="replica"),
+    )
+    if _settings.DATABASE_READ_REPLICA_URL
+    else engine
 )
 
 async_session_factory = async_sessionmaker(
@@ -35,6 +103,12 @@ async_session_factory = async_sessionmaker(
     expire_on_commit=False,
 )
 
+async_read_session_factory = async_sessionmaker(
+    bind=read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """Yield an async database session with Unit-of-Work semantics.
@@ -50,3 +124,57 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+
+
+async def _get_replica_session() -> AsyncGenerator[AsyncSession, None]:
+    """Yield a session on the read replica. Never commits."""
+    async with async_read_session_factory() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+
+
+# Without a replica, read-only endpoints share the request's primary
+# session (and any dependency override of get_async_session, e.g. tests).
+# Replica reads may lag the primary: only use this for endpoints that
+# tolerate replication delay.
+get_read_session = _get_replica_session if read_engine is not engine else get_async_session
+
+
+# ---------------------------------------------------------------------------
+# Pool metrics
+# ---------------------------------------------------------------------------
+
+
+def _pool_gauges() -> list[CollectedMetric]:
+    engines = {"primary": engine}
+    if read_engine is not engine:
+        engines["replica"] = read_engine
+
+    connections: list[tuple[dict[str, str], float]] = []
+    utilization: list[tuple[dict[str, str], float]] = []
+    for role, eng in engines.items():
+        pool = eng.sync_engine.pool
+        if not isinstance(pool, QueuePool):
+            continue
+        checked_out = pool.checkedout()
+        capacity = pool.size() + max(_settings.DB_MAX_OVERFLOW, 0)
+        connections.append(({"role": role, "state": "checked_out"}, checked_out))
+        connections.append(({"role": role, "state": "idle"}, pool.checkedin()))
+        utilization.append(({"role": role}, checked_out / capacity if capacity else 0.0))
+    return [
+        CollectedMetric(
+            "impactos_db_pool_connections", "gauge",
+            "Pooled DB connections by role and state.",
+            connections,
+        ),
+        CollectedMetric(
+            "impactos_db_pool_utilization", "gauge",
+            "Checked-out connections / (pool size + max overflow).",
+            utilization,
+        ),
+    ]
+
+
+registry.register_collector(_pool_gauges)
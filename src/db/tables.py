@@ -14,6 +14,7 @@ from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     DateTime,
     Float,
@@ -119,10 +120,48 @@ class ModelDataRow(Base):
     storage_format: Mapped[str] = mapped_column(String(50), default="json", nullable=False)
 
 
+class MultiplierTableRow(Base):
+    """Immutable precomputed multiplier table for (model, coefficients).
+
+    One row per (model_version_id, coefficients_hash, table_version);
+    content_hash covers every value and is served as the strong ETag.
+    employment_row_id is the employment_coefficients row the table was
+    built from (NULL without employment data).
+    """
+
+    __tablename__ = "multiplier_tables"
+    __table_args__ = (
+        UniqueConstraint(
+            "model_version_id", "coefficients_hash", "table_version",
+            name="uq_multiplier_table_model_coefficients",
+        ),
+        Index(
+            "ix_multiplier_tables_model_inputs",
+            "model_version_id", "table_version", "employment_row_id",
+        ),
+    )
+
+    multiplier_table_id: Mapped[UUID] = mapped_column(primary_key=True)
+    model_version_id: Mapped[UUID] = mapped_column(
+        ForeignKey("model_versions.model_version_id"), nullable=False,
+    )
+    model_checksum: Mapped[str] = mapped_column(String(100), nullable=False)
+    coefficients_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    table_version: Mapped[str] = mapped_column(String(20), nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    employment_row_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    payload = mapped_column(FlexJSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
 class RunSnapshotRow(Base):
     """Immutable snapshot of all version references at run time."""
 
     __tablename__ = "run_snapshots"
+    __table_args__ = (
+        # Run listing: WHERE workspace_id ORDER BY created_at DESC, run_id DESC
+        Index("ix_run_snapshots_workspace_created", "workspace_id", "created_at", "run_id"),
+    )
 
     run_id: Mapped[UUID] = mapped_column(primary_key=True)
     model_version_id: Mapped[UUID] = mapped_column(nullable=False)
@@ -136,6 +175,13 @@ class RunSnapshotRow(Base):
     scenario_spec_id: Mapped[UUID | None] = mapped_column(nullable=True, index=True)
     scenario_spec_version: Mapped[int | None] = mapped_column(Integer, nullable=True)
     source_checksums = mapped_column(FlexJSON, nullable=False)
+    # Run cache: content fingerprint of engine inputs, and the run whose
+    # stored result sets this snapshot reuses (None = computed itself).
+    input_fingerprint: Mapped[str | None] = mapped_column(String(80), nullable=True, index=True)
+    result_source_run_id: Mapped[UUID | None] = mapped_column(nullable=True)
+    # Monte Carlo: sampling seed and draw count (None = deterministic run)
+    monte_carlo_seed: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    monte_carlo_draws: Mapped[int | None] = mapped_column(Integer, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
 
@@ -149,6 +195,10 @@ class ResultSetRow(Base):
     """
 
     __tablename__ = "result_sets"
+    __table_args__ = (
+        # get_by_run / get_by_run_series: WHERE run_id [AND series_kind] [ORDER BY year]
+        Index("ix_result_sets_run_series_year", "run_id", "series_kind", "year"),
+    )
 
     result_id: Mapped[UUID] = mapped_column(primary_key=True)
     run_id: Mapped[UUID] = mapped_column(nullable=False)
@@ -304,6 +354,9 @@ class AssumptionRow(Base):
     """Operational — status transitions (DRAFT → APPROVED/REJECTED)."""
 
     __tablename__ = "assumptions"
+    __table_args__ = (
+        Index("ix_assumptions_workspace_status", "workspace_id", "status"),
+    )
 
     assumption_id: Mapped[UUID] = mapped_column(primary_key=True)
     type: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -340,6 +393,9 @@ class ClaimRow(Base):
     """Operational — status transitions through governance lifecycle."""
 
     __tablename__ = "claims"
+    __table_args__ = (
+        Index("ix_claims_run_created", "run_id", "created_at", "claim_id"),
+    )
 
     claim_id: Mapped[UUID] = mapped_column(primary_key=True)
     text: Mapped[str] = mapped_column(Text, nullable=False)
@@ -551,6 +607,7 @@ class DepthArtifactRow(Base):
 
     payload stores the serialized typed output (FlexJSON).
     metadata stores LLM audit info (provider, model, generation_mode, etc.).
+    cache_key identifies the step inputs so unchanged re-runs reuse payloads.
     """
 
     __tablename__ = "depth_artifacts"
@@ -566,6 +623,7 @@ class DepthArtifactRow(Base):
     payload = mapped_column(FlexJSON, nullable=False)
     disclosure_tier: Mapped[str] = mapped_column(String(20), nullable=False)
     metadata_json = mapped_column(FlexJSON, nullable=True)
+    cache_key: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
 
@@ -970,6 +1028,8 @@ class PortfolioOptimizationRow(Base):
             "config_hash",
             name="uq_portfolio_optimizations_ws_config",
         ),
+        # Created by migration 016; declared here so SQLite test schemas match.
+        Index("ix_portfolio_optimizations_ws_created", "workspace_id", text("created_at DESC")),
     )
 
     portfolio_id: Mapped[UUID] = mapped_column(primary_key=True)
@@ -1114,6 +1174,14 @@ class ChatSessionRow(Base):
         nullable=False,
     )
     title: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Running summary of turns older than the history window, plus the
+    # (created_at, message_id) keyset position of the last folded message
+    context_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
+    summary_through_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True,
+    )
+    summary_through_message_id: Mapped[UUID | None] = mapped_column(nullable=True)
+    summary_token_usage = mapped_column(FlexJSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False,
     )
@@ -1131,6 +1199,7 @@ class ChatMessageRow(Base):
             "ix_chat_messages_session",
             "session_id",
             "created_at",
+            "message_id",
         ),
     )
 
@@ -4,21 +4,25 @@ Executes multiple scenarios (50+) with optional sensitivity variants,
 produces immutable ResultSet per run, generates RunSnapshot capturing
 all version refs for reproducibility.
 
-Pure deterministic — no LLM calls, no side effects.
+Pure deterministic — no LLM calls, no side effects beyond in-process
+stage timers (impactos_engine_stage_seconds).
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from uuid import UUID
 
 import numpy as np
 
 from src.engine.leontief import LeontiefSolver
 from src.engine.model_store import LoadedModel, ModelStore
+from src.engine.monte_carlo import MonteCarloEngine, MonteCarloSpec, monte_carlo_result_sets
+from src.engine.run_cache import compute_input_fingerprint
 from src.engine.satellites import SatelliteAccounts, SatelliteCoefficients
 from src.engine.value_measures import ValueMeasuresComputer
 from src.engine.value_measures_validation import ValueMeasuresValidationError
 from src.models.common import new_uuid7
 from src.models.run import ResultSet, RunSnapshot
+from src.observability.instrumentation import ENGINE_RUNS_TOTAL, ENGINE_STAGE_SECONDS
 
 
 @dataclass
@@ -35,6 +39,8 @@ class ScenarioInput:
     # Sprint 17: delta series fields
     baseline_run_id: UUID | None = None
     baseline_annual_data: dict[int, dict[str, dict[str, float]]] | None = None
+    # Monte Carlo: percentile bands emitted as mc_* series when set
+    monte_carlo: MonteCarloSpec | None = None
 
 
 @dataclass(frozen=True)
@@ -43,11 +49,17 @@ class SingleRunResult:
 
     Amendment 7: optional quality_assessment_id links to the
     RunQualityAssessment produced by the quality automation pipeline.
+
+    Run cache: when result_source_run_id is set, the run was served from
+    the result sets already stored for that run — result_sets is empty
+    and the snapshot should be persisted as a link to the source run.
     """
 
     snapshot: RunSnapshot
     result_sets: list[ResultSet]
     quality_assessment_id: UUID | None = None
+    input_fingerprint: str | None = None
+    result_source_run_id: UUID | None = None
 
 
 @dataclass(frozen=True)
@@ -59,12 +71,17 @@ class BatchResult:
 
 @dataclass
 class BatchRequest:
-    """Input for a batch run: scenarios + model + coefficients + version refs."""
+    """Input for a batch run: scenarios + model + coefficients + version refs.
+
+    cached_runs maps input fingerprints to runs whose result sets are
+    already stored; matching runs are linked instead of recomputed.
+    """
 
     scenarios: list[ScenarioInput]
     model_version_id: UUID
     satellite_coefficients: SatelliteCoefficients
     version_refs: dict[str, UUID]
+    cached_runs: dict[str, UUID] = field(default_factory=dict)
 
 
 class BatchRunner:
@@ -91,17 +108,82 @@ class BatchRunner:
         for scenario in request.scenarios:
             multipliers = scenario.sensitivity_multipliers or [1.0]
             for multiplier in multipliers:
-                run_result = self._execute_single(
+                fingerprint = self._fingerprint(
                     loaded=loaded,
                     scenario=scenario,
                     multiplier=multiplier,
                     coefficients=request.satellite_coefficients,
-                    version_refs=request.version_refs,
                 )
+                source_run_id = request.cached_runs.get(fingerprint)
+                if source_run_id is not None:
+                    run_result = SingleRunResult(
+                        snapshot=self._build_snapshot(
+                            new_uuid7(), loaded, request.version_refs,
+                            monte_carlo=scenario.monte_carlo,
+                        ),
+                        result_sets=[],
+                        input_fingerprint=fingerprint,
+                        result_source_run_id=source_run_id,
+                    )
+                    ENGINE_RUNS_TOTAL.inc(source="cached")
+                else:
+                    run_result = self._execute_single(
+                        loaded=loaded,
+                        scenario=scenario,
+                        multiplier=multiplier,
+                        coefficients=request.satellite_coefficients,
+                        version_refs=request.version_refs,
+                        input_fingerprint=fingerprint,
+                    )
+                    ENGINE_RUNS_TOTAL.inc(source="computed")
                 results.append(run_result)
 
         return BatchResult(run_results=results)
 
+    def input_fingerprints(self, request: BatchRequest) -> list[str]:
+        """Input fingerprints for every run in the request, in run order.
+
+        Lets callers look up previously stored runs and populate
+        ``request.cached_runs`` before calling run().
+        """
+        loaded = self._store.get(request.model_version_id)
+        return [
+            self._fingerprint(
+                loaded=loaded,
+                scenario=scenario,
+                multiplier=multiplier,
+                coefficients=request.satellite_coefficients,
+            )
+            for scenario in request.scenarios
+            for multiplier in (scenario.sensitivity_multipliers or [1.0])
+        ]
+
+    def _fingerprint(
+        self,
+        *,
+        loaded: LoadedModel,
+        scenario: ScenarioInput,
+        multiplier: float,
+        coefficients: SatelliteCoefficients,
+    ) -> str:
+        return compute_input_fingerprint(
+            model_checksum=loaded.model_version.checksum,
+            annual_shocks=self._scale_shocks(scenario, multiplier),
+            base_year=scenario.base_year,
+            coefficients=coefficients,
+            deflators=scenario.deflators,
+            baseline_run_id=scenario.baseline_run_id,
+            environment=self._environment,
+            monte_carlo=scenario.monte_carlo.canonical() if scenario.monte_carlo else None,
+        )
+
+    @staticmethod
+    def _scale_shocks(scenario: ScenarioInput, multiplier: float) -> dict[int, np.ndarray]:
+        return {
+            year: shock * multiplier
+            for year, shock in scenario.annual_shocks.items()
+        }
+
     def _execute_single(
         self,
         *,
@@ -110,139 +192,145 @@ class BatchRunner:
         multiplier: float,
         coefficients: SatelliteCoefficients,
         version_refs: dict[str, UUID],
+        input_fingerprint: str | None = None,
     ) -> SingleRunResult:
         """Execute a single scenario at a given sensitivity multiplier."""
         run_id = new_uuid7()
         sector_codes = loaded.sector_codes
 
         # Scale shocks by multiplier
-        scaled_shocks: dict[int, np.ndarray] = {
-            year: shock * multiplier
-            for year, shock in scenario.annual_shocks.items()
-        }
+        scaled_shocks = self._scale_shocks(scenario, multiplier)
 
         # Solve phased Leontief
-        phased = self._solver.solve_phased(
-            loaded_model=loaded,
-            annual_shocks=scaled_shocks,
-            base_year=scenario.base_year,
-            deflators=scenario.deflators,
-        )
+        with ENGINE_STAGE_SECONDS.time(stage="phasing"):
+            phased = self._solver.solve_phased(
+                loaded_model=loaded,
+                annual_shocks=scaled_shocks,
+                base_year=scenario.base_year,
+                deflators=scenario.deflators,
+            )
 
         # Compute satellite impacts on cumulative output
-        sat_result = self._satellites.compute(
-            delta_x=phased.cumulative_delta_x,
-            coefficients=coefficients,
-        )
+        with ENGINE_STAGE_SECONDS.time(stage="satellites"):
+            sat_result = self._satellites.compute(
+                delta_x=phased.cumulative_delta_x,
+                coefficients=coefficients,
+            )
 
         # Build result sets
         result_sets: list[ResultSet] = []
 
-        # Total output
-        result_sets.append(ResultSet(
-            run_id=run_id,
-            metric_type="total_output",
-            values=self._vec_to_dict(phased.cumulative_delta_x, sector_codes),
-        ))
-
-        # Direct effect (sum of annual directs)
-        cumulative_direct = np.zeros(loaded.n)
-        cumulative_indirect = np.zeros(loaded.n)
-        for year_result in phased.annual_results.values():
-            cumulative_direct += year_result.delta_x_direct
-            cumulative_indirect += year_result.delta_x_indirect
-
-        result_sets.append(ResultSet(
-            run_id=run_id,
-            metric_type="direct_effect",
-            values=self._vec_to_dict(cumulative_direct, sector_codes),
-        ))
-
-        result_sets.append(ResultSet(
-            run_id=run_id,
-            metric_type="indirect_effect",
-            values=self._vec_to_dict(cumulative_indirect, sector_codes),
-        ))
-
-        # Sprint 17: Emit annual series rows
-        for year in sorted(phased.annual_results):
-            year_result = phased.annual_results[year]
+        with ENGINE_STAGE_SECONDS.time(stage="result_sets"):
+            # Total output
             result_sets.append(ResultSet(
                 run_id=run_id,
                 metric_type="total_output",
-                values=self._vec_to_dict(year_result.delta_x_total, sector_codes),
-                year=year,
-                series_kind="annual",
+                values=self._vec_to_dict(phased.cumulative_delta_x, sector_codes),
             ))
+
+            # Direct effect (sum of annual directs)
+            cumulative_direct = np.zeros(loaded.n)
+            cumulative_indirect = np.zeros(loaded.n)
+            for year_result in phased.annual_results.values():
+                cumulative_direct += year_result.delta_x_direct
+                cumulative_indirect += year_result.delta_x_indirect
+
             result_sets.append(ResultSet(
                 run_id=run_id,
                 metric_type="direct_effect",
-                values=self._vec_to_dict(year_result.delta_x_direct, sector_codes),
-                year=year,
-                series_kind="annual",
+                values=self._vec_to_dict(cumulative_direct, sector_codes),
             ))
+
             result_sets.append(ResultSet(
                 run_id=run_id,
                 metric_type="indirect_effect",
-                values=self._vec_to_dict(year_result.delta_x_indirect, sector_codes),
-                year=year,
-                series_kind="annual",
+                values=self._vec_to_dict(cumulative_indirect, sector_codes),
             ))
 
-        # Sprint 17: Peak-year row
-        result_sets.append(ResultSet(
-            run_id=run_id,
-            metric_type="total_output",
-            values=self._vec_to_dict(phased.peak_delta_x, sector_codes),
-            year=phased.peak_year,
-            series_kind="peak",
-        ))
+            # Sprint 17: Emit annual series rows
+            for year in sorted(phased.annual_results):
+                year_result = phased.annual_results[year]
+                result_sets.append(ResultSet(
+                    run_id=run_id,
+                    metric_type="total_output",
+                    values=self._vec_to_dict(year_result.delta_x_total, sector_codes),
+                    year=year,
+                    series_kind="annual",
+                ))
+                result_sets.append(ResultSet(
+                    run_id=run_id,
+                    metric_type="direct_effect",
+                    values=self._vec_to_dict(year_result.delta_x_direct, sector_codes),
+                    year=year,
+                    series_kind="annual",
+                ))
+                result_sets.append(ResultSet(
+                    run_id=run_id,
+                    metric_type="indirect_effect",
+                    values=self._vec_to_dict(year_result.delta_x_indirect, sector_codes),
+                    year=year,
+                    series_kind="annual",
+                ))
+
+            # Sprint 17: Peak-year row
+            result_sets.append(ResultSet(
+                run_id=run_id,
+                metric_type="total_output",
+                values=self._vec_to_dict(phased.peak_delta_x, sector_codes),
+                year=phased.peak_year,
+                series_kind="peak",
+            ))
 
         # Sprint 17: Delta series (when baseline provided)
         if scenario.baseline_run_id is not None and scenario.baseline_annual_data is not None:
-            from src.engine.runseries_delta import compute_delta_series
-            # Extract scenario annual data from just-emitted annual rows
-            scenario_annual_data: dict[int, dict[str, dict[str, float]]] = {}
-            for rs in result_sets:
-                if rs.series_kind == "annual" and rs.year is not None:
-                    scenario_annual_data.setdefault(rs.year, {})[rs.metric_type] = dict(rs.values)
-
-            delta_data = compute_delta_series(scenario_annual_data, scenario.baseline_annual_data)
-            for year, metrics in sorted(delta_data.items()):
-                for metric_type, values in sorted(metrics.items()):
-                    result_sets.append(ResultSet(
-                        run_id=run_id,
-                        metric_type=metric_type,
-                        values=values,
-                        year=year,
-                        series_kind="delta",
-                        baseline_run_id=scenario.baseline_run_id,
-                    ))
+            with ENGINE_STAGE_SECONDS.time(stage="delta_series"):
+                from src.engine.runseries_delta import compute_delta_series
+                # Extract scenario annual data from just-emitted annual rows
+                scenario_annual_data: dict[int, dict[str, dict[str, float]]] = {}
+                for rs in result_sets:
+                    if rs.series_kind == "annual" and rs.year is not None:
+                        by_metric = scenario_annual_data.setdefault(rs.year, {})
+                        by_metric[rs.metric_type] = dict(rs.values)
+
+                delta_data = compute_delta_series(
+                    scenario_annual_data, scenario.baseline_annual_data,
+                )
+                for year, metrics in sorted(delta_data.items()):
+                    for metric_type, values in sorted(metrics.items()):
+                        result_sets.append(ResultSet(
+                            run_id=run_id,
+                            metric_type=metric_type,
+                            values=values,
+                            year=year,
+                            series_kind="delta",
+                            baseline_run_id=scenario.baseline_run_id,
+                        ))
 
         # Satellite results
-        result_sets.append(ResultSet(
-            run_id=run_id,
-            metric_type="employment",
-            values=self._vec_to_dict(sat_result.delta_jobs, sector_codes),
-        ))
+        with ENGINE_STAGE_SECONDS.time(stage="satellite_result_sets"):
+            result_sets.append(ResultSet(
+                run_id=run_id,
+                metric_type="employment",
+                values=self._vec_to_dict(sat_result.delta_jobs, sector_codes),
+            ))
 
-        result_sets.append(ResultSet(
-            run_id=run_id,
-            metric_type="imports",
-            values=self._vec_to_dict(sat_result.delta_imports, sector_codes),
-        ))
+            result_sets.append(ResultSet(
+                run_id=run_id,
+                metric_type="imports",
+                values=self._vec_to_dict(sat_result.delta_imports, sector_codes),
+            ))
 
-        result_sets.append(ResultSet(
-            run_id=run_id,
-            metric_type="value_added",
-            values=self._vec_to_dict(sat_result.delta_va, sector_codes),
-        ))
+            result_sets.append(ResultSet(
+                run_id=run_id,
+                metric_type="value_added",
+                values=self._vec_to_dict(sat_result.delta_va, sector_codes),
+            ))
 
-        result_sets.append(ResultSet(
-            run_id=run_id,
-            metric_type="domestic_output",
-            values=self._vec_to_dict(sat_result.delta_domestic_output, sector_codes),
-        ))
+            result_sets.append(ResultSet(
+                run_id=run_id,
+                metric_type="domestic_output",
+                values=self._vec_to_dict(sat_result.delta_domestic_output, sector_codes),
+            ))
 
         # Value measures (fail-closed in non-dev: always attempt validation)
         _attempt_vm = (
@@ -250,155 +338,189 @@ class BatchRunner:
             or self._environment in ("staging", "prod")
         )
         if _attempt_vm:
-            try:
-                vm_computer = ValueMeasuresComputer()
-                vm_result = vm_computer.compute(
-                    delta_x=phased.cumulative_delta_x,
-                    sat_result=sat_result,
-                    loaded_model=loaded,
-                    base_year=scenario.base_year,
-                )
-
-                # GDP at basic price (per-sector + aggregate)
-                gdp_basic_vals = self._vec_to_dict(
-                    vm_result.gdp_basic_by_sector, sector_codes,
-                )
-                gdp_basic_vals["_total"] = vm_result.gdp_basic_price
-                result_sets.append(ResultSet(
-                    run_id=run_id,
-                    metric_type="gdp_basic_price",
-                    values=gdp_basic_vals,
-                ))
+            with ENGINE_STAGE_SECONDS.time(stage="value_measures"):
+                try:
+                    vm_computer = ValueMeasuresComputer()
+                    vm_result = vm_computer.compute(
+                        delta_x=phased.cumulative_delta_x,
+                        sat_result=sat_result,
+                        loaded_model=loaded,
+                        base_year=scenario.base_year,
+                    )
+
+                    # GDP at basic price (per-sector + aggregate)
+                    gdp_basic_vals = self._vec_to_dict(
+                        vm_result.gdp_basic_by_sector, sector_codes,
+                    )
+                    gdp_basic_vals["_total"] = vm_result.gdp_basic_price
+                    result_sets.append(ResultSet(
+                        run_id=run_id,
+                        metric_type="gdp_basic_price",
+                        values=gdp_basic_vals,
+                    ))
 
-                # GDP at market price
-                gdp_market_by_sector = (
-                    vm_result.gdp_basic_by_sector
-                    + vm_result.tax_effect_by_sector
-                )
-                gdp_market_vals = self._vec_to_dict(
-                    gdp_market_by_sector, sector_codes,
-                )
-                gdp_market_vals["_total"] = vm_result.gdp_market_price
-                result_sets.append(ResultSet(
-                    run_id=run_id,
-                    metric_type="gdp_market_price",
-                    values=gdp_market_vals,
-                ))
+                    # GDP at market price
+                    gdp_market_by_sector = (
+                        vm_result.gdp_basic_by_sector
+                        + vm_result.tax_effect_by_sector
+                    )
+                    gdp_market_vals = self._vec_to_dict(
+                        gdp_market_by_sector, sector_codes,
+                    )
+                    gdp_market_vals["_total"] = vm_result.gdp_market_price
+                    result_sets.append(ResultSet(
+                        run_id=run_id,
+                        metric_type="gdp_market_price",
+                        values=gdp_market_vals,
+                    ))
 
-                # GDP real (scalar only)
-                result_sets.append(ResultSet(
-                    run_id=run_id,
-                    metric_type="gdp_real",
-                    values={"_total": vm_result.gdp_real},
-                ))
+                    # GDP real (scalar only)
+                    result_sets.append(ResultSet(
+                        run_id=run_id,
+                        metric_type="gdp_real",
+                        values={"_total": vm_result.gdp_real},
+                    ))
 
-                # GDP intensity (scalar only)
-                result_sets.append(ResultSet(
-                    run_id=run_id,
-                    metric_type="gdp_intensity",
-                    values={"_total": vm_result.gdp_intensity},
-                ))
+                    # GDP intensity (scalar only)
+                    result_sets.append(ResultSet(
+                        run_id=run_id,
+                        metric_type="gdp_intensity",
+                        values={"_total": vm_result.gdp_intensity},
+                    ))
 
-                # Balance of trade (per-sector + aggregate)
-                bot_by_sector = (
-                    vm_result.export_effect_by_sector
-                    - sat_result.delta_imports
-                )
-                bot_vals = self._vec_to_dict(bot_by_sector, sector_codes)
-                bot_vals["_total"] = vm_result.balance_of_trade
-                result_sets.append(ResultSet(
-                    run_id=run_id,
-                    metric_type="balance_of_trade",
-                    values=bot_vals,
-                ))
+                    # Balance of trade (per-sector + aggregate)
+                    bot_by_sector = (
+                        vm_result.export_effect_by_sector
+                        - sat_result.delta_imports
+                    )
+                    bot_vals = self._vec_to_dict(bot_by_sector, sector_codes)
+                    bot_vals["_total"] = vm_result.balance_of_trade
+                    result_sets.append(ResultSet(
+                        run_id=run_id,
+                        metric_type="balance_of_trade",
+                        values=bot_vals,
+                    ))
 
-                # Non-oil exports (scalar)
-                result_sets.append(ResultSet(
-                    run_id=run_id,
-                    metric_type="non_oil_exports",
-                    values={"_total": vm_result.non_oil_exports},
-                ))
+                    # Non-oil exports (scalar)
+                    result_sets.append(ResultSet(
+                        run_id=run_id,
+                        metric_type="non_oil_exports",
+                        values={"_total": vm_result.non_oil_exports},
+                    ))
 
-                # Government non-oil revenue (scalar)
-                result_sets.append(ResultSet(
-                    run_id=run_id,
-                    metric_type="government_non_oil_revenue",
-                    values={"_total": vm_result.government_non_oil_revenue},
-                ))
+                    # Government non-oil revenue (scalar)
+                    result_sets.append(ResultSet(
+                        run_id=run_id,
+                        metric_type="government_non_oil_revenue",
+                        values={"_total": vm_result.government_non_oil_revenue},
+                    ))
 
-                # Government revenue/spending ratio (scalar)
-                result_sets.append(ResultSet(
-                    run_id=run_id,
-                    metric_type="government_revenue_spending_ratio",
-                    values={"_total": vm_result.government_revenue_spending_ratio},
-                ))
+                    # Government revenue/spending ratio (scalar)
+                    result_sets.append(ResultSet(
+                        run_id=run_id,
+                        metric_type="government_revenue_spending_ratio",
+                        values={"_total": vm_result.government_revenue_spending_ratio},
+                    ))
 
-            except ValueMeasuresValidationError:
-                if self._environment in ("staging", "prod"):
-                    raise  # fail-closed in non-dev
-                import logging
-                logging.getLogger(__name__).warning(
-                    "Value measures validation failed in dev — "
-                    "continuing without value measures"
-                )
+                except ValueMeasuresValidationError:
+                    if self._environment in ("staging", "prod"):
+                        raise  # fail-closed in non-dev
+                    import logging
+                    logging.getLogger(__name__).warning(
+                        "Value measures validation failed in dev — "
+                        "continuing without value measures"
+                    )
 
         # Type II induced effects (when model has prerequisites)
         if loaded.has_type_ii_prerequisites:
-            from src.engine.type_ii_validation import (
-                TypeIIValidationError,
-                validate_type_ii_prerequisites,
-            )
-            try:
-                validate_type_ii_prerequisites(
-                    n=loaded.n,
-                    x=loaded.x,
-                    compensation_of_employees=loaded.compensation_of_employees_array,
-                    household_consumption_shares=loaded.household_consumption_shares_array,
+            with ENGINE_STAGE_SECONDS.time(stage="type_ii"):
+                from src.engine.type_ii_validation import (
+                    TypeIIValidationError,
+                    validate_type_ii_prerequisites,
                 )
-                # Compute Type II phased solve
-                phased_type_ii = self._solver.solve_phased(
+                try:
+                    validate_type_ii_prerequisites(
+                        n=loaded.n,
+                        x=loaded.x,
+                        compensation_of_employees=loaded.compensation_of_employees_array,
+                        household_consumption_shares=loaded.household_consumption_shares_array,
+                    )
+                    # Compute Type II phased solve
+                    phased_type_ii = self._solver.solve_phased(
+                        loaded_model=loaded,
+                        annual_shocks=scaled_shocks,
+                        base_year=scenario.base_year,
+                        deflators=scenario.deflators,
+                        compensation_of_employees=loaded.compensation_of_employees_array,
+                        household_consumption_shares=loaded.household_consumption_shares_array,
+                    )
+                    # Type II total output
+                    type_ii_vals = self._vec_to_dict(
+                        phased_type_ii.cumulative_delta_x_type_ii, sector_codes,
+                    )
+                    result_sets.append(ResultSet(
+                        run_id=run_id,
+                        metric_type="type_ii_total_output",
+                        values=type_ii_vals,
+                    ))
+                    # Induced effect
+                    induced_vals = self._vec_to_dict(
+                        phased_type_ii.cumulative_delta_x_induced, sector_codes,
+                    )
+                    result_sets.append(ResultSet(
+                        run_id=run_id,
+                        metric_type="induced_effect",
+                        values=induced_vals,
+                    ))
+                    # Type II employment satellite
+                    type_ii_jobs = (
+                        coefficients.jobs_coeff * phased_type_ii.cumulative_delta_x_type_ii
+                    )
+                    result_sets.append(ResultSet(
+                        run_id=run_id,
+                        metric_type="type_ii_employment",
+                        values=self._vec_to_dict(type_ii_jobs, sector_codes),
+                    ))
+                except TypeIIValidationError:
+                    if self._environment in ("staging", "prod"):
+                        raise  # fail-closed in non-dev
+                    import logging
+                    logging.getLogger(__name__).warning(
+                        "Type II validation failed in dev -- continuing with Type I only"
+                    )
+
+        # Monte Carlo confidence bands (seeded, reproducible)
+        if scenario.monte_carlo is not None:
+            with ENGINE_STAGE_SECONDS.time(stage="monte_carlo"):
+                summary = MonteCarloEngine().run(
                     loaded_model=loaded,
                     annual_shocks=scaled_shocks,
-                    base_year=scenario.base_year,
+                    coefficients=coefficients,
+                    spec=scenario.monte_carlo,
                     deflators=scenario.deflators,
-                    compensation_of_employees=loaded.compensation_of_employees_array,
-                    household_consumption_shares=loaded.household_consumption_shares_array,
-                )
-                # Type II total output
-                type_ii_vals = self._vec_to_dict(
-                    phased_type_ii.cumulative_delta_x_type_ii, sector_codes,
-                )
-                result_sets.append(ResultSet(
-                    run_id=run_id,
-                    metric_type="type_ii_total_output",
-                    values=type_ii_vals,
-                ))
-                # Induced effect
-                induced_vals = self._vec_to_dict(
-                    phased_type_ii.cumulative_delta_x_induced, sector_codes,
-                )
-                result_sets.append(ResultSet(
-                    run_id=run_id,
-                    metric_type="induced_effect",
-                    values=induced_vals,
-                ))
-                # Type II employment satellite
-                type_ii_jobs = coefficients.jobs_coeff * phased_type_ii.cumulative_delta_x_type_ii
-                result_sets.append(ResultSet(
-                    run_id=run_id,
-                    metric_type="type_ii_employment",
-                    values=self._vec_to_dict(type_ii_jobs, sector_codes),
-                ))
-            except TypeIIValidationError:
-                if self._environment in ("staging", "prod"):
-                    raise  # fail-closed in non-dev
-                import logging
-                logging.getLogger(__name__).warning(
-                    "Type II validation failed in dev -- continuing with Type I only"
                 )
+                result_sets.extend(monte_carlo_result_sets(run_id, summary, sector_codes))
 
         # Build RunSnapshot
-        snapshot = RunSnapshot(
+        snapshot = self._build_snapshot(
+            run_id, loaded, version_refs, monte_carlo=scenario.monte_carlo,
+        )
+
+        return SingleRunResult(
+            snapshot=snapshot,
+            result_sets=result_sets,
+            input_fingerprint=input_fingerprint,
+        )
+
+    @staticmethod
+    def _build_snapshot(
+        run_id: UUID,
+        loaded: LoadedModel,
+        version_refs: dict[str, UUID],
+        *,
+        monte_carlo: MonteCarloSpec | None = None,
+    ) -> RunSnapshot:
+        return RunSnapshot(
             run_id=run_id,
             model_version_id=loaded.model_version.model_version_id,
             taxonomy_version_id=version_refs["taxonomy_version_id"],
@@ -406,10 +528,10 @@ class BatchRunner:
             mapping_library_version_id=version_refs["mapping_library_version_id"],
             assumption_library_version_id=version_refs["assumption_library_version_id"],
             prompt_pack_version_id=version_refs["prompt_pack_version_id"],
+            monte_carlo_seed=monte_carlo.seed if monte_carlo else None,
+            monte_carlo_draws=monte_carlo.draws if monte_carlo else None,
         )
 
-        return SingleRunResult(snapshot=snapshot, result_sets=result_sets)
-
     @staticmethod
     def _vec_to_dict(vec: np.ndarray, sector_codes: list[str]) -> dict[str, float]:
         """Convert a numpy vector to a sector-code-keyed dict."""
@@ -12,6 +12,7 @@ import numpy as np
 from scipy import linalg as scipy_linalg
 
 from src.engine.model_store import LoadedModel
+from src.engine.solver_backend import BACKEND_DENSE
 
 
 @dataclass(frozen=True)
@@ -40,9 +41,10 @@ class PhasedResult:
 class LeontiefSolver:
     """Deterministic Leontief I-O solver.
 
-    All computations use the cached Leontief inverse B from LoadedModel.
-    Uses B · Δd (matrix-vector product) rather than solving a linear system
-    per shock, since B is already computed and cached per ModelVersion.
+    All computations go through the LoadedModel's cached solver backend.
+    For the dense backend this is B · Δd (matrix-vector product) against
+    the Leontief inverse cached per ModelVersion; large sparse models use
+    a cached sparse LU factorisation or GMRES instead of forming B.
     """
 
     def solve(
@@ -54,7 +56,7 @@ class LeontiefSolver:
         """Compute output effects for a single final-demand shock.
 
         Args:
-            loaded_model: Model with cached B matrix.
+            loaded_model: Model with cached solver backend.
             delta_d: Final demand shock vector (n).
 
         Returns:
@@ -73,10 +75,8 @@ class LeontiefSolver:
             )
             raise ValueError(msg)
 
-        B = loaded_model.B
-
         # Section 7.2: Δx_total = B · Δd
-        delta_x_total = B @ delta_d
+        delta_x_total = loaded_model.solve(delta_d)
 
         # Section 7.3: decomposition
         delta_x_direct = delta_d.copy()
@@ -141,6 +141,21 @@ class LeontiefSolver:
         # Wage coefficients: w_i = comp_i / x_i
         w = comp / loaded_model.x
 
+        if loaded_model.backend.name != BACKEND_DENSE:
+            # Large sparse models: solve the bordered system without forming
+            # the dense (n+1)x(n+1) A*. With y = w · x (household income):
+            #   x = L·Δd + L·h · y,  y = w·L·Δd / (1 - w·L·h),  L = (I-A)^{-1}
+            x_hh = loaded_model.solve(hh_shares)
+            y = float(w @ type_i.delta_x_total) / (1.0 - float(w @ x_hh))
+            type_ii_total = type_i.delta_x_total + x_hh * y
+            return SolveResult(
+                delta_x_total=type_i.delta_x_total,
+                delta_x_direct=type_i.delta_x_direct,
+                delta_x_indirect=type_i.delta_x_indirect,
+                delta_x_type_ii_total=type_ii_total,
+                delta_x_induced=type_ii_total - type_i.delta_x_total,
+            )
+
         # Augmented (n+1)x(n+1) matrix A*
         A = loaded_model.A
         A_star = np.zeros((n + 1, n + 1))
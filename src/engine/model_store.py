@@ -1,7 +1,8 @@
 """ModelVersion management — MVP-3 Sections 7.1, 7.2, 7.6.
 
 Load/store ModelVersion with Z matrix and x vector, compute and cache
-technical coefficients A and Leontief inverse B=(I-A)^-1, validate
+technical coefficients A and a Leontief solver backend (dense inverse
+B=(I-A)^-1, or sparse LU / GMRES for large sparse tables), validate
 productivity conditions.
 
 This is deterministic — no LLM calls, pure functions.
@@ -12,8 +13,14 @@ import json
 from uuid import UUID
 
 import numpy as np
-from scipy import linalg as scipy_linalg
 
+from src.engine.solver_backend import (
+    BACKEND_AUTO,
+    VALID_BACKENDS,
+    LeontiefBackend,
+    build_backend,
+    spectral_radius_bounds,
+)
 from src.models.model_version import ModelVersion
 
 
@@ -59,7 +66,12 @@ def compute_model_checksum(
 class LoadedModel:
     """In-memory representation of a registered I-O model.
 
-    Holds raw data (Z, x) and lazily computes / caches A and B.
+    Holds raw data (Z, x) and lazily computes / caches A, a Leontief
+    solver backend and (on demand) the dense inverse B.
+
+    ``solver_backend`` selects how (I-A)·Δx = Δd is solved: ``dense``
+    (cached B), ``sparse_lu``, ``gmres`` or ``auto`` (sparse LU for large
+    sparse tables, dense otherwise).
     """
 
     def __init__(
@@ -69,14 +81,23 @@ class LoadedModel:
         Z: np.ndarray,
         x: np.ndarray,
         sector_codes: list[str],
+        solver_backend: str = BACKEND_AUTO,
     ) -> None:
+        if solver_backend not in VALID_BACKENDS:
+            msg = (
+                f"unknown solver backend '{solver_backend}'. "
+                f"Expected one of {sorted(VALID_BACKENDS)}."
+            )
+            raise ValueError(msg)
         self._model_version = model_version
         self._Z = Z.copy()
         self._Z.flags.writeable = False
         self._x = x.copy()
         self._x.flags.writeable = False
         self._sector_codes = list(sector_codes)
+        self._solver_backend_name = solver_backend
         self._A: np.ndarray | None = None
+        self._backend: LeontiefBackend | None = None
         self._B: np.ndarray | None = None
 
     @property
@@ -107,6 +128,21 @@ class LoadedModel:
             self._A.flags.writeable = False
         return self._A
 
+    @property
+    def backend(self) -> LeontiefBackend:
+        """Solver backend for (I-A)·Δx = Δd, built once per model."""
+        if self._backend is None:
+            self._backend = build_backend(self.A, self._solver_backend_name)
+        return self._backend
+
+    def solve(self, delta_d: np.ndarray) -> np.ndarray:
+        """Δx = (I-A)^{-1} · Δd for a vector (n) or matrix (n, k) of shocks."""
+        return self.backend.solve(delta_d)
+
+    def solve_transpose(self, weights: np.ndarray) -> np.ndarray:
+        """(I-A)^{-T} · weights: column (n) or columns (n, k) of vᵀ·B rows."""
+        return self.backend.solve_transpose(weights)
+
     @property
     def has_type_ii_prerequisites(self) -> bool:
         """Whether this model has compensation and household share data for Type II."""
@@ -187,19 +223,31 @@ class LoadedModel:
         """Leontief inverse: B = (I - A)^{-1}.
 
         Uses scipy LU-based solver for numerical stability (Section 7.6).
+        With a sparse backend B is formed from the factorisation only when
+        a caller needs it (O(n²) memory); shocks should go through solve().
         Cached per model — same object on repeated access.
         """
         if self._B is None:
-            I_minus_A = np.eye(self.n) - self.A
-            # Solve (I-A) · B = I  ⟹  B = (I-A)^{-1}
-            # Using scipy solve for stability over explicit inversion
-            B = scipy_linalg.solve(I_minus_A, np.eye(self.n))
-            B = np.asarray(B)
+            B = np.asarray(self.backend.inverse())
             B.flags.writeable = False
             self._B = B
         return self._B
 
 
+def _spectral_radius(A: np.ndarray) -> float:
+    """Spectral radius of non-negative A, avoiding eigvals when bounds decide.
+
+    Column/row-sum and Collatz–Wielandt bounds settle the productivity
+    condition for practically every I-O table; a full eigendecomposition
+    is only used when the bounds straddle 1.
+    """
+    estimate = spectral_radius_bounds(A, threshold=1.0)
+    if estimate.upper < 1.0 or estimate.lower >= 1.0:
+        return estimate.value
+    eigenvalues = np.linalg.eigvals(A)
+    return float(np.max(np.abs(eigenvalues)))
+
+
 class ModelStore:
     """In-memory store for I-O model versions.
 
@@ -219,6 +267,7 @@ class ModelStore:
         base_year: int,
         source: str,
         artifact_payload: dict[str, object] | None = None,
+        solver_backend: str = BACKEND_AUTO,
     ) -> ModelVersion:
         """Validate, store, and return an immutable ModelVersion.
 
@@ -259,10 +308,9 @@ class ModelStore:
             msg = "x must have no zero or negative output sectors."
             raise ValueError(msg)
 
-        # Compute A and check spectral radius
+        # Compute A and check spectral radius via Perron–Frobenius bounds
         A = Z / x[np.newaxis, :]
-        eigenvalues = np.linalg.eigvals(A)
-        spectral_radius = float(np.max(np.abs(eigenvalues)))
+        spectral_radius = _spectral_radius(A)
         if spectral_radius >= 1.0:
             msg = (
                 f"spectral radius of A is {spectral_radius:.4f} (must be < 1). "
@@ -300,6 +348,7 @@ class ModelStore:
             Z=Z,
             x=x,
             sector_codes=sector_codes,
+            solver_backend=solver_backend,
         )
         self._models[mv.model_version_id] = loaded
 
@@ -0,0 +1,474 @@
+"""Monte Carlo uncertainty engine — seeded confidence bands for engine runs.
+
+Samples, per draw:
+  - shock magnitudes: one multiplicative factor per ShockRange, uniform
+    over the factor range (typically an approved assumption's
+    [min, max] relative to its value), applied to the range's sectors;
+  - satellite coefficients: independent multiplicative factors
+    U(1 - r, 1 + r) per coefficient and sector;
+  - optionally A: entry-wise multiplicative perturbations U(1 - r, 1 + r)
+    on the non-zero technical coefficients, propagated to first order
+    (Δx ≈ B·ΔA·x) so every draw still uses the model's cached B / LU
+    factors instead of a fresh inversion.
+
+Draws are evaluated in chunks as stacked right-hand sides, so memory is
+bounded by chunk_size · n rather than draws · n. Per-sector draws are not
+kept: each chunk is folded into running moments and a fixed-capacity
+quantile sketch (SectorQuantileSketch). Sector percentiles are exact up
+to SKETCH_CAPACITY draws and approximate beyond; whole-economy totals
+are one scalar per draw and stay exact.
+
+Reproducibility: each sampled component has its own generator spawned
+from one seed (numpy SeedSequence), and every generator is consumed in
+draw order, so results depend only on (seed, draws, inputs) — not on
+chunk_size. The seed is recorded on the RunSnapshot.
+
+Pure deterministic given the seed — no LLM calls, no I/O.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from uuid import UUID
+
+import numpy as np
+
+from src.engine.model_store import LoadedModel
+from src.engine.satellites import SatelliteCoefficients
+from src.models.run import ResultSet
+
+MC_SERIES_CUMULATIVE = "mc_cumulative"
+MC_SERIES_ANNUAL = "mc_annual"
+MC_SERIES_KINDS = frozenset({MC_SERIES_CUMULATIVE, MC_SERIES_ANNUAL})
+
+DEFAULT_PERCENTILES: tuple[float, ...] = (5.0, 50.0, 95.0)
+DEFAULT_CHUNK_SIZE = 512
+MAX_DRAWS = 20_000
+# Items per sketch level; sector percentiles are exact up to this many draws.
+SKETCH_CAPACITY = 2048
+
+# Cumulative metrics summarized per draw (Type I + satellites).
+MC_METRICS: tuple[str, ...] = ("total_output", "employment", "imports", "value_added")
+
+
+class MonteCarloValidationError(Exception):
+    """Raised when a Monte Carlo specification is invalid."""
+
+    def __init__(self, message: str, *, reason_code: str) -> None:
+        super().__init__(message)
+        self.reason_code = reason_code
+
+
+@dataclass(frozen=True)
+class ShockRange:
+    """Uniform multiplicative factor range applied to a set of sectors.
+
+    Empty sector_codes applies the factor to every sector.
+    """
+
+    low: float
+    high: float
+    sector_codes: tuple[str, ...] = ()
+    assumption_id: UUID | None = None
+
+    @classmethod
+    def from_assumption(
+        cls,
+        *,
+        value: float,
+        range_min: float,
+        range_max: float,
+        sector_codes: tuple[str, ...] = (),
+        assumption_id: UUID | None = None,
+    ) -> "ShockRange":
+        """Factor range [min/value, max/value] from an approved assumption."""
+        if value == 0:
+            raise MonteCarloValidationError(
+                f"Assumption {assumption_id} has value 0; cannot derive a relative range.",
+                reason_code="MC_ASSUMPTION_ZERO_VALUE",
+            )
+        low, high = sorted((range_min / value, range_max / value))
+        return cls(low=low, high=high, sector_codes=tuple(sector_codes),
+                   assumption_id=assumption_id)
+
+
+@dataclass(frozen=True)
+class MonteCarloSpec:
+    """Sampling plan for one Monte Carlo run."""
+
+    draws: int
+    seed: int
+    shock_ranges: tuple[ShockRange, ...] = ()
+    coefficient_uncertainty: float = 0.0
+    a_perturbation: float = 0.0
+    percentiles: tuple[float, ...] = DEFAULT_PERCENTILES
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+
+    def canonical(self) -> dict[str, object]:
+        """JSON-safe representation of everything that affects the results.
+
+        chunk_size is excluded: results are invariant to it.
+        """
+        return {
+            "draws": int(self.draws),
+            "seed": int(self.seed),
+            "shock_ranges": [
+                [float(r.low), float(r.high), sorted(r.sector_codes)]
+                for r in self.shock_ranges
+            ],
+            "coefficient_uncertainty": float(self.coefficient_uncertainty),
+            "a_perturbation": float(self.a_perturbation),
+            "percentiles": [float(p) for p in self.percentiles],
+        }
+
+
+@dataclass(frozen=True)
+class MetricBands:
+    """Summary statistics over draws for one metric."""
+
+    total: dict[str, float]
+    by_sector: dict[str, np.ndarray] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class MonteCarloSummary:
+    """Percentile summaries of a Monte Carlo run."""
+
+    draws: int
+    seed: int
+    horizon_year: int
+    cumulative: dict[str, MetricBands]
+    annual_total_output: dict[int, dict[str, float]]
+
+
+def validate_monte_carlo_spec(spec: MonteCarloSpec, sector_codes: list[str]) -> None:
+    """Validate spec bounds and sector references.
+
+    Raises:
+        MonteCarloValidationError: On the first invalid field.
+    """
+    if not 1 <= spec.draws <= MAX_DRAWS:
+        raise MonteCarloValidationError(
+            f"draws must be between 1 and {MAX_DRAWS}, got {spec.draws}.",
+            reason_code="MC_INVALID_DRAWS",
+        )
+    if spec.chunk_size < 1:
+        raise MonteCarloValidationError(
+            f"chunk_size must be positive, got {spec.chunk_size}.",
+            reason_code="MC_INVALID_CHUNK_SIZE",
+        )
+    if not 0.0 <= spec.coefficient_uncertainty < 1.0:
+        raise MonteCarloValidationError(
+            "coefficient_uncertainty must be in [0, 1).",
+            reason_code="MC_INVALID_UNCERTAINTY",
+        )
+    if not 0.0 <= spec.a_perturbation < 1.0:
+        raise MonteCarloValidationError(
+            "a_perturbation must be in [0, 1).",
+            reason_code="MC_INVALID_UNCERTAINTY",
+        )
+    if not spec.percentiles or any(not 0.0 <= p <= 100.0 for p in spec.percentiles):
+        raise MonteCarloValidationError(
+            "percentiles must be a non-empty list of values in [0, 100].",
+            reason_code="MC_INVALID_PERCENTILES",
+        )
+    valid = set(sector_codes)
+    for shock_range in spec.shock_ranges:
+        if shock_range.high < shock_range.low:
+            raise MonteCarloValidationError(
+                f"Shock range high {shock_range.high} is below low {shock_range.low}.",
+                reason_code="MC_INVALID_RANGE",
+            )
+        unknown = sorted(set(shock_range.sector_codes) - valid)
+        if unknown:
+            raise MonteCarloValidationError(
+                f"Shock range references unknown sector codes: {unknown}.",
+                reason_code="MC_UNKNOWN_SECTOR",
+            )
+
+
+def _percentile_key(p: float) -> str:
+    return f"p{p:g}"
+
+
+class MonteCarloEngine:
+    """Chunked, seeded Monte Carlo evaluation on a loaded model."""
+
+    def run(
+        self,
+        *,
+        loaded_model: LoadedModel,
+        annual_shocks: Mapping[int, np.ndarray],
+        coefficients: SatelliteCoefficients,
+        spec: MonteCarloSpec,
+        deflators: Mapping[int, float] | None = None,
+    ) -> MonteCarloSummary:
+        """Sample spec.draws draws and summarize the output distribution.
+
+        Args:
+            loaded_model: Model with cached solver backend.
+            annual_shocks: Year -> nominal shock vector (already scaled by
+                any sensitivity multiplier).
+            coefficients: Point-estimate satellite coefficients.
+            spec: Sampling plan.
+            deflators: Optional year -> deflator, as in solve_phased.
+
+        Raises:
+            MonteCarloValidationError: If the spec is invalid.
+        """
+        sector_codes = loaded_model.sector_codes
+        validate_monte_carlo_spec(spec, sector_codes)
+        if not annual_shocks:
+            raise MonteCarloValidationError(
+                "Monte Carlo requires at least one year of shocks.",
+                reason_code="MC_NO_SHOCKS",
+            )
+
+        n = loaded_model.n
+        deflators = deflators or {}
+        years = sorted(annual_shocks)
+        real = np.stack([
+            np.asarray(annual_shocks[y], dtype=np.float64) / deflators.get(y, 1.0)
+            for y in years
+        ])  # (Y, n)
+
+        index = {code: i for i, code in enumerate(sector_codes)}
+        masks = []
+        for shock_range in spec.shock_ranges:
+            mask = np.zeros(n, dtype=bool)
+            if shock_range.sector_codes:
+                mask[[index[c] for c in shock_range.sector_codes]] = True
+            else:
+                mask[:] = True
+            masks.append(mask)
+
+        base_coeffs = np.stack([
+            np.asarray(coefficients.jobs_coeff, dtype=np.float64),
+            np.asarray(coefficients.import_ratio, dtype=np.float64),
+            np.asarray(coefficients.va_ratio, dtype=np.float64),
+        ])  # (3, n)
+
+        # Nonzero A entries (rows, cols, values) when A is perturbed
+        a_nonzero: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+        if spec.a_perturbation > 0:
+            a_matrix = loaded_model.A
+            a_rows, a_cols = np.nonzero(a_matrix)
+            a_nonzero = (a_rows, a_cols, a_matrix[a_rows, a_cols])
+
+        shock_seq, coeff_seq, a_seq = np.random.SeedSequence(spec.seed).spawn(3)
+        shock_rng = np.random.default_rng(shock_seq)
+        coeff_rng = np.random.default_rng(coeff_seq)
+        a_rng = np.random.default_rng(a_seq)
+
+        sketches = {m: SectorQuantileSketch(n) for m in MC_METRICS}
+        totals = {m: np.empty(spec.draws) for m in MC_METRICS}
+        annual_totals = np.empty((spec.draws, len(years)))
+
+        for start in range(0, spec.draws, spec.chunk_size):
+            c = min(spec.chunk_size, spec.draws - start)
+            rows = slice(start, start + c)
+
+            # Shock factors (c, n); one (c, R) draw keeps chunking invariant
+            factors = np.ones((c, n))
+            u = shock_rng.random(size=(c, len(spec.shock_ranges)))
+            for k, (shock_range, mask) in enumerate(zip(spec.shock_ranges, masks, strict=True)):
+                f = shock_range.low + (shock_range.high - shock_range.low) * u[:, k]
+                factors[:, mask] *= f[:, np.newaxis]
+
+            # Annual Type I outputs: (Y, n, c)
+            x_annual = np.stack([
+                np.asarray(loaded_model.solve((real[k] * factors).T)).reshape(n, c)
+                for k in range(len(years))
+            ])
+
+            if a_nonzero is not None:
+                x_annual = x_annual + self._a_correction(
+                    loaded_model, x_annual, *a_nonzero,
+                    a_rng, spec.a_perturbation,
+                )
+
+            x_cum = x_annual.sum(axis=0).T  # (c, n)
+            annual_totals[rows] = x_annual.sum(axis=1).T
+
+            coeffs = np.broadcast_to(base_coeffs, (c, 3, n))
+            if spec.coefficient_uncertainty > 0:
+                r = spec.coefficient_uncertainty
+                coeffs = coeffs * coeff_rng.uniform(1.0 - r, 1.0 + r, size=(c, 3, n))
+
+            per_sector = {
+                "total_output": x_cum,
+                "employment": coeffs[:, 0, :] * x_cum,
+                "imports": coeffs[:, 1, :] * x_cum,
+                "value_added": coeffs[:, 2, :] * x_cum,
+            }
+            for metric, values in per_sector.items():
+                sketches[metric].add(values)
+                totals[metric][rows] = values.sum(axis=1)
+
+        cumulative = {
+            metric: MetricBands(
+                total=self._bands(totals[metric], spec.percentiles),
+                by_sector=sketches[metric].bands(spec.percentiles),
+            )
+            for metric in MC_METRICS
+        }
+        annual = {
+            year: self._bands(annual_totals[:, k], spec.percentiles)
+            for k, year in enumerate(years)
+        }
+        return MonteCarloSummary(
+            draws=spec.draws,
+            seed=spec.seed,
+            horizon_year=years[-1],
+            cumulative=cumulative,
+            annual_total_output=annual,
+        )
+
+    @staticmethod
+    def _a_correction(
+        loaded_model: LoadedModel,
+        x_annual: np.ndarray,
+        a_rows: np.ndarray,
+        a_cols: np.ndarray,
+        a_vals: np.ndarray,
+        rng: np.random.Generator,
+        r: float,
+    ) -> np.ndarray:
+        """First-order response B·ΔA·x for one ΔA draw per column of x."""
+        n_years, n, c = x_annual.shape
+        rhs = np.zeros((n_years, n, c))
+        for k in range(c):
+            delta_a = a_vals * rng.uniform(-r, r, size=a_vals.shape[0])
+            for y in range(n_years):
+                rhs[y, :, k] = np.bincount(
+                    a_rows, weights=delta_a * x_annual[y, a_cols, k], minlength=n,
+                )
+        return np.stack([
+            np.asarray(loaded_model.solve(rhs[y])).reshape(n, c) for y in range(n_years)
+        ])
+
+    @staticmethod
+    def _bands(values: np.ndarray, percentiles: tuple[float, ...]) -> dict[str, float]:
+        bands = {"mean": float(np.mean(values)), "std": float(np.std(values))}
+        for p, v in zip(percentiles, np.percentile(values, percentiles), strict=True):
+            bands[_percentile_key(p)] = float(v)
+        return bands
+
+
+class SectorQuantileSketch:
+    """Streaming per-sector mean/std and percentiles over (draws, n) chunks.
+
+    Moments are merged per chunk (Chan et al.). Percentiles come from a
+    deterministic KLL-style compactor: level h holds items of weight 2^h;
+    whenever a level exceeds ``capacity`` items, its oldest ``capacity``
+    items are sorted per sector and every other one (alternating offset)
+    moves up a level. Compaction depends only on arrival order, so
+    results do not depend on how draws are chunked. Memory is
+    O(capacity · log(draws / capacity) · n).
+    """
+
+    def __init__(self, n: int, capacity: int = SKETCH_CAPACITY) -> None:
+        if capacity < 2 or capacity % 2:
+            raise ValueError(f"capacity must be an even number >= 2, got {capacity}.")
+        self._n = n
+        self._capacity = capacity
+        self._count = 0
+        self._mean = np.zeros(n)
+        self._m2 = np.zeros(n)
+        self._levels: list[np.ndarray] = [np.empty((0, n))]
+        self._compactions: list[int] = [0]
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def retained(self) -> int:
+        """Items held per sector across all levels."""
+        return sum(level.shape[0] for level in self._levels)
+
+    def add(self, values: np.ndarray) -> None:
+        """Fold a (c, n) chunk of draws into the sketch."""
+        chunk = np.asarray(values, dtype=np.float64).reshape(-1, self._n)
+        c = chunk.shape[0]
+        if c == 0:
+            return
+        chunk_mean = chunk.mean(axis=0)
+        chunk_m2 = ((chunk - chunk_mean) ** 2).sum(axis=0)
+        total = self._count + c
+        delta = chunk_mean - self._mean
+        self._mean = self._mean + delta * (c / total)
+        self._m2 = self._m2 + chunk_m2 + delta**2 * (self._count * c / total)
+        self._count = total
+
+        self._levels[0] = np.concatenate([self._levels[0], chunk])
+        self._compact()
+
+    def _compact(self) -> None:
+        h = 0
+        while h < len(self._levels):
+            while self._levels[h].shape[0] > self._capacity:
+                head = np.sort(self._levels[h][: self._capacity], axis=0)
+                self._levels[h] = self._levels[h][self._capacity:]
+                offset = self._compactions[h] % 2
+                self._compactions[h] += 1
+                if h + 1 == len(self._levels):
+                    self._levels.append(np.empty((0, self._n)))
+                    self._compactions.append(0)
+                self._levels[h + 1] = np.concatenate([self._levels[h + 1], head[offset::2]])
+            h += 1
+
+    def bands(self, percentiles: tuple[float, ...]) -> dict[str, np.ndarray]:
+        """mean, std and p<k> per sector (numpy 'linear' percentiles)."""
+        bands = {
+            "mean": self._mean.copy(),
+            "std": np.sqrt(self._m2 / self._count) if self._count else np.zeros(self._n),
+        }
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([
+            np.full(level.shape[0], 2.0**h) for h, level in enumerate(self._levels)
+        ])
+        order = np.argsort(items, axis=0, kind="stable")
+        sorted_items = np.take_along_axis(items, order, axis=0)
+        cum = np.cumsum(weights[order], axis=0)
+        # Centre rank of each item; unit weights give 0..N-1, i.e. exact
+        # np.percentile(..., method="linear") while nothing was compacted.
+        positions = cum - (weights[order] + 1.0) / 2.0
+        for p in percentiles:
+            rank = p / 100.0 * (self._count - 1)
+            bands[_percentile_key(p)] = np.array([
+                np.interp(rank, positions[:, j], sorted_items[:, j]) for j in range(self._n)
+            ])
+        return bands
+
+
+def monte_carlo_result_sets(
+    run_id: UUID, summary: MonteCarloSummary, sector_codes: list[str],
+) -> list[ResultSet]:
+    """ResultSet rows for a Monte Carlo summary.
+
+    mc_cumulative rows hold bands of the cumulative metric through
+    horizon_year (values = totals, sector_breakdowns = per-sector bands);
+    mc_annual rows hold total_output bands for each year.
+    """
+    result_sets: list[ResultSet] = []
+    for metric, bands in summary.cumulative.items():
+        result_sets.append(ResultSet(
+            run_id=run_id,
+            metric_type=metric,
+            values=bands.total,
+            sector_breakdowns={
+                stat: {code: float(vec[i]) for i, code in enumerate(sector_codes)}
+                for stat, vec in bands.by_sector.items()
+            },
+            year=summary.horizon_year,
+            series_kind=MC_SERIES_CUMULATIVE,
+        ))
+    for year, year_totals in sorted(summary.annual_total_output.items()):
+        result_sets.append(ResultSet(
+            run_id=run_id,
+            metric_type="total_output",
+            values=year_totals,
+            year=year,
+            series_kind=MC_SERIES_ANNUAL,
+        ))
+    return result_sets
@@ -0,0 +1,180 @@
+"""Precomputed sector multiplier tables — column reductions of B and B*.
+
+Every multiplier quoted to users (API, copilot) is a weighted column
+sum of the Leontief inverse:
+
+    m_v[j] = v · B[:, j]
+
+with v = 1 (output), jobs_coeff (employment), w = compensation/x
+(income), import_ratio (imports) or va_ratio (value added). Type II
+multipliers use the household-closed columns
+
+    B*[:n, j] = B[:, j] + L·h · (w · B[:, j]) / (1 - w·L·h)
+
+so m*_v = v·B + (v·L·h) · (w·B) / (1 - w·L·h), the same bordered
+formulation LeontiefSolver.solve_type_ii uses on sparse backends.
+
+A table depends only on the model (checksum) and the satellite
+coefficient vectors, so it is computed once per (model checksum,
+coefficient hash) and persisted; its content hash doubles as a strong
+ETag.
+
+Pure deterministic — no LLM calls, no I/O.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.engine.model_store import LoadedModel
+from src.engine.run_cache import hash_array_into, hash_satellite_coefficients
+from src.engine.satellites import SatelliteCoefficients
+from src.engine.type_ii_validation import (
+    TypeIIValidationError,
+    validate_type_ii_prerequisites,
+)
+
+# Bump whenever the table layout or multiplier definitions change —
+# persisted tables from an older version are recomputed, not reused.
+MULTIPLIER_TABLE_VERSION = "1.0.0"
+
+MULTIPLIER_KINDS = ("output", "employment", "income", "imports", "value_added")
+
+
+@dataclass(frozen=True)
+class MultiplierTable:
+    """Type I (and, when available, Type II) multipliers by sector."""
+
+    model_checksum: str
+    coefficients_hash: str
+    sector_codes: list[str]
+    type_i: dict[str, np.ndarray]
+    type_ii: dict[str, np.ndarray] | None
+    content_hash: str
+    table_version: str = MULTIPLIER_TABLE_VERSION
+
+    def to_payload(self) -> dict[str, object]:
+        """JSON-serializable form for persistence and API responses."""
+        return {
+            "table_version": self.table_version,
+            "model_checksum": self.model_checksum,
+            "coefficients_hash": self.coefficients_hash,
+            "sector_codes": list(self.sector_codes),
+            "type_i": {k: v.tolist() for k, v in self.type_i.items()},
+            "type_ii": (
+                {k: v.tolist() for k, v in self.type_ii.items()}
+                if self.type_ii is not None else None
+            ),
+        }
+
+
+def household_closure_terms(
+    loaded: LoadedModel,
+) -> tuple[np.ndarray, np.ndarray, float] | None:
+    """Household closure terms (L·h, w, 1 - w·L·h), or None if unavailable.
+
+    Same bordered formulation as LeontiefSolver.solve_type_ii on sparse
+    backends: x_II = x_I + L·h · (w·x_I) / (1 - w·L·h).
+    """
+    comp = loaded.compensation_of_employees_array
+    hh = loaded.household_consumption_shares_array
+    if not loaded.has_type_ii_prerequisites or comp is None or hh is None:
+        return None
+    try:
+        validate_type_ii_prerequisites(
+            n=loaded.n,
+            x=loaded.x,
+            compensation_of_employees=comp,
+            household_consumption_shares=hh,
+        )
+    except TypeIIValidationError:
+        return None
+    x_hh = loaded.solve(hh)
+    w = comp / loaded.x
+    return x_hh, w, 1.0 - float(w @ x_hh)
+
+
+def _weights(
+    loaded: LoadedModel, coefficients: SatelliteCoefficients,
+) -> dict[str, np.ndarray]:
+    """Row weights v per multiplier kind; income only with compensation data."""
+    weights = {
+        "output": np.ones(loaded.n),
+        "employment": np.asarray(coefficients.jobs_coeff, dtype=np.float64),
+        "imports": np.asarray(coefficients.import_ratio, dtype=np.float64),
+        "value_added": np.asarray(coefficients.va_ratio, dtype=np.float64),
+    }
+    comp = loaded.compensation_of_employees_array
+    if comp is not None and comp.shape == (loaded.n,):
+        weights["income"] = comp / loaded.x
+    return {k: weights[k] for k in MULTIPLIER_KINDS if k in weights}
+
+
+def _content_hash(
+    model_checksum: str,
+    coefficients_hash: str,
+    sector_codes: list[str],
+    type_i: dict[str, np.ndarray],
+    type_ii: dict[str, np.ndarray] | None,
+) -> str:
+    hasher = hashlib.sha256()
+    hasher.update(
+        f"{MULTIPLIER_TABLE_VERSION};{model_checksum};{coefficients_hash};".encode()
+    )
+    hasher.update("|".join(sector_codes).encode())
+    for label, table in (("type_i", type_i), ("type_ii", type_ii or {})):
+        for kind in sorted(table):
+            hasher.update(f";{label}:{kind};".encode())
+            hash_array_into(hasher, table[kind])
+    return hasher.hexdigest()
+
+
+def compute_multiplier_table(
+    loaded: LoadedModel,
+    coefficients: SatelliteCoefficients,
+) -> MultiplierTable:
+    """Compute all multipliers for a model with one multi-RHS transposed solve.
+
+    Raises:
+        ValueError: If coefficient vectors do not match the model dimension.
+    """
+    n = loaded.n
+    weights = _weights(loaded, coefficients)
+    for kind, vec in weights.items():
+        if vec.shape != (n,):
+            msg = f"{kind} coefficients have shape {vec.shape}, expected ({n},)"
+            raise ValueError(msg)
+
+    kinds = list(weights)
+    weight_matrix = np.vstack([weights[k] for k in kinds])  # (k, n)
+    terms = household_closure_terms(loaded)
+
+    # Row reductions v·B via one transposed solve (I-A)ᵀ·Y = [vᵀ | wᵀ];
+    # B itself is never formed on sparse backends.
+    rhs = weight_matrix.T if terms is None else np.column_stack([weight_matrix.T, terms[1]])
+    rows = np.asarray(loaded.solve_transpose(rhs)).reshape(n, rhs.shape[1]).T
+    reduced = rows[: len(kinds)]  # (k, n): one row per multiplier kind
+    type_i = {k: reduced[i].copy() for i, k in enumerate(kinds)}
+
+    type_ii = None
+    if terms is not None:
+        x_hh, _, denom = terms
+        induced = rows[len(kinds)] / denom  # w·B / (1 - w·L·h), (n,)
+        closed = reduced + np.outer(weight_matrix @ x_hh, induced)
+        type_ii = {k: closed[i].copy() for i, k in enumerate(kinds)}
+
+    model_checksum = loaded.model_version.checksum
+    coefficients_hash = hash_satellite_coefficients(coefficients)
+    return MultiplierTable(
+        model_checksum=model_checksum,
+        coefficients_hash=coefficients_hash,
+        sector_codes=loaded.sector_codes,
+        type_i=type_i,
+        type_ii=type_ii,
+        content_hash=_content_hash(
+            model_checksum, coefficients_hash, loaded.sector_codes, type_i, type_ii,
+        ),
+    )
@@ -0,0 +1,157 @@
+"""Content-addressed run result cache — input fingerprints for engine runs.
+
+Workshops, copilot turns and batch reruns frequently resubmit identical
+engine inputs. Every deterministic output of BatchRunner is a function
+of (model checksum, shocks, deflators, satellite coefficients, baseline
+run, engine version), so a SHA-256 fingerprint over the canonicalized
+inputs identifies a run's results exactly.
+
+A repeated fingerprint lets the caller skip computation and link a new
+RunSnapshot to the result sets already stored for the original run.
+Each request still gets its own RunSnapshot, so governance and
+reproducibility checks see one snapshot per run.
+
+Pure deterministic — no LLM calls, no I/O.
+"""
+
+import hashlib
+import json
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from uuid import UUID
+
+import numpy as np
+
+from src.engine.satellites import SatelliteCoefficients
+
+# Bump whenever BatchRunner output for identical inputs changes
+# (new metrics, different series rows, numerical method changes).
+ENGINE_VERSION = "1.0.0"
+
+
+def hash_array_into(hasher: "hashlib._Hash", arr: np.ndarray) -> None:
+    """Feed a canonical float64 byte representation of arr into hasher.
+
+    Adding 0.0 normalizes -0.0 to 0.0 so sign-of-zero noise from scaling
+    does not change the fingerprint.
+    """
+    canonical = np.ascontiguousarray(np.asarray(arr, dtype=np.float64)) + 0.0
+    hasher.update(str(canonical.shape).encode("ascii"))
+    hasher.update(canonical.tobytes())
+
+
+def hash_annual_shocks(annual_shocks: Mapping[int, np.ndarray]) -> str:
+    """Hash of year-sorted shock vectors (order of dict insertion ignored)."""
+    hasher = hashlib.sha256()
+    for year in sorted(annual_shocks):
+        hasher.update(f"year:{int(year)};".encode("ascii"))
+        hash_array_into(hasher, annual_shocks[year])
+    return hasher.hexdigest()
+
+
+def hash_satellite_coefficients(coefficients: SatelliteCoefficients) -> str:
+    """Content hash of satellite coefficient vectors.
+
+    Hashes the values rather than ``version_id``: API callers mint a fresh
+    version id per request, while the coefficient vectors are what the
+    engine output actually depends on.
+    """
+    hasher = hashlib.sha256()
+    for arr in (coefficients.jobs_coeff, coefficients.import_ratio, coefficients.va_ratio):
+        hash_array_into(hasher, arr)
+    return hasher.hexdigest()
+
+
+def compute_input_fingerprint(
+    *,
+    model_checksum: str,
+    annual_shocks: Mapping[int, np.ndarray],
+    base_year: int,
+    coefficients: SatelliteCoefficients,
+    deflators: Mapping[int, float] | None = None,
+    baseline_run_id: UUID | None = None,
+    environment: str = "dev",
+    engine_version: str = ENGINE_VERSION,
+    monte_carlo: Mapping | None = None,
+) -> str:
+    """Deterministic fingerprint of all inputs that determine a run's results.
+
+    ``annual_shocks`` must be the shocks actually solved (i.e. already
+    scaled by any sensitivity multiplier). ``monte_carlo`` is the
+    canonical sampling spec (seed included) for Monte Carlo runs.
+    """
+    payload = {
+        "model_checksum": model_checksum,
+        "shocks": hash_annual_shocks(annual_shocks),
+        "base_year": int(base_year),
+        "deflators": [
+            [int(year), float(value)]
+            for year, value in sorted((deflators or {}).items())
+        ],
+        "coefficients": hash_satellite_coefficients(coefficients),
+        "baseline_run_id": str(baseline_run_id) if baseline_run_id else None,
+        "environment": environment,
+        "engine_version": engine_version,
+    }
+    if monte_carlo is not None:
+        payload["monte_carlo"] = dict(monte_carlo)
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return f"sha256:{hashlib.sha256(canonical.encode('utf-8')).hexdigest()}"
+
+
+# ---------------------------------------------------------------------------
+# Hit-rate counters
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class RunCacheStats:
+    """Point-in-time run cache counters."""
+
+    hits: int
+    misses: int
+    bypassed: int
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+class RunCacheCounters:
+    """Process-wide, thread-safe hit/miss/bypass counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._bypassed = 0
+
+    def record_hit(self, count: int = 1) -> None:
+        with self._lock:
+            self._hits += count
+
+    def record_miss(self, count: int = 1) -> None:
+        with self._lock:
+            self._misses += count
+
+    def record_bypass(self, count: int = 1) -> None:
+        with self._lock:
+            self._bypassed += count
+
+    def snapshot(self) -> RunCacheStats:
+        with self._lock:
+            return RunCacheStats(
+                hits=self._hits, misses=self._misses, bypassed=self._bypassed,
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hits = self._misses = self._bypassed = 0
+
+
+run_cache_counters = RunCacheCounters()
@@ -0,0 +1,266 @@
+"""Pluggable Leontief solver backends — MVP-3 Section 7.6.
+
+Small models keep the dense inverse B = (I-A)^-1 and answer every shock
+with a matrix-vector product. Large disaggregated (multi-region, 500+
+sector) tables are typically very sparse, so forming B is wasteful:
+these backends store A as scipy.sparse and solve (I-A)·Δx = Δd directly,
+either with a cached sparse LU factorisation or with GMRES to a
+tolerance.
+
+Also provides a Perron–Frobenius productivity check that avoids a full
+O(n³) eigendecomposition for non-negative A.
+
+Pure deterministic — no LLM calls.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import linalg as scipy_linalg
+from scipy import sparse
+from scipy.sparse import linalg as sparse_linalg
+
+# Models with fewer sectors always use the dense backend; forming B is cheap.
+SPARSE_MIN_SECTORS = 300
+# Maximum fraction of non-zero entries in A for the sparse backends.
+SPARSE_MAX_DENSITY = 0.10
+
+BACKEND_AUTO = "auto"
+BACKEND_DENSE = "dense"
+BACKEND_SPARSE_LU = "sparse_lu"
+BACKEND_GMRES = "gmres"
+
+VALID_BACKENDS = frozenset({BACKEND_AUTO, BACKEND_DENSE, BACKEND_SPARSE_LU, BACKEND_GMRES})
+
+
+class LeontiefBackend(ABC):
+    """Solves (I - A)·X = D for one or more final-demand columns."""
+
+    name: str = ""
+
+    def __init__(self, A: np.ndarray | sparse.spmatrix) -> None:
+        self._n = A.shape[0]
+
+    @property
+    def n(self) -> int:
+        return self._n
+
+    @abstractmethod
+    def solve(self, rhs: np.ndarray) -> np.ndarray:
+        """Return (I-A)^{-1} · rhs for rhs of shape (n,) or (n, k)."""
+
+    @abstractmethod
+    def solve_transpose(self, rhs: np.ndarray) -> np.ndarray:
+        """Return (I-A)^{-T} · rhs, i.e. the rows rhsᵀ · B transposed.
+
+        Weighted column sums v·B are a transposed solve (I-A)ᵀ·y = vᵀ, so
+        k row reductions of B cost k solves instead of forming B.
+        """
+
+    def inverse(self) -> np.ndarray:
+        """Form the dense Leontief inverse B column by column.
+
+        Only needed by consumers that genuinely require all of B
+        (e.g. structural path analysis). Memory is O(n²).
+        """
+        return np.asarray(self.solve(np.eye(self._n)))
+
+
+class DenseInverseBackend(LeontiefBackend):
+    """Forms and caches the dense inverse B using scipy's LU solver."""
+
+    name = BACKEND_DENSE
+
+    def __init__(self, A: np.ndarray | sparse.spmatrix) -> None:
+        super().__init__(A)
+        dense_A = A.toarray() if sparse.issparse(A) else np.asarray(A, dtype=np.float64)
+        I_minus_A = np.eye(self._n) - dense_A
+        # Solve (I-A) · B = I  ⟹  B = (I-A)^{-1}
+        # Using scipy solve for stability over explicit inversion
+        B = np.asarray(scipy_linalg.solve(I_minus_A, np.eye(self._n)))
+        B.flags.writeable = False
+        self._B = B
+
+    def solve(self, rhs: np.ndarray) -> np.ndarray:
+        return self._B @ rhs
+
+    def solve_transpose(self, rhs: np.ndarray) -> np.ndarray:
+        return self._B.T @ rhs
+
+    def inverse(self) -> np.ndarray:
+        return self._B
+
+
+class SparseLUBackend(LeontiefBackend):
+    """Caches a sparse LU factorisation of (I - A) (SuperLU via ``splu``)."""
+
+    name = BACKEND_SPARSE_LU
+
+    def __init__(self, A: np.ndarray | sparse.spmatrix) -> None:
+        super().__init__(A)
+        I_minus_A = sparse.identity(self._n, format="csc") - sparse.csc_matrix(A)
+        self._lu = sparse_linalg.splu(sparse.csc_matrix(I_minus_A))
+
+    def solve(self, rhs: np.ndarray) -> np.ndarray:
+        return self._lu.solve(np.asarray(rhs, dtype=np.float64))
+
+    def solve_transpose(self, rhs: np.ndarray) -> np.ndarray:
+        return self._lu.solve(np.asarray(rhs, dtype=np.float64), trans="T")
+
+
+class GMRESBackend(LeontiefBackend):
+    """Iterative GMRES solve of (I - A)·x = d to a relative tolerance.
+
+    No factorisation is stored; each solve costs a handful of sparse
+    mat-vecs. Falls back to a sparse LU factorisation (built once) for
+    any right-hand side on which GMRES fails to converge.
+    """
+
+    name = BACKEND_GMRES
+
+    def __init__(
+        self,
+        A: np.ndarray | sparse.spmatrix,
+        *,
+        rtol: float = 1e-10,
+        maxiter: int | None = None,
+    ) -> None:
+        super().__init__(A)
+        self._A = sparse.csr_matrix(A)
+        self._operator = sparse.identity(self._n, format="csr") - self._A
+        self._rtol = rtol
+        self._maxiter = maxiter
+        self._fallback: SparseLUBackend | None = None
+
+    def _solve_vector(self, d: np.ndarray, *, transpose: bool = False) -> np.ndarray:
+        if not np.any(d):
+            return np.zeros(self._n)
+        operator = self._operator.T if transpose else self._operator
+        x, info = sparse_linalg.gmres(
+            operator, d, rtol=self._rtol, atol=0.0, maxiter=self._maxiter,
+        )
+        if info != 0:
+            if self._fallback is None:
+                self._fallback = SparseLUBackend(self._A)
+            if transpose:
+                return self._fallback.solve_transpose(d)
+            return self._fallback.solve(d)
+        return np.asarray(x)
+
+    def _solve_columns(self, rhs: np.ndarray, *, transpose: bool) -> np.ndarray:
+        rhs = np.asarray(rhs, dtype=np.float64)
+        if rhs.ndim == 1:
+            return self._solve_vector(rhs, transpose=transpose)
+        return np.column_stack([
+            self._solve_vector(rhs[:, j], transpose=transpose) for j in range(rhs.shape[1])
+        ])
+
+    def solve(self, rhs: np.ndarray) -> np.ndarray:
+        return self._solve_columns(rhs, transpose=False)
+
+    def solve_transpose(self, rhs: np.ndarray) -> np.ndarray:
+        return self._solve_columns(rhs, transpose=True)
+
+
+def matrix_density(A: np.ndarray | sparse.spmatrix) -> float:
+    """Fraction of non-zero entries in A."""
+    n_rows, n_cols = A.shape
+    if n_rows == 0 or n_cols == 0:
+        return 0.0
+    nnz = A.nnz if sparse.issparse(A) else int(np.count_nonzero(A))
+    return nnz / float(n_rows * n_cols)
+
+
+def select_backend_name(A: np.ndarray | sparse.spmatrix) -> str:
+    """Pick a backend for A: sparse LU for large sparse tables, else dense."""
+    if A.shape[0] >= SPARSE_MIN_SECTORS and matrix_density(A) <= SPARSE_MAX_DENSITY:
+        return BACKEND_SPARSE_LU
+    return BACKEND_DENSE
+
+
+def build_backend(A: np.ndarray | sparse.spmatrix, name: str = BACKEND_AUTO) -> LeontiefBackend:
+    """Construct the named backend for A (``auto`` detects sparsity).
+
+    Raises:
+        ValueError: If name is not a known backend.
+    """
+    if name not in VALID_BACKENDS:
+        msg = f"unknown solver backend '{name}'. Expected one of {sorted(VALID_BACKENDS)}."
+        raise ValueError(msg)
+    if name == BACKEND_AUTO:
+        name = select_backend_name(A)
+    if name == BACKEND_SPARSE_LU:
+        return SparseLUBackend(A)
+    if name == BACKEND_GMRES:
+        return GMRESBackend(A)
+    return DenseInverseBackend(A)
+
+
+# ---------------------------------------------------------------------------
+# Productivity check (Perron–Frobenius)
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class SpectralRadiusEstimate:
+    """Rigorous bounds on the spectral radius of a non-negative matrix."""
+
+    lower: float
+    upper: float
+
+    @property
+    def value(self) -> float:
+        """Best point estimate (midpoint of the bounds)."""
+        return 0.5 * (self.lower + self.upper)
+
+
+def spectral_radius_bounds(
+    A: np.ndarray | sparse.spmatrix,
+    *,
+    threshold: float = 1.0,
+    tol: float = 1e-9,
+    max_iterations: int = 1000,
+) -> SpectralRadiusEstimate:
+    """Bound ρ(A) for non-negative A without an eigendecomposition.
+
+    1. Perron–Frobenius: ρ(A) lies between the smallest and largest row
+       sums, and likewise column sums. For real I-O tables every column
+       sum of A is below 1, so this alone usually settles productivity.
+    2. Otherwise, Collatz–Wielandt power iteration on the shifted matrix
+       A + I (keeps the iterate strictly positive): for any v > 0,
+       min(Av/v) ≤ ρ(A) ≤ max(Av/v). Iterates until the bounds fall on
+       one side of ``threshold`` or are within ``tol`` of each other.
+
+    Bounds are always valid; if iteration stalls (reducible A) the
+    tightest bounds reached are returned.
+    """
+    if sparse.issparse(A):
+        A_op = sparse.csr_matrix(A)
+        col_sums = np.asarray(A_op.sum(axis=0)).ravel()
+        row_sums = np.asarray(A_op.sum(axis=1)).ravel()
+    else:
+        A_op = np.asarray(A, dtype=np.float64)
+        col_sums = A_op.sum(axis=0)
+        row_sums = A_op.sum(axis=1)
+
+    if A_op.shape[0] == 0:
+        return SpectralRadiusEstimate(lower=0.0, upper=0.0)
+
+    lower = max(float(col_sums.min()), float(row_sums.min()))
+    upper = min(float(col_sums.max()), float(row_sums.max()))
+    if upper < threshold or lower >= threshold or upper - lower <= tol:
+        return SpectralRadiusEstimate(lower=lower, upper=upper)
+
+    v = np.ones(A_op.shape[0])
+    for _ in range(max_iterations):
+        w = A_op @ v
+        ratios = w / v
+        lower = max(lower, float(ratios.min()))
+        upper = min(upper, float(ratios.max()))
+        if upper < threshold or lower >= threshold or upper - lower <= tol:
+            break
+        v = w + v
+        v /= v.max()
+
+    return SpectralRadiusEstimate(lower=lower, upper=upper)
@@ -0,0 +1,364 @@
+"""Incremental workshop preview — linear deltas against a cached baseline.
+
+Workshop sliders scale baseline shocks sector by sector:
+annual[year][j] = base[year][j] · (1 + pct_j/100). Every engine output
+the preview reports is linear in the shock, so for the set J of sectors
+with a non-zero slider:
+
+    Δx(sliders) = Δx(base) + B[:, J] · Δd_J,   Δd_J = Σ_year base_real[year][J] · pct_J/100
+
+The baseline solve happens once per preview session (model, baseline run,
+base shocks, coefficients, base year) and is kept in memory. Per-sector
+multiplier columns B[:, j] — and their Type II counterparts — are cached
+per model version, so moving a slider costs O(n·|J|) instead of a full
+BatchRunner run.
+
+Preview results are headline totals only and are never persisted; the
+full governed run still happens on workshop commit.
+
+Pure deterministic — no LLM calls, no I/O.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from uuid import UUID
+
+import numpy as np
+
+from src.engine.model_store import LoadedModel, ModelStore
+from src.engine.multipliers import household_closure_terms
+from src.engine.run_cache import hash_annual_shocks, hash_satellite_coefficients
+from src.engine.satellites import SatelliteCoefficients
+from src.engine.type_ii_validation import validate_type_ii_prerequisites
+from src.engine.value_measures_validation import (
+    ValueMeasuresValidationError,
+    validate_value_measures_prerequisites,
+)
+from src.engine.workshop_transform import SliderInput
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SESSIONS = 64
+# Environments where invalid Type II / value-measures artifacts fail the
+# preview instead of being dropped, matching BatchRunner.
+_FAIL_CLOSED_ENVIRONMENTS = ("staging", "prod")
+
+
+@dataclass(frozen=True)
+class WorkshopPreview:
+    """Headline preview metrics for one slider configuration."""
+
+    headline: dict[str, float]
+    annual_total_output: dict[int, float]
+    peak_year: int
+    changed_sectors: list[str]
+    baseline_cached: bool
+    elapsed_ms: float
+
+
+@dataclass
+class _MultiplierColumns:
+    """Lazily filled per-sector columns of B (and B* for Type II)."""
+
+    type_i: dict[int, np.ndarray] = field(default_factory=dict)
+    type_ii: dict[int, np.ndarray] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class _PreviewBaseline:
+    """Solved baseline for one preview session."""
+
+    model_version_id: UUID
+    sector_index: dict[str, int]
+    years: list[int]
+    real_shocks: np.ndarray           # (years, n), deflated base shocks
+    annual_totals: np.ndarray         # (years,), Σ Δx per year
+    delta_x: np.ndarray               # cumulative Type I Δx
+    delta_x_type_ii: np.ndarray | None
+    jobs_coeff: np.ndarray
+    import_ratio: np.ndarray
+    va_ratio: np.ndarray
+    tax_ratio: np.ndarray | None
+    export_ratio: np.ndarray | None
+
+
+class WorkshopPreviewEngine:
+    """In-memory preview engine with an LRU of solved baselines."""
+
+    def __init__(
+        self, model_store: ModelStore, *, max_sessions: int = DEFAULT_MAX_SESSIONS,
+    ) -> None:
+        self._store = model_store
+        self._max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._baselines: OrderedDict[str, _PreviewBaseline] = OrderedDict()
+        self._columns: dict[UUID, _MultiplierColumns] = {}
+
+    @staticmethod
+    def session_key(
+        *,
+        model_version_id: UUID,
+        baseline_run_id: UUID,
+        annual_shocks: Mapping[int, np.ndarray],
+        base_year: int,
+        coefficients: SatelliteCoefficients,
+        deflators: Mapping[int, float] | None = None,
+    ) -> str:
+        """Key identifying a preview baseline (everything except sliders)."""
+        parts = [
+            str(model_version_id),
+            str(baseline_run_id),
+            hash_annual_shocks(annual_shocks),
+            str(int(base_year)),
+            hash_satellite_coefficients(coefficients),
+            repr(sorted((deflators or {}).items())),
+        ]
+        return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+    def preview(
+        self,
+        *,
+        model_version_id: UUID,
+        baseline_run_id: UUID,
+        annual_shocks: Mapping[int, np.ndarray],
+        sliders: list[SliderInput],
+        base_year: int,
+        coefficients: SatelliteCoefficients,
+        deflators: Mapping[int, float] | None = None,
+        environment: str = "dev",
+    ) -> WorkshopPreview:
+        """Headline metrics for base shocks adjusted by sliders.
+
+        Sliders must already be validated against the model's sector codes.
+        Like BatchRunner, invalid Type II or value-measures artifacts are
+        dropped with a warning in dev and fail closed in staging/prod.
+
+        Raises:
+            KeyError: If the model version is not loaded in the store.
+            TypeIIValidationError: Invalid Type II artifacts (staging/prod).
+            ValueMeasuresValidationError: Invalid or missing value-measures
+                artifacts (staging/prod).
+        """
+        started = time.perf_counter()
+        loaded = self._store.get(model_version_id)
+        key = self.session_key(
+            model_version_id=model_version_id,
+            baseline_run_id=baseline_run_id,
+            annual_shocks=annual_shocks,
+            base_year=base_year,
+            coefficients=coefficients,
+            deflators=deflators,
+        )
+        with self._lock:
+            baseline = self._baselines.get(key)
+            if baseline is not None:
+                self._baselines.move_to_end(key)
+        baseline_cached = baseline is not None
+        if baseline is None:
+            baseline = self._build_baseline(
+                loaded, annual_shocks, base_year, coefficients, deflators, environment,
+            )
+            with self._lock:
+                self._baselines[key] = baseline
+                self._baselines.move_to_end(key)
+                while len(self._baselines) > self._max_sessions:
+                    self._baselines.popitem(last=False)
+
+        changed = [s for s in sliders if s.pct_delta != 0.0]
+        idx = np.array(
+            [baseline.sector_index[s.sector_code] for s in changed], dtype=np.intp,
+        )
+        pct = np.array([s.pct_delta / 100.0 for s in changed], dtype=np.float64)
+
+        delta_x = baseline.delta_x
+        delta_x_ii = baseline.delta_x_type_ii
+        annual_totals = baseline.annual_totals
+        if len(idx):
+            # Per-year shock change on the slider sectors only: (years, |J|)
+            dd_annual = baseline.real_shocks[:, idx] * pct
+            dd_cumulative = dd_annual.sum(axis=0)
+            cols = self._type_i_columns(loaded, idx)
+            delta_x = delta_x + cols @ dd_cumulative
+            annual_totals = annual_totals + dd_annual @ cols.sum(axis=0)
+            if delta_x_ii is not None:
+                delta_x_ii = delta_x_ii + self._type_ii_columns(loaded, idx) @ dd_cumulative
+
+        headline = self._headline(baseline, delta_x, delta_x_ii)
+        annual = {
+            year: float(total) for year, total in zip(baseline.years, annual_totals, strict=True)
+        }
+        peak_year = -1
+        if annual:
+            peak_year = baseline.years[int(np.argmax(annual_totals))]
+
+        return WorkshopPreview(
+            headline=headline,
+            annual_total_output=annual,
+            peak_year=peak_year,
+            changed_sectors=[s.sector_code for s in changed],
+            baseline_cached=baseline_cached,
+            elapsed_ms=(time.perf_counter() - started) * 1000.0,
+        )
+
+    def evict_model(self, model_version_id: UUID) -> None:
+        """Drop cached baselines and multiplier columns for a model version."""
+        with self._lock:
+            self._columns.pop(model_version_id, None)
+            for key in [
+                k for k, b in self._baselines.items()
+                if b.model_version_id == model_version_id
+            ]:
+                del self._baselines[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._baselines.clear()
+            self._columns.clear()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _build_baseline(
+        self,
+        loaded: LoadedModel,
+        annual_shocks: Mapping[int, np.ndarray],
+        base_year: int,
+        coefficients: SatelliteCoefficients,
+        deflators: Mapping[int, float] | None,
+        environment: str,
+    ) -> _PreviewBaseline:
+        fail_closed = environment in _FAIL_CLOSED_ENVIRONMENTS
+        n = loaded.n
+        deflators = deflators or {}
+        years = sorted(annual_shocks)
+        real = np.zeros((len(years), n))
+        for row, year in enumerate(years):
+            real[row] = np.asarray(annual_shocks[year], dtype=np.float64) / deflators.get(year, 1.0)
+
+        # One multi-RHS solve for every year: (n, years)
+        annual_x = loaded.solve(real.T) if years else np.zeros((n, 0))
+        annual_x = np.asarray(annual_x).reshape(n, len(years))
+        delta_x = annual_x.sum(axis=1)
+
+        delta_x_ii = None
+        if fail_closed and loaded.has_type_ii_prerequisites:
+            validate_type_ii_prerequisites(
+                n=n,
+                x=loaded.x,
+                compensation_of_employees=loaded.compensation_of_employees_array,
+                household_consumption_shares=loaded.household_consumption_shares_array,
+            )
+        terms = household_closure_terms(loaded)
+        if terms is not None:
+            x_hh, w, denom = terms
+            delta_x_ii = delta_x + x_hh * (float(w @ delta_x) / denom)
+
+        tax_ratio = export_ratio = None
+        if loaded.has_value_measures_prerequisites or fail_closed:
+            try:
+                validated = validate_value_measures_prerequisites(
+                    n=n,
+                    x=loaded.x,
+                    gross_operating_surplus=loaded.gross_operating_surplus_array,
+                    taxes_less_subsidies=loaded.taxes_less_subsidies_array,
+                    final_demand_f=loaded.final_demand_f_array,
+                    imports_vector=loaded.imports_vector_array,
+                    deflator_series=loaded.model_version.deflator_series,
+                    base_year=base_year,
+                )
+            except ValueMeasuresValidationError:
+                if fail_closed:
+                    raise
+                _logger.warning(
+                    "Value measures validation failed in dev — "
+                    "previewing without value measures",
+                )
+            else:
+                tax_ratio = validated.tax_ratio
+                export_ratio = validated.export_ratio
+
+        return _PreviewBaseline(
+            model_version_id=loaded.model_version.model_version_id,
+            sector_index={code: i for i, code in enumerate(loaded.sector_codes)},
+            years=years,
+            real_shocks=real,
+            annual_totals=annual_x.sum(axis=0),
+            delta_x=delta_x,
+            delta_x_type_ii=delta_x_ii,
+            jobs_coeff=np.asarray(coefficients.jobs_coeff, dtype=np.float64),
+            import_ratio=np.asarray(coefficients.import_ratio, dtype=np.float64),
+            va_ratio=np.asarray(coefficients.va_ratio, dtype=np.float64),
+            tax_ratio=tax_ratio,
+            export_ratio=export_ratio,
+        )
+
+    def _model_columns(self, loaded: LoadedModel) -> _MultiplierColumns:
+        mv_id = loaded.model_version.model_version_id
+        with self._lock:
+            return self._columns.setdefault(mv_id, _MultiplierColumns())
+
+    def _type_i_columns(self, loaded: LoadedModel, idx: np.ndarray) -> np.ndarray:
+        """B[:, idx], solving only for columns not cached yet."""
+        cache = self._model_columns(loaded).type_i
+        missing = [int(j) for j in idx if int(j) not in cache]
+        if missing:
+            rhs = np.zeros((loaded.n, len(missing)))
+            rhs[missing, np.arange(len(missing))] = 1.0
+            solved = np.asarray(loaded.solve(rhs)).reshape(loaded.n, len(missing))
+            for k, j in enumerate(missing):
+                cache[j] = solved[:, k].copy()
+        return np.column_stack([cache[int(j)] for j in idx])
+
+    def _type_ii_columns(self, loaded: LoadedModel, idx: np.ndarray) -> np.ndarray:
+        """Type II multiplier columns B*[:n, idx] derived from B[:, idx]."""
+        cache = self._model_columns(loaded).type_ii
+        missing = [int(j) for j in idx if int(j) not in cache]
+        if missing:
+            terms = household_closure_terms(loaded)
+            if terms is None:
+                msg = (
+                    f"model version {loaded.model_version.model_version_id} has no "
+                    "valid household closure for Type II preview columns."
+                )
+                raise ValueError(msg)
+            x_hh, w, denom = terms
+            cols = self._type_i_columns(loaded, np.array(missing, dtype=np.intp))
+            cols_ii = cols + np.outer(x_hh, (w @ cols) / denom)
+            for k, j in enumerate(missing):
+                cache[j] = cols_ii[:, k].copy()
+        return np.column_stack([cache[int(j)] for j in idx])
+
+    @staticmethod
+    def _headline(
+        baseline: _PreviewBaseline,
+        delta_x: np.ndarray,
+        delta_x_ii: np.ndarray | None,
+    ) -> dict[str, float]:
+        """Aggregate totals matching the BatchRunner metric types."""
+        imports = float(baseline.import_ratio @ delta_x)
+        value_added = float(baseline.va_ratio @ delta_x)
+        total_output = float(delta_x.sum())
+        headline = {
+            "total_output": total_output,
+            "employment": float(baseline.jobs_coeff @ delta_x),
+            "imports": imports,
+            "value_added": value_added,
+            "domestic_output": total_output - imports,
+        }
+        if baseline.tax_ratio is not None and baseline.export_ratio is not None:
+            headline["gdp_basic_price"] = value_added
+            headline["gdp_market_price"] = value_added + float(baseline.tax_ratio @ delta_x)
+            headline["balance_of_trade"] = float(baseline.export_ratio @ delta_x) - imports
+        if delta_x_ii is not None:
+            headline["type_ii_total_output"] = float(delta_x_ii.sum())
+            headline["induced_effect"] = float(delta_x_ii.sum()) - total_output
+            headline["type_ii_employment"] = float(baseline.jobs_coeff @ delta_x_ii)
+        return headline
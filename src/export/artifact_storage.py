@@ -1,23 +1,41 @@
 """Export artifact storage — persists generated export bytes to filesystem.
 
 Stores artifacts under OBJECT_STORAGE_PATH/exports/{export_id}/{format}.ext.
-Retrieval returns raw bytes by storage key.
+Retrieval returns raw bytes by storage key, or streams them in chunks.
 """
 
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass
 from pathlib import Path
 
-_FORMAT_EXTENSIONS: dict[str, str] = {
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+FORMAT_EXTENSIONS: dict[str, str] = {
     "excel": "xlsx",
     "pptx": "pptx",
 }
 
 
+@dataclass(frozen=True)
+class StoredArtifact:
+    """Listing entry for a stored artifact."""
+
+    key: str
+    size: int
+    modified_at: float
+
+
 class ExportArtifactStorage:
     """Filesystem-backed export artifact storage."""
 
     def __init__(self, storage_root: str) -> None:
         self._root = Path(storage_root)
 
+    @property
+    def root(self) -> Path:
+        return self._root
+
     def store(self, key: str, data: bytes) -> None:
         """Write artifact bytes to the given storage key."""
         dest = self._root / key
@@ -36,8 +54,55 @@ class ExportArtifactStorage:
             raise FileNotFoundError(msg)
         return path.read_bytes()
 
+    def size(self, key: str) -> int:
+        """Size in bytes of the artifact at the storage key.
+
+        Raises:
+            FileNotFoundError: If the key does not exist.
+        """
+        path = self._root / key
+        if not path.is_file():
+            msg = f"Export artifact not found: {key}"
+            raise FileNotFoundError(msg)
+        return path.stat().st_size
+
+    def iter_chunks(
+        self, key: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Yield artifact bytes in chunks without loading the whole file.
+
+        Call size() first to surface a missing key before streaming starts.
+        """
+        with (self._root / key).open("rb") as fh:
+            while chunk := fh.read(chunk_size):
+                yield chunk
+
+    def touch(self, key: str) -> None:
+        """Mark an artifact as recently used (bumps its modification time)."""
+        os.utime(self._root / key)
+
+    def delete(self, key: str) -> None:
+        """Remove an artifact; missing keys are ignored."""
+        (self._root / key).unlink(missing_ok=True)
+
+    def list_prefix(self, prefix: str) -> list[StoredArtifact]:
+        """List every artifact stored under a key prefix."""
+        base = self._root / prefix
+        if not base.is_dir():
+            return []
+        entries = []
+        for path in base.rglob("*"):
+            if path.is_file():
+                stat = path.stat()
+                entries.append(StoredArtifact(
+                    key=path.relative_to(self._root).as_posix(),
+                    size=stat.st_size,
+                    modified_at=stat.st_mtime,
+                ))
+        return entries
+
     @staticmethod
     def build_key(export_id: str, fmt: str) -> str:
         """Build a canonical storage key for an export artifact."""
-        ext = _FORMAT_EXTENSIONS.get(fmt, fmt)
+        ext = FORMAT_EXTENSIONS.get(fmt, fmt)
         return f"exports/{export_id}/{fmt}.{ext}"
@@ -7,14 +7,40 @@ Generate a fully linked Excel workbook with:
 - Integrity signature (SHA-256 hash of key ranges) in a hidden sheet
 
 If the workbook is modified outside ImpactOS, the signature fails.
+
+The workbook is written in one streaming pass (openpyxl write-only mode).
+Cell values are canonicalized to what openpyxl reads back after a save,
+so the signature is hashed as rows are written and still matches what
+IntegrityChecker recomputes from the saved file.
+
+openpyxl is imported on first export/verify, not at module import.
+
 Deterministic — no LLM calls.
 """
 
+from __future__ import annotations
+
 import hashlib
 import io
+import math
+from collections.abc import Sequence
+from decimal import Decimal
+from numbers import Real
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from openpyxl import Workbook
+    from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+    from openpyxl.worksheet.worksheet import Worksheet
+
+from src.export.watermark import ExcelWatermark
 
-from openpyxl import Workbook, load_workbook
-from openpyxl.worksheet.worksheet import Worksheet
+# Signed sheets and the number of columns hashed in each, in hash order
+_SIGNED_RANGES: tuple[tuple[str, int], ...] = (
+    ("Sector Impacts", 8),
+    ("Input Vectors", 2),
+    ("Run Metadata", 2),
+)
 
 
 def _compute_range_hash(ws: Worksheet, min_row: int, max_row: int, min_col: int, max_col: int) -> str:
@@ -26,85 +52,139 @@ def _compute_range_hash(ws: Worksheet, min_row: int, max_row: int, min_col: int,
     return h.hexdigest()
 
 
+def _canonical(value: object) -> object:
+    """Value as openpyxl reads it back after a save.
+
+    Numbers are written with "%.16g" and read back as int when there is
+    no decimal point or exponent (500.0 -> 500). Empty strings and
+    non-finite floats are written as empty cells (None). Text round-trips
+    unchanged, carriage returns included.
+    """
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, (Real, Decimal)):
+        if isinstance(value, float) and not math.isfinite(value):
+            return None
+        text = f"{float(value):.16g}"
+        if "." in text or "e" in text or "E" in text:
+            return float(text)
+        return int(text)
+    if value == "":
+        return None
+    return value
+
+
+class _SignedSheet:
+    """Write-only sheet that hashes its first ``hash_cols`` columns per row."""
+
+    def __init__(self, ws: WriteOnlyWorksheet, hash_cols: int) -> None:
+        self._ws = ws
+        self._cols = hash_cols
+        self._hash = hashlib.sha256()
+
+    def append(self, row: Sequence[object]) -> None:
+        self._ws.append(row)
+        padded = list(row[: self._cols]) + [None] * (self._cols - len(row))
+        for value in padded:
+            self._hash.update(str(_canonical(value)).encode())
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
 class ExcelExporter:
     """Generate governed Excel workbook with integrity tracking."""
 
-    def export(self, pack_data: dict) -> bytes:
-        """Generate Excel workbook bytes from Decision Pack data."""
-        wb = Workbook()
+    # Bump when sheet content or layout changes
+    RENDERER_VERSION = "2"
+
+    def export(self, pack_data: dict, *, watermark: ExcelWatermark | None = None) -> bytes:
+        """Generate Excel workbook bytes from Decision Pack data.
+
+        When a watermark is given it is stamped on every visible sheet
+        in the same pass, so no load/save round trip is needed afterwards.
+        """
+        from openpyxl import Workbook
+
+        wb = Workbook(write_only=True)
+        signed: dict[str, _SignedSheet] = {}
 
-        # Remove default sheet
-        wb.remove(wb.active)
+        def sheet(title: str) -> WriteOnlyWorksheet:
+            ws = wb.create_sheet(title)
+            if watermark is not None:
+                watermark.apply(ws)
+            return ws
+
+        def signed_sheet(title: str, hash_cols: int) -> _SignedSheet:
+            signed[title] = _SignedSheet(sheet(title), hash_cols)
+            return signed[title]
+
+        hash_cols = dict(_SIGNED_RANGES)
 
         # 1. Sector Impacts sheet
-        self._write_sector_impacts(wb, pack_data.get("sector_impacts", []))
+        self._write_sector_impacts(
+            signed_sheet("Sector Impacts", hash_cols["Sector Impacts"]),
+            pack_data.get("sector_impacts", []),
+        )
 
         # 2. Input Vectors sheet
-        self._write_input_vectors(wb, pack_data.get("input_vectors", {}))
+        self._write_input_vectors(
+            signed_sheet("Input Vectors", hash_cols["Input Vectors"]),
+            pack_data.get("input_vectors", {}),
+        )
 
         # 3. Assumptions sheet
-        self._write_assumptions(wb, pack_data.get("assumptions", []))
+        self._write_assumptions(sheet("Assumptions"), pack_data.get("assumptions", []))
 
         # 4. Run Metadata sheet (visible footer)
-        self._write_metadata(wb, pack_data)
+        self._write_metadata(
+            signed_sheet("Run Metadata", hash_cols["Run Metadata"]), pack_data,
+        )
+
+        # 5. Integrity signature (hidden sheet) — hashed during the writes
+        h = hashlib.sha256()
+        for title, _ in _SIGNED_RANGES:
+            h.update(signed[title].hexdigest().encode())
+        ws_integrity = wb.create_sheet("_Integrity")
+        ws_integrity.append(["Integrity Signature", f"sha256:{h.hexdigest()}"])
+        ws_integrity.sheet_state = "hidden"
 
-        # Save and reload so cell value representations are stable
-        # (openpyxl normalises numeric types on round-trip)
         buf = io.BytesIO()
         wb.save(buf)
-        wb = load_workbook(io.BytesIO(buf.getvalue()))
+        return buf.getvalue()
 
-        # 5. Integrity signature (hidden sheet) — computed on reloaded wb
-        self._write_integrity(wb)
-
-        buf2 = io.BytesIO()
-        wb.save(buf2)
-        return buf2.getvalue()
-
-    def _write_sector_impacts(self, wb: Workbook, impacts: list[dict]) -> None:
-        ws = wb.create_sheet("Sector Impacts")
-        headers = [
+    def _write_sector_impacts(self, ws: _SignedSheet, impacts: list[dict]) -> None:
+        ws.append([
             "Sector Code", "Sector Name", "Direct Impact",
             "Indirect Impact", "Total Impact", "Multiplier",
             "Domestic Share", "Import Leakage",
-        ]
-        for col, h in enumerate(headers, 1):
-            ws.cell(row=1, column=col, value=h)
-
+        ])
         for row_idx, si in enumerate(impacts, 2):
-            ws.cell(row=row_idx, column=1, value=si["sector_code"])
-            ws.cell(row=row_idx, column=2, value=si["sector_name"])
-            ws.cell(row=row_idx, column=3, value=si["direct_impact"])
-            ws.cell(row=row_idx, column=4, value=si["indirect_impact"])
-            # Linked formula: total = direct + indirect
-            ws.cell(row=row_idx, column=5, value=f"=C{row_idx}+D{row_idx}")
-            ws.cell(row=row_idx, column=6, value=si["multiplier"])
-            ws.cell(row=row_idx, column=7, value=si["domestic_share"])
-            ws.cell(row=row_idx, column=8, value=si["import_leakage"])
-
-    def _write_input_vectors(self, wb: Workbook, vectors: dict) -> None:
-        ws = wb.create_sheet("Input Vectors")
-        ws.cell(row=1, column=1, value="Sector Code")
-        ws.cell(row=1, column=2, value="Input Value")
-
-        for row_idx, (sector, value) in enumerate(sorted(vectors.items()), 2):
-            ws.cell(row=row_idx, column=1, value=sector)
-            ws.cell(row=row_idx, column=2, value=value)
-
-    def _write_assumptions(self, wb: Workbook, assumptions: list[dict]) -> None:
-        ws = wb.create_sheet("Assumptions")
-        headers = ["Name", "Value", "Range Min", "Range Max"]
-        for col, h in enumerate(headers, 1):
-            ws.cell(row=1, column=col, value=h)
-
-        for row_idx, a in enumerate(assumptions, 2):
-            ws.cell(row=row_idx, column=1, value=a.get("name", ""))
-            ws.cell(row=row_idx, column=2, value=a.get("value"))
-            ws.cell(row=row_idx, column=3, value=a.get("range_min"))
-            ws.cell(row=row_idx, column=4, value=a.get("range_max"))
-
-    def _write_metadata(self, wb: Workbook, pack_data: dict) -> None:
-        ws = wb.create_sheet("Run Metadata")
+            ws.append([
+                si["sector_code"],
+                si["sector_name"],
+                si["direct_impact"],
+                si["indirect_impact"],
+                # Linked formula: total = direct + indirect
+                f"=C{row_idx}+D{row_idx}",
+                si["multiplier"],
+                si["domestic_share"],
+                si["import_leakage"],
+            ])
+
+    def _write_input_vectors(self, ws: _SignedSheet, vectors: dict) -> None:
+        ws.append(["Sector Code", "Input Value"])
+        for sector, value in sorted(vectors.items()):
+            ws.append([sector, value])
+
+    def _write_assumptions(self, ws: WriteOnlyWorksheet, assumptions: list[dict]) -> None:
+        ws.append(["Name", "Value", "Range Min", "Range Max"])
+        for a in assumptions:
+            ws.append([
+                a.get("name", ""), a.get("value"), a.get("range_min"), a.get("range_max"),
+            ])
+
+    def _write_metadata(self, ws: _SignedSheet, pack_data: dict) -> None:
         metadata = [
             ("Run ID", pack_data.get("run_id", "")),
             ("Scenario Name", pack_data.get("scenario_name", "")),
@@ -113,42 +193,19 @@ class ExcelExporter:
             ("Model Version", pack_data.get("model_version_id", "")),
             ("Scenario Version", pack_data.get("scenario_version", "")),
         ]
-        for row_idx, (label, value) in enumerate(metadata, 1):
-            ws.cell(row=row_idx, column=1, value=label)
-            ws.cell(row=row_idx, column=2, value=str(value) if value is not None else "")
-
-    def _write_integrity(self, wb: Workbook) -> None:
-        """Compute integrity hash over key data ranges and store in hidden sheet."""
-        h = hashlib.sha256()
+        for label, value in metadata:
+            ws.append([label, str(value) if value is not None else ""])
 
-        # Hash sector impacts data
-        if "Sector Impacts" in wb.sheetnames:
-            ws = wb["Sector Impacts"]
-            max_row = ws.max_row or 1
-            range_hash = _compute_range_hash(ws, 1, max_row, 1, 8)
-            h.update(range_hash.encode())
-
-        # Hash input vectors data
-        if "Input Vectors" in wb.sheetnames:
-            ws = wb["Input Vectors"]
-            max_row = ws.max_row or 1
-            range_hash = _compute_range_hash(ws, 1, max_row, 1, 2)
-            h.update(range_hash.encode())
 
-        # Hash metadata
-        if "Run Metadata" in wb.sheetnames:
-            ws = wb["Run Metadata"]
+def _workbook_signature(wb: Workbook) -> str:
+    """Recompute the integrity signature from a loaded workbook."""
+    h = hashlib.sha256()
+    for title, cols in _SIGNED_RANGES:
+        if title in wb.sheetnames:
+            ws = wb[title]
             max_row = ws.max_row or 1
-            range_hash = _compute_range_hash(ws, 1, max_row, 1, 2)
-            h.update(range_hash.encode())
-
-        signature = f"sha256:{h.hexdigest()}"
-
-        # Write to hidden sheet
-        ws_integrity = wb.create_sheet("_Integrity")
-        ws_integrity.cell(row=1, column=1, value="Integrity Signature")
-        ws_integrity.cell(row=1, column=2, value=signature)
-        ws_integrity.sheet_state = "hidden"
+            h.update(_compute_range_hash(ws, 1, max_row, 1, cols).encode())
+    return f"sha256:{h.hexdigest()}"
 
 
 class IntegrityChecker:
@@ -157,8 +214,12 @@ class IntegrityChecker:
     def verify(self, workbook_bytes: bytes) -> bool:
         """Check if the workbook's integrity signature is still valid.
 
-        Returns True if unmodified, False if tampered.
+        Returns True if unmodified, False if tampered. Works for streamed
+        workbooks and for those issued before single-pass export, since
+        both sign the values openpyxl reads back.
         """
+        from openpyxl import load_workbook
+
         wb = load_workbook(io.BytesIO(workbook_bytes))
 
         if "_Integrity" not in wb.sheetnames:
@@ -168,26 +229,4 @@ class IntegrityChecker:
         if not stored_signature or not stored_signature.startswith("sha256:"):
             return False
 
-        # Recompute the hash
-        h = hashlib.sha256()
-
-        if "Sector Impacts" in wb.sheetnames:
-            ws = wb["Sector Impacts"]
-            max_row = ws.max_row or 1
-            range_hash = _compute_range_hash(ws, 1, max_row, 1, 8)
-            h.update(range_hash.encode())
-
-        if "Input Vectors" in wb.sheetnames:
-            ws = wb["Input Vectors"]
-            max_row = ws.max_row or 1
-            range_hash = _compute_range_hash(ws, 1, max_row, 1, 2)
-            h.update(range_hash.encode())
-
-        if "Run Metadata" in wb.sheetnames:
-            ws = wb["Run Metadata"]
-            max_row = ws.max_row or 1
-            range_hash = _compute_range_hash(ws, 1, max_row, 1, 2)
-            h.update(range_hash.encode())
-
-        computed = f"sha256:{h.hexdigest()}"
-        return computed == stored_signature
+        return _workbook_signature(wb) == stored_signature
@@ -3,7 +3,9 @@
 Coordinate the full export pipeline:
 1. Check NFF gate first (governed mode only)
 2. Check synthetic-fallback provenance (governed mode only)
-3. Generate requested formats (Excel/PPTX)
+3. Generate requested formats (Excel/PPTX) — concurrently in a process
+   pool when several formats need rendering; base decks come from the
+   per-run render cache on repeat exports
 4. Apply watermarks (sandbox or governed)
 5. Compute checksums (SHA-256)
 6. Create Export record
@@ -15,13 +17,17 @@ Deterministic — no LLM calls.
 from __future__ import annotations
 
 import hashlib
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import StrEnum
 from uuid import UUID
 
 from src.export.excel_export import ExcelExporter
 from src.export.pptx_export import PptxExporter
-from src.export.watermark import WatermarkService
+from src.export.render_cache import RenderCache, pack_data_hash
+from src.export.watermark import ExcelWatermark, WatermarkService
 from src.governance.publication_gate import PublicationGate
 from src.models.common import ExportMode, new_uuid7, utc_now
 from src.models.governance import Claim
@@ -60,14 +66,77 @@ class ExportRecord:
     blocking_reasons: list[str] = field(default_factory=list)
 
 
+# ---------------------------------------------------------------------------
+# Format renderers (module-level so they can run in a process pool)
+# ---------------------------------------------------------------------------
+
+# Formats whose unwatermarked base is cached. Excel is not: it stamps its
+# watermark while streaming, so a cached base would need an extra
+# load/save to re-stamp — as costly as rendering it again.
+_CACHED_FORMATS = frozenset({"pptx"})
+
+_RENDERER_VERSIONS: dict[str, str] = {
+    "excel": ExcelExporter.RENDERER_VERSION,
+    "pptx": PptxExporter.RENDERER_VERSION,
+}
+
+
+def _render_format(
+    fmt: str, pack_data: dict, excel_watermark: ExcelWatermark | None,
+) -> bytes:
+    """Render one format: stamped Excel workbook or unwatermarked PPTX deck."""
+    if fmt == "excel":
+        return ExcelExporter().export(pack_data, watermark=excel_watermark)
+    return PptxExporter().export(pack_data)
+
+
+def _render_all(
+    formats: list[str],
+    pack_data: dict,
+    excel_watermark: ExcelWatermark | None,
+    pool: Executor | None,
+) -> dict[str, bytes]:
+    """Render formats, concurrently when a pool is given and it pays off."""
+    if pool is None or len(formats) < 2:
+        return {f: _render_format(f, pack_data, excel_watermark) for f in formats}
+    futures = {f: pool.submit(_render_format, f, pack_data, excel_watermark) for f in formats}
+    return {f: future.result() for f, future in futures.items()}
+
+
+_render_pool_lock = threading.Lock()
+_render_pool: ProcessPoolExecutor | None = None
+
+
+def get_render_pool() -> ProcessPoolExecutor | None:
+    """Get or create the shared render process pool (None when disabled)."""
+    global _render_pool
+    if _render_pool is not None:
+        return _render_pool
+    from src.config.settings import get_settings
+
+    processes = get_settings().EXPORT_RENDER_PROCESSES
+    if processes < 2:
+        return None
+    # Export jobs call this from several worker threads; only one may
+    # create the pool.
+    with _render_pool_lock:
+        if _render_pool is None:
+            # spawn: export jobs run on worker threads, and forking a
+            # threaded process can deadlock on inherited locks
+            _render_pool = ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _render_pool
+
+
 class ExportOrchestrator:
     """Coordinate the full export pipeline."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, render_pool: Executor | None = None) -> None:
         self._gate = PublicationGate()
-        self._excel = ExcelExporter()
-        self._pptx = PptxExporter()
         self._watermark = WatermarkService()
+        self._render_pool = render_pool
 
     def execute(
         self,
@@ -76,14 +145,19 @@ class ExportOrchestrator:
         claims: list[Claim],
         quality_assessment: RunQualityAssessment | None = None,
         model_provenance_disallowed: bool = False,
+        export_id: UUID | None = None,
+        render_cache: RenderCache | None = None,
     ) -> ExportRecord:
         """Execute the export pipeline.
 
         D-5.1: effective_used_synthetic = quality flag OR model provenance
         disallowed. Does not mutate the quality payload — computes the
-        effective decision independently.
+        effective decision independently. export_id is pre-allocated when
+        the export row was created before the job ran. With a
+        render_cache, base decks are reused across exports of the same
+        run and pack data; only watermark/metadata layers are re-applied.
         """
-        export_id = new_uuid7()
+        export_id = export_id or new_uuid7()
 
         # 1. NFF gate check (governed only)
         if request.mode == ExportMode.GOVERNED:
@@ -135,29 +209,57 @@ class ExportOrchestrator:
             )
 
         # 3. Generate formats
-        artifacts: dict[str, bytes] = {}
         now = utc_now()
+        formats = [
+            f for f in dict.fromkeys(request.export_formats)
+            if f in _RENDERER_VERSIONS
+        ]
 
-        for fmt in request.export_formats:
-            if fmt == "excel":
-                raw = self._excel.export(request.pack_data)
-                if request.mode == ExportMode.SANDBOX:
-                    raw = self._watermark.apply_sandbox_excel(raw)
-                else:
-                    raw = self._watermark.apply_governed_excel(
-                        raw, run_id=request.run_id, timestamp=now,
-                    )
-                artifacts["excel"] = raw
+        # Watermark is stamped while the workbook streams out
+        if request.mode == ExportMode.SANDBOX:
+            excel_watermark = self._watermark.sandbox_excel_watermark()
+        else:
+            excel_watermark = self._watermark.governed_excel_watermark(
+                run_id=request.run_id, timestamp=now,
+            )
+
+        rendered: dict[str, bytes] = {}
+        cache_keys: dict[str, str] = {}
+        if render_cache is not None:
+            pack_hash = pack_data_hash(request.pack_data)
+            for fmt in formats:
+                if fmt not in _CACHED_FORMATS:
+                    continue
+                cache_keys[fmt] = RenderCache.build_key(
+                    request.run_id, fmt, _RENDERER_VERSIONS[fmt], pack_hash,
+                )
+                cached = render_cache.get(cache_keys[fmt])
+                if cached is not None:
+                    rendered[fmt] = cached
 
-            elif fmt == "pptx":
-                raw = self._pptx.export(request.pack_data)
+        pool = self._render_pool if self._render_pool is not None else get_render_pool()
+        fresh = _render_all(
+            [f for f in formats if f not in rendered],
+            request.pack_data, excel_watermark, pool,
+        )
+        if render_cache is not None:
+            for fmt, data in fresh.items():
+                if fmt in cache_keys:
+                    render_cache.put(cache_keys[fmt], data)
+        rendered.update(fresh)
+
+        # Watermark/metadata layer for formats rendered unstamped
+        artifacts: dict[str, bytes] = {}
+        for fmt in formats:
+            raw = rendered[fmt]
+            if fmt == "pptx":
                 if request.mode == ExportMode.SANDBOX:
                     raw = self._watermark.apply_sandbox_pptx(raw)
                 else:
                     raw = self._watermark.apply_governed_pptx(
                         raw, run_id=request.run_id, timestamp=now,
                     )
-                artifacts["pptx"] = raw
+            artifacts[fmt] = raw
 
         # 4. Compute checksums
         checksums: dict[str, str] = {}
@@ -8,20 +8,31 @@ Generate deck-ready slides:
 - Assumption summary
 - Evidence appendix references
 
-Uses python-pptx. Deterministic — no LLM calls.
+Uses python-pptx, imported on first export so that importing this
+module (API startup, workers) does not load it. Deterministic — no LLM
+calls.
 """
 
+from __future__ import annotations
+
 import io
+from typing import TYPE_CHECKING
 
-from pptx import Presentation
-from pptx.util import Inches, Pt
+if TYPE_CHECKING:
+    from pptx.presentation import Presentation
 
 
 class PptxExporter:
     """Generate governed PowerPoint presentation."""
 
+    # Bump when slide content or layout changes (invalidates render cache)
+    RENDERER_VERSION = "1"
+
     def export(self, pack_data: dict) -> bytes:
         """Generate PPTX bytes from Decision Pack data."""
+        from pptx import Presentation
+        from pptx.util import Inches
+
         prs = Presentation()
         prs.slide_width = Inches(13.333)
         prs.slide_height = Inches(7.5)
@@ -38,6 +49,8 @@ class PptxExporter:
         return buf.getvalue()
 
     def _add_title_slide(self, prs: Presentation, data: dict) -> None:
+        from pptx.util import Inches, Pt
+
         slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
         txBox = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(10), Inches(2))
         tf = txBox.text_frame
@@ -52,6 +65,8 @@ class PptxExporter:
         sub.font.size = Pt(18)
 
     def _add_headline_slide(self, prs: Presentation, data: dict) -> None:
+        from pptx.util import Inches, Pt
+
         slide = prs.slides.add_slide(prs.slide_layouts[6])
         summary = data.get("executive_summary", {})
 
@@ -88,6 +103,8 @@ class PptxExporter:
         sub.font.size = Pt(16)
 
     def _add_sector_impact_slide(self, prs: Presentation, data: dict) -> None:
+        from pptx.util import Inches, Pt
+
         slide = prs.slides.add_slide(prs.slide_layouts[6])
         impacts = data.get("sector_impacts", [])
 
@@ -116,6 +133,8 @@ class PptxExporter:
             table.cell(row_idx, 4).text = f"{si.get('multiplier', 0):.2f}"
 
     def _add_sensitivity_slide(self, prs: Presentation, data: dict) -> None:
+        from pptx.util import Inches, Pt
+
         slide = prs.slides.add_slide(prs.slide_layouts[6])
         sensitivity = data.get("sensitivity", [])
 
@@ -141,6 +160,8 @@ class PptxExporter:
                 table.cell(row_idx, 3).text = f"{s.get('high', 0):,.0f}"
 
     def _add_assumptions_slide(self, prs: Presentation, data: dict) -> None:
+        from pptx.util import Inches, Pt
+
         slide = prs.slides.add_slide(prs.slide_layouts[6])
         assumptions = data.get("assumptions", [])
 
@@ -166,6 +187,8 @@ class PptxExporter:
                 table.cell(row_idx, 3).text = a.get("status", "")
 
     def _add_evidence_slide(self, prs: Presentation, data: dict) -> None:
+        from pptx.util import Inches, Pt
+
         slide = prs.slides.add_slide(prs.slide_layouts[6])
         evidence = data.get("evidence_ledger", [])
 
@@ -0,0 +1,230 @@
+"""Per-run render cache for unwatermarked export artifacts.
+
+Re-exporting a run (sandbox, then governed, then for another audience)
+used to rebuild the same deck from scratch. Base artifacts are now
+stored in ExportArtifactStorage under
+
+    render-cache/{run_id}/{format}-v{renderer_version}-{pack_hash}.{ext}
+
+so a repeat export only re-applies the watermark/metadata layer. The
+cache is bounded by total bytes; least recently used entries are evicted
+first. Cache failures never fail an export — they are logged and the
+artifact is rendered as if the cache were empty.
+
+One RenderCache is shared per storage root (get_render_cache). It keeps
+an in-memory LRU index of entry sizes, seeded by a directory scan on
+first use and updated on every get/put, so a put costs no directory
+walk. Other processes writing to the same storage are picked up by a
+rescan whenever the tracked total crosses the limit, before evicting.
+
+Deterministic — no LLM calls.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.export.artifact_storage import FORMAT_EXTENSIONS, ExportArtifactStorage
+
+logger = logging.getLogger(__name__)
+
+RENDER_CACHE_PREFIX = "render-cache"
+
+
+def pack_data_hash(pack_data: dict) -> str:
+    """Stable SHA-256 of Decision Pack data (key order independent)."""
+    canonical = json.dumps(pack_data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Hit-rate counters
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class RenderCacheStats:
+    """Point-in-time render cache counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+class RenderCacheCounters:
+    """Process-wide, thread-safe hit/miss/eviction counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def record_hit(self, count: int = 1) -> None:
+        with self._lock:
+            self._hits += count
+
+    def record_miss(self, count: int = 1) -> None:
+        with self._lock:
+            self._misses += count
+
+    def record_eviction(self, count: int = 1) -> None:
+        with self._lock:
+            self._evictions += count
+
+    def snapshot(self) -> RenderCacheStats:
+        with self._lock:
+            return RenderCacheStats(
+                hits=self._hits, misses=self._misses, evictions=self._evictions,
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hits = self._misses = self._evictions = 0
+
+
+render_cache_counters = RenderCacheCounters()
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+
+class RenderCache:
+    """Size-bounded LRU of base renders backed by ExportArtifactStorage.
+
+    Use get_render_cache() outside tests so every job and request in the
+    process shares one index and lock.
+    """
+
+    def __init__(
+        self,
+        storage: ExportArtifactStorage,
+        *,
+        max_bytes: int,
+        counters: RenderCacheCounters | None = None,
+    ) -> None:
+        self._storage = storage
+        self._max_bytes = max_bytes
+        self._counters = counters if counters is not None else render_cache_counters
+        self._lock = threading.Lock()
+        # key -> size, least recently used first; None until the first scan
+        self._index: OrderedDict[str, int] | None = None
+        self._bytes = 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @staticmethod
+    def build_key(run_id: UUID, fmt: str, renderer_version: str, pack_hash: str) -> str:
+        ext = FORMAT_EXTENSIONS.get(fmt, fmt)
+        return f"{RENDER_CACHE_PREFIX}/{run_id}/{fmt}-v{renderer_version}-{pack_hash}.{ext}"
+
+    def stats(self) -> RenderCacheStats:
+        return self._counters.snapshot()
+
+    def get(self, key: str) -> bytes | None:
+        """Cached bytes for a key, or None. Records a hit or miss."""
+        try:
+            data = self._storage.retrieve(key)
+            self._storage.touch(key)
+        except FileNotFoundError:
+            self._counters.record_miss()
+            with self._lock:
+                self._forget(key)
+            return None
+        except OSError:
+            logger.warning("Render cache read failed for %s", key, exc_info=True)
+            self._counters.record_miss()
+            return None
+        self._counters.record_hit()
+        with self._lock:
+            self._track(key, len(data))
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store a base render, then evict LRU entries over the byte limit."""
+        if len(data) > self._max_bytes:
+            return
+        try:
+            self._storage.store(key, data)
+            with self._lock:
+                self._track(key, len(data))
+                if self._bytes > self._max_bytes:
+                    self._rescan()
+                    self._evict()
+        except OSError:
+            logger.warning("Render cache write failed for %s", key, exc_info=True)
+
+    def bytes_used(self) -> int:
+        with self._lock:
+            self._ensure_index()
+            return self._bytes
+
+    # -- index (callers hold self._lock) ------------------------------------
+
+    def _ensure_index(self) -> OrderedDict[str, int]:
+        return self._index if self._index is not None else self._rescan()
+
+    def _rescan(self) -> OrderedDict[str, int]:
+        entries = sorted(
+            self._storage.list_prefix(RENDER_CACHE_PREFIX), key=lambda e: e.modified_at,
+        )
+        self._index = OrderedDict((e.key, e.size) for e in entries)
+        self._bytes = sum(self._index.values())
+        return self._index
+
+    def _track(self, key: str, size: int) -> None:
+        index = self._ensure_index()
+        self._bytes += size - index.pop(key, 0)
+        index[key] = size
+
+    def _forget(self, key: str) -> None:
+        if self._index is not None and key in self._index:
+            self._bytes -= self._index.pop(key)
+
+    def _evict(self) -> None:
+        index = self._ensure_index()
+        while self._bytes > self._max_bytes and index:
+            key, size = index.popitem(last=False)
+            self._storage.delete(key)
+            self._bytes -= size
+            self._counters.record_eviction()
+
+
+# ---------------------------------------------------------------------------
+# Process-wide instances
+# ---------------------------------------------------------------------------
+
+_caches_lock = threading.Lock()
+_caches: dict[tuple[str, int], RenderCache] = {}
+
+
+def get_render_cache(storage: ExportArtifactStorage, *, max_bytes: int) -> RenderCache:
+    """Shared RenderCache for a storage root (one index and lock per process)."""
+    key = (str(storage.root.resolve()), max_bytes)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = RenderCache(storage, max_bytes=max_bytes)
+        return cache
+
+
+def reset_render_caches() -> None:
+    """Drop shared instances (tests, config reload)."""
+    with _caches_lock:
+        _caches.clear()
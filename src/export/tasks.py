@@ -0,0 +1,170 @@
+"""Export job workers — background export generation.
+
+When CELERY_BROKER_URL is configured, export jobs run in a Celery worker
+and the API returns the export as PENDING. When empty (dev/test), jobs
+run on the local in-process worker: openpyxl/python-pptx generation
+executes on a small thread pool so the event loop stays responsive, and
+the request awaits the final status.
+
+The job itself (src.services.export_execution.run_export_job) is shared
+by both paths.
+"""
+
+import asyncio
+import functools
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, TypeVar
+from uuid import UUID
+
+from src.config.settings import get_settings
+
+if TYPE_CHECKING:
+    from celery import Celery, Task
+
+    from src.services.export_execution import ExportExecutionInput
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# ---------------------------------------------------------------------------
+# Local in-process worker (lazy init)
+# ---------------------------------------------------------------------------
+
+_local_executor: ThreadPoolExecutor | None = None
+
+
+def get_local_executor() -> ThreadPoolExecutor:
+    """Get or create the in-process export worker pool."""
+    global _local_executor
+    if _local_executor is None:
+        _local_executor = ThreadPoolExecutor(
+            max_workers=max(1, get_settings().EXPORT_LOCAL_WORKERS),
+            thread_name_prefix="export-worker",
+        )
+    return _local_executor
+
+
+async def run_on_local_worker(
+    fn: Callable[..., _T], /, *args: object, **kwargs: object,
+) -> _T:
+    """Run a blocking export step on the local worker pool and await it."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_local_executor(), functools.partial(fn, *args, **kwargs),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Celery task wrapper
+# ---------------------------------------------------------------------------
+
+
+class ExportRowNotVisibleError(RuntimeError):
+    """The PENDING export row is not committed yet; the task will retry."""
+
+
+def _celery_export_task(
+    export_id_str: str,
+    workspace_id_str: str,
+    run_id_str: str,
+    mode: str,
+    export_formats: list[str],
+    pack_data: dict,
+) -> str:
+    """Celery task that runs an export job in a worker process.
+
+    Creates its own async session and runs the shared job function.
+    All UUIDs are serialized as strings for JSON transport.
+    """
+    from src.db.session import async_session_factory
+    from src.export.artifact_storage import ExportArtifactStorage
+    from src.models.common import ExportMode
+    from src.repositories.data_quality import DataQualityRepository
+    from src.repositories.engine import ModelVersionRepository, RunSnapshotRepository
+    from src.repositories.exports import ExportRepository
+    from src.repositories.governance import ClaimRepository
+    from src.services.export_execution import (
+        ExportExecutionInput,
+        ExportRepositories,
+        run_export_job,
+    )
+
+    export_id = UUID(export_id_str)
+
+    async def _run() -> str:
+        async with async_session_factory() as session:
+            export_repo = ExportRepository(session)
+            # The API commits the PENDING row after dispatching; retry
+            # until it is visible rather than generating an orphan export.
+            if await export_repo.get(export_id) is None:
+                raise ExportRowNotVisibleError(
+                    f"Export {export_id} not found (not committed yet?)",
+                )
+
+            repos = ExportRepositories(
+                export_repo=export_repo,
+                claim_repo=ClaimRepository(session),
+                quality_repo=DataQualityRepository(session),
+                snap_repo=RunSnapshotRepository(session),
+                mv_repo=ModelVersionRepository(session),
+                artifact_store=ExportArtifactStorage(
+                    storage_root=get_settings().OBJECT_STORAGE_PATH,
+                ),
+            )
+            result = await run_export_job(
+                export_id=export_id,
+                input=ExportExecutionInput(
+                    workspace_id=UUID(workspace_id_str),
+                    run_id=UUID(run_id_str),
+                    mode=ExportMode(mode),
+                    export_formats=export_formats,
+                    pack_data=pack_data,
+                ),
+                repos=repos,
+            )
+
+            await session.commit()
+            return result.status
+
+    return asyncio.run(_run())
+
+
+EXPORT_TASK_NAME = "impactos.export"
+
+
+def register_export_task(app: "Celery") -> "Task":
+    """Register the export task on ``app`` and return it.
+
+    Called from get_celery_app so the worker process, which only imports
+    src.ingestion.tasks, knows the task before any message arrives.
+    """
+    if EXPORT_TASK_NAME in app.tasks:
+        return app.tasks[EXPORT_TASK_NAME]
+    return app.task(
+        name=EXPORT_TASK_NAME,
+        autoretry_for=(ExportRowNotVisibleError,),
+        retry_backoff=True,
+        retry_backoff_max=60,
+        max_retries=5,
+    )(_celery_export_task)
+
+
+def dispatch_export(*, export_id: UUID, input: "ExportExecutionInput") -> None:
+    """Dispatch an export job to a Celery worker.
+
+    Serializes all arguments as JSON-safe types for Celery transport.
+    """
+    from src.ingestion.tasks import get_celery_app
+
+    task = get_celery_app().tasks[EXPORT_TASK_NAME]
+    task.delay(
+        str(export_id),
+        str(input.workspace_id),
+        str(input.run_id),
+        input.mode.value,
+        list(input.export_formats),
+        input.pack_data,
+    )
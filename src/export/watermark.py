@@ -5,38 +5,63 @@ page/slide/sheet.
 Governed exports: run_id and timestamp footer.
 Watermarks are tied to the integrity signature — removing them breaks it.
 
-Deterministic — no LLM calls.
+Deterministic — no LLM calls. openpyxl / python-pptx are imported on
+first use so importing this module stays cheap.
 """
 
+from __future__ import annotations
+
 import io
+from dataclasses import dataclass
 from datetime import datetime
+from typing import TYPE_CHECKING
 from uuid import UUID
 
-from openpyxl import load_workbook
-from pptx import Presentation
-from pptx.dml.color import RGBColor
-from pptx.util import Inches, Pt
+if TYPE_CHECKING:
+    from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+    from openpyxl.worksheet.worksheet import Worksheet
 
 SANDBOX_WATERMARK = "DRAFT \u2014 FAILS NFF GOVERNANCE"
 
 
+@dataclass(frozen=True)
+class ExcelWatermark:
+    """Header/footer text stamped on every visible sheet."""
+
+    header_text: str | None = None
+    header_size: int | None = None
+    footer_text: str | None = None
+
+    def apply(self, ws: Worksheet | WriteOnlyWorksheet) -> None:
+        """Stamp one worksheet (regular or write-only)."""
+        if self.header_text is not None:
+            ws.oddHeader.center.text = self.header_text
+            if self.header_size is not None:
+                ws.oddHeader.center.size = self.header_size
+        if self.footer_text is not None:
+            ws.oddFooter.center.text = self.footer_text
+
+
 class WatermarkService:
     """Apply watermarks to Excel and PowerPoint exports."""
 
     # ----- Excel -----
 
+    @staticmethod
+    def sandbox_excel_watermark() -> ExcelWatermark:
+        """Sandbox header, for stamping sheets while they are written."""
+        return ExcelWatermark(header_text=SANDBOX_WATERMARK, header_size=14)
+
+    @staticmethod
+    def governed_excel_watermark(*, run_id: UUID, timestamp: datetime) -> ExcelWatermark:
+        """Governed run_id + timestamp footer, for stamping sheets while written."""
+        return ExcelWatermark(
+            footer_text=f"Run: {run_id} | Generated: {timestamp.isoformat()}",
+        )
+
     def apply_sandbox_excel(self, workbook_bytes: bytes) -> bytes:
         """Apply sandbox watermark to every visible sheet header."""
-        wb = load_workbook(io.BytesIO(workbook_bytes))
-        for name in wb.sheetnames:
-            ws = wb[name]
-            if ws.sheet_state == "hidden":
-                continue
-            ws.oddHeader.center.text = SANDBOX_WATERMARK
-            ws.oddHeader.center.size = 14
-        buf = io.BytesIO()
-        wb.save(buf)
-        return buf.getvalue()
+        return self._apply_excel(workbook_bytes, self.sandbox_excel_watermark())
 
     def apply_governed_excel(
         self,
@@ -46,13 +71,22 @@ class WatermarkService:
         timestamp: datetime,
     ) -> bytes:
         """Apply governed footer with run_id and timestamp to every visible sheet."""
+        return self._apply_excel(
+            workbook_bytes,
+            self.governed_excel_watermark(run_id=run_id, timestamp=timestamp),
+        )
+
+    @staticmethod
+    def _apply_excel(workbook_bytes: bytes, watermark: ExcelWatermark) -> bytes:
+        """Stamp an already-serialized workbook (load + save round trip)."""
+        from openpyxl import load_workbook
+
         wb = load_workbook(io.BytesIO(workbook_bytes))
-        footer_text = f"Run: {run_id} | Generated: {timestamp.isoformat()}"
         for name in wb.sheetnames:
             ws = wb[name]
             if ws.sheet_state == "hidden":
                 continue
-            ws.oddFooter.center.text = footer_text
+            watermark.apply(ws)
         buf = io.BytesIO()
         wb.save(buf)
         return buf.getvalue()
@@ -61,6 +95,10 @@ class WatermarkService:
 
     def apply_sandbox_pptx(self, pptx_bytes: bytes) -> bytes:
         """Apply sandbox watermark text box to every slide."""
+        from pptx import Presentation
+        from pptx.dml.color import RGBColor
+        from pptx.util import Pt
+
         prs = Presentation(io.BytesIO(pptx_bytes))
         for slide in prs.slides:
             self._add_watermark_textbox(
@@ -81,6 +119,10 @@ class WatermarkService:
         timestamp: datetime,
     ) -> bytes:
         """Apply governed footer text box to every slide."""
+        from pptx import Presentation
+        from pptx.dml.color import RGBColor
+        from pptx.util import Pt
+
         prs = Presentation(io.BytesIO(pptx_bytes))
         footer_text = f"Run: {run_id} | {timestamp.isoformat()}"
         for slide in prs.slides:
@@ -99,11 +141,18 @@ class WatermarkService:
     def _add_watermark_textbox(
         slide,
         text: str,
-        font_size=Pt(12),
-        color=RGBColor(0xFF, 0x00, 0x00),
+        font_size=None,
+        color=None,
         bottom: bool = False,
     ) -> None:
-        """Add a watermark/footer text box to a slide."""
+        """Add a watermark/footer text box to a slide (default 12pt red)."""
+        from pptx.dml.color import RGBColor
+        from pptx.util import Inches, Pt
+
+        if font_size is None:
+            font_size = Pt(12)
+        if color is None:
+            color = RGBColor(0xFF, 0x00, 0x00)
         if bottom:
             top = Inches(7.0)
         else:
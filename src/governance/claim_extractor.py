@@ -5,11 +5,17 @@ MODEL / SOURCE_FACT / ASSUMPTION / RECOMMENDATION, flag claims that
 need evidence.
 
 Deterministic heuristic classifier — no LLM calls.
+
+The ASSUMPTION / RECOMMENDATION / SOURCE_FACT pattern families are
+compiled into one zero-width alternation with a named group per family,
+so each sentence is classified in a single regex scan with the original
+priority order preserved.
 """
 
 import re
 from collections import Counter
 from dataclasses import dataclass, field
+from functools import lru_cache
 from uuid import UUID
 
 from src.models.common import ClaimStatus, ClaimType
@@ -57,6 +63,51 @@ _MODEL_PATTERNS: list[re.Pattern[str]] = [
     re.compile(r"\b[\d.,]+\s*(?:billion|million|thousand|%)\b", re.IGNORECASE),
 ]
 
+# Classification priority: first family wins, MODEL is the fallback
+_CLASSIFIER_FAMILIES: tuple[tuple[str, ClaimType, list[re.Pattern[str]]], ...] = (
+    ("assumption", ClaimType.ASSUMPTION, _ASSUMPTION_PATTERNS),
+    ("recommendation", ClaimType.RECOMMENDATION, _RECOMMENDATION_PATTERNS),
+    ("source_fact", ClaimType.SOURCE_FACT, _SOURCE_FACT_PATTERNS),
+)
+
+
+def _inline(pattern: re.Pattern[str]) -> str:
+    """Pattern source wrapped so its IGNORECASE flag stays scoped to it."""
+    if pattern.flags & re.IGNORECASE:
+        return f"(?i:{pattern.pattern})"
+    return f"(?:{pattern.pattern})"
+
+
+# Zero-width lookahead: finditer probes every position without consuming
+# text, and at each position the highest-priority matching family wins.
+_CLASSIFIER_RE = re.compile(
+    "(?=" + "|".join(
+        f"(?P<{name}>" + "|".join(_inline(p) for p in patterns) + ")"
+        for name, _, patterns in _CLASSIFIER_FAMILIES
+    ) + ")"
+)
+_FAMILY_RANK = {name: rank for rank, (name, _, _) in enumerate(_CLASSIFIER_FAMILIES)}
+_FAMILY_TYPES = [claim_type for _, claim_type, _ in _CLASSIFIER_FAMILIES]
+
+# Split on sentence-ending punctuation followed by space or end
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+@lru_cache(maxsize=8192)
+def _classify_sentence(sentence: str) -> ClaimType:
+    best = len(_CLASSIFIER_FAMILIES)
+    for match in _CLASSIFIER_RE.finditer(sentence):
+        # Every alternative sits inside a named family group
+        rank = _FAMILY_RANK[str(match.lastgroup)]
+        if rank == 0:
+            return _FAMILY_TYPES[0]
+        best = min(best, rank)
+    if best < len(_FAMILY_TYPES):
+        return _FAMILY_TYPES[best]
+    # Default to MODEL for quantitative / analytical statements
+    return ClaimType.MODEL
+
+
 # Types that get auto-flagged as NEEDS_EVIDENCE
 _NEEDS_EVIDENCE_TYPES = frozenset({ClaimType.MODEL, ClaimType.SOURCE_FACT})
 
@@ -103,8 +154,7 @@ class ClaimExtractor:
     @staticmethod
     def _split_sentences(text: str) -> list[str]:
         """Split text into sentences, filtering empty/whitespace."""
-        # Split on sentence-ending punctuation followed by space or end
-        raw = re.split(r"(?<=[.!?])\s+", text.strip())
+        raw = _SENTENCE_SPLIT_RE.split(text.strip())
         return [s.strip() for s in raw if s.strip()]
 
     @staticmethod
@@ -113,20 +163,7 @@ class ClaimExtractor:
 
         Priority: ASSUMPTION > RECOMMENDATION > SOURCE_FACT > MODEL (fallback).
         """
-        for pattern in _ASSUMPTION_PATTERNS:
-            if pattern.search(sentence):
-                return ClaimType.ASSUMPTION
-
-        for pattern in _RECOMMENDATION_PATTERNS:
-            if pattern.search(sentence):
-                return ClaimType.RECOMMENDATION
-
-        for pattern in _SOURCE_FACT_PATTERNS:
-            if pattern.search(sentence):
-                return ClaimType.SOURCE_FACT
-
-        # Default to MODEL for quantitative / analytical statements
-        return ClaimType.MODEL
+        return _classify_sentence(sentence)
 
     def extract(
         self,
@@ -140,10 +177,9 @@ class ClaimExtractor:
         Each sentence becomes one claim. Claims of type MODEL or SOURCE_FACT
         are auto-transitioned to NEEDS_EVIDENCE.
         """
-        sentences = self._split_sentences(draft_text)
         claims: list[Claim] = []
 
-        for sentence in sentences:
+        for sentence in self._split_sentences(draft_text):
             claim_type = self._classify(sentence)
 
             # Determine initial status
@@ -5,10 +5,24 @@ attach evidence_refs to claims, transition claims from NEEDS_EVIDENCE
 to SUPPORTED.
 
 Deterministic keyword matching — no LLM calls.
+
+Snippets are matched through a per-document SnippetIndex: an inverted
+token → snippet posting list over precomputed meaningful-token sets.
+A claim only touches snippets that share at least one of its tokens,
+instead of re-tokenising every (claim, snippet) pair. Indexes are
+built lazily by EvidenceLinker through get_or_build and cached per
+source document, and result-set metric tokens are compiled once per
+link call.
 """
 
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
+from uuid import UUID
+
+import numpy as np
 
 from src.models.common import ClaimStatus
 from src.models.governance import Claim, EvidenceSnippet, ModelRef
@@ -19,30 +33,122 @@ from src.models.run import ResultSet
 # ---------------------------------------------------------------------------
 
 
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Very common stop words excluded from keyword overlap
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "is", "are", "was", "were", "in", "on", "at",
+    "to", "for", "of", "and", "or", "by", "it", "we", "be", "as",
+})
+
+_OVERLAP_THRESHOLD = 2
+
+
 def _tokenise(text: str) -> set[str]:
     """Extract lowercase alphanumeric tokens from text."""
-    return set(re.findall(r"[a-z0-9]+", text.lower()))
+    return set(_TOKEN_RE.findall(text.lower()))
+
 
+def _meaningful_tokens(text: str) -> frozenset[str]:
+    return frozenset(_tokenise(text) - _STOP_WORDS)
 
-def _keyword_overlap(text_a: str, text_b: str, threshold: int = 2) -> bool:
+
+def _keyword_overlap(text_a: str, text_b: str, threshold: int = _OVERLAP_THRESHOLD) -> bool:
     """Check if two texts share enough meaningful keywords."""
-    tokens_a = _tokenise(text_a)
-    tokens_b = _tokenise(text_b)
-    # Remove very common stop words
-    stop = {"the", "a", "an", "is", "are", "was", "were", "in", "on", "at",
-            "to", "for", "of", "and", "or", "by", "it", "we", "be", "as"}
-    meaningful_a = tokens_a - stop
-    meaningful_b = tokens_b - stop
-    overlap = meaningful_a & meaningful_b
+    overlap = _meaningful_tokens(text_a) & _meaningful_tokens(text_b)
     return len(overlap) >= threshold
 
 
-def _metric_matches_claim(metric_type: str, claim_text: str) -> bool:
-    """Check if a result set metric type is referenced in the claim."""
+def _metric_tokens(metric_type: str) -> frozenset[str]:
     # Normalise metric_type: "gdp_impact" → {"gdp", "impact"}
-    metric_tokens = set(metric_type.lower().replace("_", " ").split())
-    claim_lower = claim_text.lower()
-    return all(token in claim_lower for token in metric_tokens)
+    return frozenset(metric_type.lower().replace("_", " ").split())
+
+
+# ---------------------------------------------------------------------------
+# Snippet index
+# ---------------------------------------------------------------------------
+
+
+class SnippetIndex:
+    """Inverted token index over one document's snippets.
+
+    Holds each snippet's meaningful-token set and a posting list
+    token → snippet positions. Immutable once built.
+    """
+
+    def __init__(self, snippets: Sequence[EvidenceSnippet]) -> None:
+        self.snippet_ids: tuple[UUID, ...] = tuple(s.snippet_id for s in snippets)
+        postings: dict[str, list[int]] = {}
+        for pos, snippet in enumerate(snippets):
+            for token in _meaningful_tokens(snippet.extracted_text):
+                postings.setdefault(token, []).append(pos)
+        self._postings: dict[str, np.ndarray] = {
+            token: np.asarray(positions, dtype=np.int64)
+            for token, positions in postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.snippet_ids)
+
+    def matches(
+        self, tokens: Iterable[str], threshold: int = _OVERLAP_THRESHOLD,
+    ) -> list[int]:
+        """Positions of snippets sharing >= threshold of tokens, in order.
+
+        tokens must be distinct (a set), so the posting hit count per
+        snippet equals the size of the token-set intersection.
+        """
+        lists = [self._postings[t] for t in tokens if t in self._postings]
+        if len(lists) < threshold:
+            return []
+        hits = np.bincount(np.concatenate(lists), minlength=len(self.snippet_ids))
+        return np.flatnonzero(hits >= threshold).tolist()
+
+
+class SnippetIndexCache:
+    """Thread-safe LRU of SnippetIndex per source document.
+
+    An entry is reused only when the requested snippet ids match the
+    indexed ones exactly, so re-extraction (new snippet ids) rebuilds.
+    """
+
+    def __init__(self, max_documents: int = 256) -> None:
+        self._max_documents = max_documents
+        self._entries: OrderedDict[UUID, SnippetIndex] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, source_id: UUID, snippets: Sequence[EvidenceSnippet]) -> SnippetIndex:
+        """Build and cache the index for a document's snippets."""
+        index = SnippetIndex(snippets)
+        with self._lock:
+            self._entries[source_id] = index
+            self._entries.move_to_end(source_id)
+            while len(self._entries) > self._max_documents:
+                self._entries.popitem(last=False)
+        return index
+
+    def get_or_build(
+        self, source_id: UUID, snippets: Sequence[EvidenceSnippet],
+    ) -> SnippetIndex:
+        snippet_ids = tuple(s.snippet_id for s in snippets)
+        with self._lock:
+            index = self._entries.get(source_id)
+            if index is not None and index.snippet_ids == snippet_ids:
+                self._entries.move_to_end(source_id)
+                return index
+        return self.put(source_id, snippets)
+
+    def evict(self, source_id: UUID) -> None:
+        with self._lock:
+            self._entries.pop(source_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared process-wide cache; EvidenceLinker builds entries on first use.
+snippet_index_cache = SnippetIndexCache()
 
 
 # ---------------------------------------------------------------------------
@@ -83,6 +189,9 @@ class EvidenceLinker:
     states are passed through unchanged.
     """
 
+    def __init__(self, index_cache: SnippetIndexCache | None = None) -> None:
+        self._index_cache = index_cache if index_cache is not None else snippet_index_cache
+
     def link_evidence(
         self,
         *,
@@ -97,6 +206,27 @@ class EvidenceLinker:
         - Check result set metric match → attach ModelRef to model_refs
         - If any evidence found → transition to SUPPORTED
         """
+        # Group snippets by document, remembering input positions so refs
+        # are attached in the same order as a linear scan would.
+        by_source: dict[UUID, list[int]] = {}
+        for pos, snippet in enumerate(snippets):
+            by_source.setdefault(snippet.source_id, []).append(pos)
+        indexes = [
+            (
+                self._index_cache.get_or_build(
+                    source_id, [snippets[pos] for pos in positions],
+                ),
+                positions,
+            )
+            for source_id, positions in by_source.items()
+        ]
+
+        # Precompiled metric-token table: (tokens, ModelRef fields) per result set
+        metric_table = [
+            (_metric_tokens(rs.metric_type), rs.run_id, rs.metric_type, sum(rs.values.values()))
+            for rs in result_sets
+        ]
+
         linked: list[Claim] = []
 
         for claim in claims:
@@ -108,20 +238,21 @@ class EvidenceLinker:
             new_evidence_refs = list(claim.evidence_refs)
             new_model_refs = list(claim.model_refs)
 
-            # Match against snippets
-            for snippet in snippets:
-                if _keyword_overlap(claim.text, snippet.extracted_text):
-                    new_evidence_refs.append(snippet.snippet_id)
+            # Match against snippets (index probe, then restore input order)
+            claim_tokens = _meaningful_tokens(claim.text)
+            matched: list[int] = []
+            if len(claim_tokens) >= _OVERLAP_THRESHOLD:
+                for index, positions in indexes:
+                    matched.extend(positions[i] for i in index.matches(claim_tokens))
+            matched.sort()
+            new_evidence_refs.extend(snippets[pos].snippet_id for pos in matched)
 
             # Match against result sets
-            for rs in result_sets:
-                if _metric_matches_claim(rs.metric_type, claim.text):
+            claim_lower = claim.text.lower()
+            for tokens, run_id, metric, value in metric_table:
+                if all(token in claim_lower for token in tokens):
                     new_model_refs.append(
-                        ModelRef(
-                            run_id=rs.run_id,
-                            metric=rs.metric_type,
-                            value=sum(rs.values.values()),
-                        )
+                        ModelRef(run_id=run_id, metric=metric, value=value)
                     )
 
             # Determine if evidence was found
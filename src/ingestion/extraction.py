@@ -17,8 +17,6 @@ import csv
 import io
 from uuid import UUID
 
-import openpyxl
-
 from src.models.common import utc_now
 from src.models.document import (
     DocumentGraph,
@@ -103,6 +101,8 @@ class ExtractionService:
         Each sheet becomes a page. Bounding boxes are synthesized.
         Confidence is 1.0 (exact data).
         """
+        import openpyxl
+
         wb = openpyxl.load_workbook(io.BytesIO(content), read_only=True, data_only=True)
         pages: list[PageBlock] = []
 
@@ -3,15 +3,17 @@
 Uses pdfplumber for digital PDFs with table detection and text extraction.
 Falls back to camelot for complex table layouts when pdfplumber finds no tables.
 For scanned/image PDFs, attempts Tesseract OCR with Arabic language support.
+
+pdfplumber (and pdfminer/Pillow behind it) is imported on first use, so
+the API and workers that never parse a PDF do not pay for it.
 """
 
 import asyncio
 import io
 import logging
+from typing import Any
 from uuid import UUID
 
-import pdfplumber as _pdfplumber_lib
-
 from src.ingestion.providers.base import ExtractionOptions, ExtractionProvider
 from src.models.common import utc_now
 from src.models.document import (
@@ -26,6 +28,18 @@ from src.models.governance import BoundingBox
 
 logger = logging.getLogger(__name__)
 
+
+class _LazyPdfplumber:
+    """Resolves pdfplumber attributes on first access."""
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401 - proxies the pdfplumber module
+        import pdfplumber
+
+        return getattr(pdfplumber, name)
+
+
+_pdfplumber_lib = _LazyPdfplumber()
+
 _PDF_MIMES = frozenset({"application/pdf"})
 
 
@@ -9,6 +9,7 @@ used by both sync and async paths.
 
 import asyncio
 import logging
+import time
 from uuid import UUID
 
 from src.config.settings import get_settings
@@ -16,6 +17,7 @@ from src.ingestion.boq_structuring import BoQStructuringPipeline
 from src.ingestion.extraction import ExtractionService
 from src.ingestion.providers.base import ExtractionOptions
 from src.ingestion.providers.router import ExtractionRouter
+from src.observability.instrumentation import EXTRACTION_SECONDS
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +43,10 @@ def get_celery_app():
         )
         _celery_app.conf.task_serializer = "json"
         _celery_app.conf.result_serializer = "json"
+
+        from src.export.tasks import register_export_task
+
+        register_export_task(_celery_app)
     return _celery_app
 
 
@@ -110,11 +116,20 @@ async def run_extraction(
             doc_checksum=doc_checksum,
         )
 
+        extract_started = time.perf_counter()
         try:
             graph = await provider.extract(
                 document_bytes, mime_type, doc_id, options,
             )
+            EXTRACTION_SECONDS.observe(
+                time.perf_counter() - extract_started,
+                provider=provider.name, outcome="ok",
+            )
         except Exception as exc:
+            EXTRACTION_SECONDS.observe(
+                time.perf_counter() - extract_started,
+                provider=provider.name, outcome="error",
+            )
             is_non_dev = settings.ENVIRONMENT in ("staging", "prod")
             if provider.name == "azure-di" and not is_non_dev:
                 logger.warning(
@@ -126,9 +141,10 @@ async def run_extraction(
                 )
                 fallback = LocalPdfProvider()
                 fallback_provider_name = fallback.name
-                graph = await fallback.extract(
-                    document_bytes, mime_type, doc_id, options,
-                )
+                with EXTRACTION_SECONDS.time(provider=fallback.name, outcome="fallback"):
+                    graph = await fallback.extract(
+                        document_bytes, mime_type, doc_id, options,
+                    )
             else:
                 raise
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from typing import Literal
 
 from pydantic import BaseModel, Field
@@ -99,3 +100,20 @@ class ListSessionsResponse(BaseModel):
     """Paginated session list."""
 
     sessions: list[ChatSessionResponse]
+
+
+class ChatStreamEvent(BaseModel):
+    """One server-sent event of a streamed chat turn.
+
+    delta: LLM text chunk ({"text"}); tool_start / tool_end: tool progress
+    ({"index", "tool_name"} plus "result" on tool_end); message: the
+    persisted assistant ChatMessageResponse, whose content may replace the
+    streamed text with the post-execution narrative; error: {"detail"}.
+    """
+
+    event: Literal["delta", "tool_start", "tool_end", "message", "error"]
+    data: dict
+
+    def to_sse(self) -> str:
+        """Encode as a text/event-stream frame."""
+        return f"event: {self.event}\ndata: {json.dumps(self.data)}\n\n"
@@ -125,7 +125,9 @@ class StepMetadata(ImpactOSBase):
     """Metadata for a single Depth Engine step execution.
 
     Captures provider, model, token usage, and duration per step
-    for debugging, cost tracking, and reproducibility.
+    for debugging, cost tracking, and reproducibility. ``cache_hit`` marks
+    steps whose artifact was reused from an earlier run with the same
+    cache key (zero tokens, duration covers only the lookup).
     """
 
     step: int
@@ -137,6 +139,8 @@ class StepMetadata(ImpactOSBase):
     output_tokens: int = 0
     duration_ms: int | None = None
     generation_mode: str = "FALLBACK"
+    cache_hit: bool = False
+    cache_key: str | None = None
     timestamp: UTCTimestamp = Field(default_factory=utc_now)
 
 
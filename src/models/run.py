@@ -43,6 +43,9 @@ class RunSnapshot(ImpactOSBase, frozen=True):
     data_mode: str | None = None           # "curated_real" | "curated_estimated" | "synthetic_fallback" | "synthetic_only"
     data_source_id: str | None = None      # manifest dataset_id
     checksum_verified: bool = False
+    # Monte Carlo: seed and draw count, so sampled bands are reproducible
+    monte_carlo_seed: int | None = None
+    monte_carlo_draws: int | None = None
     created_at: UTCTimestamp = Field(default_factory=utc_now)
 
 
@@ -72,7 +75,7 @@ class ResultSet(ImpactOSBase, frozen=True):
 
     @model_validator(mode="after")
     def _validate_series_fields(self) -> "ResultSet":
-        valid_series_kinds = {"annual", "peak", "delta"}
+        valid_series_kinds = {"annual", "peak", "delta", "mc_cumulative", "mc_annual"}
 
         if self.series_kind is not None and self.series_kind not in valid_series_kinds:
             raise ValueError(
@@ -0,0 +1,398 @@
+"""Hot-path instrumentation — timers, counters and fixed-bucket histograms.
+
+Lightweight, dependency-free process metrics for the parts of a run
+where latency goes: engine stages, model loading, persistence, LLM calls
+and document extraction. Metrics are aggregated in memory and rendered
+in the Prometheus text exposition format (GET /metrics).
+
+Usage::
+
+    with ENGINE_STAGE_SECONDS.time(stage="phasing"):
+        ...
+    LLM_TOKENS_TOTAL.inc(n, provider="anthropic", direction="input")
+
+When the registry is disabled (INSTRUMENTATION_ENABLED=false), ``time()``
+returns a shared no-op context manager and ``observe``/``inc`` return
+immediately, so instrumented code pays one attribute check.
+
+Unlike MetricsStore (business time-motion events), these are operational
+metrics and are never persisted.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import TypeVar
+
+# Seconds; covers sub-millisecond cache hits up to multi-second LLM calls.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(pairs: Iterable[tuple[str, str]]) -> str:
+    inner = ",".join(f'{k}="{_escape(v)}"' for k, v in pairs)
+    return f"{{{inner}}}" if inner else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _NoopTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> _NoopTimer:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+_NOOP_TIMER = _NoopTimer()
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_labels", "_start")
+
+    def __init__(self, histogram: Histogram, labels: tuple[str, ...]) -> None:
+        self._histogram = histogram
+        self._labels = labels
+        self._start = 0.0
+
+    def __enter__(self) -> _Timer:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._histogram._observe(self._labels, time.perf_counter() - self._start)
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(
+        self,
+        registry: InstrumentationRegistry,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...],
+    ) -> None:
+        self._registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: dict[str, object]) -> tuple[str, ...]:
+        if set(labels) != set(self.label_names):
+            raise ValueError(
+                f"{self.name} expects labels {self.label_names}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    @abstractmethod
+    def render(self) -> list[str]:
+        """Return this metric's Prometheus exposition lines."""
+        ...
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Clear every recorded sample."""
+        ...
+
+
+class Counter(_Metric):
+    """Monotonic counter with optional labels."""
+
+    kind = "counter"
+
+    def __init__(
+        self,
+        registry: InstrumentationRegistry,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...],
+    ) -> None:
+        super().__init__(registry, name, documentation, label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        if not self._registry.enabled:
+            return
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        with self._lock:
+            return self._values.get(self._label_values(labels), 0.0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        lines: list[str] = []
+        for key, v in items:
+            labels = _format_labels(zip(self.label_names, key, strict=True))
+            lines.append(f"{self.name}{labels} {_format_value(v)}")
+        return lines
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+@dataclass
+class _HistogramSeries:
+    bucket_counts: list[int]
+    total: float = 0.0
+    count: int = 0
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """Cumulative bucket counts (aligned with ``buckets`` + +Inf), sum, count."""
+
+    buckets: tuple[float, ...]
+    cumulative_counts: tuple[int, ...]
+    total: float
+    count: int
+
+
+class Histogram(_Metric):
+    """Fixed-bucket histogram of observed durations (seconds)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        registry: InstrumentationRegistry,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...],
+        *,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(registry, name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[tuple[str, ...], _HistogramSeries] = {}
+
+    def time(self, **labels: object) -> _Timer | _NoopTimer:
+        """Context manager observing the elapsed wall time of its block."""
+        if not self._registry.enabled:
+            return _NOOP_TIMER
+        return _Timer(self, self._label_values(labels))
+
+    def observe(self, value: float, **labels: object) -> None:
+        if not self._registry.enabled:
+            return
+        self._observe(self._label_values(labels), value)
+
+    def _observe(self, key: tuple[str, ...], value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = _HistogramSeries(bucket_counts=[0] * (len(self.buckets) + 1))
+                self._series[key] = series
+            series.bucket_counts[index] += 1
+            series.total += value
+            series.count += 1
+
+    def snapshot(self, **labels: object) -> HistogramSnapshot:
+        key = self._label_values(labels)
+        with self._lock:
+            series = self._series.get(key)
+            counts = list(series.bucket_counts) if series else [0] * (len(self.buckets) + 1)
+            total = series.total if series else 0.0
+            count = series.count if series else 0
+        cumulative: list[int] = []
+        running = 0
+        for c in counts:
+            running += c
+            cumulative.append(running)
+        return HistogramSnapshot(
+            buckets=self.buckets,
+            cumulative_counts=tuple(cumulative),
+            total=total,
+            count=count,
+        )
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(
+                (key, list(s.bucket_counts), s.total, s.count)
+                for key, s in self._series.items()
+            )
+        lines: list[str] = []
+        bounds = [*self.buckets, math.inf]
+        for key, counts, total, count in items:
+            pairs = list(zip(self.label_names, key, strict=True))
+            running = 0
+            for bound, c in zip(bounds, counts, strict=True):
+                running += c
+                le = _format_labels([*pairs, ("le", _format_value(bound))])
+                lines.append(f"{self.name}_bucket{le} {running}")
+            lines.append(f"{self.name}_sum{_format_labels(pairs)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(pairs)} {count}")
+        return lines
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+@dataclass(frozen=True)
+class CollectedMetric:
+    """A metric family produced on demand by a collector at scrape time."""
+
+    name: str
+    kind: str  # "counter" or "gauge"
+    documentation: str
+    samples: list[tuple[dict[str, str], float]] = field(default_factory=list)
+
+
+_M = TypeVar("_M", bound=_Metric)
+
+
+class InstrumentationRegistry:
+    """Process-wide metric registry with Prometheus text rendering."""
+
+    def __init__(self, *, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], Iterable[CollectedMetric]]] = []
+
+    def counter(
+        self, name: str, documentation: str, *, labels: tuple[str, ...] = (),
+    ) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labels)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        *,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(
+            Histogram, name, documentation, labels, buckets=buckets,
+        )
+
+    def _get_or_create(
+        self,
+        cls: type[_M],
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...],
+        **kwargs: object,
+    ) -> _M:
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if not isinstance(existing, cls) or existing.label_names != labels:
+                    raise ValueError(f"Metric {name} already registered differently")
+                return existing
+            metric = cls(self, name, documentation, labels, **kwargs)
+            self._metrics[name] = metric
+            return metric
+
+    def register_collector(self, collector: Callable[[], Iterable[CollectedMetric]]) -> None:
+        """Add a callable sampled at render time (e.g. cache counters)."""
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in Prometheus text exposition format 0.0.4."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+            collectors = list(self._collectors)
+
+        lines: list[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        for collector in collectors:
+            for family in collector():
+                lines.append(f"# HELP {family.name} {family.documentation}")
+                lines.append(f"# TYPE {family.name} {family.kind}")
+                for labels, value in family.samples:
+                    lines.append(
+                        f"{family.name}{_format_labels(sorted(labels.items()))} "
+                        f"{_format_value(value)}"
+                    )
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Zero every metric (tests). Registrations are kept."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+
+registry = InstrumentationRegistry()
+
+
+# ---------------------------------------------------------------------------
+# Hot-path metrics
+# ---------------------------------------------------------------------------
+
+ENGINE_STAGE_SECONDS = registry.histogram(
+    "impactos_engine_stage_seconds",
+    "Time spent in each BatchRunner stage of a single run.",
+    labels=("stage",),
+)
+ENGINE_RUNS_TOTAL = registry.counter(
+    "impactos_engine_runs_total",
+    "Single runs executed by BatchRunner, by source (computed or cached).",
+    labels=("source",),
+)
+MODEL_LOAD_SECONDS = registry.histogram(
+    "impactos_model_load_seconds",
+    "Time to resolve a LoadedModel, by source (cache or db).",
+    labels=("source",),
+)
+PERSIST_SECONDS = registry.histogram(
+    "impactos_persist_seconds",
+    "Time to persist engine outputs, by entity.",
+    labels=("entity",),
+)
+LLM_CALL_SECONDS = registry.histogram(
+    "impactos_llm_call_seconds",
+    "LLM provider call latency including retries, by provider and outcome.",
+    labels=("provider", "outcome"),
+)
+LLM_TOKENS_TOTAL = registry.counter(
+    "impactos_llm_tokens_total",
+    "LLM tokens consumed, by provider and direction (input/output).",
+    labels=("provider", "direction"),
+)
+EXTRACTION_SECONDS = registry.histogram(
+    "impactos_extraction_seconds",
+    "Document extraction time, by provider and outcome.",
+    labels=("provider", "outcome"),
+)
+DB_POOL_WAIT_SECONDS = registry.histogram(
+    "impactos_db_pool_wait_seconds",
+    "Time to check a connection out of the pool (wait + connect), by role.",
+    labels=("role",),
+)
@@ -44,14 +44,26 @@ class MetricEvent:
 
 
 class MetricsStore:
-    """In-memory metrics store. Production replaces with PostgreSQL."""
+    """In-memory metrics store. Production replaces with PostgreSQL.
+
+    Keeps per-type running sums and per-key indexes so averages and
+    lookups do not rescan every recorded event.
+    """
 
     def __init__(self) -> None:
         self._events: list[MetricEvent] = []
+        self._by_engagement: dict[UUID, list[MetricEvent]] = {}
+        self._by_type: dict[MetricType, list[MetricEvent]] = {}
+        self._sum_by_type: dict[MetricType, float] = {}
 
     def record(self, event: MetricEvent) -> None:
         """Record a metric event."""
         self._events.append(event)
+        self._by_engagement.setdefault(event.engagement_id, []).append(event)
+        self._by_type.setdefault(event.metric_type, []).append(event)
+        self._sum_by_type[event.metric_type] = (
+            self._sum_by_type.get(event.metric_type, 0.0) + event.value
+        )
 
     def get_all(self) -> list[MetricEvent]:
         """Get all recorded events."""
@@ -59,15 +71,15 @@ class MetricsStore:
 
     def get_by_engagement(self, engagement_id: UUID) -> list[MetricEvent]:
         """Get events for a specific engagement."""
-        return [e for e in self._events if e.engagement_id == engagement_id]
+        return list(self._by_engagement.get(engagement_id, ()))
 
     def get_by_type(self, metric_type: MetricType) -> list[MetricEvent]:
         """Get events of a specific metric type."""
-        return [e for e in self._events if e.metric_type == metric_type]
+        return list(self._by_type.get(metric_type, ()))
 
     def average_by_type(self, metric_type: MetricType) -> float:
         """Compute average value for a metric type. Returns 0.0 if empty."""
-        events = self.get_by_type(metric_type)
-        if not events:
+        count = len(self._by_type.get(metric_type, ()))
+        if not count:
             return 0.0
-        return sum(e.value for e in events) / len(events)
+        return self._sum_by_type[metric_type] / count
@@ -0,0 +1,330 @@
+"""On-demand statistical profiling — collapsed-stack (flamegraph) artifacts.
+
+Admin-only, opt-in (PROFILING_ENABLED). Two entry points:
+
+- ProfilingMiddleware: a request carrying ``X-Profile: 1`` from a global
+  admin is sampled for its duration; the response gets ``X-Profile-Id``.
+- sample_process(): time-boxed whole-process sampling (admin endpoint).
+
+Sampling walks ``sys._current_frames()`` from a daemon thread every
+PROFILING_SAMPLE_INTERVAL_MS and aggregates stacks in the collapsed
+format consumed by flamegraph.pl / speedscope (``a;b;c <count>``), with
+the thread name as the root frame. Async handlers share the event-loop
+thread with concurrent requests, so a request profile shows everything
+that thread ran while the request was in flight.
+
+When profiling is disabled the middleware is not installed at all, so
+normal requests pay nothing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from pathlib import Path
+from types import FrameType
+
+import structlog
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from uuid_extensions import uuid7
+
+PROFILE_HEADER = "x-profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+_MAX_STACK_DEPTH = 128
+
+logger = structlog.get_logger(__name__)
+
+
+class ProfilingBusyError(Exception):
+    """A whole-process sample is already running."""
+
+
+# ---------------------------------------------------------------------------
+# Sampler
+# ---------------------------------------------------------------------------
+
+
+def _frame_label(frame: FrameType) -> str:
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{frame.f_code.co_name}"
+
+
+def collapse_stack(frame: FrameType | None) -> list[str]:
+    """Frame labels from root to leaf (at most _MAX_STACK_DEPTH)."""
+    labels: list[str] = []
+    while frame is not None and len(labels) < _MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+
+class StackSampler:
+    """Samples all thread stacks on a background thread."""
+
+    def __init__(self, interval_seconds: float) -> None:
+        self._interval = max(interval_seconds, 0.0005)
+        self._stacks: Counter[str] = Counter()
+        self._samples = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started_at = 0.0
+        self._duration = 0.0
+
+    @property
+    def sample_count(self) -> int:
+        return self._samples
+
+    @property
+    def duration_seconds(self) -> float:
+        return self._duration
+
+    def start(self) -> None:
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name="impactos-profiler", daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._duration = time.perf_counter() - self._started_at
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self._interval):
+            self.sample(exclude=own_id)
+
+    def sample(self, *, exclude: int | None = None) -> None:
+        """Take one sample of every thread except ``exclude``."""
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == exclude:
+                continue
+            stack = collapse_stack(frame)
+            if not stack:
+                continue
+            root = names.get(thread_id, f"thread-{thread_id}")
+            self._stacks[";".join([root, *stack])] += 1
+        self._samples += 1
+
+    def collapsed(self) -> str:
+        """Collapsed-stack text, heaviest stacks first."""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self._stacks.most_common()
+        )
+
+
+# ---------------------------------------------------------------------------
+# Artifact store
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class ProfileArtifact:
+    """Metadata for a stored collapsed-stack profile."""
+
+    profile_id: str
+    kind: str  # "request" or "process"
+    label: str
+    created_at: float
+    duration_seconds: float
+    sample_count: int
+    storage_key: str
+
+
+class ProfileStore:
+    """Keeps the most recent profiles on disk under ``<root>/profiles``."""
+
+    def __init__(self, storage_root: str, *, max_artifacts: int) -> None:
+        self._root = Path(storage_root)
+        self._lock = threading.Lock()
+        self._artifacts: deque[ProfileArtifact] = deque()
+        self._max_artifacts = max(1, max_artifacts)
+
+    def save(
+        self,
+        sampler: StackSampler,
+        *,
+        kind: str,
+        label: str,
+        profile_id: str | None = None,
+    ) -> ProfileArtifact:
+        profile_id = profile_id or str(uuid7())
+        key = f"profiles/{profile_id}.folded"
+        dest = self._root / key
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_text(sampler.collapsed())
+        artifact = ProfileArtifact(
+            profile_id=profile_id,
+            kind=kind,
+            label=label,
+            created_at=time.time(),
+            duration_seconds=sampler.duration_seconds,
+            sample_count=sampler.sample_count,
+            storage_key=key,
+        )
+        evicted: list[ProfileArtifact] = []
+        with self._lock:
+            self._artifacts.append(artifact)
+            while len(self._artifacts) > self._max_artifacts:
+                evicted.append(self._artifacts.popleft())
+        for old in evicted:
+            (self._root / old.storage_key).unlink(missing_ok=True)
+        return artifact
+
+    def list(self) -> list[ProfileArtifact]:
+        with self._lock:
+            return list(reversed(self._artifacts))
+
+    def get(self, profile_id: str) -> ProfileArtifact | None:
+        with self._lock:
+            for artifact in self._artifacts:
+                if artifact.profile_id == profile_id:
+                    return artifact
+        return None
+
+    def read(self, artifact: ProfileArtifact) -> str:
+        """Collapsed-stack text. Raises FileNotFoundError if removed."""
+        return (self._root / artifact.storage_key).read_text()
+
+
+_store_lock = threading.Lock()
+_store: ProfileStore | None = None
+_process_running = False
+
+
+def get_profile_store() -> ProfileStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            from src.config.settings import get_settings
+
+            settings = get_settings()
+            _store = ProfileStore(
+                settings.OBJECT_STORAGE_PATH,
+                max_artifacts=settings.PROFILING_MAX_ARTIFACTS,
+            )
+        return _store
+
+
+def reset_profile_store() -> None:
+    """Forget stored profile metadata (tests)."""
+    global _store
+    with _store_lock:
+        _store = None
+
+
+# ---------------------------------------------------------------------------
+# Whole-process sampling
+# ---------------------------------------------------------------------------
+
+
+async def sample_process(
+    seconds: float, *, interval_seconds: float, store: ProfileStore,
+) -> ProfileArtifact:
+    """Sample every thread for ``seconds`` without blocking the event loop.
+
+    Raises:
+        ProfilingBusyError: If another process sample is in progress.
+    """
+    global _process_running
+    if _process_running:
+        raise ProfilingBusyError("A process profile is already running")
+    _process_running = True
+    sampler = StackSampler(interval_seconds)
+    sampler.start()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        sampler.stop()
+        _process_running = False
+    artifact = await asyncio.to_thread(
+        store.save, sampler, kind="process", label=f"process {seconds:g}s",
+    )
+    logger.info(
+        "profile_captured",
+        profile_id=artifact.profile_id,
+        kind="process",
+        samples=artifact.sample_count,
+        duration_seconds=round(artifact.duration_seconds, 3),
+    )
+    return artifact
+
+
+# ---------------------------------------------------------------------------
+# Per-request middleware
+# ---------------------------------------------------------------------------
+
+
+class ProfilingMiddleware:
+    """Samples requests that ask for it (``X-Profile: 1``) from global admins.
+
+    Authorization reuses get_current_principal + require_global_role; any
+    auth failure simply leaves the request unprofiled — the route's own
+    dependencies still decide whether it succeeds.
+    """
+
+    def __init__(self, app: ASGIApp, *, interval_seconds: float) -> None:
+        self.app = app
+        self._interval = interval_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not await self._wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = str(uuid7())
+        label = f"{scope.get('method', '')} {scope.get('path', '')}"
+
+        async def _send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (PROFILE_ID_HEADER.lower().encode(), profile_id.encode()),
+                ]
+            await send(message)
+
+        sampler = StackSampler(self._interval)
+        structlog.contextvars.bind_contextvars(profile_id=profile_id)
+        sampler.start()
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            sampler.stop()
+            artifact = await asyncio.to_thread(
+                get_profile_store().save,
+                sampler, kind="request", label=label, profile_id=profile_id,
+            )
+            logger.info(
+                "profile_captured",
+                kind="request",
+                path=label,
+                samples=artifact.sample_count,
+                duration_seconds=round(artifact.duration_seconds, 3),
+            )
+            structlog.contextvars.unbind_contextvars("profile_id")
+
+    async def _wants_profile(self, scope: Scope) -> bool:
+        headers = dict(scope.get("headers") or [])
+        if headers.get(PROFILE_HEADER.encode(), b"").strip() not in (b"1", b"true"):
+            return False
+        from fastapi import HTTPException
+        from starlette.requests import Request
+
+        from src.api.auth_deps import get_current_principal, require_global_role
+
+        try:
+            principal = await get_current_principal(Request(scope))
+            await require_global_role("admin")(principal=principal)
+        except HTTPException:
+            return False
+        return True
+
@@ -1,5 +1,6 @@
 """Chat repositories — session and message persistence (Sprint 25)."""
 
+from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import select, update
@@ -86,6 +87,32 @@ class ChatSessionRepository:
         )
         await self._session.flush()
 
+    async def update_summary(
+        self,
+        session_id: UUID,
+        workspace_id: UUID,
+        *,
+        summary: str,
+        through_at: datetime,
+        through_message_id: UUID,
+        token_usage: dict | None = None,
+    ) -> None:
+        """Persist the running history summary and its keyset watermark."""
+        await self._session.execute(
+            update(ChatSessionRow)
+            .where(
+                ChatSessionRow.session_id == session_id,
+                ChatSessionRow.workspace_id == workspace_id,
+            )
+            .values(
+                context_summary=summary,
+                summary_through_at=through_at,
+                summary_through_message_id=through_message_id,
+                summary_token_usage=token_usage,
+            )
+        )
+        await self._session.flush()
+
 
 class ChatMessageRepository:
     """CRUD operations for chat messages."""
@@ -135,3 +162,71 @@ class ChatMessageRepository:
             .order_by(ChatMessageRow.created_at.asc())
         )
         return list(result.scalars().all())
+
+    async def list_recent(
+        self,
+        session_id: UUID,
+        *,
+        limit: int,
+        roles: tuple[str, ...] = ("user", "assistant"),
+        exclude_message_id: UUID | None = None,
+    ) -> list[ChatMessageRow]:
+        """Last ``limit`` messages in chronological order.
+
+        Reads backwards on (created_at, message_id), so cost depends on
+        the window size rather than the session length.
+        """
+        query = (
+            select(ChatMessageRow)
+            .where(
+                ChatMessageRow.session_id == session_id,
+                ChatMessageRow.role.in_(roles),
+            )
+            .order_by(ChatMessageRow.created_at.desc(), ChatMessageRow.message_id.desc())
+            .limit(limit)
+        )
+        if exclude_message_id is not None:
+            query = query.where(ChatMessageRow.message_id != exclude_message_id)
+        result = await self._session.execute(query)
+        return list(reversed(result.scalars().all()))
+
+    async def list_between(
+        self,
+        session_id: UUID,
+        *,
+        after: tuple[datetime, UUID] | None,
+        before: tuple[datetime, UUID],
+        roles: tuple[str, ...] = ("user", "assistant"),
+        limit: int | None = None,
+    ) -> list[ChatMessageRow]:
+        """Messages strictly between two (created_at, message_id) positions.
+
+        ``after=None`` starts at the beginning of the session.
+        """
+        before_ts, before_id = before
+        query = (
+            select(ChatMessageRow)
+            .where(
+                ChatMessageRow.session_id == session_id,
+                ChatMessageRow.role.in_(roles),
+                (ChatMessageRow.created_at < before_ts)
+                | (
+                    (ChatMessageRow.created_at == before_ts)
+                    & (ChatMessageRow.message_id < before_id)
+                ),
+            )
+            .order_by(ChatMessageRow.created_at.asc(), ChatMessageRow.message_id.asc())
+        )
+        if after is not None:
+            after_ts, after_id = after
+            query = query.where(
+                (ChatMessageRow.created_at > after_ts)
+                | (
+                    (ChatMessageRow.created_at == after_ts)
+                    & (ChatMessageRow.message_id > after_id)
+                ),
+            )
+        if limit is not None:
+            query = query.limit(limit)
+        result = await self._session.execute(query)
+        return list(result.scalars().all())
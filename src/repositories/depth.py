@@ -105,6 +105,7 @@ class DepthArtifactRepository:
         payload: dict,
         disclosure_tier: str = "TIER0",
         metadata_json: dict | None = None,
+        cache_key: str | None = None,
     ) -> DepthArtifactRow:
         now = utc_now()
         row = DepthArtifactRow(
@@ -114,6 +115,7 @@ class DepthArtifactRepository:
             payload=payload,
             disclosure_tier=disclosure_tier,
             metadata_json=metadata_json or {},
+            cache_key=cache_key,
             created_at=now,
         )
         self._session.add(row)
@@ -142,6 +144,16 @@ class DepthArtifactRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_by_cache_key(self, cache_key: str) -> DepthArtifactRow | None:
+        """Most recent artifact produced from identical step inputs."""
+        result = await self._session.execute(
+            select(DepthArtifactRow)
+            .where(DepthArtifactRow.cache_key == cache_key)
+            .order_by(DepthArtifactRow.created_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
     async def list_all(self) -> list[DepthArtifactRow]:
         result = await self._session.execute(select(DepthArtifactRow))
         return list(result.scalars().all())
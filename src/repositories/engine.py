@@ -1,14 +1,17 @@
-"""Engine repositories — model versions, model data, run snapshots, results, batches."""
+"""Engine repositories — model versions, model data, multipliers, snapshots, results, batches."""
 
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, func, or_, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.tables import (
     BatchRow,
     ModelDataRow,
     ModelVersionRow,
+    MultiplierTableRow,
     ResultSetRow,
     RunSnapshotRow,
 )
@@ -86,6 +89,73 @@ class ModelDataRepository:
         return await self._session.get(ModelDataRow, model_version_id)
 
 
+class MultiplierTableRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def create(
+        self, *, multiplier_table_id: UUID, model_version_id: UUID,
+        model_checksum: str, coefficients_hash: str, table_version: str,
+        content_hash: str, payload: dict, employment_row_id: int | None = None,
+    ) -> MultiplierTableRow:
+        """Insert a table, or return the one a concurrent builder stored first.
+
+        The insert runs in a SAVEPOINT so losing the race on
+        uq_multiplier_table_model_coefficients leaves the caller's
+        transaction usable.
+        """
+        row = MultiplierTableRow(
+            multiplier_table_id=multiplier_table_id,
+            model_version_id=model_version_id,
+            model_checksum=model_checksum,
+            coefficients_hash=coefficients_hash,
+            table_version=table_version,
+            content_hash=content_hash,
+            employment_row_id=employment_row_id,
+            payload=payload,
+            created_at=utc_now(),
+        )
+        try:
+            async with self._session.begin_nested():
+                self._session.add(row)
+        except IntegrityError:
+            existing = await self.get_for_model(
+                model_version_id, coefficients_hash, table_version,
+            )
+            if existing is None:
+                raise
+            return existing
+        return row
+
+    async def get_for_model(
+        self, model_version_id: UUID, coefficients_hash: str, table_version: str,
+    ) -> MultiplierTableRow | None:
+        result = await self._session.execute(
+            select(MultiplierTableRow).where(
+                MultiplierTableRow.model_version_id == model_version_id,
+                MultiplierTableRow.coefficients_hash == coefficients_hash,
+                MultiplierTableRow.table_version == table_version,
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def get_current(
+        self, model_version_id: UUID, employment_row_id: int | None, table_version: str,
+    ) -> MultiplierTableRow | None:
+        """Table built from these inputs, found without recomputing its hash."""
+        result = await self._session.execute(
+            select(MultiplierTableRow)
+            .where(
+                MultiplierTableRow.model_version_id == model_version_id,
+                MultiplierTableRow.table_version == table_version,
+                MultiplierTableRow.employment_row_id.is_not_distinct_from(employment_row_id),
+            )
+            .order_by(MultiplierTableRow.created_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+
 class RunSnapshotRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -99,7 +169,11 @@ class RunSnapshotRepository:
                      source_checksums: list | None = None,
                      workspace_id: UUID | None = None,
                      scenario_spec_id: UUID | None = None,
-                     scenario_spec_version: int | None = None) -> RunSnapshotRow:
+                     scenario_spec_version: int | None = None,
+                     input_fingerprint: str | None = None,
+                     result_source_run_id: UUID | None = None,
+                     monte_carlo_seed: int | None = None,
+                     monte_carlo_draws: int | None = None) -> RunSnapshotRow:
         row = RunSnapshotRow(
             run_id=run_id, model_version_id=model_version_id,
             taxonomy_version_id=taxonomy_version_id,
@@ -112,6 +186,10 @@ class RunSnapshotRepository:
             workspace_id=workspace_id,
             scenario_spec_id=scenario_spec_id,
             scenario_spec_version=scenario_spec_version,
+            input_fingerprint=input_fingerprint,
+            result_source_run_id=result_source_run_id,
+            monte_carlo_seed=monte_carlo_seed,
+            monte_carlo_draws=monte_carlo_draws,
             created_at=utc_now(),
         )
         self._session.add(row)
@@ -121,6 +199,40 @@ class RunSnapshotRepository:
     async def get(self, run_id: UUID) -> RunSnapshotRow | None:
         return await self._session.get(RunSnapshotRow, run_id)
 
+    async def get_many(self, run_ids: list[UUID]) -> dict[UUID, RunSnapshotRow]:
+        """Fetch several snapshots in one query. Missing run_ids are absent."""
+        if not run_ids:
+            return {}
+        result = await self._session.execute(
+            select(RunSnapshotRow).where(RunSnapshotRow.run_id.in_(set(run_ids)))
+        )
+        return {row.run_id: row for row in result.scalars().all()}
+
+    async def find_by_fingerprints(
+        self, fingerprints: list[str], *, workspace_id: UUID | None,
+    ) -> dict[str, UUID]:
+        """Map input fingerprints to the run holding their stored result sets.
+
+        Scoped to a workspace so results are never shared across workspaces.
+        Linked snapshots resolve to their source run.
+        """
+        if not fingerprints:
+            return {}
+        result = await self._session.execute(
+            select(RunSnapshotRow)
+            .where(
+                RunSnapshotRow.input_fingerprint.in_(set(fingerprints)),
+                RunSnapshotRow.workspace_id == workspace_id,
+            )
+            .order_by(RunSnapshotRow.created_at)
+        )
+        found: dict[str, UUID] = {}
+        for row in result.scalars().all():
+            fingerprint = row.input_fingerprint
+            if fingerprint is not None and fingerprint not in found:
+                found[fingerprint] = row.result_source_run_id or row.run_id
+        return found
+
     async def get_by_workspace(self, workspace_id: UUID) -> list[RunSnapshotRow]:
         """Get all run snapshots for a workspace (Amendment 3)."""
         result = await self._session.execute(
@@ -129,18 +241,57 @@ class RunSnapshotRepository:
         return list(result.scalars().all())
 
     async def list_for_workspace(
-        self, workspace_id: UUID, *, limit: int = 50, offset: int = 0,
+        self,
+        workspace_id: UUID,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        cursor_created_at: datetime | None = None,
+        cursor_run_id: UUID | None = None,
     ) -> list[RunSnapshotRow]:
-        """List run snapshots for a workspace, newest first (paginated)."""
-        result = await self._session.execute(
+        """List run snapshots for a workspace, newest first.
+
+        With a cursor (the last row of the previous page) this is keyset
+        pagination over (created_at, run_id), served by
+        ix_run_snapshots_workspace_created; ``offset`` is then ignored.
+        """
+        stmt = (
             select(RunSnapshotRow)
             .where(RunSnapshotRow.workspace_id == workspace_id)
-            .order_by(RunSnapshotRow.created_at.desc())
+            .order_by(RunSnapshotRow.created_at.desc(), RunSnapshotRow.run_id.desc())
             .limit(limit)
-            .offset(offset)
         )
+        if cursor_created_at is not None and cursor_run_id is not None:
+            stmt = stmt.where(
+                (RunSnapshotRow.created_at < cursor_created_at)
+                | (
+                    (RunSnapshotRow.created_at == cursor_created_at)
+                    & (RunSnapshotRow.run_id < cursor_run_id)
+                ),
+            )
+        elif offset:
+            stmt = stmt.offset(offset)
+        result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def listing_version(self, workspace_id: UUID) -> tuple[int, UUID | None]:
+        """(snapshot count, newest run_id) in a workspace — the listing ETag.
+
+        Snapshots are append-only, so any new run changes the pair.
+        """
+        count = await self._session.scalar(
+            select(func.count())
+            .select_from(RunSnapshotRow)
+            .where(RunSnapshotRow.workspace_id == workspace_id)
+        )
+        newest = await self._session.scalar(
+            select(RunSnapshotRow.run_id)
+            .where(RunSnapshotRow.workspace_id == workspace_id)
+            .order_by(RunSnapshotRow.created_at.desc(), RunSnapshotRow.run_id.desc())
+            .limit(1)
+        )
+        return count or 0, newest
+
 
 class ResultSetRepository:
     def __init__(self, session: AsyncSession) -> None:
@@ -166,16 +317,26 @@ class ResultSetRepository:
         await self._session.flush()
         return row
 
+    @staticmethod
+    def _run_filter(run_id: UUID) -> ColumnElement[bool]:
+        """Match a run's own rows, or its cache source's rows when linked."""
+        source_run_id = (
+            select(RunSnapshotRow.result_source_run_id)
+            .where(RunSnapshotRow.run_id == run_id)
+            .scalar_subquery()
+        )
+        return or_(ResultSetRow.run_id == run_id, ResultSetRow.run_id == source_run_id)
+
     async def get_by_run(self, run_id: UUID) -> list[ResultSetRow]:
         result = await self._session.execute(
-            select(ResultSetRow).where(ResultSetRow.run_id == run_id)
+            select(ResultSetRow).where(self._run_filter(run_id))
         )
         return list(result.scalars().all())
 
     async def get_by_run_series(
         self, run_id: UUID, *, series_kind: str | None,
     ) -> list[ResultSetRow]:
-        stmt = select(ResultSetRow).where(ResultSetRow.run_id == run_id)
+        stmt = select(ResultSetRow).where(self._run_filter(run_id))
         if series_kind is None:
             stmt = stmt.where(ResultSetRow.series_kind.is_(None))
         else:
@@ -183,6 +344,44 @@ class ResultSetRepository:
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_by_runs(
+        self, run_ids: list[UUID], *, metric_types: list[str] | None = None,
+    ) -> dict[UUID, list[ResultSetRow]]:
+        """Batched get_by_run: result sets for many runs in two queries.
+
+        Every requested run_id is a key (empty list when it has no rows).
+        Linked cache-hit runs also receive their source run's rows, as in
+        get_by_run. ``metric_types`` restricts which metrics are loaded.
+        """
+        if not run_ids:
+            return {}
+        requested = set(run_ids)
+        sources_result = await self._session.execute(
+            select(RunSnapshotRow.run_id, RunSnapshotRow.result_source_run_id).where(
+                RunSnapshotRow.run_id.in_(requested),
+                RunSnapshotRow.result_source_run_id.is_not(None),
+            )
+        )
+        source_of = {
+            rid: src for rid, src in sources_result.all() if src is not None and src != rid
+        }
+
+        stmt = select(ResultSetRow).where(
+            ResultSetRow.run_id.in_(requested | set(source_of.values()))
+        )
+        if metric_types is not None:
+            stmt = stmt.where(ResultSetRow.metric_type.in_(set(metric_types)))
+        result = await self._session.execute(stmt)
+        by_run: dict[UUID, list[ResultSetRow]] = {}
+        for row in result.scalars().all():
+            by_run.setdefault(row.run_id, []).append(row)
+
+        return {
+            rid: by_run.get(rid, [])
+            + (by_run.get(source_of[rid], []) if rid in source_of else [])
+            for rid in run_ids
+        }
+
 
 class BatchRepository:
     def __init__(self, session: AsyncSession) -> None:
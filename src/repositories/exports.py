@@ -78,10 +78,21 @@ class ExportRepository:
         result = await self._session.execute(select(ExportRow))
         return list(result.scalars().all())
 
-    async def update_status(self, export_id: UUID, status: str) -> ExportRow | None:
+    async def update_status(
+        self, export_id: UUID, status: str, *,
+        checksums_json: dict | None = None,
+        blocked_reasons: list[str] | None = None,
+        artifact_refs_json: dict | None = None,
+    ) -> ExportRow | None:
         row = await self.get(export_id)
         if row is not None:
             row.status = status
+            if checksums_json is not None:
+                row.checksums_json = checksums_json
+            if blocked_reasons is not None:
+                row.blocked_reasons = blocked_reasons
+            if artifact_refs_json is not None:
+                row.artifact_refs_json = artifact_refs_json
             await self._session.flush()
         return row
 
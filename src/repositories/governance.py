@@ -1,5 +1,6 @@
 """Assumption, claim, and evidence snippet repositories."""
 
+from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import func, select
@@ -136,6 +137,18 @@ class AssumptionRepository:
         )
         return list(rows_result.scalars().all()), total
 
+    async def count_by_status(self, workspace_id: UUID) -> dict[str, int]:
+        """Count assumptions per status for a workspace in one GROUP BY.
+
+        Excludes NULL workspace_id rows. Statuses with no rows are absent.
+        """
+        result = await self._session.execute(
+            select(AssumptionRow.status, func.count())
+            .where(AssumptionRow.workspace_id == workspace_id)
+            .group_by(AssumptionRow.status)
+        )
+        return {status: count for status, count in result.all()}
+
 
 class ClaimRepository:
     def __init__(self, session: AsyncSession) -> None:
@@ -206,6 +219,46 @@ class ClaimRepository:
         )
         return list(result.scalars().all())
 
+    async def list_for_workspace(
+        self, workspace_id: UUID, *,
+        limit: int | None = None,
+        cursor_created_at: datetime | None = None,
+        cursor_claim_id: UUID | None = None,
+    ) -> tuple[list[ClaimRow], int]:
+        """List claims whose run belongs to the workspace, keyset-paginated.
+
+        Returns (rows, total_count). Cursor-based on (created_at, claim_id);
+        total_count ignores the cursor. Claims without a run are excluded.
+        """
+        base = (
+            select(ClaimRow)
+            .join(RunSnapshotRow, ClaimRow.run_id == RunSnapshotRow.run_id)
+            .where(RunSnapshotRow.workspace_id == workspace_id)
+        )
+
+        query = base.order_by(ClaimRow.created_at.asc(), ClaimRow.claim_id.asc())
+        if cursor_created_at is not None and cursor_claim_id is not None:
+            query = query.where(
+                (ClaimRow.created_at > cursor_created_at)
+                | (
+                    (ClaimRow.created_at == cursor_created_at)
+                    & (ClaimRow.claim_id > cursor_claim_id)
+                ),
+            )
+        if limit is None:
+            result = await self._session.execute(query)
+            rows = list(result.scalars().all())
+            if cursor_created_at is None:
+                return rows, len(rows)
+        else:
+            result = await self._session.execute(query.limit(limit))
+            rows = list(result.scalars().all())
+
+        count_result = await self._session.execute(
+            select(func.count()).select_from(base.subquery())
+        )
+        return rows, count_result.scalar_one()
+
     async def link_evidence(self, claim_id: UUID, snippet_id: UUID) -> ClaimRow | None:
         """Append a snippet_id to the claim's evidence_refs list."""
         row = await self.get(claim_id)
@@ -100,6 +100,16 @@ class EmploymentCoefficientsRepository:
         )
         return list(result.scalars().all())
 
+    async def get_latest_row_id_for_model(self, model_version_id: UUID) -> int | None:
+        """row_id of the newest coefficient set for a model (no payload load)."""
+        result = await self._session.execute(
+            select(EmploymentCoefficientsRow.row_id)
+            .where(EmploymentCoefficientsRow.model_version_id == model_version_id)
+            .order_by(EmploymentCoefficientsRow.created_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
 
 class SectorOccupationBridgeRepository:
     """Repository for versioned sector-occupation bridge (append-only)."""
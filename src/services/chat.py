@@ -6,26 +6,43 @@ and tool execution.  Enforces confirmation gate at the service level.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
 from uuid import UUID
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.agents.economist_copilot import CopilotResponse, EconomistCopilot
+from src.db.tables import ChatMessageRow, ChatSessionRow
 from src.models.chat import (
     ChatMessageResponse,
     ChatSessionDetail,
     ChatSessionResponse,
+    ChatStreamEvent,
     ListSessionsResponse,
     TokenUsage,
+    ToolCall,
+    ToolExecutionResult,
     TraceMetadata,
 )
 from src.models.common import new_uuid7
 from src.repositories.chat import ChatMessageRepository, ChatSessionRepository
-from src.services.chat_tool_executor import ChatToolExecutor
+from src.services.chat_tool_executor import ChatToolExecutor, ToolEvent
 
 _logger = logging.getLogger(__name__)
 
+# Rough characters-per-token ratio for budgeting history before the LLM call
+_CHARS_PER_TOKEN = 4
+
+# Max messages folded into the summary per turn; long pre-existing
+# sessions catch up over several turns instead of one huge prompt
+_MAX_FOLD_MESSAGES = 200
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // _CHARS_PER_TOKEN + 1
+
 
 def _session_row_to_response(row) -> ChatSessionResponse:
     """Convert ChatSessionRow to API response."""
@@ -73,6 +90,9 @@ class ChatService:
         max_tokens: int = 4096,
         model: str = "",
         db_session: AsyncSession | None = None,
+        history_window: int = 20,
+        history_token_budget: int = 8000,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
     ) -> None:
         self._session_repo = session_repo
         self._message_repo = message_repo
@@ -80,6 +100,10 @@ class ChatService:
         self._max_tokens = max_tokens
         self._model = model
         self._db_session = db_session
+        self._history_window = history_window
+        self._history_token_budget = history_token_budget
+        # Lets read-only tool calls run concurrently on their own sessions
+        self._session_factory = session_factory
 
     async def create_session(
         self,
@@ -136,11 +160,86 @@ class ChatService:
 
         1. Verify session exists and belongs to workspace
         2. Persist user message
-        3. Load conversation history
+        3. Load the recent history window (older turns folded into a summary)
         4. Call copilot agent (if available)
         5. Persist assistant response with trace metadata
         6. Return assistant response
         """
+        session_row, user_msg_id = await self._begin_turn(
+            workspace_id, session_id, content,
+        )
+        return await self._complete_turn(
+            session_row, workspace_id, user_msg_id, content, confirm_scenario,
+        )
+
+    async def stream_message(
+        self,
+        workspace_id: UUID,
+        session_id: UUID,
+        content: str,
+        confirm_scenario: bool | None = None,
+    ) -> AsyncIterator[ChatStreamEvent]:
+        """Streaming variant of send_message.
+
+        The session check and user-message persistence happen before this
+        returns (ValueError if the session is not found), so callers can
+        reject the request before opening the stream. The returned
+        iterator yields delta, tool_start/tool_end and a final message
+        event; on failure it yields an error event, then re-raises.
+        """
+        session_row, user_msg_id = await self._begin_turn(
+            workspace_id, session_id, content,
+        )
+        return self._stream_turn(
+            session_row, workspace_id, user_msg_id, content, confirm_scenario,
+        )
+
+    async def _stream_turn(
+        self,
+        session_row: ChatSessionRow,
+        workspace_id: UUID,
+        user_msg_id: UUID,
+        content: str,
+        confirm_scenario: bool | None,
+    ) -> AsyncIterator[ChatStreamEvent]:
+        # The turn runs as a task feeding a queue, so progress events from
+        # deep inside tool execution reach the client as they happen
+        queue: asyncio.Queue[ChatStreamEvent | None] = asyncio.Queue()
+
+        async def run() -> None:
+            try:
+                message = await self._complete_turn(
+                    session_row, workspace_id, user_msg_id, content,
+                    confirm_scenario, emit=queue.put,
+                )
+                await queue.put(ChatStreamEvent(event="message", data=message.model_dump()))
+            except Exception as exc:
+                _logger.exception("Streamed chat turn failed")
+                await queue.put(ChatStreamEvent(event="error", data={"detail": str(exc)[:200]}))
+                raise
+            finally:
+                await queue.put(None)
+
+        task = asyncio.create_task(run())
+        try:
+            while (event := await queue.get()) is not None:
+                yield event
+        finally:
+            if not task.done():
+                # Client went away mid-stream
+                task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _begin_turn(
+        self,
+        workspace_id: UUID,
+        session_id: UUID,
+        content: str,
+    ) -> tuple[ChatSessionRow, UUID]:
+        """Verify the session, persist the user message, title and touch it."""
         # Verify session exists
         session_row = await self._session_repo.get(session_id, workspace_id)
         if session_row is None:
@@ -162,6 +261,23 @@ class ChatService:
 
         # Touch session updated_at
         await self._session_repo.touch(session_id, workspace_id)
+        return session_row, user_msg_id
+
+    async def _complete_turn(
+        self,
+        session_row: ChatSessionRow,
+        workspace_id: UUID,
+        user_msg_id: UUID,
+        content: str,
+        confirm_scenario: bool | None,
+        emit: Callable[[ChatStreamEvent], Awaitable[None]] | None = None,
+    ) -> ChatMessageResponse:
+        """Copilot call, tool execution, narrative and assistant persistence.
+
+        With ``emit``, LLM output is streamed as delta events and tool
+        progress as tool_start/tool_end events.
+        """
+        session_id = session_row.session_id
 
         # If no copilot agent, return a stub response
         if self._copilot is None:
@@ -174,14 +290,10 @@ class ChatService:
             )
             return _message_row_to_response(row)
 
-        # Load conversation history for context
-        message_rows = await self._message_repo.list_for_session(session_id)
-        history = [
-            {"role": m.role, "content": m.content}
-            for m in message_rows
-            if m.role in ("user", "assistant")
-            and str(m.message_id) != str(user_msg_id)  # exclude current user msg
-        ]
+        # Load bounded conversation history for context
+        history, summary = await self._load_history(
+            session_row, workspace_id, user_msg_id,
+        )
 
         # Call copilot
         context = {
@@ -190,12 +302,29 @@ class ChatService:
             "max_tokens": self._max_tokens,
             "model": self._model,
         }
-
-        copilot_response: CopilotResponse = await self._copilot.process_turn(
-            messages=history,
-            user_message=content,
-            context=context,
-        )
+        if summary:
+            context["conversation_summary"] = summary
+
+        copilot_response: CopilotResponse | None
+        if emit is None:
+            copilot_response = await self._copilot.process_turn(
+                messages=history,
+                user_message=content,
+                context=context,
+            )
+        else:
+            copilot_response = None
+            async for chunk in self._copilot.stream_turn(
+                messages=history,
+                user_message=content,
+                context=context,
+            ):
+                if chunk.response is not None:
+                    copilot_response = chunk.response
+                elif chunk.delta:
+                    await emit(ChatStreamEvent(event="delta", data={"text": chunk.delta}))
+            if copilot_response is None:
+                raise RuntimeError("Copilot stream ended without a response")
 
         # Build trace metadata dict for persistence
         trace_dict = None
@@ -216,8 +345,26 @@ class ChatService:
             tool_executor = ChatToolExecutor(
                 session=self._db_session,
                 workspace_id=workspace_id,
+                session_factory=self._session_factory,
+            )
+            on_tool_event = None
+            if emit is not None:
+                async def on_tool_event(
+                    event: ToolEvent,
+                    index: int,
+                    tool_call: ToolCall,
+                    result: ToolExecutionResult | None,
+                ) -> None:
+                    data: dict[str, object] = {
+                        "index": index, "tool_name": tool_call.tool_name,
+                    }
+                    if result is not None:
+                        data["result"] = result.model_dump()
+                    await emit(ChatStreamEvent(event=event, data=data))
+
+            exec_results = await tool_executor.execute_all(
+                copilot_response.tool_calls, on_event=on_tool_event,
             )
-            exec_results = await tool_executor.execute_all(copilot_response.tool_calls)
             # Merge results into tool calls
             for tc, er in zip(copilot_response.tool_calls, exec_results):
                 tc.result = er.model_dump()
@@ -317,3 +464,104 @@ class ChatService:
         )
 
         return _message_row_to_response(row)
+
+    async def _load_history(
+        self,
+        session_row: ChatSessionRow,
+        workspace_id: UUID,
+        user_msg_id: UUID,
+    ) -> tuple[list[dict[str, str]], str | None]:
+        """Recent messages plus the running summary of everything older.
+
+        Only the last ``history_window`` messages are loaded (keyset read),
+        then trimmed oldest-first to the token budget. Messages that fall
+        out of the window are folded into the persisted session summary,
+        so per-turn prompt size stays flat as the session grows. A window
+        of 0 sends the full history (legacy behaviour).
+        """
+        session_id = session_row.session_id
+        if self._history_window <= 0:
+            message_rows = await self._message_repo.list_for_session(session_id)
+            history = [
+                {"role": m.role, "content": m.content}
+                for m in message_rows
+                if m.role in ("user", "assistant")
+                and m.message_id != user_msg_id  # exclude current user msg
+            ]
+            return history, None
+
+        window = await self._message_repo.list_recent(
+            session_id,
+            limit=self._history_window,
+            exclude_message_id=user_msg_id,
+        )
+        summary = session_row.context_summary
+
+        budget = self._history_token_budget - _estimate_tokens(summary or "")
+        kept: list[ChatMessageRow] = []
+        used = 0
+        for m in reversed(window):
+            cost = _estimate_tokens(m.content)
+            if kept and used + cost > budget:
+                break
+            kept.append(m)
+            used += cost
+        kept.reverse()
+
+        # Older messages exist only if the window filled up or was trimmed
+        if kept and (len(window) >= self._history_window or len(kept) < len(window)):
+            summary = await self._fold_older(session_row, workspace_id, kept[0])
+
+        history = [{"role": m.role, "content": m.content} for m in kept]
+        return history, summary
+
+    async def _fold_older(
+        self,
+        session_row: ChatSessionRow,
+        workspace_id: UUID,
+        oldest_kept: ChatMessageRow,
+    ) -> str | None:
+        """Fold messages between the summary watermark and the window.
+
+        Summarization failure keeps the previous summary and watermark, so
+        the same messages are retried on the next turn.
+        """
+        after = None
+        if (
+            session_row.summary_through_at is not None
+            and session_row.summary_through_message_id is not None
+        ):
+            after = (session_row.summary_through_at, session_row.summary_through_message_id)
+
+        pending = await self._message_repo.list_between(
+            session_row.session_id,
+            after=after,
+            before=(oldest_kept.created_at, oldest_kept.message_id),
+            limit=_MAX_FOLD_MESSAGES,
+        )
+        if not pending or self._copilot is None:
+            return session_row.context_summary
+
+        try:
+            summary, usage = await self._copilot.summarize_history(
+                session_row.context_summary,
+                [{"role": m.role, "content": m.content} for m in pending],
+            )
+        except Exception:
+            _logger.warning("History summarization failed", exc_info=True)
+            return session_row.context_summary
+
+        total = TokenUsage(**(session_row.summary_token_usage or {}))
+        total = TokenUsage(
+            input_tokens=total.input_tokens + usage.input_tokens,
+            output_tokens=total.output_tokens + usage.output_tokens,
+        )
+        await self._session_repo.update_summary(
+            session_row.session_id,
+            workspace_id,
+            summary=summary,
+            through_at=pending[-1].created_at,
+            through_message_id=pending[-1].message_id,
+            token_usage=total.model_dump(),
+        )
+        return summary
@@ -4,6 +4,10 @@ Executes tool calls proposed by the EconomistCopilot, enforcing per-turn
 safety caps and measuring latency.  Handlers interact with repositories
 to create scenarios, execute engine runs, read results, and create exports.
 
+Read-only tools run concurrently (each on its own DB session) when a
+session factory is available; mutating tools stay serialized on the
+request session.
+
 Agent-to-Math Boundary: this executor dispatches to deterministic engine
 endpoints via RunExecutionService -- it never performs economic computations
 itself.
@@ -11,17 +15,27 @@ itself.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
+from collections.abc import Awaitable, Callable
+from typing import Literal
 from uuid import UUID
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.models.chat import ToolCall, ToolExecutionResult
 from src.models.common import ExportMode, new_uuid7
 
 _logger = logging.getLogger(__name__)
 
+# Progress callback: (event, index, tool_call, result). event is
+# "tool_start" (result None) or "tool_end".
+ToolEvent = Literal["tool_start", "tool_end"]
+ToolEventCallback = Callable[
+    [ToolEvent, int, ToolCall, "ToolExecutionResult | None"], Awaitable[None]
+]
+
 # ------------------------------------------------------------------
 # Safety caps
 # ------------------------------------------------------------------
@@ -29,6 +43,13 @@ MAX_TOOL_CALLS_PER_TURN = 5
 _MAX_RUN_ENGINE_PER_TURN = 1
 _MAX_CREATE_EXPORT_PER_TURN = 1
 
+# Tools that only read persisted state (lookup_data may fill the derived
+# multiplier-table cache). These may run concurrently on their own sessions.
+_READ_ONLY_TOOLS = frozenset({"lookup_data", "narrate_results"})
+
+# Max read-only calls in flight at once within a turn
+MAX_CONCURRENT_READ_ONLY = 4
+
 # Tools with per-turn caps (tool_name -> max per turn)
 _PER_TOOL_CAPS: dict[str, int] = {
     "run_engine": _MAX_RUN_ENGINE_PER_TURN,
@@ -53,11 +74,20 @@ class ChatToolExecutor:
     """Dispatches tool calls to handlers with safety caps and latency tracking.
 
     Each handler receives a DB session and workspace_id for repository access.
+    With a ``session_factory``, read-only calls get their own session so
+    they can run concurrently; without one everything runs sequentially
+    on ``session``.
     """
 
-    def __init__(self, session: AsyncSession, workspace_id: UUID) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        workspace_id: UUID,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ) -> None:
         self._session = session
         self._workspace_id = workspace_id
+        self._session_factory = session_factory
         self._handler_map = {
             "lookup_data": self._handle_lookup_data,
             "build_scenario": self._handle_build_scenario,
@@ -75,12 +105,82 @@ class ChatToolExecutor:
     # ------------------------------------------------------------------
 
     async def _handle_lookup_data(self, arguments: dict) -> dict:
-        """MVP stub: return available dataset metadata list."""
+        """Return dataset metadata, or a persisted multiplier table.
+
+        dataset_id "multipliers" with a model_version_id reads the
+        precomputed table (computed once per model + coefficients) instead
+        of running the engine. Optional sector_codes filters the columns.
+        Any other request returns the available dataset list.
+        """
+        if arguments.get("dataset_id") == "multipliers" and arguments.get("model_version_id"):
+            return await self._lookup_multipliers(arguments)
         return {
             "reason_code": "datasets_listed",
             "datasets": _AVAILABLE_DATASETS,
         }
 
+    async def _lookup_multipliers(self, arguments: dict) -> dict:
+        from src.repositories.engine import (
+            ModelDataRepository,
+            ModelVersionRepository,
+            MultiplierTableRepository,
+        )
+        from src.repositories.workforce import EmploymentCoefficientsRepository
+        from src.services.multiplier_tables import get_or_build_multiplier_table
+        from src.services.run_execution import RunExecutionService
+
+        model_version_id = arguments.get("model_version_id")
+        try:
+            mv_uuid = UUID(str(model_version_id))
+        except (ValueError, AttributeError):
+            return {
+                "reason_code": "invalid_args",
+                "error": f"Invalid model_version_id format: {model_version_id}",
+            }
+
+        mv_repo = ModelVersionRepository(self._session)
+        md_repo = ModelDataRepository(self._session)
+        if await mv_repo.get(mv_uuid) is None:
+            return {
+                "reason_code": "model_not_found",
+                "error": f"Model {model_version_id} not found",
+            }
+        svc = RunExecutionService()
+        row = await get_or_build_multiplier_table(
+            mv_uuid,
+            md_repo=md_repo,
+            ec_repo=EmploymentCoefficientsRepository(self._session),
+            mt_repo=MultiplierTableRepository(self._session),
+            load_model=lambda: svc.ensure_model_loaded(mv_uuid, mv_repo, md_repo),
+        )
+        if row is None:
+            return {
+                "reason_code": "model_not_found",
+                "error": f"Model data for {model_version_id} not found",
+            }
+
+        payload = row.payload
+        codes: list[str] = payload["sector_codes"]
+        wanted = arguments.get("sector_codes") or codes
+        idx = [i for i, code in enumerate(codes) if code in set(wanted)]
+
+        def _select(table: dict | None) -> dict | None:
+            if table is None:
+                return None
+            return {
+                kind: {codes[i]: values[i] for i in idx}
+                for kind, values in table.items()
+            }
+
+        return {
+            "reason_code": "multipliers_found",
+            "model_version_id": str(mv_uuid),
+            "content_hash": row.content_hash,
+            "coefficients_hash": row.coefficients_hash,
+            "type_i": _select(payload["type_i"]),
+            "type_ii": _select(payload.get("type_ii")),
+        }
+
     async def _handle_build_scenario(self, arguments: dict) -> dict:
         """Create a ScenarioSpec via ScenarioVersionRepository.
 
@@ -411,60 +511,141 @@ class ChatToolExecutor:
                 error_summary=str(exc)[:200],
             )
 
-    # Per-turn cap reason codes (used to distinguish cap-blocked from
-    # governance-blocked in execute_all counting).
-    _CAP_REASON_CODES = frozenset({
-        "max_tool_calls_exceeded",
-        "max_run_engine_exceeded",
-        "max_create_export_exceeded",
-    })
-
     async def execute_all(
-        self, tool_calls: list[ToolCall],
+        self,
+        tool_calls: list[ToolCall],
+        *,
+        on_event: ToolEventCallback | None = None,
     ) -> list[ToolExecutionResult]:
-        """Execute tool calls sequentially, enforcing safety caps.
+        """Execute tool calls, enforcing safety caps; results keep call order.
 
         - Overall cap: MAX_TOOL_CALLS_PER_TURN
         - Per-tool caps: run_engine (1), create_export (1)
         - Excess calls are returned as status='blocked'
+        - Consecutive read-only calls run concurrently (at most
+          MAX_CONCURRENT_READ_ONLY at once) until the first mutating call
+          has executed; after that, reads may depend on this turn's
+          uncommitted writes and run sequentially on the request session
+
+        ``on_event`` is awaited with "tool_start" before each executed
+        call and "tool_end" for every result (cap-blocked calls included).
+        """
+        blocked = self._apply_caps(tool_calls)
+        results: list[ToolExecutionResult | None] = [None] * len(tool_calls)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_READ_ONLY)
+        pending_reads: list[int] = []
+        mutated = False
+
+        async def flush_reads() -> None:
+            if not pending_reads:
+                return
+            factory = self._session_factory
+            if factory is None or mutated or len(pending_reads) == 1:
+                for i in pending_reads:
+                    results[i] = await self._run_tracked(i, tool_calls[i], on_event)
+            else:
+                batch = await asyncio.gather(*(
+                    self._run_isolated(i, tool_calls[i], on_event, factory, semaphore)
+                    for i in pending_reads
+                ))
+                for i, result in zip(pending_reads, batch, strict=True):
+                    results[i] = result
+            pending_reads.clear()
+
+        for index, tool_call in enumerate(tool_calls):
+            if index in blocked:
+                await flush_reads()
+                results[index] = blocked[index]
+                if on_event is not None:
+                    await on_event("tool_end", index, tool_call, blocked[index])
+            elif tool_call.tool_name in _READ_ONLY_TOOLS:
+                pending_reads.append(index)
+            else:
+                await flush_reads()
+                results[index] = await self._run_tracked(index, tool_call, on_event)
+                mutated = True
+        await flush_reads()
+
+        # Every slot is filled: blocked, executed in order, or flushed above
+        return [result for result in results if result is not None]
+
+    def _apply_caps(self, tool_calls: list[ToolCall]) -> dict[int, ToolExecutionResult]:
+        """Decide up front which calls the per-turn caps block.
+
+        Every call that is not cap-blocked counts as executed, whatever its
+        outcome (governance-blocked exports included), so the decision does
+        not depend on results.
         """
-        results: list[ToolExecutionResult] = []
+        blocked: dict[int, ToolExecutionResult] = {}
+        executed_count = 0
         per_tool_counts: dict[str, int] = {}
 
-        for tool_call in tool_calls:
-            # Overall cap — only skip cap-blocked results (not governance-blocked)
-            executed_count = sum(
-                1 for r in results
-                if r.reason_code not in self._CAP_REASON_CODES
-            )
+        for index, tool_call in enumerate(tool_calls):
+            tool_name = tool_call.tool_name
             if executed_count >= MAX_TOOL_CALLS_PER_TURN:
-                results.append(ToolExecutionResult(
-                    tool_name=tool_call.tool_name,
+                blocked[index] = ToolExecutionResult(
+                    tool_name=tool_name,
                     status="blocked",
                     reason_code="max_tool_calls_exceeded",
-                ))
+                )
                 continue
 
-            # Per-tool cap
-            tool_name = tool_call.tool_name
             cap = _PER_TOOL_CAPS.get(tool_name)
-            if cap is not None:
-                current = per_tool_counts.get(tool_name, 0)
-                if current >= cap:
-                    results.append(ToolExecutionResult(
-                        tool_name=tool_name,
-                        status="blocked",
-                        reason_code=f"max_{tool_name}_exceeded",
-                    ))
-                    continue
-
-            # Execute
-            result = await self.execute(tool_call)
-            results.append(result)
-
-            # Track per-tool count — governance-blocked still counts as "executed"
-            # Only per-turn cap blocks should be excluded from the count
-            if result.reason_code not in self._CAP_REASON_CODES:
-                per_tool_counts[tool_name] = per_tool_counts.get(tool_name, 0) + 1
-
-        return results
+            if cap is not None and per_tool_counts.get(tool_name, 0) >= cap:
+                blocked[index] = ToolExecutionResult(
+                    tool_name=tool_name,
+                    status="blocked",
+                    reason_code=f"max_{tool_name}_exceeded",
+                )
+                continue
+
+            executed_count += 1
+            per_tool_counts[tool_name] = per_tool_counts.get(tool_name, 0) + 1
+
+        return blocked
+
+    async def _run_tracked(
+        self,
+        index: int,
+        tool_call: ToolCall,
+        on_event: ToolEventCallback | None,
+    ) -> ToolExecutionResult:
+        """Execute on the request session, reporting start/end."""
+        if on_event is not None:
+            await on_event("tool_start", index, tool_call, None)
+        result = await self.execute(tool_call)
+        if on_event is not None:
+            await on_event("tool_end", index, tool_call, result)
+        return result
+
+    async def _run_isolated(
+        self,
+        index: int,
+        tool_call: ToolCall,
+        on_event: ToolEventCallback | None,
+        session_factory: async_sessionmaker[AsyncSession],
+        semaphore: asyncio.Semaphore,
+    ) -> ToolExecutionResult:
+        """Execute a read-only call on its own session (own unit of work).
+
+        Sessions are never shared between concurrent calls. Two calls that
+        build the same multiplier table race on its unique key; the loser's
+        savepoint insert fails and it reads the winner's row.
+        """
+        async with semaphore:
+            if on_event is not None:
+                await on_event("tool_start", index, tool_call, None)
+            async with session_factory() as session:
+                result = await ChatToolExecutor(session, self._workspace_id).execute(tool_call)
+                try:
+                    # Keeps derived caches (multiplier tables) built by the read
+                    await session.commit()
+                except Exception:
+                    _logger.warning(
+                        "Commit after read-only tool %s failed", tool_call.tool_name,
+                        exc_info=True,
+                    )
+                    await session.rollback()
+            if on_event is not None:
+                await on_event("tool_end", index, tool_call, result)
+            return result
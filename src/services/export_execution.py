@@ -5,6 +5,10 @@ the API route call this service. No internal HTTP self-calls.
 
 Deterministic -- no LLM calls. Delegates to ExportOrchestrator for
 format generation, watermarking, and checksum computation.
+
+Exports run as jobs: the export row is created PENDING, then the job
+runs on a Celery worker (CELERY_BROKER_URL set) or on the local
+in-process export worker (dev/test).
 """
 
 from __future__ import annotations
@@ -15,13 +19,17 @@ from typing import Literal
 from uuid import UUID
 
 from src.api.runs import ALLOWED_RUNTIME_PROVENANCE
+from src.config.settings import get_settings
 from src.export.artifact_storage import ExportArtifactStorage
 from src.export.orchestrator import ExportOrchestrator, ExportRequest, ExportStatus
+from src.export.render_cache import get_render_cache
+from src.export.tasks import dispatch_export, run_on_local_worker
 from src.models.common import (
     ClaimStatus,
     ClaimType,
     DisclosureTier,
     ExportMode,
+    new_uuid7,
 )
 from src.models.governance import Claim
 from src.quality.models import RunQualityAssessment
@@ -53,7 +61,7 @@ class ExportExecutionInput:
 class ExportExecutionResult:
     """Result of an export execution."""
 
-    status: Literal["COMPLETED", "BLOCKED", "FAILED"]
+    status: Literal["PENDING", "COMPLETED", "BLOCKED", "FAILED"]
     export_id: UUID | None = None
     checksums: dict[str, str] = field(default_factory=dict)
     blocking_reasons: list[str] = field(default_factory=list)
@@ -74,7 +82,7 @@ class ExportRepositories:
 
 
 # ------------------------------------------------------------------
-# Helpers (reused from src/api/exports.py)
+# Helpers
 # ------------------------------------------------------------------
 
 
@@ -119,6 +127,132 @@ async def _check_model_provenance(
 _orchestrator = ExportOrchestrator()
 
 
+# ------------------------------------------------------------------
+# Export job (shared by the local worker and the Celery task)
+# ------------------------------------------------------------------
+
+
+async def run_export_job(
+    *,
+    export_id: UUID,
+    input: ExportExecutionInput,
+    repos: ExportRepositories,
+) -> ExportExecutionResult:
+    """Generate, store and finalize an export whose row already exists.
+
+    Moves the row PENDING -> GENERATING -> COMPLETED/BLOCKED/FAILED. Format
+    generation runs on the local export worker thread pool so the event
+    loop stays free. Never raises: failures come back as FAILED.
+    """
+    await repos.export_repo.update_status(export_id, "GENERATING")
+
+    # Load governance inputs
+    claim_rows = await repos.claim_repo.get_by_run(input.run_id)
+    claims = [_claim_row_to_model(r) for r in claim_rows]
+
+    quality_assessment: RunQualityAssessment | None = None
+    quality_row = await repos.quality_repo.get_by_run(input.run_id)
+    if quality_row is not None and quality_row.payload:
+        try:
+            quality_assessment = RunQualityAssessment.model_validate(
+                quality_row.payload,
+            )
+        except Exception:
+            pass
+
+    model_provenance_disallowed = await _check_model_provenance(
+        input.run_id, repos.snap_repo, repos.mv_repo,
+    )
+
+    request = ExportRequest(
+        run_id=input.run_id,
+        workspace_id=input.workspace_id,
+        mode=input.mode,
+        export_formats=input.export_formats,
+        pack_data=input.pack_data,
+    )
+
+    cache_max_bytes = get_settings().EXPORT_RENDER_CACHE_MAX_BYTES
+    render_cache = (
+        get_render_cache(repos.artifact_store, max_bytes=cache_max_bytes)
+        if cache_max_bytes > 0 else None
+    )
+
+    try:
+        record = await run_on_local_worker(
+            _orchestrator.execute,
+            request=request,
+            claims=claims,
+            quality_assessment=quality_assessment,
+            model_provenance_disallowed=model_provenance_disallowed,
+            export_id=export_id,
+            render_cache=render_cache,
+        )
+    except Exception as exc:
+        await repos.export_repo.update_status(export_id, "FAILED")
+        return ExportExecutionResult(
+            status="FAILED",
+            export_id=export_id,
+            error=f"Export orchestration failed: {str(exc)[:200]}",
+        )
+
+    # Store artifacts and finalize the DB record
+    # Wrap in try/except so failures in artifact storage or DB
+    # persistence are returned as FAILED (not bubbled to generic
+    # handler_exception), honoring the COMPLETED/BLOCKED/FAILED contract.
+    try:
+        artifact_refs: dict[str, str] = {}
+        if record.artifacts:
+            for fmt, data in record.artifacts.items():
+                key = ExportArtifactStorage.build_key(str(export_id), fmt)
+                repos.artifact_store.store(key, data)
+                artifact_refs[fmt] = key
+
+        await repos.export_repo.update_status(
+            export_id,
+            record.status.value,
+            checksums_json=record.checksums,
+            blocked_reasons=record.blocking_reasons,
+            artifact_refs_json=artifact_refs or None,
+        )
+    except Exception as exc:
+        _logger.exception(
+            "Failed to store artifacts or persist export record for %s",
+            export_id,
+        )
+        try:
+            await repos.export_repo.update_status(export_id, "FAILED")
+        except Exception:
+            _logger.exception("Failed to mark export %s as FAILED", export_id)
+        return ExportExecutionResult(
+            status="FAILED",
+            export_id=export_id,
+            error=f"Post-orchestration persistence failed: {str(exc)[:200]}",
+        )
+
+    # Map orchestrator result to service result
+    if record.status == ExportStatus.COMPLETED:
+        return ExportExecutionResult(
+            status="COMPLETED",
+            export_id=export_id,
+            checksums=record.checksums,
+            artifact_refs=artifact_refs,
+        )
+    elif record.status == ExportStatus.BLOCKED:
+        return ExportExecutionResult(
+            status="BLOCKED",
+            export_id=export_id,
+            blocking_reasons=record.blocking_reasons,
+        )
+    else:
+        # ExportStatus.FAILED (if orchestrator ever returns it)
+        return ExportExecutionResult(
+            status="FAILED",
+            export_id=export_id,
+            error="Export failed during orchestration",
+        )
+
+
 # ------------------------------------------------------------------
 # Service
 # ------------------------------------------------------------------
@@ -139,13 +273,9 @@ class ExportExecutionService:
         """Execute export pipeline with governance checks.
 
         1. Validate run exists and belongs to workspace.
-        2. Load claims, quality assessment, model provenance.
-        3. Call ExportOrchestrator.execute().
-        4. Store artifacts via ExportArtifactStorage when COMPLETED.
-        5. Persist export record via ExportRepository.create().
-        6. Return truthful status: COMPLETED, BLOCKED, or FAILED.
+        2. Submit the export job (see submit()).
+        3. Return truthful status: PENDING, COMPLETED, BLOCKED, or FAILED.
         """
-        # 1. Validate run exists and belongs to the workspace
         snap_row = await repos.snap_repo.get(input.run_id)
         if snap_row is None:
             return ExportExecutionResult(
@@ -162,99 +292,38 @@ class ExportExecutionService:
                 ),
             )
 
-        # 2. Load governance inputs (same as src/api/exports.py create_export)
-        claim_rows = await repos.claim_repo.get_by_run(input.run_id)
-        claims = [_claim_row_to_model(r) for r in claim_rows]
-
-        quality_assessment: RunQualityAssessment | None = None
-        quality_row = await repos.quality_repo.get_by_run(input.run_id)
-        if quality_row is not None and quality_row.payload:
-            try:
-                quality_assessment = RunQualityAssessment.model_validate(
-                    quality_row.payload,
-                )
-            except Exception:
-                pass
-
-        model_provenance_disallowed = await _check_model_provenance(
-            input.run_id, repos.snap_repo, repos.mv_repo,
-        )
-
-        # 3. Build ExportRequest and call orchestrator
-        request = ExportRequest(
-            run_id=input.run_id,
-            workspace_id=input.workspace_id,
-            mode=input.mode,
-            export_formats=input.export_formats,
-            pack_data=input.pack_data,
-        )
+        return await self.submit(input, repos)
 
-        try:
-            record = _orchestrator.execute(
-                request=request,
-                claims=claims,
-                quality_assessment=quality_assessment,
-                model_provenance_disallowed=model_provenance_disallowed,
-            )
-        except Exception as exc:
-            return ExportExecutionResult(
-                status="FAILED",
-                error=f"Export orchestration failed: {str(exc)[:200]}",
-            )
+    async def submit(
+        self,
+        input: ExportExecutionInput,
+        repos: ExportRepositories,
+    ) -> ExportExecutionResult:
+        """Persist a PENDING export row and run or enqueue its job.
 
-        # 4. Store artifacts and persist DB record
-        # Wrap in try/except so failures in artifact storage or DB
-        # persistence are returned as FAILED (not bubbled to generic
-        # handler_exception), honoring the COMPLETED/BLOCKED/FAILED contract.
+        Async mode (CELERY_BROKER_URL set): dispatches to Celery and
+        returns PENDING; poll the export row for the final status.
+        Local mode (dev/test): awaits run_export_job() on the in-process
+        worker and returns the final status.
+        """
+        export_id = new_uuid7()
         try:
-            artifact_refs: dict[str, str] = {}
-            if record.artifacts:
-                for fmt, data in record.artifacts.items():
-                    key = ExportArtifactStorage.build_key(
-                        str(record.export_id), fmt,
-                    )
-                    repos.artifact_store.store(key, data)
-                    artifact_refs[fmt] = key
-
-            # 5. Persist export record in DB
             await repos.export_repo.create(
-                export_id=record.export_id,
-                run_id=record.run_id,
-                mode=record.mode.value,
-                status=record.status.value,
-                checksums_json=record.checksums,
-                blocked_reasons=record.blocking_reasons,
-                artifact_refs_json=artifact_refs or None,
+                export_id=export_id,
+                run_id=input.run_id,
+                mode=input.mode.value,
+                status="PENDING",
             )
         except Exception as exc:
-            _logger.exception(
-                "Failed to store artifacts or persist export record for %s",
-                record.export_id,
-            )
+            _logger.exception("Failed to persist export record %s", export_id)
             return ExportExecutionResult(
                 status="FAILED",
-                export_id=record.export_id,
-                error=f"Post-orchestration persistence failed: {str(exc)[:200]}",
+                export_id=export_id,
+                error=f"Export record persistence failed: {str(exc)[:200]}",
             )
 
-        # 6. Map orchestrator result to service result
-        if record.status == ExportStatus.COMPLETED:
-            return ExportExecutionResult(
-                status="COMPLETED",
-                export_id=record.export_id,
-                checksums=record.checksums,
-                artifact_refs=artifact_refs,
-            )
-        elif record.status == ExportStatus.BLOCKED:
-            return ExportExecutionResult(
-                status="BLOCKED",
-                export_id=record.export_id,
-                blocking_reasons=record.blocking_reasons,
-            )
-        else:
-            # ExportStatus.FAILED (if orchestrator ever returns it)
-            return ExportExecutionResult(
-                status="FAILED",
-                export_id=record.export_id,
-                error="Export failed during orchestration",
-            )
+        if get_settings().CELERY_BROKER_URL:
+            dispatch_export(export_id=export_id, input=input)
+            return ExportExecutionResult(status="PENDING", export_id=export_id)
+
+        return await run_export_job(export_id=export_id, input=input, repos=repos)
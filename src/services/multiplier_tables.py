@@ -0,0 +1,156 @@
+"""Multiplier table service — persisted Type I/II multipliers per model.
+
+Resolves the model-linked satellite coefficients (same sources as the
+B-15 coefficients endpoint), looks up the persisted table for
+(model, coefficient hash, table version) and computes + persists it only
+on a miss. Both the models API and the copilot lookup_data tool read
+tables through this service, so quoting a multiplier never triggers an
+engine run.
+
+Agent-to-Math Boundary: computation is delegated to
+src.engine.multipliers — this service only resolves inputs and persists.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from uuid import UUID
+
+import numpy as np
+
+from src.db.tables import EmploymentCoefficientsRow, ModelDataRow, MultiplierTableRow
+from src.engine.model_store import LoadedModel
+from src.engine.multipliers import MULTIPLIER_TABLE_VERSION, compute_multiplier_table
+from src.engine.run_cache import hash_satellite_coefficients
+from src.engine.satellites import SatelliteCoefficients
+from src.models.common import new_uuid7
+from src.repositories.engine import ModelDataRepository, MultiplierTableRepository
+from src.repositories.workforce import EmploymentCoefficientsRepository
+
+_logger = logging.getLogger(__name__)
+
+# Matches satellite_coeff_loader.py default (0.15 per sector).
+DEFAULT_IMPORT_RATIO = 0.15
+
+
+@dataclass(frozen=True)
+class ModelCoefficients:
+    """Satellite coefficients resolved for one model version."""
+
+    sector_codes: list[str]
+    coefficients: SatelliteCoefficients
+    source: str
+
+
+def compute_va_ratios(z_matrix: list[list[float]], x_vector: list[float]) -> np.ndarray:
+    """Compute value-added ratios from IO model: va_i = 1 - sum(A_col_i).
+
+    Same formula as satellite_coeff_loader._load_io_ratios().
+    """
+    z = np.array(z_matrix, dtype=np.float64)
+    x = np.array(x_vector, dtype=np.float64)
+    x_safe = np.where(x > 0, x, 1.0)
+    a_mat = z / x_safe[np.newaxis, :]
+    va = 1.0 - a_mat.sum(axis=0)
+    clipped: np.ndarray = np.clip(va, 0.0, 1.0)
+    return clipped
+
+
+def default_import_ratios(n: int) -> np.ndarray:
+    """Default import ratios when curated data unavailable."""
+    return np.full(n, DEFAULT_IMPORT_RATIO, dtype=np.float64)
+
+
+def resolve_model_coefficients(
+    model_data: ModelDataRow,
+    employment_rows: Sequence[EmploymentCoefficientsRow],
+) -> ModelCoefficients:
+    """Model-linked coefficients: VA from Z/x, default imports, latest jobs.
+
+    employment_rows are EmploymentCoefficientsRow objects ordered by
+    created_at desc (as returned by the repository); only the latest is
+    used. Sectors without employment data get jobs_coeff 0.0.
+    """
+    sector_codes: list[str] = list(model_data.sector_codes)
+    n = len(sector_codes)
+    jobs_by_sector: dict[str, float] = {}
+    source = "model-data"
+    if employment_rows:
+        latest = employment_rows[0]
+        for coeff in latest.coefficients:
+            jobs_by_sector[coeff.get("sector_code", "")] = coeff.get(
+                "jobs_per_million_sar", 0.0,
+            )
+        source = "model-data+employment"
+
+    coefficients = SatelliteCoefficients(
+        jobs_coeff=np.array(
+            [float(jobs_by_sector.get(code, 0.0)) for code in sector_codes],
+            dtype=np.float64,
+        ),
+        import_ratio=default_import_ratios(n),
+        va_ratio=compute_va_ratios(model_data.z_matrix_json, model_data.x_vector_json),
+        version_id=new_uuid7(),
+    )
+    return ModelCoefficients(
+        sector_codes=sector_codes, coefficients=coefficients, source=source,
+    )
+
+
+async def get_or_build_multiplier_table(
+    model_version_id: UUID,
+    *,
+    md_repo: ModelDataRepository,
+    ec_repo: EmploymentCoefficientsRepository,
+    mt_repo: MultiplierTableRepository,
+    load_model: Callable[[], Awaitable[LoadedModel]],
+) -> MultiplierTableRow | None:
+    """Return the persisted multiplier table, computing it on first use.
+
+    Model data is immutable, so the current table is identified by the
+    model's latest employment coefficients row: a hit costs two indexed
+    reads and never loads Z. Only on a miss are coefficients resolved
+    and hashed, and only when no table has that hash is the model loaded
+    (and B formed). Returns None when no model data exists for
+    model_version_id.
+    """
+    employment_row_id = await ec_repo.get_latest_row_id_for_model(model_version_id)
+    row = await mt_repo.get_current(
+        model_version_id, employment_row_id, MULTIPLIER_TABLE_VERSION,
+    )
+    if row is not None:
+        return row
+
+    model_data = await md_repo.get(model_version_id)
+    if model_data is None:
+        return None
+
+    employment_rows = await ec_repo.get_by_model_version(model_version_id)
+    resolved = resolve_model_coefficients(model_data, employment_rows)
+    coefficients_hash = hash_satellite_coefficients(resolved.coefficients)
+    row = await mt_repo.get_for_model(
+        model_version_id, coefficients_hash, MULTIPLIER_TABLE_VERSION,
+    )
+    if row is not None:
+        return row
+
+    loaded = await load_model()
+    table = compute_multiplier_table(loaded, resolved.coefficients)
+    payload = table.to_payload()
+    payload["coefficients_source"] = resolved.source
+    _logger.info(
+        "Computed multiplier table for model %s (coefficients %s, %d sectors)",
+        model_version_id, coefficients_hash[:12], len(table.sector_codes),
+    )
+    return await mt_repo.create(
+        multiplier_table_id=new_uuid7(),
+        model_version_id=model_version_id,
+        model_checksum=table.model_checksum,
+        coefficients_hash=table.coefficients_hash,
+        table_version=table.table_version,
+        content_hash=table.content_hash,
+        payload=payload,
+        employment_row_id=employment_rows[0].row_id if employment_rows else None,
+    )
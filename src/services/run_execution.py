@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
 from typing import Literal
 from uuid import UUID
@@ -22,9 +23,11 @@ from src.config.settings import get_settings
 from src.data.workforce.satellite_coeff_loader import load_satellite_coefficients
 from src.engine.batch import BatchRequest, BatchRunner, ScenarioInput, SingleRunResult
 from src.engine.model_store import LoadedModel, ModelStore, compute_model_checksum
+from src.engine.run_cache import run_cache_counters
 from src.engine.satellites import SatelliteCoefficients
 from src.models.common import new_uuid7
 from src.models.model_version import ModelVersion
+from src.observability.instrumentation import MODEL_LOAD_SECONDS, PERSIST_SECONDS
 from src.repositories.engine import (
     ModelDataRepository,
     ModelVersionRepository,
@@ -48,6 +51,7 @@ class RunFromScenarioInput:
     workspace_id: UUID
     scenario_spec_id: UUID
     scenario_spec_version: int | None = None  # None = latest
+    bypass_cache: bool = False  # audits: always recompute
 
 
 @dataclass(frozen=True)
@@ -103,6 +107,31 @@ _global_lock = asyncio.Lock()
 ALLOWED_RUNTIME_PROVENANCE = frozenset({"curated_real"})
 
 
+async def resolve_cached_runs(
+    runner: BatchRunner,
+    request: BatchRequest,
+    snap_repo: RunSnapshotRepository,
+    *,
+    workspace_id: UUID | None,
+    bypass: bool = False,
+) -> None:
+    """Populate request.cached_runs from stored runs with matching fingerprints.
+
+    Runs found here are linked to the stored result sets instead of being
+    recomputed. ``bypass`` (or RUN_CACHE_ENABLED=false) forces a full
+    recompute, e.g. for audits. Updates the process-wide hit-rate counters.
+    """
+    fingerprints = runner.input_fingerprints(request)
+    if bypass or not get_settings().RUN_CACHE_ENABLED:
+        run_cache_counters.record_bypass(len(fingerprints))
+        return
+    cached = await snap_repo.find_by_fingerprints(fingerprints, workspace_id=workspace_id)
+    hits = sum(1 for fp in fingerprints if fp in cached)
+    run_cache_counters.record_hit(hits)
+    run_cache_counters.record_miss(len(fingerprints) - hits)
+    request.cached_runs = cached
+
+
 # ------------------------------------------------------------------
 # Service
 # ------------------------------------------------------------------
@@ -179,7 +208,7 @@ class RunExecutionService:
 
         # 3. Load model into cache (two-phase: cache check, then DB fallback)
         try:
-            loaded = await self._ensure_model_loaded(
+            loaded = await self.ensure_model_loaded(
                 model_version_id, repos.mv_repo, repos.md_repo,
             )
         except Exception as exc:
@@ -228,6 +257,11 @@ class RunExecutionService:
             satellite_coefficients=coeffs,
             version_refs=version_refs,
         )
+        await resolve_cached_runs(
+            runner, request, repos.snap_repo,
+            workspace_id=input.workspace_id,
+            bypass=input.bypass_cache,
+        )
 
         try:
             batch_result = runner.run(request)
@@ -325,7 +359,7 @@ class RunExecutionService:
             "prompt_pack_version_id": new_uuid7(),
         }
 
-    async def _ensure_model_loaded(
+    async def ensure_model_loaded(
         self,
         model_version_id: UUID,
         mv_repo: ModelVersionRepository,
@@ -333,14 +367,18 @@ class RunExecutionService:
     ) -> LoadedModel:
         """Load model from cache, falling back to DB on miss.
 
-        Same logic as src/api/runs.py::_ensure_model_loaded() but extracted
+        Same logic as src/api/runs.py::ensure_model_loaded() but extracted
         into the shared service. Uses double-checked locking for concurrency.
         """
         # Fast path: cache hit (no lock needed)
+        started = time.perf_counter()
         try:
-            return _model_store.get(model_version_id)
+            loaded = _model_store.get(model_version_id)
         except KeyError:
             pass
+        else:
+            MODEL_LOAD_SECONDS.observe(time.perf_counter() - started, source="cache")
+            return loaded
 
         # Cache miss — acquire per-model lock to prevent thundering herd
         async with _global_lock:
@@ -407,6 +445,7 @@ class RunExecutionService:
             _logger.info(
                 "Rehydrated model %s from DB into cache", model_version_id,
             )
+            MODEL_LOAD_SECONDS.observe(time.perf_counter() - started, source="db")
             return loaded
 
     async def _persist_run_result(
@@ -420,29 +459,38 @@ class RunExecutionService:
     ) -> None:
         """Persist a SingleRunResult to DB (snapshot + result sets).
 
-        Same logic as src/api/runs.py::_persist_run_result().
+        Cache hits persist only the snapshot, linked to the source run's
+        result sets. Same logic as src/api/runs.py::_persist_run_result().
         """
         snap = sr.snapshot
-        await snap_repo.create(
-            run_id=snap.run_id,
-            model_version_id=snap.model_version_id,
-            taxonomy_version_id=snap.taxonomy_version_id,
-            concordance_version_id=snap.concordance_version_id,
-            mapping_library_version_id=snap.mapping_library_version_id,
-            assumption_library_version_id=snap.assumption_library_version_id,
-            prompt_pack_version_id=snap.prompt_pack_version_id,
-            workspace_id=workspace_id,
-            scenario_spec_id=scenario_spec_id,
-            scenario_spec_version=scenario_spec_version,
-        )
-        for rs in sr.result_sets:
-            await rs_repo.create(
-                result_id=rs.result_id,
-                run_id=rs.run_id,
-                metric_type=rs.metric_type,
-                values=rs.values,
+        with PERSIST_SECONDS.time(entity="run_snapshot"):
+            await snap_repo.create(
+                run_id=snap.run_id,
+                model_version_id=snap.model_version_id,
+                taxonomy_version_id=snap.taxonomy_version_id,
+                concordance_version_id=snap.concordance_version_id,
+                mapping_library_version_id=snap.mapping_library_version_id,
+                assumption_library_version_id=snap.assumption_library_version_id,
+                prompt_pack_version_id=snap.prompt_pack_version_id,
                 workspace_id=workspace_id,
-                year=rs.year,
-                series_kind=rs.series_kind,
-                baseline_run_id=rs.baseline_run_id,
+                scenario_spec_id=scenario_spec_id,
+                scenario_spec_version=scenario_spec_version,
+                input_fingerprint=sr.input_fingerprint,
+                result_source_run_id=sr.result_source_run_id,
+                monte_carlo_seed=snap.monte_carlo_seed,
+                monte_carlo_draws=snap.monte_carlo_draws,
             )
+        if sr.result_sets:
+            with PERSIST_SECONDS.time(entity="result_sets"):
+                for rs in sr.result_sets:
+                    await rs_repo.create(
+                        result_id=rs.result_id,
+                        run_id=rs.run_id,
+                        metric_type=rs.metric_type,
+                        values=rs.values,
+                        sector_breakdowns=rs.sector_breakdowns,
+                        workspace_id=workspace_id,
+                        year=rs.year,
+                        series_kind=rs.series_kind,
+                        baseline_run_id=rs.baseline_run_id,
+                    )
@@ -6,12 +6,19 @@ Tests the full 5-step pipeline including:
 - Degraded step tracking
 - Artifact persistence
 - Status semantics (COMPLETED vs PARTIAL)
+- Dependency wave scheduling and step artifact caching
 """
 
 
 import pytest
 
-from src.agents.depth.orchestrator import DepthOrchestrator
+from src.agents.depth.orchestrator import (
+    _STEP_DEPENDENCIES,
+    DepthOrchestrator,
+    _step_cache_key,
+    _step_waves,
+)
+from src.agents.llm_client import LLMClient, LLMProvider
 from src.models.common import DataClassification, new_uuid7
 from src.models.depth import DepthPlanStatus, DepthStepName
 from src.repositories.depth import DepthArtifactRepository, DepthPlanRepository
@@ -386,3 +393,206 @@ class TestNonDevDepthFailsClosed:
         plan = await plan_repo.get(plan_id)
         errors_str = str(plan.step_errors) + str(plan.error_message or "")
         assert "sk-" not in errors_str
+
+
+class TestStepScheduling:
+    def test_waves_respect_dependencies(self):
+        waves = _step_waves(DepthOrchestrator.STEPS)
+        seen: set[DepthStepName] = set()
+        for wave in waves:
+            for step in wave:
+                assert set(_STEP_DEPENDENCIES[step]) <= seen
+            seen.update(wave)
+        assert seen == set(DepthOrchestrator.STEPS)
+
+    def test_steps_without_pending_dependencies_share_a_wave(self):
+        # Khawatir is not scheduled, so both dependents are ready at once.
+        waves = _step_waves([DepthStepName.MURAQABA, DepthStepName.MUHASABA])
+        assert waves == [[DepthStepName.MURAQABA, DepthStepName.MUHASABA]]
+
+    def test_cache_key_ignores_unread_upstream(self):
+        base = {"sector_codes": ["SEC01"], "workspace_id": "ws"}
+        kwargs = {
+            "base_context": base,
+            "prompt_pack_version": "v1",
+            "classification": DataClassification.RESTRICTED,
+            "generation_mode": "FALLBACK",
+            "provider": "none",
+            "model": "fallback",
+        }
+        k1 = _step_cache_key(
+            DepthStepName.MURAQABA,
+            upstream={DepthStepName.KHAWATIR: {"candidates": [1]}},
+            **kwargs,
+        )
+        k2 = _step_cache_key(
+            DepthStepName.MURAQABA,
+            upstream={
+                DepthStepName.KHAWATIR: {"candidates": [1]},
+                DepthStepName.MUHASABA: {"scored": [2]},
+            },
+            **kwargs,
+        )
+        k3 = _step_cache_key(
+            DepthStepName.MURAQABA,
+            upstream={DepthStepName.KHAWATIR: {"candidates": [2]}},
+            **kwargs,
+        )
+        assert k1 == k2
+        assert k1 != k3
+        assert len(k1) == 64
+
+    def test_cache_key_covers_provider_and_model(self):
+        kwargs = {
+            "base_context": {"sector_codes": ["SEC01"], "workspace_id": "ws"},
+            "upstream": {},
+            "prompt_pack_version": "v1",
+            "classification": DataClassification.INTERNAL,
+            "generation_mode": "LLM",
+        }
+        keys = {
+            _step_cache_key(DepthStepName.KHAWATIR, provider=p, model=m, **kwargs)
+            for p, m in [("anthropic", "default"), ("openai", "default"), ("anthropic", "x")]
+        }
+        assert len(keys) == 3
+
+
+class TestDepthArtifactCache:
+    @pytest.fixture
+    def orchestrator(self):
+        return DepthOrchestrator()
+
+    @pytest.fixture
+    def plan_repo(self, db_session):
+        return DepthPlanRepository(db_session)
+
+    @pytest.fixture
+    def artifact_repo(self, db_session):
+        return DepthArtifactRepository(db_session)
+
+    @pytest.fixture
+    def context(self):
+        return {
+            "workspace_description": "Saudi mega-project",
+            "sector_codes": ["SEC01", "SEC02", "SEC03"],
+            "existing_shocks": [],
+            "time_horizon": {"start_year": 2025, "end_year": 2035},
+        }
+
+    async def _run(self, orchestrator, plan_repo, artifact_repo, workspace_id, context, **kw):
+        pid = new_uuid7()
+        await plan_repo.create(plan_id=pid, workspace_id=workspace_id)
+        status = await orchestrator.run(
+            plan_id=pid,
+            workspace_id=workspace_id,
+            context=context,
+            classification=DataClassification.RESTRICTED,
+            plan_repo=plan_repo,
+            artifact_repo=artifact_repo,
+            **kw,
+        )
+        return pid, status
+
+    async def test_first_run_misses_cache(
+        self, orchestrator, plan_repo, artifact_repo, workspace_id, context,
+    ):
+        pid, _ = await self._run(
+            orchestrator, plan_repo, artifact_repo, workspace_id, context,
+        )
+        plan = await plan_repo.get(pid)
+        assert len(plan.step_metadata) == 5
+        assert all(m["cache_hit"] is False for m in plan.step_metadata)
+        assert all(m["duration_ms"] is not None for m in plan.step_metadata)
+
+    async def test_rerun_unchanged_scenario_hits_cache(
+        self, orchestrator, plan_repo, artifact_repo, workspace_id, context,
+    ):
+        first, _ = await self._run(
+            orchestrator, plan_repo, artifact_repo, workspace_id, context,
+        )
+        second, status = await self._run(
+            orchestrator, plan_repo, artifact_repo, workspace_id, context,
+        )
+        assert status == DepthPlanStatus.COMPLETED
+
+        plan = await plan_repo.get(second)
+        assert [m["cache_hit"] for m in plan.step_metadata] == [True] * 5
+        assert all(m["input_tokens"] == 0 for m in plan.step_metadata)
+
+        # Every step still gets its own artifact with the reused payload.
+        for step in DepthOrchestrator.STEPS:
+            a = await artifact_repo.get_by_plan_and_step(first, step.value)
+            b = await artifact_repo.get_by_plan_and_step(second, step.value)
+            assert b.payload == a.payload
+            assert b.cache_key == a.cache_key
+            assert b.metadata_json["cache_hit"] is True
+
+    async def test_changed_scenario_misses_cache(
+        self, orchestrator, plan_repo, artifact_repo, workspace_id, context,
+    ):
+        await self._run(
+            orchestrator, plan_repo, artifact_repo, workspace_id, context,
+        )
+        changed = {**context, "sector_codes": ["SEC09"]}
+        pid, _ = await self._run(
+            orchestrator, plan_repo, artifact_repo, workspace_id, changed,
+        )
+        plan = await plan_repo.get(pid)
+        assert plan.step_metadata[0]["cache_hit"] is False
+
+    async def test_cache_can_be_disabled(
+        self, orchestrator, plan_repo, artifact_repo, workspace_id, context,
+    ):
+        await self._run(
+            orchestrator, plan_repo, artifact_repo, workspace_id, context,
+        )
+        pid, _ = await self._run(
+            orchestrator, plan_repo, artifact_repo, workspace_id, context,
+            use_cache=False,
+        )
+        plan = await plan_repo.get(pid)
+        assert all(m["cache_hit"] is False for m in plan.step_metadata)
+
+    async def test_llm_cache_key_follows_provider_and_model(
+        self, orchestrator, plan_repo, artifact_repo, workspace_id, context,
+    ):
+        async def first_key(llm_client):
+            pid = new_uuid7()
+            await plan_repo.create(plan_id=pid, workspace_id=workspace_id)
+            await orchestrator.run(
+                plan_id=pid,
+                workspace_id=workspace_id,
+                context=context,
+                classification=DataClassification.INTERNAL,
+                llm_client=llm_client,
+                plan_repo=plan_repo,
+                artifact_repo=artifact_repo,
+            )
+            plan = await plan_repo.get(pid)
+            meta = plan.step_metadata[0]
+            assert meta["generation_mode"] == "LLM"
+            return meta["provider"], meta["model"], meta["cache_key"]
+
+        anthropic = await first_key(
+            LLMClient(anthropic_key="sk-ant", model_anthropic="claude-a"),
+        )
+        assert anthropic[:2] == (LLMProvider.ANTHROPIC.value, "claude-a")
+        # Unchanged provider and model reuse the cached artifact key
+        again = await first_key(
+            LLMClient(anthropic_key="sk-ant", model_anthropic="claude-a"),
+        )
+        assert again == anthropic
+        other_model = await first_key(
+            LLMClient(anthropic_key="sk-ant", model_anthropic="claude-b"),
+        )
+        assert other_model[1] == "claude-b"
+        assert other_model[2] != anthropic[2]
+        other_provider = await first_key(
+            LLMClient(
+                openai_key="sk-oai",
+                model_openai="claude-a",
+                routing_table={DataClassification.INTERNAL: LLMProvider.OPENAI},
+            ),
+        )
+        assert other_provider[0] == LLMProvider.OPENAI.value
+        assert other_provider[2] not in {anthropic[2], other_model[2]}
@@ -13,10 +13,19 @@ from src.agents.economist_copilot import (
     CopilotResponse,
     EconomistCopilot,
     InvalidToolCallError,
+    compact_history,
     parse_tool_calls,
     validate_tool_call,
 )
-from src.agents.llm_client import LLMProvider, LLMRequest, LLMResponse, ProviderUnavailableError, TokenUsage
+from src.agents.llm_client import (
+    LLMClient,
+    LLMProvider,
+    LLMRequest,
+    LLMResponse,
+    ProviderUnavailableError,
+    TokenUsage,
+)
+from src.models.common import DataClassification
 
 
 # ── Prompt tests ────────────────────────────────────────────────────────
@@ -65,6 +74,12 @@ class TestVersionedPrompt:
     def test_prompt_without_context(self):
         prompt = build_system_prompt()
         assert "Economic impact assessment" in prompt  # default
+        assert "EARLIER IN THIS CONVERSATION" not in prompt
+
+    def test_prompt_with_conversation_summary(self):
+        prompt = build_system_prompt({"conversation_summary": "Agreed on a SAR 2bn tourism shock."})
+        assert "EARLIER IN THIS CONVERSATION" in prompt
+        assert "Agreed on a SAR 2bn tourism shock." in prompt
 
     def test_prompt_agent_math_boundary(self):
         prompt = build_system_prompt()
@@ -492,3 +507,113 @@ class TestEnrichNarrative:
 
         assert isinstance(request, LLMRequest)
         assert "Hajj Tourism Impact" in request.user_prompt
+
+
+# ── summarize_history tests ─────────────────────────────────────────────
+
+
+class TestSummarizeHistory:
+    """Incremental folding of turns that left the history window."""
+
+    async def test_summarize_sends_previous_summary_and_new_turns(self):
+        mock_llm = MagicMock()
+        mock_llm.call_unstructured = AsyncMock(return_value=LLMResponse(
+            content="Tourism shock agreed; awaiting run.",
+            parsed=None,
+            provider=LLMProvider.LOCAL,
+            model="local-deterministic",
+            usage=TokenUsage(input_tokens=60, output_tokens=12),
+        ))
+        copilot = EconomistCopilot(llm_client=mock_llm)
+
+        summary, usage = await copilot.summarize_history(
+            "Discussed Hajj tourism.",
+            [{"role": "user", "content": "Use SAR 2bn."}],
+        )
+
+        assert summary == "Tourism shock agreed; awaiting run."
+        assert (usage.input_tokens, usage.output_tokens) == (60, 12)
+        request = mock_llm.call_unstructured.call_args[0][0]
+        assert "Discussed Hajj tourism." in request.user_prompt
+        assert "user: Use SAR 2bn." in request.user_prompt
+
+    async def test_summarize_falls_back_to_compaction(self):
+        mock_llm = MagicMock()
+        mock_llm.call_unstructured = AsyncMock(
+            side_effect=ProviderUnavailableError("all providers down"),
+        )
+        copilot = EconomistCopilot(llm_client=mock_llm)
+        turns = [{"role": "user", "content": "Use SAR 2bn."}]
+
+        summary, usage = await copilot.summarize_history("Earlier.", turns)
+
+        assert summary == compact_history("Earlier.", turns)
+        assert usage.input_tokens == 0
+
+    def test_compact_history_is_bounded(self):
+        turns = [{"role": "user", "content": "x" * 500}] * 100
+        assert len(compact_history(None, turns)) <= 4000
+
+    def test_compact_history_keeps_oldest_context(self):
+        previous = "Agreed: Hajj tourism shock, SAR 2bn, 2024 base year. " * 20
+        turns = [{"role": "user", "content": f"turn {i} " + "x" * 300} for i in range(40)]
+
+        compacted = compact_history(previous, turns)
+
+        assert len(compacted) <= 4000
+        assert compacted.startswith("Agreed: Hajj tourism shock")
+        assert "earlier turns omitted" in compacted
+        assert compacted.endswith("x" * 100)
+        assert "turn 39 " in compacted
+
+
+# ── stream_turn tests ───────────────────────────────────────────────────
+
+
+def _scripted_llm(*replies: str) -> LLMClient:
+    """LLMClient whose every route is the scripted LOCAL provider."""
+    return LLMClient(
+        routing_table={c: LLMProvider.LOCAL for c in DataClassification},
+        local_responses=list(replies),
+    )
+
+
+class TestStreamTurn:
+    """Streaming turns yield deltas, then the same response as process_turn."""
+
+    async def test_stream_turn_yields_deltas_then_response(self):
+        copilot = EconomistCopilot(llm_client=_scripted_llm("Tourism supports construction."))
+
+        chunks = [c async for c in copilot.stream_turn(messages=[], user_message="Impact?")]
+
+        deltas = "".join(c.delta for c in chunks if c.response is None)
+        assert deltas == "Tourism supports construction."
+        final = chunks[-1].response
+        assert isinstance(final, CopilotResponse)
+        assert final.content == "Tourism supports construction."
+        assert final.model_provider == "LOCAL"
+
+    async def test_stream_turn_parses_tool_calls_on_full_content(self):
+        reply = (
+            'Listing datasets. '
+            '{"tool": "lookup_data", "arguments": {"dataset_id": "io_tables"}}'
+        )
+        copilot = EconomistCopilot(llm_client=_scripted_llm(reply))
+
+        chunks = [c async for c in copilot.stream_turn(messages=[], user_message="Data?")]
+
+        final = chunks[-1].response
+        assert [tc.tool_name for tc in final.tool_calls] == ["lookup_data"]
+
+    async def test_stream_turn_applies_confirmation_gate(self):
+        reply = (
+            '{"tool": "run_engine", '
+            '"arguments": {"scenario_spec_id": "x", "scenario_spec_version": 1}}'
+        )
+        copilot = EconomistCopilot(llm_client=_scripted_llm(reply))
+
+        chunks = [c async for c in copilot.stream_turn(messages=[], user_message="Run")]
+
+        final = chunks[-1].response
+        assert final.pending_confirmation["tool"] == "run_engine"
+        assert final.tool_calls == []
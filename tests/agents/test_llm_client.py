@@ -215,6 +215,13 @@ class TestProviderAvailability:
         client = LLMClient(anthropic_key="", openai_key="", openrouter_key="")
         assert client.is_available_for(DataClassification.CONFIDENTIAL) is False
 
+    def test_route_for_returns_configured_model(self) -> None:
+        client = LLMClient(anthropic_key="sk-test", model_anthropic="claude-x")
+        assert client.route_for(DataClassification.CONFIDENTIAL) == (
+            LLMProvider.ANTHROPIC, "claude-x",
+        )
+        assert client.route_for(DataClassification.RESTRICTED)[0] == LLMProvider.LOCAL
+
 
 # ===================================================================
 # Retry configuration
@@ -17,6 +17,7 @@ from src.agents.llm_client import (
     LLMProvider,
     LLMRequest,
     LLMResponse,
+    LLMStreamChunk,
     ProviderUnavailableError,
     TokenUsage,
 )
@@ -245,3 +246,95 @@ class TestRetryBehavior:
                     _make_request(),
                     classification=DataClassification.CONFIDENTIAL,
                 )
+
+
+# ===================================================================
+# Streaming
+# ===================================================================
+
+
+async def _collect(stream) -> list[LLMStreamChunk]:
+    return [chunk async for chunk in stream]
+
+
+class TestStreaming:
+    """stream_unstructured: deltas then one final response chunk."""
+
+    @pytest.mark.anyio
+    async def test_local_scripted_stream(self) -> None:
+        client = LLMClient(local_responses=["Tourism output rises.", "Second reply"])
+
+        chunks = await _collect(client.stream_unstructured(
+            _make_request(), classification=DataClassification.RESTRICTED,
+        ))
+
+        deltas = [c.delta for c in chunks if c.response is None]
+        assert len(deltas) == 3
+        assert "".join(deltas) == "Tourism output rises."
+        final = chunks[-1].response
+        assert final.content == "Tourism output rises."
+        assert final.provider == LLMProvider.LOCAL
+        assert final.usage.output_tokens == 3
+
+    @pytest.mark.anyio
+    async def test_local_script_advances_and_repeats_last(self) -> None:
+        client = LLMClient(local_responses=["one", "two"])
+        request = _make_request()
+        contents = [
+            (await client.call_unstructured(
+                request, classification=DataClassification.RESTRICTED,
+            )).content
+            for _ in range(3)
+        ]
+        assert contents == ["one", "two", "two"]
+
+    @pytest.mark.anyio
+    async def test_stream_unavailable_provider_raises(self) -> None:
+        client = LLMClient()
+        with pytest.raises(ProviderUnavailableError):
+            await _collect(client.stream_unstructured(
+                _make_request(), classification=DataClassification.CONFIDENTIAL,
+            ))
+
+    @pytest.mark.anyio
+    async def test_stream_retries_before_first_delta(self) -> None:
+        client = LLMClient(anthropic_key="sk-ant-test", max_retries=3, base_delay=0.0)
+        attempts = 0
+
+        async def flaky_stream(request):
+            nonlocal attempts
+            attempts += 1
+            if attempts < 2:
+                raise ConnectionError("connect failed")
+            yield LLMStreamChunk(delta="ok")
+            yield LLMStreamChunk(response=LLMResponse(
+                content="ok", parsed=None, provider=LLMProvider.ANTHROPIC,
+                model="claude", usage=TokenUsage(input_tokens=5, output_tokens=1),
+            ))
+
+        with patch.object(client, "_stream_anthropic", flaky_stream):
+            chunks = await _collect(client.stream_unstructured(
+                _make_request(), classification=DataClassification.CONFIDENTIAL,
+            ))
+
+        assert attempts == 2
+        assert chunks[-1].response.content == "ok"
+        assert client.cumulative_usage().input_tokens == 5
+
+    @pytest.mark.anyio
+    async def test_stream_failure_mid_response_not_retried(self) -> None:
+        client = LLMClient(anthropic_key="sk-ant-test", max_retries=3, base_delay=0.0)
+        attempts = 0
+
+        async def broken_stream(request):
+            nonlocal attempts
+            attempts += 1
+            yield LLMStreamChunk(delta="partial")
+            raise ConnectionError("dropped")
+
+        with patch.object(client, "_stream_anthropic", broken_stream):
+            with pytest.raises(ProviderUnavailableError, match="mid-response"):
+                await _collect(client.stream_unstructured(
+                    _make_request(), classification=DataClassification.CONFIDENTIAL,
+                ))
+        assert attempts == 1
@@ -110,3 +110,25 @@ class TestLogout:
             headers={"Authorization": f"Bearer {token}"},
         )
         assert me_resp.status_code == 401
+
+    @pytest.mark.anyio
+    async def test_logout_leaves_other_logins_valid(self, client: AsyncClient) -> None:
+        tokens = []
+        for _ in range(2):
+            resp = await client.post("/v1/auth/login", json={
+                "username": "analyst",
+                "password": "any",
+            })
+            tokens.append(resp.json()["token"])
+        assert tokens[0] != tokens[1]
+
+        await client.post(
+            "/v1/auth/logout",
+            headers={"Authorization": f"Bearer {tokens[0]}"},
+        )
+
+        me_resp = await client.get(
+            "/v1/auth/me",
+            headers={"Authorization": f"Bearer {tokens[1]}"},
+        )
+        assert me_resp.status_code == 200
@@ -0,0 +1,209 @@
+"""Tests for auth claims + workspace membership caching (src/api/auth_cache.py).
+
+Covers: repeat requests skip the membership SELECT and JWT decode, denies
+are never cached, invalidation drops stale allows, token expiry bounds
+claims memoization, and hit rates are reported via the stats endpoint.
+"""
+
+import time
+from uuid import UUID
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.auth_cache import (
+    ClaimsCache,
+    MembershipCache,
+    auth_cache_counters,
+    get_membership_cache,
+)
+from src.db.session import get_async_session
+from src.db.tables import WorkspaceMembershipRow, WorkspaceRow
+from src.models.common import utc_now
+
+pytestmark = pytest.mark.anyio
+
+ANALYST_USER_ID = UUID("00000000-0000-7000-8000-000000000001")
+ADMIN_USER_ID = UUID("00000000-0000-7000-8000-000000000003")
+DEV_WS_ID = UUID("00000000-0000-7000-8000-000000000010")
+
+
+@pytest.fixture
+async def unauthed_client(db_session: AsyncSession) -> AsyncClient:
+    from src.api.main import app
+
+    async def _override_session():
+        yield db_session
+
+    app.dependency_overrides[get_async_session] = _override_session
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test",
+    ) as ac:
+        yield ac
+
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_counters():
+    auth_cache_counters.reset()
+    yield
+    auth_cache_counters.reset()
+
+
+async def _login(client: AsyncClient, username: str) -> str:
+    resp = await client.post("/v1/auth/login", json={
+        "username": username, "password": "any",
+    })
+    return resp.json()["token"]
+
+
+async def _seed(session: AsyncSession, user_id: UUID, role: str) -> None:
+    now = utc_now()
+    session.add(WorkspaceRow(
+        workspace_id=DEV_WS_ID,
+        client_name="Test WS",
+        engagement_code="ENG-001",
+        classification="CONFIDENTIAL",
+        description="test",
+        created_by=user_id,
+        created_at=now,
+        updated_at=now,
+    ))
+    session.add(WorkspaceMembershipRow(
+        workspace_id=DEV_WS_ID,
+        user_id=user_id,
+        role=role,
+        created_at=now,
+        created_by=user_id,
+    ))
+    await session.flush()
+
+
+class TestMembershipCache:
+    async def test_allow_is_cached(self) -> None:
+        cache = MembershipCache(ttl_seconds=30, max_entries=10)
+        await cache.put_role(ANALYST_USER_ID, DEV_WS_ID, "analyst")
+        assert await cache.get_role(ANALYST_USER_ID, DEV_WS_ID) == "analyst"
+
+    async def test_invalidate_drops_allow(self) -> None:
+        cache = MembershipCache(ttl_seconds=30, max_entries=10)
+        await cache.put_role(ANALYST_USER_ID, DEV_WS_ID, "analyst")
+        await cache.invalidate(ANALYST_USER_ID, DEV_WS_ID)
+        assert await cache.get_role(ANALYST_USER_ID, DEV_WS_ID) is None
+
+    async def test_put_after_invalidation_is_ignored(self) -> None:
+        """A lookup that raced an invalidation must not re-cache its allow."""
+        cache = MembershipCache(ttl_seconds=30, max_entries=10)
+        epoch = cache.epoch
+        await cache.invalidate(ANALYST_USER_ID, DEV_WS_ID)
+        await cache.put_role(ANALYST_USER_ID, DEV_WS_ID, "analyst", epoch=epoch)
+        assert await cache.get_role(ANALYST_USER_ID, DEV_WS_ID) is None
+
+    async def test_zero_ttl_disables(self) -> None:
+        cache = MembershipCache(ttl_seconds=0, max_entries=10)
+        await cache.put_role(ANALYST_USER_ID, DEV_WS_ID, "analyst")
+        assert cache.backend == "none"
+        assert await cache.get_role(ANALYST_USER_ID, DEV_WS_ID) is None
+
+
+class TestClaimsCache:
+    def test_memoized_until_exp(self) -> None:
+        cache = ClaimsCache(max_ttl_seconds=300, max_entries=10)
+        claims = {"sub": "x", "exp": time.time() + 60}
+        cache.put("dev", "tok", claims)
+        assert cache.get("dev", "tok") == claims
+        assert cache.get("staging", "tok") is None
+
+    def test_expired_token_not_memoized(self) -> None:
+        cache = ClaimsCache(max_ttl_seconds=300, max_entries=10)
+        cache.put("dev", "tok", {"sub": "x", "exp": time.time() - 1})
+        assert cache.get("dev", "tok") is None
+
+
+class TestRequireWorkspaceMemberCaching:
+    async def test_repeat_requests_hit_cache(
+        self, unauthed_client: AsyncClient, db_session: AsyncSession,
+    ) -> None:
+        await _seed(db_session, ANALYST_USER_ID, "analyst")
+        token = await _login(unauthed_client, "analyst")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        for _ in range(5):
+            resp = await unauthed_client.get(
+                f"/v1/workspaces/{DEV_WS_ID}", headers=headers,
+            )
+            assert resp.status_code == 200
+
+        stats = auth_cache_counters.snapshot()
+        assert stats.membership_misses == 1
+        assert stats.membership_hits == 4
+        assert stats.claims_misses == 1
+        assert stats.claims_hits == 4
+        assert stats.membership_count == 5
+
+    async def test_deny_is_not_cached(
+        self, unauthed_client: AsyncClient, db_session: AsyncSession,
+    ) -> None:
+        await _seed(db_session, ADMIN_USER_ID, "admin")
+        token = await _login(unauthed_client, "analyst")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        resp = await unauthed_client.get(f"/v1/workspaces/{DEV_WS_ID}", headers=headers)
+        assert resp.status_code == 404
+
+        db_session.add(WorkspaceMembershipRow(
+            workspace_id=DEV_WS_ID,
+            user_id=ANALYST_USER_ID,
+            role="analyst",
+            created_at=utc_now(),
+            created_by=ADMIN_USER_ID,
+        ))
+        await db_session.flush()
+
+        resp = await unauthed_client.get(f"/v1/workspaces/{DEV_WS_ID}", headers=headers)
+        assert resp.status_code == 200
+
+    async def test_invalidation_revokes_cached_allow(
+        self, unauthed_client: AsyncClient, db_session: AsyncSession,
+    ) -> None:
+        await _seed(db_session, ANALYST_USER_ID, "analyst")
+        token = await _login(unauthed_client, "analyst")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        resp = await unauthed_client.get(f"/v1/workspaces/{DEV_WS_ID}", headers=headers)
+        assert resp.status_code == 200
+
+        await db_session.execute(
+            delete(WorkspaceMembershipRow).where(
+                WorkspaceMembershipRow.user_id == ANALYST_USER_ID,
+            )
+        )
+        await get_membership_cache().invalidate(ANALYST_USER_ID, DEV_WS_ID)
+
+        resp = await unauthed_client.get(f"/v1/workspaces/{DEV_WS_ID}", headers=headers)
+        assert resp.status_code == 404
+
+    async def test_stats_endpoint(self, unauthed_client: AsyncClient) -> None:
+        token = await _login(unauthed_client, "admin")
+        resp = await unauthed_client.get(
+            "/v1/auth/cache/stats",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["membership_backend"] == "memory"
+        assert 0.0 <= body["claims_hit_rate"] <= 1.0
+
+    async def test_stats_endpoint_requires_admin(
+        self, unauthed_client: AsyncClient,
+    ) -> None:
+        token = await _login(unauthed_client, "analyst")
+        resp = await unauthed_client.get(
+            "/v1/auth/cache/stats",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert resp.status_code == 403
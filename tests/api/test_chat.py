@@ -4,8 +4,12 @@ POST   /v1/workspaces/{ws}/chat/sessions
 GET    /v1/workspaces/{ws}/chat/sessions
 GET    /v1/workspaces/{ws}/chat/sessions/{sid}
 POST   /v1/workspaces/{ws}/chat/sessions/{sid}/messages
+POST   /v1/workspaces/{ws}/chat/sessions/{sid}/messages/stream
 """
 
+import json
+from unittest.mock import patch
+
 import pytest
 from uuid import UUID
 from uuid_extensions import uuid7
@@ -216,6 +220,66 @@ class TestSendMessage:
         assert resp.status_code == 201
 
 
+def _parse_sse(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for frame in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in frame.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestStreamMessage:
+    async def test_stream_returns_event_stream(self, client, db_session):
+        """Streaming endpoint emits deltas and the persisted message."""
+        from src.agents.economist_copilot import EconomistCopilot
+        from src.agents.llm_client import LLMClient, LLMProvider
+        from src.models.common import DataClassification
+
+        await _seed_ws(db_session)
+        create_resp = await client.post(f"/v1/workspaces/{WS}/chat/sessions", json={})
+        sid = create_resp.json()["session_id"]
+        copilot = EconomistCopilot(llm_client=LLMClient(
+            routing_table={c: LLMProvider.LOCAL for c in DataClassification},
+            local_responses=["Hotels gain most."],
+        ))
+
+        with patch("src.api.chat._build_copilot", return_value=copilot):
+            resp = await client.post(
+                f"/v1/workspaces/{WS}/chat/sessions/{sid}/messages/stream",
+                json={"content": "Who gains?"},
+            )
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        events = _parse_sse(resp.text)
+        assert events[0][0] == "delta"
+        assert events[-1][0] == "message"
+        assert events[-1][1]["content"] == "Hotels gain most."
+
+        detail = await client.get(f"/v1/workspaces/{WS}/chat/sessions/{sid}")
+        assert len(detail.json()["messages"]) == 2
+
+    async def test_stream_without_copilot_sends_stub_message(self, client, db_session):
+        await _seed_ws(db_session)
+        create_resp = await client.post(f"/v1/workspaces/{WS}/chat/sessions", json={})
+        sid = create_resp.json()["session_id"]
+        resp = await client.post(
+            f"/v1/workspaces/{WS}/chat/sessions/{sid}/messages/stream",
+            json={"content": "Hello"},
+        )
+        events = _parse_sse(resp.text)
+        assert [name for name, _ in events] == ["message"]
+        assert events[0][1]["role"] == "assistant"
+
+    async def test_stream_404_invalid_session(self, client, db_session):
+        await _seed_ws(db_session)
+        resp = await client.post(
+            f"/v1/workspaces/{WS}/chat/sessions/{uuid7()}/messages/stream",
+            json={"content": "Hello"},
+        )
+        assert resp.status_code == 404
+
+
 class TestCopilotRuntimeWiring:
     """S27-0: Chat API wires real copilot by default."""
 
@@ -0,0 +1,82 @@
+"""Tests for CompressionMiddleware (src/api/compression.py)."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from src.api.compression import CompressionMiddleware, negotiate_encoding
+from src.api.fast_json import FastJSONResponse
+
+pytestmark = pytest.mark.anyio
+
+_BIG = {"values": {f"S{i}": i * 1.5 for i in range(500)}}
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=512)
+
+    @app.get("/big")
+    async def big() -> FastJSONResponse:
+        return FastJSONResponse(_BIG, headers={"ETag": '"abc"'})
+
+    @app.get("/small")
+    async def small() -> dict:
+        return {"ok": True}
+
+    @app.get("/text")
+    async def text() -> PlainTextResponse:
+        return PlainTextResponse("x" * 4096)
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for _ in range(3):
+                yield b'{"chunk": "' + b"y" * 1024 + b'"}\n'
+
+        return StreamingResponse(chunks(), media_type="application/json")
+
+    return app
+
+
+async def _get(path: str, accept_encoding: str = "gzip"):
+    transport = ASGITransport(app=_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+
+class TestNegotiation:
+    def test_quality_values(self) -> None:
+        assert negotiate_encoding("gzip") == "gzip"
+        assert negotiate_encoding("deflate, gzip;q=0.5") == "gzip"
+        assert negotiate_encoding("gzip;q=0") is None
+        assert negotiate_encoding("") is None
+
+
+class TestCompressionMiddleware:
+    async def test_large_json_is_gzipped(self) -> None:
+        resp = await _get("/big")
+        assert resp.headers["content-encoding"] == "gzip"
+        assert "accept-encoding" in resp.headers["vary"].lower()
+        assert resp.headers["etag"] == '"abc"'
+        assert resp.json() == _BIG  # httpx decodes transparently
+        assert int(resp.headers["content-length"]) < len(resp.content)
+
+    async def test_identity_when_not_accepted(self) -> None:
+        resp = await _get("/big", accept_encoding="identity")
+        assert "content-encoding" not in resp.headers
+        assert resp.json() == _BIG
+
+    async def test_small_json_untouched(self) -> None:
+        resp = await _get("/small")
+        assert "content-encoding" not in resp.headers
+
+    async def test_non_json_untouched(self) -> None:
+        resp = await _get("/text")
+        assert "content-encoding" not in resp.headers
+
+    async def test_streaming_untouched(self) -> None:
+        resp = await _get("/stream")
+        assert "content-encoding" not in resp.headers
+        assert resp.text.count("chunk") == 3
@@ -343,3 +343,38 @@ class TestExportRepoWorkspaceScope:
         updated = await repo.set_artifact_refs(row.export_id, refs)
         assert updated is not None
         assert updated.artifact_refs_json == refs
+
+
+class TestArtifactStreaming:
+    """Downloads stream from storage in chunks."""
+
+    def test_iter_chunks_reassembles_bytes(self, tmp_path):
+        store = ExportArtifactStorage(storage_root=str(tmp_path))
+        data = bytes(range(256)) * 1000
+        store.store("exports/x/excel.xlsx", data)
+        chunks = list(store.iter_chunks("exports/x/excel.xlsx", chunk_size=4096))
+        assert all(len(c) <= 4096 for c in chunks)
+        assert len(chunks) > 1
+        assert b"".join(chunks) == data
+        assert store.size("exports/x/excel.xlsx") == len(data)
+
+    def test_size_missing_key_raises(self, tmp_path):
+        store = ExportArtifactStorage(storage_root=str(tmp_path))
+        with pytest.raises(FileNotFoundError):
+            store.size("exports/missing/excel.xlsx")
+
+    @pytest.mark.anyio
+    async def test_large_download_streams_with_content_length(
+        self, client, db_session, _artifact_storage,
+    ):
+        key = "exports/large/excel.xlsx"
+        export_id, _ = await _seed_completed_export(db_session, artifact_refs={"excel": key})
+        data = b"\x50\x4b" * 300_000
+        _artifact_storage.store(key, data)
+
+        resp = await client.get(
+            f"/v1/workspaces/{WS_ID}/exports/{export_id}/download/excel"
+        )
+        assert resp.status_code == 200
+        assert resp.headers["content-length"] == str(len(data))
+        assert resp.content == data
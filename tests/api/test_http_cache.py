@@ -0,0 +1,236 @@
+"""Tests for HTTP validators / conditional GET (src/api/http_cache.py).
+
+Covers: ETag/If-None-Match helpers, the byte-bounded response cache,
+and 304 handling on run results, run listing, model version detail and
+library version endpoints.
+"""
+
+from uuid import UUID
+
+import pytest
+from starlette.requests import Request
+from uuid_extensions import uuid7
+
+from src.api.http_cache import (
+    ResponseCache,
+    etag_matches,
+    get_response_cache,
+    not_modified,
+    strong_etag,
+)
+from src.db.tables import ModelVersionRow, ResultSetRow, RunSnapshotRow
+from src.models.common import utc_now
+from src.repositories.libraries import MappingLibraryRepository
+
+WS = "00000000-0000-7000-8000-000000000042"
+
+
+def _request(**headers: str) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()],
+    })
+
+
+class TestValidators:
+    def test_strong_etag_is_quoted_and_stable(self) -> None:
+        tag = strong_etag("run", "abc", False)
+        assert tag.startswith('"') and tag.endswith('"')
+        assert tag == strong_etag("run", "abc", False)
+        assert tag != strong_etag("run", "abc", True)
+
+    def test_etag_matches_list_star_and_weak(self) -> None:
+        tag = '"abc"'
+        assert etag_matches('"x", "abc"', tag)
+        assert etag_matches("*", tag)
+        assert etag_matches('W/"abc"', tag)
+        assert not etag_matches('"x"', tag)
+        assert not etag_matches(None, tag)
+
+    def test_not_modified_needs_if_none_match(self) -> None:
+        assert not_modified(_request(if_none_match='"tag"'), etag='"tag"')
+        assert not not_modified(_request(if_none_match='"other"'), etag='"tag"')
+        assert not not_modified(_request(), etag='"tag"')
+
+
+class TestResponseCache:
+    def test_lru_eviction_by_bytes(self) -> None:
+        cache = ResponseCache(max_bytes=10)
+        cache.put('"a"', b"12345")
+        cache.put('"b"', b"12345")
+        assert cache.get('"a"') == b"12345"  # a is now most recent
+        cache.put('"c"', b"12345")
+        assert cache.get('"b"') is None
+        assert cache.get('"a"') is not None
+        assert cache.snapshot().bytes == 10
+
+    def test_oversized_and_disabled(self) -> None:
+        cache = ResponseCache(max_bytes=4)
+        cache.put('"a"', b"12345")
+        assert cache.snapshot().entries == 0
+        disabled = ResponseCache(max_bytes=0)
+        disabled.put('"a"', b"1")
+        assert disabled.get('"a"') is None
+
+
+# ---------------------------------------------------------------------------
+# Endpoints
+# ---------------------------------------------------------------------------
+
+
+async def _seed_run(session, *, workspace_id: str = WS) -> UUID:
+    run_id = uuid7()
+    session.add(RunSnapshotRow(
+        run_id=run_id,
+        model_version_id=uuid7(),
+        taxonomy_version_id=uuid7(),
+        concordance_version_id=uuid7(),
+        mapping_library_version_id=uuid7(),
+        assumption_library_version_id=uuid7(),
+        prompt_pack_version_id=uuid7(),
+        source_checksums=[],
+        workspace_id=UUID(workspace_id),
+        created_at=utc_now(),
+    ))
+    session.add(ResultSetRow(
+        result_id=uuid7(),
+        run_id=run_id,
+        metric_type="total_output",
+        values={"S1": 1.0},
+        sector_breakdowns={},
+        workspace_id=UUID(workspace_id),
+        created_at=utc_now(),
+    ))
+    await session.flush()
+    return run_id
+
+
+@pytest.mark.anyio
+class TestRunResults:
+    async def test_etag_and_304(self, client, db_session) -> None:
+        run_id = await _seed_run(db_session)
+        url = f"/v1/workspaces/{WS}/engine/runs/{run_id}"
+
+        first = await client.get(url)
+        assert first.status_code == 200
+        assert "immutable" in first.headers["cache-control"]
+        etag = first.headers["etag"]
+        assert first.json()["run_id"] == str(run_id)
+
+        revalidated = await client.get(url, headers={"If-None-Match": etag})
+        assert revalidated.status_code == 304
+        assert revalidated.headers["etag"] == etag
+        assert revalidated.content == b""
+
+    async def test_include_series_has_its_own_etag(self, client, db_session) -> None:
+        run_id = await _seed_run(db_session)
+        url = f"/v1/workspaces/{WS}/engine/runs/{run_id}"
+        plain = await client.get(url)
+        series = await client.get(url, params={"include_series": "true"})
+        assert plain.headers["etag"] != series.headers["etag"]
+
+    async def test_body_served_from_response_cache(self, client, db_session) -> None:
+        run_id = await _seed_run(db_session)
+        url = f"/v1/workspaces/{WS}/engine/runs/{run_id}"
+        first = await client.get(url)
+        second = await client.get(url)
+        assert second.content == first.content
+        stats = get_response_cache().snapshot()
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    async def test_other_workspace_gets_404_not_304(self, client, db_session) -> None:
+        run_id = await _seed_run(db_session, workspace_id=str(uuid7()))
+        resp = await client.get(
+            f"/v1/workspaces/{WS}/engine/runs/{run_id}", headers={"If-None-Match": "*"},
+        )
+        assert resp.status_code == 404
+
+
+@pytest.mark.anyio
+class TestRunListing:
+    async def test_etag_and_304(self, client, db_session) -> None:
+        await _seed_run(db_session)
+        url = f"/v1/workspaces/{WS}/engine/runs"
+        first = await client.get(url)
+        assert first.headers["cache-control"] == "private, no-cache"
+        assert "last-modified" not in first.headers
+
+        unchanged = await client.get(url, headers={"If-None-Match": first.headers["etag"]})
+        assert unchanged.status_code == 304
+
+    async def test_new_run_in_same_second_invalidates(self, client, db_session) -> None:
+        await _seed_run(db_session)
+        url = f"/v1/workspaces/{WS}/engine/runs"
+        first = await client.get(url)
+
+        await _seed_run(db_session)  # well within the same second
+        resp = await client.get(url, headers={"If-None-Match": first.headers["etag"]})
+        assert resp.status_code == 200
+        assert len(resp.json()["runs"]) == 2
+
+    async def test_pages_have_distinct_etags(self, client, db_session) -> None:
+        await _seed_run(db_session)
+        url = f"/v1/workspaces/{WS}/engine/runs"
+        first = await client.get(url, params={"limit": 1})
+        other = await client.get(url, params={"limit": 2})
+        assert first.headers["etag"] != other.headers["etag"]
+
+
+@pytest.mark.anyio
+class TestModelVersion:
+    async def test_etag_and_304(self, client, db_session) -> None:
+        mvid = uuid7()
+        db_session.add(ModelVersionRow(
+            model_version_id=mvid,
+            base_year=2023,
+            source="test",
+            sector_count=2,
+            checksum="sha256:abc",
+            provenance_class="curated_real",
+            created_at=utc_now(),
+        ))
+        await db_session.flush()
+        url = f"/v1/workspaces/{WS}/models/versions/{mvid}"
+
+        first = await client.get(url)
+        assert first.status_code == 200
+        assert "immutable" in first.headers["cache-control"]
+        revalidated = await client.get(url, headers={"If-None-Match": first.headers["etag"]})
+        assert revalidated.status_code == 304
+
+
+@pytest.mark.anyio
+class TestLibraryVersions:
+    async def test_latest_and_list_revalidate(self, client, db_session) -> None:
+        repo = MappingLibraryRepository(db_session)
+        await repo.create_version(
+            library_version_id=uuid7(), workspace_id=UUID(WS),
+            version=1, entry_ids=[], entry_count=0,
+        )
+        base = f"/v1/workspaces/{WS}/libraries/mapping/versions"
+
+        latest = await client.get(f"{base}/latest")
+        assert latest.status_code == 200
+        again = await client.get(
+            f"{base}/latest", headers={"If-None-Match": latest.headers["etag"]},
+        )
+        assert again.status_code == 304
+
+        listing = await client.get(base)
+        assert listing.status_code == 200
+        unchanged = await client.get(
+            base, headers={"If-None-Match": listing.headers["etag"]},
+        )
+        assert unchanged.status_code == 304
+
+        await repo.create_version(
+            library_version_id=uuid7(), workspace_id=UUID(WS),
+            version=2, entry_ids=[], entry_count=0,
+        )
+        published = await client.get(
+            base, headers={"If-None-Match": listing.headers["etag"]},
+        )
+        assert published.status_code == 200
+        assert len(published.json()) == 2
@@ -7,7 +7,7 @@ missing JWKS_URL in non-dev → fail-closed 401.
 Uses monkeypatch to override ENVIRONMENT to staging for non-dev tests.
 """
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import jwt as pyjwt
 import pytest
@@ -144,7 +144,8 @@ class TestRS256Validation:
         )
 
         with patch(
-            "src.api.auth_deps._fetch_jwks_public_key",
+            "src.api.auth_deps._resolve_signing_key",
+            new_callable=AsyncMock,
             return_value=pem_bytes,
         ):
             resp = await unauthed_client.get(
@@ -200,7 +201,8 @@ class TestRS256Rejection:
         )
 
         with patch(
-            "src.api.auth_deps._fetch_jwks_public_key",
+            "src.api.auth_deps._resolve_signing_key",
+            new_callable=AsyncMock,
             return_value=pem_bytes,
         ):
             resp = await unauthed_client.get(
@@ -248,7 +250,8 @@ class TestRS256Rejection:
         )
 
         with patch(
-            "src.api.auth_deps._fetch_jwks_public_key",
+            "src.api.auth_deps._resolve_signing_key",
+            new_callable=AsyncMock,
             return_value=pem_bytes,
         ):
             resp = await unauthed_client.get(
@@ -298,7 +301,8 @@ class TestRS256Rejection:
         )
 
         with patch(
-            "src.api.auth_deps._fetch_jwks_public_key",
+            "src.api.auth_deps._resolve_signing_key",
+            new_callable=AsyncMock,
             return_value=wrong_pem,
         ):
             resp = await unauthed_client.get(
@@ -0,0 +1,200 @@
+"""Tests for cached JWKS key resolution (src/api/jwks.py).
+
+A local stub JWKS server (httpx.MockTransport) counts fetches so the
+tests can assert steady-state requests never reach the IdP, rotation is
+picked up via unknown kid, and IdP outages serve stale keys.
+"""
+
+import asyncio
+
+import jwt as pyjwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from httpx import MockTransport, Response
+from jwt.algorithms import RSAAlgorithm
+
+from src.api.jwks import JWKSCache, JWKSCacheCounters, JWKSUnavailableError
+
+pytestmark = pytest.mark.anyio
+
+JWKS_URL = "https://idp.example.com/.well-known/jwks.json"
+
+
+def _jwk(private_key, kid: str) -> dict:
+    jwk = RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    jwk.update({"kid": kid, "use": "sig", "alg": "RS256"})
+    return jwk
+
+
+def _rsa_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+class StubJWKSServer:
+    """Serves a mutable key set and counts requests."""
+
+    def __init__(self, keys: list[dict]) -> None:
+        self.keys = keys
+        self.requests = 0
+        self.fail = False
+
+    def handler(self, request):
+        self.requests += 1
+        if self.fail:
+            return Response(503)
+        return Response(200, json={"keys": self.keys})
+
+    @property
+    def transport(self) -> MockTransport:
+        return MockTransport(self.handler)
+
+
+@pytest.fixture
+def key_a():
+    return _rsa_key()
+
+
+@pytest.fixture
+def key_b():
+    return _rsa_key()
+
+
+@pytest.fixture
+def server(key_a):
+    return StubJWKSServer([_jwk(key_a, "a")])
+
+
+def _cache(server: StubJWKSServer, **kwargs) -> JWKSCache:
+    return JWKSCache(
+        JWKS_URL,
+        transport=server.transport,
+        counters=JWKSCacheCounters(),
+        **kwargs,
+    )
+
+
+class TestSteadyState:
+    async def test_repeat_lookups_fetch_once(self, server) -> None:
+        cache = _cache(server)
+        for _ in range(50):
+            assert await cache.get_key("a") is not None
+        assert server.requests == 1
+
+    async def test_keys_are_decoded_once(self, server) -> None:
+        cache = _cache(server)
+        first = await cache.get_key("a")
+        assert await cache.get_key("a") is first
+
+    async def test_no_kid_uses_first_rsa_key(self, server, key_a) -> None:
+        cache = _cache(server)
+        key = await cache.get_key(None)
+        assert key.public_numbers() == key_a.public_key().public_numbers()
+
+
+class TestRotation:
+    async def test_unknown_kid_refetches(self, server, key_b) -> None:
+        cache = _cache(server)
+        await cache.get_key("a")
+        server.keys = server.keys + [_jwk(key_b, "b")]
+
+        cache._last_attempt_at = None  # allow immediate refetch
+        assert await cache.get_key("b") is not None
+        assert server.requests == 2
+
+    async def test_unknown_kid_refetch_is_rate_limited(self, server) -> None:
+        cache = _cache(server, min_refresh_interval_seconds=60)
+        await cache.get_key("a")
+        for _ in range(10):
+            assert await cache.get_key("nope") is None
+        assert server.requests == 1
+
+
+class TestStaleness:
+    async def test_expired_keys_served_while_refreshing(self, server) -> None:
+        cache = _cache(server, ttl_seconds=0)
+        await cache.get_key("a")
+        assert await cache.get_key("a") is not None
+        await cache.refresh()
+        assert server.requests >= 2
+
+    async def test_stale_while_error(self, server) -> None:
+        cache = _cache(server, max_stale_seconds=3600)
+        await cache.get_key("a")
+        server.fail = True
+        cache._fetched_at -= 600
+
+        assert await cache.get_key("a") is not None
+
+    async def test_background_refresh_is_rate_limited(self, server) -> None:
+        cache = _cache(
+            server, ttl_seconds=60, max_stale_seconds=3600, min_refresh_interval_seconds=30,
+        )
+        await cache.get_key("a")
+        server.fail = True
+        cache._fetched_at -= 600
+        cache._last_attempt_at -= 600
+
+        for _ in range(20):
+            assert await cache.get_key("a") is not None
+            if cache._inflight is not None:
+                await asyncio.gather(cache._inflight, return_exceptions=True)
+        assert server.requests == 2
+
+    async def test_failed_cold_start_is_not_retried_per_request(self, server) -> None:
+        server.fail = True
+        cache = _cache(server, min_refresh_interval_seconds=30)
+        for _ in range(5):
+            with pytest.raises(JWKSUnavailableError):
+                await cache.get_key("a")
+        assert server.requests == 1
+
+    async def test_fails_closed_beyond_max_stale(self, server) -> None:
+        cache = _cache(server, max_stale_seconds=60)
+        await cache.get_key("a")
+        server.fail = True
+        cache._fetched_at -= 120
+        cache._last_attempt_at -= 120
+
+        with pytest.raises(JWKSUnavailableError):
+            await cache.get_key("a")
+
+    async def test_cold_start_failure_raises(self, server) -> None:
+        server.fail = True
+        cache = _cache(server)
+        with pytest.raises(JWKSUnavailableError):
+            await cache.get_key("a")
+
+
+class TestExternalValidationUsesCache:
+    async def test_no_per_request_fetches(self, server, key_a, monkeypatch) -> None:
+        from src.api import auth_deps
+        from src.config import settings as settings_mod
+
+        original = settings_mod.get_settings
+
+        def _staging_settings():
+            s = original()
+            object.__setattr__(s, "ENVIRONMENT", "staging")
+            object.__setattr__(s, "JWT_ISSUER", "https://idp.example.com")
+            object.__setattr__(s, "JWT_AUDIENCE", "impactos-api")
+            object.__setattr__(s, "JWKS_URL", JWKS_URL)
+            return s
+
+        cache = _cache(server)
+        monkeypatch.setattr(auth_deps, "get_settings", _staging_settings)
+        monkeypatch.setattr(auth_deps, "get_jwks_cache", lambda url: cache)
+
+        token = pyjwt.encode(
+            {
+                "sub": "00000000-0000-7000-8000-000000000001",
+                "iss": "https://idp.example.com",
+                "aud": "impactos-api",
+            },
+            key_a,
+            algorithm="RS256",
+            headers={"kid": "a"},
+        )
+        for _ in range(20):
+            claims = await auth_deps._validate_jwt_external(token)
+            assert claims["sub"].endswith("0001")
+        assert server.requests == 1
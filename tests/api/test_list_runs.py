@@ -124,3 +124,31 @@ class TestListRuns:
         resp = await client.get(f"/v1/workspaces/{WS}/engine/runs")
         data = resp.json()
         assert len(data["runs"]) == 1
+
+    async def test_list_runs_cursor_pagination(self, client, db_session):
+        """next_cursor walks every run exactly once, newest first."""
+        await _seed_ws(db_session)
+        for _ in range(5):
+            await _create_run_snapshot(db_session, WS)
+
+        seen = []
+        url = f"/v1/workspaces/{WS}/engine/runs?limit=2"
+        cursor = None
+        while True:
+            resp = await client.get(url + (f"&cursor={cursor}" if cursor else ""))
+            assert resp.status_code == 200
+            data = resp.json()
+            seen.extend(r["run_id"] for r in data["runs"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        full = (await client.get(f"/v1/workspaces/{WS}/engine/runs")).json()
+        assert seen == [r["run_id"] for r in full["runs"]]
+        assert full["next_cursor"] is None
+
+    async def test_list_runs_invalid_cursor(self, client, db_session):
+        """A malformed cursor is rejected with 422."""
+        await _seed_ws(db_session)
+        resp = await client.get(f"/v1/workspaces/{WS}/engine/runs?cursor=not-a-cursor")
+        assert resp.status_code == 422
@@ -1,4 +1,4 @@
-"""Tests for B-14 + B-15: Model version list/detail + coefficient retrieval."""
+"""Tests for B-14 + B-15: Model version list/detail + coefficient retrieval + multiplier tables."""
 
 import ast
 import inspect
@@ -9,6 +9,8 @@ import pytest
 from httpx import AsyncClient
 from uuid_extensions import uuid7
 
+from src.repositories.engine import ModelDataRepository
+
 
 @pytest.fixture
 def workspace_id() -> str:
@@ -274,6 +276,135 @@ class TestGetCoefficients:
         assert resp.status_code == 404
 
 
+class TestGetMultipliers:
+    @pytest.mark.anyio
+    async def test_multipliers_type_i_by_sector(
+        self, client: AsyncClient, workspace_id: str,
+    ) -> None:
+        mv_id = await _register_model(client, sector_codes=["A", "B", "C"])
+        resp = await client.get(
+            f"/v1/workspaces/{workspace_id}/models/versions/{mv_id}/multipliers",
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["sector_codes"] == ["A", "B", "C"]
+        assert set(data["type_i"]) == {"output", "employment", "imports", "value_added"}
+        assert all(m >= 1.0 for m in data["type_i"]["output"])
+        assert data["type_ii"] is None
+        assert resp.headers["etag"] == f'"{data["content_hash"]}"'
+        assert resp.headers["cache-control"] == "private, no-cache"
+
+    @pytest.mark.anyio
+    async def test_multipliers_type_ii_with_household_data(
+        self, client: AsyncClient, workspace_id: str,
+    ) -> None:
+        mv_id = await _register_model(
+            client,
+            sector_codes=["S1", "S2"],
+            extra_payload={
+                "compensation_of_employees": [2.0, 3.0],
+                "household_consumption_shares": [0.4, 0.6],
+            },
+        )
+        resp = await client.get(
+            f"/v1/workspaces/{workspace_id}/models/versions/{mv_id}/multipliers",
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert "income" in data["type_i"]
+        for i in range(2):
+            assert data["type_ii"]["output"][i] > data["type_i"]["output"][i]
+
+    @pytest.mark.anyio
+    async def test_if_none_match_returns_304(
+        self, client: AsyncClient, workspace_id: str,
+    ) -> None:
+        mv_id = await _register_model(client)
+        url = f"/v1/workspaces/{workspace_id}/models/versions/{mv_id}/multipliers"
+        first = await client.get(url)
+        resp = await client.get(url, headers={"If-None-Match": first.headers["etag"]})
+        assert resp.status_code == 304
+        assert resp.headers["etag"] == first.headers["etag"]
+
+    @pytest.mark.anyio
+    async def test_unpinned_hit_does_not_load_model_data(
+        self, client: AsyncClient, workspace_id: str, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        mv_id = await _register_model(client)
+        url = f"/v1/workspaces/{workspace_id}/models/versions/{mv_id}/multipliers"
+        first = await client.get(url)
+
+        async def _no_model_data(self, model_version_id):  # noqa: ANN001, ANN202
+            raise AssertionError("model data loaded for a persisted table")
+
+        monkeypatch.setattr(ModelDataRepository, "get", _no_model_data)
+        again = await client.get(url, headers={"If-None-Match": first.headers["etag"]})
+        assert again.status_code == 304
+        assert (await client.get(url)).json() == first.json()
+
+    @pytest.mark.anyio
+    async def test_pinned_coefficients_hash_is_immutable(
+        self, client: AsyncClient, workspace_id: str,
+    ) -> None:
+        mv_id = await _register_model(client)
+        url = f"/v1/workspaces/{workspace_id}/models/versions/{mv_id}/multipliers"
+        first = (await client.get(url)).json()
+        resp = await client.get(url, params={"coefficients_hash": first["coefficients_hash"]})
+        assert resp.status_code == 200
+        assert resp.headers["cache-control"] == "private, max-age=31536000, immutable"
+        assert resp.json()["content_hash"] == first["content_hash"]
+
+    @pytest.mark.anyio
+    async def test_employment_registration_changes_table(
+        self, client: AsyncClient, workspace_id: str,
+    ) -> None:
+        mv_id = await _register_model(client, sector_codes=["A", "B"])
+        url = f"/v1/workspaces/{workspace_id}/models/versions/{mv_id}/multipliers"
+        before = (await client.get(url)).json()
+        ec_resp = await client.post(
+            f"/v1/workspaces/{workspace_id}/employment-coefficients",
+            json={
+                "model_version_id": mv_id,
+                "output_unit": "MILLION_SAR",
+                "base_year": 2023,
+                "coefficients": [
+                    {"sector_code": "A", "jobs_per_million_sar": 5.5,
+                     "confidence": "HIGH", "source_description": "test"},
+                    {"sector_code": "B", "jobs_per_million_sar": 3.2,
+                     "confidence": "MEDIUM", "source_description": "test"},
+                ],
+            },
+        )
+        assert ec_resp.status_code == 201
+        after = (await client.get(url)).json()
+        assert after["coefficients_hash"] != before["coefficients_hash"]
+        assert after["coefficients_source"] == "model-data+employment"
+        assert all(m > 0 for m in after["type_i"]["employment"])
+        # The earlier table stays addressable by its coefficients hash
+        pinned = await client.get(url, params={"coefficients_hash": before["coefficients_hash"]})
+        assert pinned.json()["content_hash"] == before["content_hash"]
+
+    @pytest.mark.anyio
+    async def test_unknown_coefficients_hash_404(
+        self, client: AsyncClient, workspace_id: str,
+    ) -> None:
+        mv_id = await _register_model(client)
+        resp = await client.get(
+            f"/v1/workspaces/{workspace_id}/models/versions/{mv_id}/multipliers",
+            params={"coefficients_hash": "0" * 64},
+        )
+        assert resp.status_code == 404
+
+    @pytest.mark.anyio
+    async def test_multipliers_missing_model(
+        self, client: AsyncClient, workspace_id: str,
+    ) -> None:
+        resp = await client.get(
+            f"/v1/workspaces/{workspace_id}/models/versions/{uuid7()}/multipliers",
+        )
+        assert resp.status_code == 404
+
+
 class TestNoSyntheticInRuntime:
     """Guardrail: B-15 code path must never import from data/synthetic."""
 
@@ -0,0 +1,187 @@
+"""Tests for on-demand profiling (src/observability/profiling.py, src/api/profiling.py).
+
+Covers: stack sampling into collapsed format, bounded artifact store,
+admin-only sampling endpoints gated by PROFILING_ENABLED, and the
+per-request X-Profile middleware.
+"""
+
+import time
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.api import profiling as profiling_api
+from src.api.auth import _create_token
+from src.observability import profiling
+from src.observability.profiling import (
+    PROFILE_ID_HEADER,
+    ProfileStore,
+    ProfilingMiddleware,
+    StackSampler,
+)
+
+pytestmark = pytest.mark.anyio
+
+ADMIN_TOKEN_ARGS = ("00000000-0000-7000-8000-000000000003", "admin", "admin")
+ANALYST_TOKEN_ARGS = ("00000000-0000-7000-8000-000000000001", "analyst", "analyst")
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(1000))
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch) -> ProfileStore:
+    store = ProfileStore(str(tmp_path), max_artifacts=3)
+    monkeypatch.setattr(profiling, "_store", store)
+    return store
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    original = profiling_api.get_settings
+
+    def _enabled_settings():
+        s = original()
+        object.__setattr__(s, "PROFILING_ENABLED", True)
+        object.__setattr__(s, "PROFILING_SAMPLE_INTERVAL_MS", 1.0)
+        return s
+
+    monkeypatch.setattr(profiling_api, "get_settings", _enabled_settings)
+
+
+@pytest.fixture
+async def unauthed_client() -> AsyncClient:
+    from src.api.main import app
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test",
+    ) as ac:
+        yield ac
+
+
+def _auth(args: tuple[str, str, str]) -> dict[str, str]:
+    return {"Authorization": f"Bearer {_create_token(*args)}"}
+
+
+class TestStackSampler:
+    def test_collapsed_stacks_include_busy_function(self) -> None:
+        sampler = StackSampler(0.001)
+        sampler.start()
+        _busy(0.1)
+        sampler.stop()
+
+        assert sampler.sample_count > 0
+        lines = sampler.collapsed().splitlines()
+        assert any("_busy" in line for line in lines)
+        stack, count = lines[0].rsplit(" ", 1)
+        assert int(count) >= 1
+        assert ";" in stack
+
+    def test_sampler_thread_excluded(self) -> None:
+        sampler = StackSampler(0.001)
+        sampler.start()
+        _busy(0.05)
+        sampler.stop()
+        assert "impactos-profiler" not in sampler.collapsed()
+
+
+class TestProfileStore:
+    def test_oldest_profiles_evicted(self, tmp_path) -> None:
+        store = ProfileStore(str(tmp_path), max_artifacts=2)
+        sampler = StackSampler(0.001)
+        sampler.sample()
+        first = store.save(sampler, kind="process", label="a")
+        store.save(sampler, kind="process", label="b")
+        store.save(sampler, kind="process", label="c")
+
+        assert [a.label for a in store.list()] == ["c", "b"]
+        assert store.get(first.profile_id) is None
+        assert not (tmp_path / first.storage_key).exists()
+
+
+class TestProfilingEndpoints:
+    async def test_disabled_returns_404(self, unauthed_client: AsyncClient) -> None:
+        resp = await unauthed_client.get(
+            "/v1/profiling/profiles", headers=_auth(ADMIN_TOKEN_ARGS),
+        )
+        assert resp.status_code == 404
+
+    async def test_requires_admin(self, unauthed_client: AsyncClient, enabled) -> None:
+        resp = await unauthed_client.get(
+            "/v1/profiling/profiles", headers=_auth(ANALYST_TOKEN_ARGS),
+        )
+        assert resp.status_code == 403
+
+    async def test_process_sample_roundtrip(
+        self, unauthed_client: AsyncClient, enabled, store,
+    ) -> None:
+        headers = _auth(ADMIN_TOKEN_ARGS)
+        resp = await unauthed_client.post(
+            "/v1/profiling/sample", params={"seconds": 0.05}, headers=headers,
+        )
+        assert resp.status_code == 201
+        body = resp.json()
+        assert body["kind"] == "process"
+        assert body["sample_count"] > 0
+
+        listing = await unauthed_client.get("/v1/profiling/profiles", headers=headers)
+        assert [p["profile_id"] for p in listing.json()["items"]] == [body["profile_id"]]
+
+        folded = await unauthed_client.get(
+            f"/v1/profiling/profiles/{body['profile_id']}", headers=headers,
+        )
+        assert folded.status_code == 200
+        assert folded.text.strip()
+
+    async def test_window_is_capped(self, unauthed_client: AsyncClient, enabled) -> None:
+        resp = await unauthed_client.post(
+            "/v1/profiling/sample", params={"seconds": 3600},
+            headers=_auth(ADMIN_TOKEN_ARGS),
+        )
+        assert resp.status_code == 422
+
+
+class TestProfilingMiddleware:
+    @pytest.fixture
+    async def profiled_client(self, store) -> AsyncClient:
+        app = FastAPI()
+
+        @app.get("/work")
+        async def work() -> dict:
+            _busy(0.05)
+            return {"ok": True}
+
+        app.add_middleware(ProfilingMiddleware, interval_seconds=0.001)
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test",
+        ) as ac:
+            yield ac
+
+    async def test_admin_request_is_profiled(self, profiled_client, store) -> None:
+        resp = await profiled_client.get(
+            "/work", headers={"X-Profile": "1", **_auth(ADMIN_TOKEN_ARGS)},
+        )
+        assert resp.status_code == 200
+        profile_id = resp.headers[PROFILE_ID_HEADER]
+        artifact = store.get(profile_id)
+        assert artifact is not None
+        assert artifact.kind == "request"
+        assert artifact.label == "GET /work"
+        assert "_busy" in store.read(artifact)
+
+    async def test_no_header_not_profiled(self, profiled_client, store) -> None:
+        resp = await profiled_client.get("/work", headers=_auth(ADMIN_TOKEN_ARGS))
+        assert PROFILE_ID_HEADER not in resp.headers
+        assert store.list() == []
+
+    async def test_non_admin_not_profiled(self, profiled_client, store) -> None:
+        resp = await profiled_client.get(
+            "/work", headers={"X-Profile": "1", **_auth(ANALYST_TOKEN_ARGS)},
+        )
+        assert resp.status_code == 200
+        assert PROFILE_ID_HEADER not in resp.headers
+        assert store.list() == []
@@ -1,8 +1,9 @@
 """Tests for workshop session API endpoints -- Sprint 22.
 
-Tests session CRUD, idempotency, workspace isolation, and export gate.
-Preview and commit endpoints are integration-heavy (require in-memory ModelStore)
-and are deferred to integration testing.
+Tests session CRUD, idempotency, workspace isolation, export gate and the
+incremental headline preview. Full preview and commit endpoints are
+integration-heavy (require in-memory ModelStore) and are deferred to
+integration testing.
 """
 
 import numpy as np
@@ -10,6 +11,8 @@ import pytest
 from httpx import ASGITransport, AsyncClient
 from uuid_extensions import uuid7
 
+from src.api import workshop as workshop_api
+from src.config.settings import Environment, get_settings
 from src.db.session import get_async_session
 from src.db.tables import (
     ModelDataRow,
@@ -433,3 +436,81 @@ class TestExportWorkshopSession:
         )
         assert resp.status_code == 404
         assert resp.json()["detail"]["reason_code"] == "WORKSHOP_SESSION_NOT_FOUND"
+
+
+# ---------------------------------------------------------------------------
+# TestHeadlinePreview
+# ---------------------------------------------------------------------------
+
+
+def _make_preview_payload(run_id, model_id, **overrides):
+    base = _make_create_payload(
+        run_id,
+        model_version_id=str(model_id),
+        base_year=2023,
+        satellite_coefficients={
+            "jobs_coeff": [0.01, 0.02, 0.03],
+            "import_ratio": [0.1, 0.1, 0.1],
+            "va_ratio": [0.5, 0.5, 0.5],
+        },
+    )
+    base.update(overrides)
+    return base
+
+
+class TestHeadlinePreview:
+    """Tests for POST /{workspace_id}/workshop/preview/headline."""
+
+    async def test_headline_preview_200(self, ws_client, seeded, db_session):
+        """Slider deltas applied linearly: totals match B·d on transformed shocks."""
+        payload = _make_preview_payload(seeded["run_id"], seeded["model_id"])
+        resp = await ws_client.post(
+            f"/v1/workspaces/{WS_ID}/workshop/preview/headline",
+            json=payload,
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["preview"] is True
+        assert data["changed_sectors"] == ["A", "B"]
+
+        # Z = 0.1·I, x = 100 -> A = 0.001·I, B = I / 0.999
+        scale = np.array([1.10, 0.95, 1.0])
+        d = sum(np.array(v) for v in BASE_SHOCKS.values()) * scale
+        assert data["headline"]["total_output"] == pytest.approx(d.sum() / 0.999)
+        assert set(data["annual_total_output"]) == set(BASE_SHOCKS)
+
+    async def test_headline_preview_reuses_baseline(self, ws_client, seeded, db_session):
+        """Second slider move on the same session hits the cached baseline."""
+        url = f"/v1/workspaces/{WS_ID}/workshop/preview/headline"
+        payload = _make_preview_payload(seeded["run_id"], seeded["model_id"])
+        await ws_client.post(url, json=payload)
+        payload["sliders"] = [{"sector_code": "C", "pct_delta": 25.0}]
+        resp = await ws_client.post(url, json=payload)
+        assert resp.status_code == 200
+        assert resp.json()["baseline_cached"] is True
+
+    async def test_headline_preview_unknown_sector_422(self, ws_client, seeded, db_session):
+        payload = _make_preview_payload(
+            seeded["run_id"], seeded["model_id"],
+            sliders=[{"sector_code": "ZZZ", "pct_delta": 10.0}],
+        )
+        resp = await ws_client.post(
+            f"/v1/workspaces/{WS_ID}/workshop/preview/headline",
+            json=payload,
+        )
+        assert resp.status_code == 422
+        assert resp.json()["detail"]["reason_code"] == "WORKSHOP_UNKNOWN_SECTOR"
+
+    async def test_headline_preview_value_measures_422_in_prod(
+        self, ws_client, seeded, db_session, monkeypatch,
+    ):
+        """Missing value-measures artifacts fail closed outside dev, like /preview."""
+        prod = get_settings().model_copy(update={"ENVIRONMENT": Environment.PROD})
+        monkeypatch.setattr(workshop_api, "get_settings", lambda: prod)
+        payload = _make_preview_payload(seeded["run_id"], seeded["model_id"])
+        resp = await ws_client.post(
+            f"/v1/workspaces/{WS_ID}/workshop/preview/headline",
+            json=payload,
+        )
+        assert resp.status_code == 422
+        assert resp.json()["detail"]["reason_code"] == "VM_MISSING_GOS"
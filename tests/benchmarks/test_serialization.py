@@ -0,0 +1,28 @@
+"""Batch response serialization — fast path vs default FastAPI path.
+
+The fast path (model_construct + orjson) must produce the same JSON as
+the default response path and must not be slower; compression must
+shrink a large batch substantially (engine floats carry full precision,
+so gzip gets a bit under 3x on them). Timing checks only run with
+-m benchmark.
+"""
+
+import json
+
+import pytest
+
+from scripts.bench_serialization import baseline_render, fast_render, measure, synthetic_runs
+
+
+def test_fast_path_matches_default_json() -> None:
+    runs = synthetic_runs(3, 5, 2)
+    assert json.loads(fast_render(runs)) == json.loads(baseline_render(runs))
+
+
+@pytest.mark.benchmark
+def test_fast_path_faster_and_compressed() -> None:
+    profile = measure(runs=100, sectors=45, years=10, repeat=3)
+    assert profile.fast_seconds < profile.baseline_seconds, (
+        f"fast {profile.fast_seconds:.3f}s vs baseline {profile.baseline_seconds:.3f}s"
+    )
+    assert profile.gzip_bytes < profile.raw_bytes / 2
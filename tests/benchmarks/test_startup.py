@@ -0,0 +1,51 @@
+"""Startup import budget — API app and extraction worker entry points.
+
+Heavy optional dependencies (openpyxl, python-pptx, pdfplumber, LLM
+SDKs) are imported on first use; these tests fail if a module-level
+import drags one back into startup. The wall-clock budget is a generous
+ceiling (catches large regressions, not precise SLAs) and only runs with
+-m benchmark.
+"""
+
+import pytest
+
+from scripts.bench_startup import ENTRY_POINTS, measure, parse_importtime
+
+# Cumulative `-X importtime` ceiling per entry point (3-5x expected).
+IMPORT_BUDGET_SECONDS: dict[str, float] = {
+    "api": 6.0,
+    "worker": 3.0,
+}
+
+
+class TestParseImporttime:
+    def test_sums_self_and_keeps_top_level_cumulative(self) -> None:
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       100 |        100 |   json.decoder\n"
+            "import time:       200 |        300 | json\n"
+            "import time:        50 |         50 | re\n"
+        )
+        total, cumulative = parse_importtime(stderr)
+        assert total == 350
+        assert cumulative == {"json": 300, "re": 50}
+
+
+@pytest.mark.parametrize("entry", sorted(ENTRY_POINTS))
+def test_deferred_dependencies_not_loaded_at_startup(entry: str) -> None:
+    profile = measure(ENTRY_POINTS[entry])
+    assert profile.deferred_loaded == [], (
+        f"{ENTRY_POINTS[entry]} imports {profile.deferred_loaded} at startup; "
+        "move the import into the function that needs it"
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("entry", sorted(ENTRY_POINTS))
+def test_import_time_within_budget(entry: str) -> None:
+    profile = measure(ENTRY_POINTS[entry])
+    seconds = profile.total_us / 1_000_000
+    assert seconds < IMPORT_BUDGET_SECONDS[entry], (
+        f"{entry} startup imports took {seconds:.2f}s "
+        f"(budget {IMPORT_BUDGET_SECONDS[entry]}s); slowest: {profile.slowest[:5]}"
+    )
@@ -16,14 +16,17 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.pool import StaticPool
 
 import src.db.tables  # noqa: F401 — register ORM models on Base.metadata
+from src.api.auth_cache import reset_auth_caches
 from src.api.auth_deps import (
     AuthPrincipal,
     WorkspaceMember,
     get_current_principal,
     require_workspace_member,
 )
+from src.api.http_cache import reset_response_cache
 from src.config.settings import Settings
 from src.db.session import Base, get_async_session
+from src.export.render_cache import reset_render_caches
 
 _DEFAULT_PRINCIPAL = AuthPrincipal(
     user_id=UUID("00000000-0000-7000-8000-000000000001"),
@@ -32,6 +35,30 @@ _DEFAULT_PRINCIPAL = AuthPrincipal(
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_auth_caches():
+    """Cached claims/memberships must not leak between tests."""
+    reset_auth_caches()
+    yield
+    reset_auth_caches()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_response_cache():
+    """Serialized response bodies must not leak between tests."""
+    reset_response_cache()
+    yield
+    reset_response_cache()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_render_caches():
+    """Shared render cache indexes are per storage root; tests use tmp roots."""
+    reset_render_caches()
+    yield
+    reset_render_caches()
+
+
 @pytest.fixture
 async def db_engine():
     """Create an in-memory SQLite async engine with all tables."""
@@ -0,0 +1,196 @@
+"""Query-plan regression suite for the hot result/run read paths.
+
+Captures the SQL each repository method actually emits and runs it
+through SQLite's EXPLAIN QUERY PLAN (the test database). The tables are
+seeded with a few thousand rows and ANALYZEd first, so the planner picks
+indexes on real statistics rather than on empty tables. A full-table
+``SCAN`` or a temp B-tree sort on these paths means an index from
+tables.py / alembic 027 no longer matches the query shape.
+"""
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from uuid import UUID
+
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid_extensions import uuid7
+
+from src.db.tables import ResultSetRow, RunSnapshotRow
+from src.models.common import utc_now
+from src.repositories.engine import ResultSetRepository, RunSnapshotRepository
+from src.repositories.portfolio import PortfolioRepository
+
+pytestmark = pytest.mark.anyio
+
+_SEED_WORKSPACES = 20
+_SEED_RUNS_PER_WORKSPACE = 50
+_SEED_RESULT_RUNS = 200
+_SEED_METRICS = ("total_output", "employment", "gdp_basic_price")
+_SEED_YEARS = range(2025, 2035)
+
+
+@dataclass
+class _Seeded:
+    workspace_id: UUID
+    run_id: UUID
+
+
+@pytest.fixture
+async def seeded(db_session: AsyncSession) -> _Seeded:
+    """Seed run_snapshots/result_sets across many workspaces and runs, then ANALYZE."""
+    base = utc_now()
+    workspaces = [uuid7() for _ in range(_SEED_WORKSPACES)]
+    snapshots = []
+    for ws in workspaces:
+        for i in range(_SEED_RUNS_PER_WORKSPACE):
+            snapshots.append({
+                "run_id": uuid7(), "model_version_id": uuid7(),
+                "taxonomy_version_id": uuid7(), "concordance_version_id": uuid7(),
+                "mapping_library_version_id": uuid7(),
+                "assumption_library_version_id": uuid7(),
+                "prompt_pack_version_id": uuid7(), "source_checksums": [],
+                "workspace_id": ws,
+                "created_at": base - timedelta(minutes=i),
+            })
+    await db_session.execute(insert(RunSnapshotRow), snapshots)
+
+    results = []
+    for snap in snapshots[:_SEED_RESULT_RUNS]:
+        for metric in _SEED_METRICS:
+            results.append({
+                "result_id": uuid7(), "run_id": snap["run_id"], "metric_type": metric,
+                "values": {"S01": 1.0}, "sector_breakdowns": {},
+                "year": None, "series_kind": None,
+                "workspace_id": snap["workspace_id"], "created_at": base,
+            })
+            for year in _SEED_YEARS:
+                results.append({
+                    "result_id": uuid7(), "run_id": snap["run_id"], "metric_type": metric,
+                    "values": {"S01": 1.0}, "sector_breakdowns": {},
+                    "year": year, "series_kind": "annual",
+                    "workspace_id": snap["workspace_id"], "created_at": base,
+                })
+    await db_session.execute(insert(ResultSetRow), results)
+    await db_session.execute(text("ANALYZE"))
+    return _Seeded(workspace_id=workspaces[0], run_id=snapshots[0]["run_id"])
+
+
+async def _plans(
+    session: AsyncSession, call: Callable[[], Awaitable[object]],
+) -> list[list[str]]:
+    """Run ``call`` and return the query plan of every SELECT it issued."""
+    captured: list[tuple[str, tuple]] = []
+    conn = await session.connection()
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):  # noqa: ARG001
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, tuple(parameters or ())))
+
+    event.listen(conn.sync_connection, "before_cursor_execute", _capture)
+    try:
+        await call()
+    finally:
+        event.remove(conn.sync_connection, "before_cursor_execute", _capture)
+
+    plans: list[list[str]] = []
+    for statement, parameters in captured:
+        result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        plans.append([row[-1] for row in result.all()])
+    assert plans, "repository call issued no SELECT"
+    return plans
+
+
+def _assert_indexed(plans: list[list[str]], table: str, *, ordered: bool = False) -> None:
+    for plan in plans:
+        details = "\n".join(plan)
+        assert f"SCAN {table}" not in details, details
+        assert any(line.startswith(f"SEARCH {table}") for line in plan), details
+        if ordered:
+            assert "TEMP B-TREE" not in details, details
+
+
+class TestResultSetPlans:
+    async def test_get_by_run_uses_index(
+        self, db_session: AsyncSession, seeded: _Seeded,
+    ) -> None:
+        repo = ResultSetRepository(db_session)
+        plans = await _plans(db_session, lambda: repo.get_by_run(seeded.run_id))
+        _assert_indexed(plans, "result_sets")
+
+    @pytest.mark.parametrize("series_kind", [None, "annual"])
+    async def test_get_by_run_series_uses_index(
+        self, db_session: AsyncSession, seeded: _Seeded, series_kind: str | None,
+    ) -> None:
+        repo = ResultSetRepository(db_session)
+        plans = await _plans(
+            db_session,
+            lambda: repo.get_by_run_series(seeded.run_id, series_kind=series_kind),
+        )
+        _assert_indexed(plans, "result_sets")
+        assert any(
+            "ix_result_sets_run_series_year" in line for plan in plans for line in plan
+        )
+
+
+class TestRunSnapshotPlans:
+    async def test_list_first_page_uses_index_order(
+        self, db_session: AsyncSession, seeded: _Seeded,
+    ) -> None:
+        repo = RunSnapshotRepository(db_session)
+        plans = await _plans(db_session, lambda: repo.list_for_workspace(seeded.workspace_id))
+        _assert_indexed(plans, "run_snapshots", ordered=True)
+
+    async def test_list_with_cursor_uses_index_order(
+        self, db_session: AsyncSession, seeded: _Seeded,
+    ) -> None:
+        repo = RunSnapshotRepository(db_session)
+        plans = await _plans(
+            db_session,
+            lambda: repo.list_for_workspace(
+                seeded.workspace_id,
+                cursor_created_at=utc_now() - timedelta(minutes=10),
+                cursor_run_id=uuid7(),
+            ),
+        )
+        _assert_indexed(plans, "run_snapshots", ordered=True)
+
+
+class TestPortfolioPlans:
+    async def test_list_for_workspace_uses_index(self, db_session: AsyncSession) -> None:
+        repo = PortfolioRepository(db_session)
+        plans = await _plans(db_session, lambda: repo.list_for_workspace(uuid7()))
+        _assert_indexed(plans, "portfolio_optimizations")
+
+
+class TestRunKeysetPagination:
+    async def test_cursor_pages_cover_all_rows_once(self, db_session: AsyncSession) -> None:
+        repo = RunSnapshotRepository(db_session)
+        ws = uuid7()
+        base = utc_now()
+        for i in range(5):
+            row = await repo.create(
+                run_id=uuid7(), model_version_id=uuid7(),
+                taxonomy_version_id=uuid7(), concordance_version_id=uuid7(),
+                mapping_library_version_id=uuid7(),
+                assumption_library_version_id=uuid7(),
+                prompt_pack_version_id=uuid7(), workspace_id=ws,
+            )
+            # Two rows share a timestamp so the run_id tie-breaker matters.
+            row.created_at = base + timedelta(seconds=min(i, 3))
+        await db_session.flush()
+
+        seen = []
+        page = await repo.list_for_workspace(ws, limit=2)
+        while page:
+            seen.extend(r.run_id for r in page)
+            last = page[-1]
+            page = await repo.list_for_workspace(
+                ws, limit=2, cursor_created_at=last.created_at, cursor_run_id=last.run_id,
+            )
+
+        everything = await repo.list_for_workspace(ws, limit=10)
+        assert seen == [r.run_id for r in everything]
+        assert len(set(seen)) == 5
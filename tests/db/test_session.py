@@ -0,0 +1,98 @@
+"""Tests for engine/pool configuration in src/db/session.py.
+
+Covers: settings-driven pool and asyncpg statement-cache options, SQLite
+left on SQLAlchemy defaults, read-session routing without a replica, and
+pool wait-time / utilization metrics.
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.config.settings import Settings
+from src.db import session as session_mod
+from src.db.session import (
+    _InstrumentedPool,
+    _pool_class,
+    _pool_gauges,
+    engine_options,
+    get_async_session,
+    get_read_session,
+)
+from src.observability.instrumentation import DB_POOL_WAIT_SECONDS, registry
+
+PG_URL = "postgresql+asyncpg://u:p@db:5432/impactos"
+
+
+def _settings(**overrides) -> Settings:
+    return Settings(DATABASE_URL=PG_URL, **overrides)
+
+
+class TestEngineOptions:
+    def test_sqlite_keeps_defaults(self) -> None:
+        options = engine_options("sqlite+aiosqlite:///:memory:", _settings())
+        assert set(options) == {"echo", "pool_pre_ping"}
+
+    def test_pool_settings_applied(self) -> None:
+        settings = _settings(
+            DB_POOL_SIZE=5,
+            DB_MAX_OVERFLOW=2,
+            DB_POOL_TIMEOUT_SECONDS=3.0,
+            DB_POOL_RECYCLE_SECONDS=600,
+        )
+        options = engine_options(PG_URL, settings)
+        assert options["pool_size"] == 5
+        assert options["max_overflow"] == 2
+        assert options["pool_timeout"] == 3.0
+        assert options["pool_recycle"] == 600
+        assert issubclass(options["poolclass"], _InstrumentedPool)
+        assert options["poolclass"].role == "primary"
+
+    def test_asyncpg_statement_caches(self) -> None:
+        settings = _settings(DB_STATEMENT_CACHE_SIZE=0, DB_PREPARED_STATEMENT_CACHE_SIZE=50)
+        options = engine_options(PG_URL, settings)
+        assert options["connect_args"] == {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 50,
+        }
+
+    def test_other_drivers_get_no_asyncpg_args(self) -> None:
+        options = engine_options("postgresql+psycopg://u:p@db/impactos", _settings())
+        assert "connect_args" not in options
+
+    def test_replica_role(self) -> None:
+        options = engine_options(PG_URL, _settings(), role="replica")
+        assert options["poolclass"].role == "replica"
+
+    def test_echo_defaults_to_dev_only(self) -> None:
+        assert engine_options(PG_URL, _settings(ENVIRONMENT="dev"))["echo"] is True
+        assert engine_options(PG_URL, _settings(ENVIRONMENT="dev", DB_ECHO=False))["echo"] is False
+
+
+class TestReadSession:
+    def test_without_replica_reads_share_primary_dependency(self) -> None:
+        if session_mod.read_engine is not session_mod.engine:
+            pytest.skip("DATABASE_READ_REPLICA_URL is configured")
+        assert get_read_session is get_async_session
+
+
+class TestPoolMetrics:
+    @pytest.mark.anyio
+    async def test_checkout_wait_recorded(self) -> None:
+        registry.reset()
+        eng = create_async_engine(
+            "sqlite+aiosqlite:///:memory:",
+            poolclass=_pool_class("primary"),
+            pool_size=1,
+            max_overflow=0,
+        )
+        try:
+            async with eng.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        finally:
+            await eng.dispose()
+        assert DB_POOL_WAIT_SECONDS.snapshot(role="primary").count >= 1
+
+    def test_pool_gauges_families(self) -> None:
+        names = {family.name for family in _pool_gauges()}
+        assert names == {"impactos_db_pool_connections", "impactos_db_pool_utilization"}
@@ -10,7 +10,7 @@ from uuid import UUID
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import update
+from sqlalchemy import event, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid_extensions import uuid7
 
@@ -259,6 +259,47 @@ class TestBatchRunEndpoint:
         response = await client.get(f"/v1/workspaces/{WS_ID}/engine/batch/{uuid7()}")
         assert response.status_code == 404
 
+    @pytest.mark.anyio
+    async def test_batch_status_query_count_independent_of_size(
+        self, client: AsyncClient, db_session: AsyncSession,
+    ) -> None:
+        reg_resp = await client.post("/v1/engine/models", json=_register_model_payload())
+        model_version_id = reg_resp.json()["model_version_id"]
+        await _promote_model(db_session, model_version_id)
+
+        async def _batch_status_selects(n_scenarios: int) -> int:
+            batch_resp = await client.post(f"/v1/workspaces/{WS_ID}/engine/batch", json={
+                "model_version_id": model_version_id,
+                "scenarios": [
+                    {
+                        "name": f"S{i}",
+                        "annual_shocks": {"2026": [100.0 + i, 0.0]},
+                        "base_year": 2023,
+                    }
+                    for i in range(n_scenarios)
+                ],
+                "satellite_coefficients": _satellite_payload(),
+            })
+            batch_id = batch_resp.json()["batch_id"]
+
+            statements: list[str] = []
+            conn = (await db_session.connection()).sync_connection
+
+            def _count(conn, cursor, statement, params, context, executemany):  # noqa: ARG001
+                if statement.lstrip().upper().startswith("SELECT"):
+                    statements.append(statement)
+
+            event.listen(conn, "before_cursor_execute", _count)
+            try:
+                response = await client.get(f"/v1/workspaces/{WS_ID}/engine/batch/{batch_id}")
+            finally:
+                event.remove(conn, "before_cursor_execute", _count)
+            assert response.status_code == 200
+            assert len(response.json()["results"]) == n_scenarios
+            return len(statements)
+
+        assert await _batch_status_selects(1) == await _batch_status_selects(4)
+
 
 # ---------------------------------------------------------------------------
 # Sprint 16: Value Measures API tests
@@ -642,3 +683,223 @@ class TestRunSeriesAPI:
         for rs in delta_rows:
             assert rs["confidence_class"] == "ESTIMATED"
             assert rs["baseline_run_id"] == baseline_id
+
+
+# ===================================================================
+# Run result cache — identical inputs reuse stored result sets
+# ===================================================================
+
+
+class TestRunResultCache:
+    """Identical run inputs link a new snapshot to the stored results."""
+
+    async def _setup(self, client: AsyncClient, db_session: AsyncSession) -> dict:
+        reg_resp = await client.post("/v1/engine/models", json=_register_model_payload())
+        model_version_id = reg_resp.json()["model_version_id"]
+        await _promote_model(db_session, model_version_id)
+        return {
+            "model_version_id": model_version_id,
+            "annual_shocks": {"2026": [100.0, 0.0]},
+            "base_year": 2023,
+            "satellite_coefficients": _satellite_payload(),
+        }
+
+    @pytest.mark.anyio
+    async def test_repeat_run_reuses_results_with_distinct_snapshot(
+        self, client: AsyncClient, db_session: AsyncSession,
+    ) -> None:
+        from sqlalchemy import func, select
+
+        from src.db.tables import ResultSetRow, RunSnapshotRow
+
+        payload = await self._setup(client, db_session)
+        first = (await client.post(f"/v1/workspaces/{WS_ID}/engine/runs", json=payload)).json()
+        rows_after_first = await db_session.scalar(select(func.count(ResultSetRow.result_id)))
+
+        second = (await client.post(f"/v1/workspaces/{WS_ID}/engine/runs", json=payload)).json()
+        rows_after_second = await db_session.scalar(select(func.count(ResultSetRow.result_id)))
+
+        assert second["run_id"] != first["run_id"]
+        assert rows_after_second == rows_after_first
+        first_values = {rs["metric_type"]: rs["values"] for rs in first["result_sets"]}
+        second_values = {rs["metric_type"]: rs["values"] for rs in second["result_sets"]}
+        assert second_values == first_values
+
+        snap = await db_session.get(RunSnapshotRow, UUID(second["run_id"]))
+        assert snap is not None
+        assert snap.result_source_run_id == UUID(first["run_id"])
+
+        # GET on the linked run serves the shared result sets
+        get_resp = await client.get(f"/v1/workspaces/{WS_ID}/engine/runs/{second['run_id']}")
+        assert get_resp.status_code == 200
+        assert {rs["metric_type"] for rs in get_resp.json()["result_sets"]} == set(first_values)
+
+    @pytest.mark.anyio
+    async def test_bypass_cache_recomputes(
+        self, client: AsyncClient, db_session: AsyncSession,
+    ) -> None:
+        from sqlalchemy import func, select
+
+        from src.db.tables import ResultSetRow, RunSnapshotRow
+
+        payload = await self._setup(client, db_session)
+        await client.post(f"/v1/workspaces/{WS_ID}/engine/runs", json=payload)
+        rows_before = await db_session.scalar(select(func.count(ResultSetRow.result_id)))
+        audit = (await client.post(
+            f"/v1/workspaces/{WS_ID}/engine/runs", json={**payload, "bypass_cache": True},
+        )).json()
+        rows_after = await db_session.scalar(select(func.count(ResultSetRow.result_id)))
+
+        snap = await db_session.get(RunSnapshotRow, UUID(audit["run_id"]))
+        assert snap.result_source_run_id is None
+        assert rows_after > rows_before
+
+    @pytest.mark.anyio
+    async def test_different_shock_misses_cache(
+        self, client: AsyncClient, db_session: AsyncSession,
+    ) -> None:
+        from src.db.tables import RunSnapshotRow
+
+        payload = await self._setup(client, db_session)
+        await client.post(f"/v1/workspaces/{WS_ID}/engine/runs", json=payload)
+        other = (await client.post(
+            f"/v1/workspaces/{WS_ID}/engine/runs",
+            json={**payload, "annual_shocks": {"2026": [200.0, 0.0]}},
+        )).json()
+        snap = await db_session.get(RunSnapshotRow, UUID(other["run_id"]))
+        assert snap.result_source_run_id is None
+
+    @pytest.mark.anyio
+    async def test_cache_not_shared_across_workspaces(
+        self, client: AsyncClient, db_session: AsyncSession,
+    ) -> None:
+        from src.db.tables import RunSnapshotRow
+
+        payload = await self._setup(client, db_session)
+        await client.post(f"/v1/workspaces/{WS_ID}/engine/runs", json=payload)
+        other_ws = str(uuid7())
+        other = (await client.post(
+            f"/v1/workspaces/{other_ws}/engine/runs", json=payload,
+        )).json()
+        snap = await db_session.get(RunSnapshotRow, UUID(other["run_id"]))
+        assert snap.result_source_run_id is None
+
+    @pytest.mark.anyio
+    async def test_cache_stats_endpoint(
+        self, client: AsyncClient, db_session: AsyncSession,
+    ) -> None:
+        from src.engine.run_cache import run_cache_counters
+
+        run_cache_counters.reset()
+        payload = await self._setup(client, db_session)
+        await client.post(f"/v1/workspaces/{WS_ID}/engine/runs", json=payload)
+        await client.post(f"/v1/workspaces/{WS_ID}/engine/runs", json=payload)
+
+        resp = await client.get("/v1/engine/run-cache/stats")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["hits"] == 1
+        assert data["misses"] == 1
+        assert data["hit_rate"] == 0.5
+
+
+# ===================================================================
+# Monte Carlo — seeded confidence bands over approved assumption ranges
+# ===================================================================
+
+
+class TestMonteCarloRuns:
+    """monte_carlo block stores mc_* series and records the seed."""
+
+    async def _setup(self, client: AsyncClient, db_session: AsyncSession) -> dict:
+        reg_resp = await client.post("/v1/engine/models", json=_register_model_payload())
+        model_version_id = reg_resp.json()["model_version_id"]
+        await _promote_model(db_session, model_version_id)
+        return {
+            "model_version_id": model_version_id,
+            "annual_shocks": {"2026": [100.0, 20.0]},
+            "base_year": 2023,
+            "satellite_coefficients": _satellite_payload(),
+        }
+
+    async def _assumption(self, db_session: AsyncSession, *, approved: bool) -> str:
+        from src.repositories.governance import AssumptionRepository
+
+        repo = AssumptionRepository(db_session)
+        row = await repo.create(
+            assumption_id=uuid7(), type="PHASING", value=100.0,
+            units="SAR m", justification="capex envelope",
+            range_json={"min": 80.0, "max": 130.0} if approved else None,
+            status="APPROVED" if approved else "DRAFT",
+            workspace_id=UUID(WS_ID),
+        )
+        return str(row.assumption_id)
+
+    @pytest.mark.anyio
+    async def test_monte_carlo_run_persists_bands_and_seed(
+        self, client: AsyncClient, db_session: AsyncSession,
+    ) -> None:
+        from src.db.tables import RunSnapshotRow
+
+        payload = await self._setup(client, db_session)
+        assumption_id = await self._assumption(db_session, approved=True)
+        payload["monte_carlo"] = {
+            "draws": 500, "seed": 99, "coefficient_uncertainty": 0.1,
+            "shock_assumptions": [{"assumption_id": assumption_id, "sector_codes": ["S1"]}],
+        }
+        resp = await client.post(f"/v1/workspaces/{WS_ID}/engine/runs", json=payload)
+        assert resp.status_code == 200
+        run_id = resp.json()["run_id"]
+
+        snap = await db_session.get(RunSnapshotRow, UUID(run_id))
+        assert snap.monte_carlo_seed == 99
+        assert snap.monte_carlo_draws == 500
+
+        series = (await client.get(
+            f"/v1/workspaces/{WS_ID}/engine/runs/{run_id}?include_series=true",
+        )).json()["result_sets"]
+        bands = next(
+            rs["values"] for rs in series
+            if rs["series_kind"] == "mc_cumulative" and rs["metric_type"] == "total_output"
+        )
+        assert bands["p5"] < bands["p50"] < bands["p95"]
+
+    @pytest.mark.anyio
+    async def test_monte_carlo_seed_generated_when_omitted(
+        self, client: AsyncClient, db_session: AsyncSession,
+    ) -> None:
+        from src.db.tables import RunSnapshotRow
+
+        payload = await self._setup(client, db_session)
+        payload["monte_carlo"] = {"draws": 50, "coefficient_uncertainty": 0.05}
+        resp = await client.post(f"/v1/workspaces/{WS_ID}/engine/runs", json=payload)
+        snap = await db_session.get(RunSnapshotRow, UUID(resp.json()["run_id"]))
+        assert snap.monte_carlo_seed is not None
+
+    @pytest.mark.anyio
+    async def test_unapproved_assumption_rejected(
+        self, client: AsyncClient, db_session: AsyncSession,
+    ) -> None:
+        payload = await self._setup(client, db_session)
+        assumption_id = await self._assumption(db_session, approved=False)
+        payload["monte_carlo"] = {
+            "draws": 50, "seed": 1,
+            "shock_assumptions": [{"assumption_id": assumption_id}],
+        }
+        resp = await client.post(f"/v1/workspaces/{WS_ID}/engine/runs", json=payload)
+        assert resp.status_code == 422
+        assert resp.json()["detail"]["reason_code"] == "MC_ASSUMPTION_NOT_APPROVED"
+
+    @pytest.mark.anyio
+    async def test_unknown_sector_rejected(
+        self, client: AsyncClient, db_session: AsyncSession,
+    ) -> None:
+        payload = await self._setup(client, db_session)
+        assumption_id = await self._assumption(db_session, approved=True)
+        payload["monte_carlo"] = {
+            "draws": 50, "seed": 1,
+            "shock_assumptions": [{"assumption_id": assumption_id, "sector_codes": ["ZZ"]}],
+        }
+        resp = await client.post(f"/v1/workspaces/{WS_ID}/engine/runs", json=payload)
+        assert resp.status_code == 422
+        assert resp.json()["detail"]["reason_code"] == "MC_UNKNOWN_SECTOR"
@@ -0,0 +1,253 @@
+"""Tests for the Monte Carlo uncertainty engine (MVP-3 Section 7.6).
+
+Covers: seeded reproducibility, chunk-size invariance, degenerate
+(no-uncertainty) draws matching the deterministic run, band ordering,
+assumption-derived shock ranges, A perturbations, the per-sector quantile
+sketch, spec validation,
+BatchRunner integration (mc_* series, seed on RunSnapshot, fingerprint).
+"""
+
+import numpy as np
+import pytest
+from uuid_extensions import uuid7
+
+from src.engine.batch import BatchRequest, BatchRunner, ScenarioInput
+from src.engine.model_store import ModelStore
+from src.engine.monte_carlo import (
+    MC_SERIES_ANNUAL,
+    MC_SERIES_CUMULATIVE,
+    MonteCarloEngine,
+    MonteCarloSpec,
+    MonteCarloValidationError,
+    SectorQuantileSketch,
+    ShockRange,
+    monte_carlo_result_sets,
+)
+from src.engine.satellites import SatelliteCoefficients
+
+SHOCKS = {2025: np.array([100.0, 50.0]), 2026: np.array([40.0, 80.0])}
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _loaded():
+    store = ModelStore()
+    mv = store.register(
+        Z=np.array([[150.0, 500.0], [200.0, 100.0]]),
+        x=np.array([1000.0, 2000.0]),
+        sector_codes=["S1", "S2"], base_year=2023, source="test",
+    )
+    return store, store.get(mv.model_version_id)
+
+
+def _coefficients() -> SatelliteCoefficients:
+    return SatelliteCoefficients(
+        jobs_coeff=np.array([0.01, 0.005]),
+        import_ratio=np.array([0.30, 0.20]),
+        va_ratio=np.array([0.40, 0.55]),
+        version_id=uuid7(),
+    )
+
+
+def _spec(**overrides) -> MonteCarloSpec:
+    kwargs = {
+        "draws": 2000,
+        "seed": 42,
+        "shock_ranges": (ShockRange(low=0.8, high=1.2, sector_codes=("S1",)),),
+        "coefficient_uncertainty": 0.1,
+    }
+    kwargs.update(overrides)
+    return MonteCarloSpec(**kwargs)
+
+
+def _run(spec: MonteCarloSpec):
+    _, loaded = _loaded()
+    return MonteCarloEngine().run(
+        loaded_model=loaded, annual_shocks=SHOCKS,
+        coefficients=_coefficients(), spec=spec,
+    )
+
+
+# ===================================================================
+# Sampling
+# ===================================================================
+
+
+class TestMonteCarloSampling:
+    """Seeded, chunk-invariant, and consistent with the point estimate."""
+
+    def test_same_seed_same_bands(self) -> None:
+        assert _run(_spec()).cumulative["employment"].total == \
+            _run(_spec()).cumulative["employment"].total
+
+    def test_different_seed_different_bands(self) -> None:
+        a = _run(_spec(seed=1)).cumulative["total_output"].total
+        b = _run(_spec(seed=2)).cumulative["total_output"].total
+        assert a != b
+
+    def test_chunk_size_does_not_change_results(self) -> None:
+        spec = _spec(a_perturbation=0.05)
+        small = _run(MonteCarloSpec(**{**spec.__dict__, "chunk_size": 7}))
+        large = _run(MonteCarloSpec(**{**spec.__dict__, "chunk_size": 5000}))
+        for metric in ("total_output", "employment"):
+            assert small.cumulative[metric].total == pytest.approx(
+                large.cumulative[metric].total, rel=1e-12,
+            )
+
+    def test_no_uncertainty_matches_deterministic(self) -> None:
+        _, loaded = _loaded()
+        summary = _run(_spec(draws=10, shock_ranges=(), coefficient_uncertainty=0.0))
+        expected = loaded.B @ sum(SHOCKS.values())
+        bands = summary.cumulative["total_output"].total
+        assert bands["p5"] == pytest.approx(expected.sum())
+        assert bands["p95"] == pytest.approx(expected.sum())
+        assert bands["std"] == pytest.approx(0.0, abs=1e-9)
+        np.testing.assert_allclose(
+            summary.cumulative["total_output"].by_sector["p50"], expected, rtol=1e-6,
+        )
+
+    def test_bands_are_ordered_and_bracket_point_estimate(self) -> None:
+        _, loaded = _loaded()
+        point = float((loaded.B @ sum(SHOCKS.values())).sum())
+        bands = _run(_spec()).cumulative["total_output"].total
+        assert bands["p5"] < bands["p50"] < bands["p95"]
+        assert bands["p5"] < point < bands["p95"]
+
+    def test_annual_bands_per_year(self) -> None:
+        summary = _run(_spec())
+        assert set(summary.annual_total_output) == set(SHOCKS)
+        assert summary.horizon_year == 2026
+
+    def test_a_perturbation_widens_bands(self) -> None:
+        base = _run(_spec(shock_ranges=(), coefficient_uncertainty=0.0))
+        perturbed = _run(_spec(shock_ranges=(), coefficient_uncertainty=0.0, a_perturbation=0.2))
+        assert perturbed.cumulative["total_output"].total["std"] > \
+            base.cumulative["total_output"].total["std"]
+
+
+# ===================================================================
+# Per-sector quantile sketch
+# ===================================================================
+
+
+class TestSectorQuantileSketch:
+    """Bounded-memory sector bands over streamed chunks."""
+
+    DATA = np.random.default_rng(3).lognormal(size=(5000, 4))
+
+    def _sketch(self, capacity: int, chunk: int) -> SectorQuantileSketch:
+        sketch = SectorQuantileSketch(4, capacity=capacity)
+        for start in range(0, len(self.DATA), chunk):
+            sketch.add(self.DATA[start:start + chunk])
+        return sketch
+
+    def test_exact_within_capacity(self) -> None:
+        bands = self._sketch(capacity=8192, chunk=97).bands((5.0, 50.0, 95.0))
+        expected = np.percentile(self.DATA, [5.0, 50.0, 95.0], axis=0)
+        np.testing.assert_allclose(bands["p5"], expected[0], rtol=1e-12)
+        np.testing.assert_allclose(bands["p95"], expected[2], rtol=1e-12)
+        np.testing.assert_allclose(bands["mean"], self.DATA.mean(axis=0), rtol=1e-12)
+        np.testing.assert_allclose(bands["std"], self.DATA.std(axis=0), rtol=1e-12)
+
+    def test_bounded_and_close_beyond_capacity(self) -> None:
+        sketch = self._sketch(capacity=256, chunk=97)
+        assert sketch.count == len(self.DATA)
+        assert sketch.retained < 4 * 256
+        bands = sketch.bands((5.0, 50.0, 95.0))
+        expected = np.percentile(self.DATA, [50.0, 95.0], axis=0)
+        np.testing.assert_allclose(bands["p50"], expected[0], rtol=0.05)
+        np.testing.assert_allclose(bands["p95"], expected[1], rtol=0.05)
+
+    def test_chunking_does_not_change_sketch(self) -> None:
+        a = self._sketch(capacity=256, chunk=7).bands((5.0, 95.0))
+        b = self._sketch(capacity=256, chunk=5000).bands((5.0, 95.0))
+        np.testing.assert_array_equal(a["p5"], b["p5"])
+        np.testing.assert_array_equal(a["p95"], b["p95"])
+
+
+# ===================================================================
+# Spec validation
+# ===================================================================
+
+
+class TestMonteCarloSpecValidation:
+    """Invalid specs fail with structured reason codes."""
+
+    def test_from_assumption_relative_range(self) -> None:
+        r = ShockRange.from_assumption(value=200.0, range_min=150.0, range_max=260.0)
+        assert (r.low, r.high) == (0.75, 1.3)
+
+    def test_from_assumption_zero_value(self) -> None:
+        with pytest.raises(MonteCarloValidationError) as exc_info:
+            ShockRange.from_assumption(value=0.0, range_min=0.0, range_max=1.0)
+        assert exc_info.value.reason_code == "MC_ASSUMPTION_ZERO_VALUE"
+
+    def test_unknown_sector(self) -> None:
+        spec = _spec(shock_ranges=(ShockRange(low=0.9, high=1.1, sector_codes=("ZZ",)),))
+        with pytest.raises(MonteCarloValidationError) as exc_info:
+            _run(spec)
+        assert exc_info.value.reason_code == "MC_UNKNOWN_SECTOR"
+
+    def test_too_many_draws(self) -> None:
+        with pytest.raises(MonteCarloValidationError) as exc_info:
+            _run(_spec(draws=10_000_000))
+        assert exc_info.value.reason_code == "MC_INVALID_DRAWS"
+
+
+# ===================================================================
+# BatchRunner integration
+# ===================================================================
+
+
+class TestMonteCarloBatchIntegration:
+    """BatchRunner emits mc_* series and records the seed."""
+
+    def _run_batch(self, spec: MonteCarloSpec | None):
+        store, loaded = _loaded()
+        runner = BatchRunner(model_store=store)
+        scenario = ScenarioInput(
+            scenario_spec_id=uuid7(), scenario_spec_version=1, name="mc",
+            annual_shocks=SHOCKS, base_year=2023, monte_carlo=spec,
+        )
+        request = BatchRequest(
+            scenarios=[scenario],
+            model_version_id=loaded.model_version.model_version_id,
+            satellite_coefficients=_coefficients(),
+            version_refs={
+                "taxonomy_version_id": uuid7(),
+                "concordance_version_id": uuid7(),
+                "mapping_library_version_id": uuid7(),
+                "assumption_library_version_id": uuid7(),
+                "prompt_pack_version_id": uuid7(),
+            },
+        )
+        return runner, request, runner.run(request).run_results[0]
+
+    def test_emits_mc_series_and_records_seed(self) -> None:
+        _, _, sr = self._run_batch(_spec(draws=200, seed=7))
+        kinds = {(rs.metric_type, rs.series_kind) for rs in sr.result_sets}
+        assert ("employment", MC_SERIES_CUMULATIVE) in kinds
+        assert ("total_output", MC_SERIES_ANNUAL) in kinds
+        assert sr.snapshot.monte_carlo_seed == 7
+        assert sr.snapshot.monte_carlo_draws == 200
+
+    def test_deterministic_run_unchanged(self) -> None:
+        _, _, sr = self._run_batch(None)
+        assert not any(rs.series_kind in (MC_SERIES_CUMULATIVE, MC_SERIES_ANNUAL)
+                       for rs in sr.result_sets)
+        assert sr.snapshot.monte_carlo_seed is None
+
+    def test_seed_changes_fingerprint(self) -> None:
+        runner, request, _ = self._run_batch(_spec(seed=1))
+        fp_1 = runner.input_fingerprints(request)
+        request.scenarios[0].monte_carlo = _spec(seed=2)
+        assert runner.input_fingerprints(request) != fp_1
+
+    def test_result_sets_carry_sector_bands(self) -> None:
+        summary = _run(_spec(draws=100))
+        rows = monte_carlo_result_sets(uuid7(), summary, ["S1", "S2"])
+        cumulative = [r for r in rows if r.series_kind == MC_SERIES_CUMULATIVE]
+        assert all(r.year == 2026 for r in cumulative)
+        assert set(cumulative[0].sector_breakdowns["p95"]) == {"S1", "S2"}
@@ -0,0 +1,138 @@
+"""Tests for precomputed multiplier tables (column reductions of B and B*).
+
+Covers: Type I multipliers against explicit B column sums, Type II
+against the explicit bordered inverse, income availability, content
+hash determinism and sensitivity, and payload round-trip.
+"""
+
+import numpy as np
+import pytest
+from uuid_extensions import uuid7
+
+from src.engine.model_store import ModelStore
+from src.engine.multipliers import MULTIPLIER_KINDS, compute_multiplier_table
+from src.engine.satellites import SatelliteCoefficients
+from src.engine.solver_backend import BACKEND_GMRES, BACKEND_SPARSE_LU
+
+Z = np.array([[150.0, 500.0, 40.0], [200.0, 100.0, 80.0], [50.0, 60.0, 30.0]])
+X = np.array([1000.0, 2000.0, 800.0])
+COMP = [300.0, 500.0, 200.0]
+HH_SHARES = [0.5, 0.3, 0.2]
+
+
+def _loaded(*, type_ii: bool = True, solver_backend: str = "auto"):
+    store = ModelStore()
+    payload = None
+    if type_ii:
+        payload = {
+            "compensation_of_employees": COMP,
+            "household_consumption_shares": HH_SHARES,
+        }
+    mv = store.register(
+        Z=Z, x=X, sector_codes=["S1", "S2", "S3"],
+        base_year=2023, source="test", artifact_payload=payload,
+        solver_backend=solver_backend,
+    )
+    return store.get(mv.model_version_id)
+
+
+def _coefficients(jobs: tuple[float, ...] = (0.01, 0.005, 0.02)) -> SatelliteCoefficients:
+    return SatelliteCoefficients(
+        jobs_coeff=np.array(jobs),
+        import_ratio=np.array([0.30, 0.20, 0.10]),
+        va_ratio=np.array([0.40, 0.55, 0.60]),
+        version_id=uuid7(),
+    )
+
+
+class TestTypeIMultipliers:
+    """Type I multipliers are weighted column sums of B."""
+
+    def test_output_is_column_sum(self) -> None:
+        loaded = _loaded()
+        table = compute_multiplier_table(loaded, _coefficients())
+        np.testing.assert_allclose(table.type_i["output"], loaded.B.sum(axis=0))
+
+    def test_satellite_multipliers(self) -> None:
+        loaded = _loaded()
+        coeffs = _coefficients()
+        table = compute_multiplier_table(loaded, coeffs)
+        np.testing.assert_allclose(table.type_i["employment"], coeffs.jobs_coeff @ loaded.B)
+        np.testing.assert_allclose(table.type_i["imports"], coeffs.import_ratio @ loaded.B)
+        np.testing.assert_allclose(table.type_i["value_added"], coeffs.va_ratio @ loaded.B)
+        np.testing.assert_allclose(
+            table.type_i["income"], (np.array(COMP) / X) @ loaded.B,
+        )
+
+    def test_no_income_or_type_ii_without_household_data(self) -> None:
+        table = compute_multiplier_table(_loaded(type_ii=False), _coefficients())
+        assert "income" not in table.type_i
+        assert table.type_ii is None
+
+    def test_coefficient_shape_mismatch(self) -> None:
+        with pytest.raises(ValueError, match="employment"):
+            compute_multiplier_table(_loaded(), _coefficients(jobs=(0.01, 0.02)))
+
+
+class TestTypeIIMultipliers:
+    """Type II multipliers match the explicit household-closed inverse."""
+
+    def test_matches_bordered_inverse(self) -> None:
+        loaded = _loaded()
+        coeffs = _coefficients()
+        n = loaded.n
+        w = np.array(COMP) / X
+        a_star = np.zeros((n + 1, n + 1))
+        a_star[:n, :n] = loaded.A
+        a_star[:n, n] = HH_SHARES
+        a_star[n, :n] = w
+        b_star = np.linalg.inv(np.eye(n + 1) - a_star)[:n, :n]
+
+        table = compute_multiplier_table(loaded, coeffs)
+        np.testing.assert_allclose(table.type_ii["output"], b_star.sum(axis=0))
+        np.testing.assert_allclose(table.type_ii["employment"], coeffs.jobs_coeff @ b_star)
+        assert set(table.type_ii) == set(MULTIPLIER_KINDS)
+
+    def test_type_ii_exceeds_type_i(self) -> None:
+        table = compute_multiplier_table(_loaded(), _coefficients())
+        assert np.all(table.type_ii["output"] > table.type_i["output"])
+
+
+class TestSparseBackends:
+    """Sparse backends reduce B by transposed solves without forming it."""
+
+    @pytest.mark.parametrize("backend", [BACKEND_SPARSE_LU, BACKEND_GMRES])
+    def test_matches_dense_without_forming_B(self, backend: str) -> None:
+        dense = compute_multiplier_table(_loaded(), _coefficients())
+        loaded = _loaded(solver_backend=backend)
+        table = compute_multiplier_table(loaded, _coefficients())
+
+        assert loaded._B is None
+        for kind in dense.type_i:
+            np.testing.assert_allclose(table.type_i[kind], dense.type_i[kind], rtol=1e-8)
+            np.testing.assert_allclose(table.type_ii[kind], dense.type_ii[kind], rtol=1e-8)
+
+
+class TestContentHash:
+    """Content hash is deterministic and covers coefficients and values."""
+
+    def test_deterministic_across_version_ids(self) -> None:
+        loaded = _loaded()
+        a = compute_multiplier_table(loaded, _coefficients())
+        b = compute_multiplier_table(loaded, _coefficients())
+        assert a.content_hash == b.content_hash
+        assert a.coefficients_hash == b.coefficients_hash
+
+    def test_changes_with_coefficients(self) -> None:
+        loaded = _loaded()
+        a = compute_multiplier_table(loaded, _coefficients())
+        b = compute_multiplier_table(loaded, _coefficients(jobs=(0.02, 0.005, 0.02)))
+        assert a.content_hash != b.content_hash
+        assert a.coefficients_hash != b.coefficients_hash
+
+    def test_payload_round_trip(self) -> None:
+        table = compute_multiplier_table(_loaded(), _coefficients())
+        payload = table.to_payload()
+        assert payload["sector_codes"] == ["S1", "S2", "S3"]
+        assert payload["model_checksum"] == table.model_checksum
+        np.testing.assert_allclose(payload["type_ii"]["output"], table.type_ii["output"])
@@ -0,0 +1,166 @@
+"""Tests for the content-addressed run result cache (input fingerprints).
+
+Covers: fingerprint determinism and sensitivity to every input,
+BatchRunner linking of cached runs, hit-rate counters.
+"""
+
+import numpy as np
+from uuid_extensions import uuid7
+
+from src.engine.batch import BatchRequest, BatchRunner, ScenarioInput
+from src.engine.model_store import ModelStore
+from src.engine.run_cache import (
+    RunCacheCounters,
+    compute_input_fingerprint,
+)
+from src.engine.satellites import SatelliteCoefficients
+
+
+def _coeffs(jobs: float = 0.01) -> SatelliteCoefficients:
+    return SatelliteCoefficients(
+        jobs_coeff=np.array([jobs, 0.005]),
+        import_ratio=np.array([0.30, 0.20]),
+        va_ratio=np.array([0.40, 0.55]),
+        version_id=uuid7(),
+    )
+
+
+def _fp(**overrides: object) -> str:
+    kwargs: dict[str, object] = {
+        "model_checksum": "sha256:abc",
+        "annual_shocks": {2026: np.array([100.0, 0.0]), 2027: np.array([50.0, 10.0])},
+        "base_year": 2023,
+        "coefficients": _coeffs(),
+    }
+    kwargs.update(overrides)
+    return compute_input_fingerprint(**kwargs)
+
+
+def _version_refs() -> dict:
+    return {
+        "taxonomy_version_id": uuid7(),
+        "concordance_version_id": uuid7(),
+        "mapping_library_version_id": uuid7(),
+        "assumption_library_version_id": uuid7(),
+        "prompt_pack_version_id": uuid7(),
+    }
+
+
+def _runner_and_request(cached_runs: dict | None = None) -> tuple[BatchRunner, BatchRequest]:
+    store = ModelStore()
+    mv = store.register(
+        Z=np.array([[150.0, 500.0], [200.0, 100.0]]),
+        x=np.array([1000.0, 2000.0]),
+        sector_codes=["S1", "S2"],
+        base_year=2023,
+        source="test",
+    )
+    scenario = ScenarioInput(
+        scenario_spec_id=uuid7(),
+        scenario_spec_version=1,
+        name="s",
+        annual_shocks={2026: np.array([100.0, 0.0])},
+        base_year=2023,
+        sensitivity_multipliers=[1.0, 1.1],
+    )
+    request = BatchRequest(
+        scenarios=[scenario],
+        model_version_id=mv.model_version_id,
+        satellite_coefficients=_coeffs(),
+        version_refs=_version_refs(),
+        cached_runs=cached_runs or {},
+    )
+    return BatchRunner(model_store=store), request
+
+
+class TestInputFingerprint:
+    """Fingerprint is deterministic and covers every result-determining input."""
+
+    def test_deterministic(self) -> None:
+        assert _fp() == _fp()
+        assert _fp().startswith("sha256:")
+
+    def test_coefficient_version_id_ignored(self) -> None:
+        """API callers mint new version ids; only coefficient values matter."""
+        assert _fp(coefficients=_coeffs()) == _fp(coefficients=_coeffs())
+
+    def test_year_order_ignored(self) -> None:
+        shocks = {2027: np.array([50.0, 10.0]), 2026: np.array([100.0, 0.0])}
+        assert _fp(annual_shocks=shocks) == _fp()
+
+    def test_negative_zero_normalized(self) -> None:
+        shocks = {2026: np.array([100.0, -0.0]), 2027: np.array([50.0, 10.0])}
+        assert _fp(annual_shocks=shocks) == _fp()
+
+    def test_sensitive_to_each_input(self) -> None:
+        base = _fp()
+        variants = [
+            _fp(model_checksum="sha256:def"),
+            _fp(annual_shocks={2026: np.array([100.0, 0.0])}),
+            _fp(annual_shocks={2026: np.array([101.0, 0.0]), 2027: np.array([50.0, 10.0])}),
+            _fp(base_year=2022),
+            _fp(coefficients=_coeffs(jobs=0.02)),
+            _fp(deflators={2026: 1.05}),
+            _fp(baseline_run_id=uuid7()),
+            _fp(environment="prod"),
+            _fp(engine_version="0.0.0-test"),
+        ]
+        assert base not in variants
+        assert len(set(variants)) == len(variants)
+
+
+class TestBatchRunnerCachedRuns:
+    """BatchRunner links runs whose fingerprint is in request.cached_runs."""
+
+    def test_fingerprints_in_run_order(self) -> None:
+        runner, request = _runner_and_request()
+        fps = runner.input_fingerprints(request)
+        result = runner.run(request)
+        assert [sr.input_fingerprint for sr in result.run_results] == fps
+        assert len(set(fps)) == 2  # multipliers differ
+
+    def test_cached_run_is_linked_not_recomputed(self) -> None:
+        runner, request = _runner_and_request()
+        fps = runner.input_fingerprints(request)
+        source_run_id = uuid7()
+        request.cached_runs = {fps[0]: source_run_id}
+
+        result = runner.run(request)
+        cached, computed = result.run_results
+        assert cached.result_source_run_id == source_run_id
+        assert cached.result_sets == []
+        assert cached.snapshot.run_id != source_run_id
+        assert computed.result_source_run_id is None
+        assert computed.result_sets
+
+    def test_cached_runs_get_distinct_snapshots(self) -> None:
+        runner, request = _runner_and_request()
+        fps = runner.input_fingerprints(request)
+        request.cached_runs = {fp: uuid7() for fp in fps}
+        first = runner.run(request)
+        second = runner.run(request)
+        run_ids = {sr.snapshot.run_id for sr in first.run_results + second.run_results}
+        assert len(run_ids) == 4
+
+
+class TestRunCacheCounters:
+    """Hit-rate counters."""
+
+    def test_hit_rate(self) -> None:
+        counters = RunCacheCounters()
+        counters.record_hit(3)
+        counters.record_miss(1)
+        counters.record_bypass(2)
+        stats = counters.snapshot()
+        assert stats.lookups == 4
+        assert stats.hit_rate == 0.75
+        assert stats.bypassed == 2
+
+    def test_empty_hit_rate_is_zero(self) -> None:
+        assert RunCacheCounters().snapshot().hit_rate == 0.0
+
+    def test_reset(self) -> None:
+        counters = RunCacheCounters()
+        counters.record_hit()
+        counters.reset()
+        assert counters.snapshot().hits == 0
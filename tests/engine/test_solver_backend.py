@@ -0,0 +1,218 @@
+"""Tests for pluggable Leontief solver backends (MVP-3 Section 7.6).
+
+Covers: sparsity detection, dense / sparse LU / GMRES equivalence,
+LeontiefSolver on sparse backends (Type I and Type II), Perron–Frobenius
+spectral radius bounds.
+"""
+
+import numpy as np
+import pytest
+
+from src.engine.leontief import LeontiefSolver
+from src.engine.model_store import ModelStore
+from src.engine.solver_backend import (
+    BACKEND_DENSE,
+    BACKEND_GMRES,
+    BACKEND_SPARSE_LU,
+    SPARSE_MIN_SECTORS,
+    build_backend,
+    select_backend_name,
+    spectral_radius_bounds,
+)
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _sparse_economy(n: int, density: float = 0.02, seed: int = 7) -> tuple:
+    """Random sparse productive economy: column sums of A stay below 0.6."""
+    rng = np.random.default_rng(seed)
+    mask = rng.random((n, n)) < density
+    Z = np.where(mask, rng.uniform(1.0, 10.0, size=(n, n)), 0.0)
+    col_totals = Z.sum(axis=0)
+    x = np.maximum(col_totals / 0.6, 100.0)
+    return Z, x
+
+
+def _register(store: ModelStore, Z: np.ndarray, x: np.ndarray, backend: str) -> object:
+    mv = store.register(
+        Z=Z, x=x, sector_codes=[f"S{i}" for i in range(len(x))],
+        base_year=2023, source="test", solver_backend=backend,
+    )
+    return store.get(mv.model_version_id)
+
+
+# ===================================================================
+# Backend selection
+# ===================================================================
+
+
+class TestBackendSelection:
+    """Auto mode picks sparse LU only for large sparse tables."""
+
+    def test_small_model_uses_dense(self) -> None:
+        A = np.array([[0.15, 0.25], [0.20, 0.05]])
+        assert select_backend_name(A) == BACKEND_DENSE
+
+    def test_large_sparse_model_uses_sparse_lu(self) -> None:
+        Z, x = _sparse_economy(SPARSE_MIN_SECTORS)
+        assert select_backend_name(Z / x[np.newaxis, :]) == BACKEND_SPARSE_LU
+
+    def test_large_dense_model_uses_dense(self) -> None:
+        Z, x = _sparse_economy(SPARSE_MIN_SECTORS, density=0.5)
+        assert select_backend_name(Z / x[np.newaxis, :]) == BACKEND_DENSE
+
+    def test_auto_registered_model_reports_backend(self) -> None:
+        store = ModelStore()
+        Z, x = _sparse_economy(SPARSE_MIN_SECTORS)
+        loaded = _register(store, Z, x, "auto")
+        assert loaded.backend.name == BACKEND_SPARSE_LU
+
+    def test_unknown_backend_raises(self) -> None:
+        with pytest.raises(ValueError, match="unknown solver backend"):
+            build_backend(np.zeros((2, 2)), "cholesky")
+
+    def test_register_unknown_backend_raises(self) -> None:
+        store = ModelStore()
+        Z, x = _sparse_economy(5, density=0.5)
+        with pytest.raises(ValueError, match="unknown solver backend"):
+            _register(store, Z, x, "cholesky")
+
+
+# ===================================================================
+# Backend equivalence
+# ===================================================================
+
+
+class TestBackendEquivalence:
+    """All backends agree with the dense inverse."""
+
+    @pytest.mark.parametrize("backend", [BACKEND_SPARSE_LU, BACKEND_GMRES])
+    def test_solve_matches_dense(self, backend: str) -> None:
+        Z, x = _sparse_economy(400)
+        A = Z / x[np.newaxis, :]
+        dense = build_backend(A, BACKEND_DENSE)
+        other = build_backend(A, backend)
+        d = np.random.default_rng(1).uniform(0.0, 100.0, size=400)
+        np.testing.assert_allclose(other.solve(d), dense.solve(d), rtol=1e-8)
+
+    @pytest.mark.parametrize("backend", [BACKEND_SPARSE_LU, BACKEND_GMRES])
+    def test_matrix_rhs_matches_dense(self, backend: str) -> None:
+        Z, x = _sparse_economy(350)
+        A = Z / x[np.newaxis, :]
+        D = np.random.default_rng(2).uniform(0.0, 10.0, size=(350, 3))
+        np.testing.assert_allclose(
+            build_backend(A, backend).solve(D),
+            build_backend(A, BACKEND_DENSE).solve(D),
+            rtol=1e-8,
+        )
+
+    @pytest.mark.parametrize("backend", [BACKEND_DENSE, BACKEND_SPARSE_LU, BACKEND_GMRES])
+    def test_solve_transpose_gives_weighted_rows_of_B(self, backend: str) -> None:
+        Z, x = _sparse_economy(350)
+        A = Z / x[np.newaxis, :]
+        V = np.random.default_rng(3).uniform(0.0, 1.0, size=(350, 2))
+        B = build_backend(A, BACKEND_DENSE).inverse()
+        np.testing.assert_allclose(
+            build_backend(A, backend).solve_transpose(V), B.T @ V, rtol=1e-8,
+        )
+
+    def test_sparse_B_matches_dense_B(self) -> None:
+        store = ModelStore()
+        Z, x = _sparse_economy(SPARSE_MIN_SECTORS)
+        sparse_loaded = _register(store, Z, x, BACKEND_SPARSE_LU)
+        dense_loaded = _register(store, Z, x, BACKEND_DENSE)
+        np.testing.assert_allclose(sparse_loaded.B, dense_loaded.B, atol=1e-10)
+
+
+# ===================================================================
+# LeontiefSolver on sparse backends
+# ===================================================================
+
+
+class TestLeontiefSolverOnSparseBackend:
+    """LeontiefSolver API is unchanged on top of sparse backends."""
+
+    def test_solve_matches_dense_model(self) -> None:
+        store = ModelStore()
+        Z, x = _sparse_economy(SPARSE_MIN_SECTORS)
+        sparse_loaded = _register(store, Z, x, BACKEND_SPARSE_LU)
+        dense_loaded = _register(store, Z, x, BACKEND_DENSE)
+        d = np.zeros(SPARSE_MIN_SECTORS)
+        d[[3, 17, 120]] = [100.0, 50.0, 25.0]
+
+        solver = LeontiefSolver()
+        r_sparse = solver.solve(loaded_model=sparse_loaded, delta_d=d)
+        r_dense = solver.solve(loaded_model=dense_loaded, delta_d=d)
+        np.testing.assert_allclose(r_sparse.delta_x_total, r_dense.delta_x_total, rtol=1e-10)
+        np.testing.assert_array_equal(r_sparse.delta_x_direct, d)
+
+    def test_type_ii_bordered_solve_matches_dense(self) -> None:
+        store = ModelStore()
+        Z, x = _sparse_economy(SPARSE_MIN_SECTORS)
+        sparse_loaded = _register(store, Z, x, BACKEND_SPARSE_LU)
+        dense_loaded = _register(store, Z, x, BACKEND_DENSE)
+        rng = np.random.default_rng(3)
+        comp = x * 0.3
+        hh = rng.random(SPARSE_MIN_SECTORS)
+        hh = 0.5 * hh / hh.sum()
+        d = rng.uniform(0.0, 10.0, size=SPARSE_MIN_SECTORS)
+
+        solver = LeontiefSolver()
+        kwargs = {
+            "delta_d": d,
+            "compensation_of_employees": comp,
+            "household_consumption_shares": hh,
+        }
+        r_sparse = solver.solve_type_ii(loaded_model=sparse_loaded, **kwargs)
+        r_dense = solver.solve_type_ii(loaded_model=dense_loaded, **kwargs)
+        np.testing.assert_allclose(
+            r_sparse.delta_x_type_ii_total, r_dense.delta_x_type_ii_total, rtol=1e-8,
+        )
+        np.testing.assert_allclose(
+            r_sparse.delta_x_induced, r_dense.delta_x_induced, rtol=1e-7, atol=1e-9,
+        )
+
+
+# ===================================================================
+# Perron–Frobenius productivity check
+# ===================================================================
+
+
+class TestSpectralRadiusBounds:
+    """Bounds bracket the true spectral radius of non-negative A."""
+
+    def test_bounds_bracket_eigvals(self) -> None:
+        Z, x = _sparse_economy(60, density=0.2)
+        A = Z / x[np.newaxis, :]
+        rho = float(np.max(np.abs(np.linalg.eigvals(A))))
+        est = spectral_radius_bounds(A)
+        assert est.lower - 1e-12 <= rho <= est.upper + 1e-12
+
+    def test_column_sums_decide_productive(self) -> None:
+        A = np.array([[0.15, 0.25], [0.20, 0.05]])
+        est = spectral_radius_bounds(A)
+        assert est.upper < 1.0
+
+    def test_unproductive_lower_bound(self) -> None:
+        A = np.array([[0.95, 0.5], [0.5, 0.95]])
+        est = spectral_radius_bounds(A)
+        assert est.lower >= 1.0
+        assert est.value == pytest.approx(1.45)
+
+    def test_power_iteration_tightens_bounds(self) -> None:
+        """Column sums straddle 1 but ρ(A) < 1: iteration must resolve it."""
+        A = np.array([[0.0, 1.2], [0.3, 0.0]])  # ρ = sqrt(0.36) = 0.6
+        est = spectral_radius_bounds(A, tol=1e-10)
+        assert est.upper < 1.0
+        assert est.lower <= 0.6 + 1e-12 <= est.upper + 1e-9
+
+    def test_register_accepts_straddling_productive_model(self) -> None:
+        store = ModelStore()
+        Z = np.array([[0.0, 120.0], [30.0, 0.0]])
+        x = np.array([100.0, 100.0])
+        mv = store.register(
+            Z=Z, x=x, sector_codes=["S1", "S2"], base_year=2023, source="test",
+        )
+        assert mv.sector_count == 2
@@ -0,0 +1,302 @@
+"""Tests for the incremental workshop preview engine (Sprint 22).
+
+Covers: equivalence with a full BatchRunner run (Type I, satellites,
+value measures, Type II), baseline caching per session, multiplier
+column reuse, LRU eviction, headline latency.
+"""
+
+from uuid import UUID
+
+import numpy as np
+import pytest
+from uuid_extensions import uuid7
+
+from src.engine.batch import BatchRequest, BatchRunner, ScenarioInput
+from src.engine.model_store import ModelStore
+from src.engine.satellites import SatelliteCoefficients
+from src.engine.solver_backend import BACKEND_SPARSE_LU
+from src.engine.value_measures_validation import ValueMeasuresValidationError
+from src.engine.workshop_preview import WorkshopPreviewEngine
+from src.engine.workshop_transform import SliderInput, transform_sliders
+from tests.integration.golden_scenarios.shared import (
+    GOLDEN_COMPENSATION,
+    GOLDEN_HOUSEHOLD_SHARES,
+    GOLDEN_X,
+    GOLDEN_Z,
+    SECTOR_CODES_SMALL,
+    SMALL_DEFLATOR_SERIES,
+    SMALL_FINAL_DEMAND_F,
+    SMALL_GOS,
+    SMALL_IMPORT_RATIO,
+    SMALL_IMPORTS_VECTOR,
+    SMALL_JOBS_COEFF,
+    SMALL_TAXES_LESS_SUBSIDIES,
+    SMALL_VA_RATIO,
+)
+
+BASE_SHOCKS = {"2025": [100.0, 50.0, 25.0], "2026": [80.0, 120.0, 10.0]}
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _register_full_model(store: ModelStore, solver_backend: str = "auto") -> UUID:
+    mv = store.register(
+        Z=GOLDEN_Z, x=GOLDEN_X, sector_codes=SECTOR_CODES_SMALL,
+        base_year=2024, source="test-preview",
+        artifact_payload={
+            "compensation_of_employees": GOLDEN_COMPENSATION,
+            "household_consumption_shares": GOLDEN_HOUSEHOLD_SHARES,
+            "gross_operating_surplus": SMALL_GOS.tolist(),
+            "taxes_less_subsidies": SMALL_TAXES_LESS_SUBSIDIES.tolist(),
+            "final_demand_F": SMALL_FINAL_DEMAND_F.tolist(),
+            "imports_vector": SMALL_IMPORTS_VECTOR.tolist(),
+            "deflator_series": SMALL_DEFLATOR_SERIES,
+        },
+        solver_backend=solver_backend,
+    )
+    return mv.model_version_id
+
+
+def _coefficients() -> SatelliteCoefficients:
+    return SatelliteCoefficients(
+        jobs_coeff=np.array(SMALL_JOBS_COEFF),
+        import_ratio=np.array(SMALL_IMPORT_RATIO),
+        va_ratio=np.array(SMALL_VA_RATIO),
+        version_id=uuid7(),
+    )
+
+
+def _to_numpy(shocks: dict[str, list[float]]) -> dict[int, np.ndarray]:
+    return {int(year): np.array(values) for year, values in shocks.items()}
+
+
+def _full_run_totals(store: ModelStore, mv_id: UUID, shocks: dict[str, list[float]]) -> dict:
+    runner = BatchRunner(model_store=store, environment="dev")
+    scenario = ScenarioInput(
+        scenario_spec_id=uuid7(), scenario_spec_version=1, name="full",
+        annual_shocks=_to_numpy(shocks), base_year=2024,
+    )
+    result = runner.run(BatchRequest(
+        scenarios=[scenario], model_version_id=mv_id,
+        satellite_coefficients=_coefficients(),
+        version_refs={
+            "taxonomy_version_id": uuid7(),
+            "concordance_version_id": uuid7(),
+            "mapping_library_version_id": uuid7(),
+            "assumption_library_version_id": uuid7(),
+            "prompt_pack_version_id": uuid7(),
+        },
+    ))
+    totals: dict = {"annual": {}}
+    for rs in result.run_results[0].result_sets:
+        if rs.series_kind == "annual" and rs.metric_type == "total_output":
+            totals["annual"][rs.year] = sum(rs.values.values())
+        elif rs.series_kind is None:
+            totals[rs.metric_type] = rs.values.get(
+                "_total", sum(v for k, v in rs.values.items() if k != "_total"),
+            )
+        elif rs.series_kind == "peak":
+            totals["peak_year"] = rs.year
+    return totals
+
+
+def _preview(engine: WorkshopPreviewEngine, mv_id: UUID, sliders: list[SliderInput],
+             baseline_run_id: UUID | None = None):
+    return engine.preview(
+        model_version_id=mv_id,
+        baseline_run_id=baseline_run_id or UUID(int=1),
+        annual_shocks=_to_numpy(BASE_SHOCKS),
+        sliders=sliders,
+        base_year=2024,
+        coefficients=_coefficients(),
+    )
+
+
+# ===================================================================
+# Equivalence with the full engine path
+# ===================================================================
+
+
+class TestPreviewMatchesBatchRunner:
+    """Incremental headline metrics equal a full run on transformed shocks."""
+
+    @pytest.mark.parametrize("solver_backend", ["auto", BACKEND_SPARSE_LU])
+    def test_headline_matches_full_run(self, solver_backend: str) -> None:
+        store = ModelStore()
+        mv_id = _register_full_model(store, solver_backend)
+        engine = WorkshopPreviewEngine(store)
+        sliders = [SliderInput("F", 20.0), SliderInput("G", -35.0)]
+
+        preview = _preview(engine, mv_id, sliders)
+        full = _full_run_totals(
+            store, mv_id, transform_sliders(BASE_SHOCKS, sliders, SECTOR_CODES_SMALL),
+        )
+
+        for metric, value in preview.headline.items():
+            assert value == pytest.approx(full[metric], rel=1e-9), metric
+        for year, total in preview.annual_total_output.items():
+            assert total == pytest.approx(full["annual"][year], rel=1e-9)
+        assert preview.peak_year == full["peak_year"]
+
+    def test_reports_type_ii_and_value_measures(self) -> None:
+        store = ModelStore()
+        mv_id = _register_full_model(store)
+        preview = _preview(WorkshopPreviewEngine(store), mv_id, [SliderInput("C", 10.0)])
+        for metric in ("gdp_market_price", "balance_of_trade", "type_ii_total_output",
+                       "induced_effect", "type_ii_employment"):
+            assert metric in preview.headline
+
+    def test_model_without_artifacts_reports_type_i_only(self) -> None:
+        store = ModelStore()
+        mv = store.register(
+            Z=GOLDEN_Z, x=GOLDEN_X, sector_codes=SECTOR_CODES_SMALL,
+            base_year=2024, source="test",
+        )
+        preview = _preview(WorkshopPreviewEngine(store), mv.model_version_id, [])
+        assert set(preview.headline) == {
+            "total_output", "employment", "imports", "value_added", "domestic_output",
+        }
+
+    @staticmethod
+    def _register_invalid_value_measures(store: ModelStore) -> UUID:
+        gos = SMALL_GOS.copy()
+        gos[0] = -1.0
+        mv = store.register(
+            Z=GOLDEN_Z, x=GOLDEN_X, sector_codes=SECTOR_CODES_SMALL,
+            base_year=2024, source="test-bad-vm",
+            artifact_payload={
+                "gross_operating_surplus": gos.tolist(),
+                "taxes_less_subsidies": SMALL_TAXES_LESS_SUBSIDIES.tolist(),
+                "final_demand_F": SMALL_FINAL_DEMAND_F.tolist(),
+                "imports_vector": SMALL_IMPORTS_VECTOR.tolist(),
+                "deflator_series": SMALL_DEFLATOR_SERIES,
+            },
+        )
+        return mv.model_version_id
+
+    def test_invalid_value_measures_dropped_in_dev(self) -> None:
+        store = ModelStore()
+        mv_id = self._register_invalid_value_measures(store)
+        preview = _preview(WorkshopPreviewEngine(store), mv_id, [])
+        assert "gdp_market_price" not in preview.headline
+        assert preview.headline["total_output"] > 0
+
+    def test_invalid_value_measures_fail_closed_in_prod(self) -> None:
+        store = ModelStore()
+        mv_id = self._register_invalid_value_measures(store)
+        with pytest.raises(ValueMeasuresValidationError) as exc_info:
+            WorkshopPreviewEngine(store).preview(
+                model_version_id=mv_id,
+                baseline_run_id=UUID(int=1),
+                annual_shocks=_to_numpy(BASE_SHOCKS),
+                sliders=[],
+                base_year=2024,
+                coefficients=_coefficients(),
+                environment="prod",
+            )
+        assert exc_info.value.reason_code == "VM_INVALID_GOS"
+
+    def test_zero_sliders_return_baseline(self) -> None:
+        store = ModelStore()
+        mv_id = _register_full_model(store)
+        engine = WorkshopPreviewEngine(store)
+        baseline = _preview(engine, mv_id, [])
+        unchanged = _preview(engine, mv_id, [SliderInput("F", 0.0)])
+        assert unchanged.changed_sectors == []
+        assert unchanged.headline == baseline.headline
+
+
+# ===================================================================
+# Caching
+# ===================================================================
+
+
+class TestPreviewCaching:
+    """Baselines are solved once per session; columns once per model."""
+
+    def test_baseline_cached_across_slider_moves(self) -> None:
+        store = ModelStore()
+        mv_id = _register_full_model(store)
+        engine = WorkshopPreviewEngine(store)
+        first = _preview(engine, mv_id, [SliderInput("F", 5.0)])
+        second = _preview(engine, mv_id, [SliderInput("F", 15.0)])
+        assert not first.baseline_cached
+        assert second.baseline_cached
+
+    def test_new_baseline_run_is_new_session(self) -> None:
+        store = ModelStore()
+        mv_id = _register_full_model(store)
+        engine = WorkshopPreviewEngine(store)
+        _preview(engine, mv_id, [], baseline_run_id=UUID(int=1))
+        other = _preview(engine, mv_id, [], baseline_run_id=UUID(int=2))
+        assert not other.baseline_cached
+
+    def test_lru_evicts_oldest_session(self) -> None:
+        store = ModelStore()
+        mv_id = _register_full_model(store)
+        engine = WorkshopPreviewEngine(store, max_sessions=1)
+        _preview(engine, mv_id, [], baseline_run_id=UUID(int=1))
+        _preview(engine, mv_id, [], baseline_run_id=UUID(int=2))
+        again = _preview(engine, mv_id, [], baseline_run_id=UUID(int=1))
+        assert not again.baseline_cached
+
+    def test_columns_are_solved_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        store = ModelStore()
+        mv_id = _register_full_model(store)
+        engine = WorkshopPreviewEngine(store)
+        _preview(engine, mv_id, [SliderInput("F", 5.0), SliderInput("C", 5.0)])
+
+        loaded = store.get(mv_id)
+        calls: list = []
+        original = type(loaded).solve
+        monkeypatch.setattr(
+            type(loaded), "solve",
+            lambda self, d: calls.append(d) or original(self, d),
+        )
+        _preview(engine, mv_id, [SliderInput("F", -10.0), SliderInput("C", 40.0)])
+        assert calls == []
+
+    def test_evict_model_drops_sessions(self) -> None:
+        store = ModelStore()
+        mv_id = _register_full_model(store)
+        engine = WorkshopPreviewEngine(store)
+        _preview(engine, mv_id, [])
+        engine.evict_model(mv_id)
+        assert not _preview(engine, mv_id, []).baseline_cached
+
+
+# ===================================================================
+# Latency
+# ===================================================================
+
+
+class TestPreviewLatency:
+    """Cached slider moves stay well inside an interactive budget."""
+
+    def test_slider_move_under_10ms(self) -> None:
+        n = 400
+        rng = np.random.default_rng(11)
+        Z = rng.uniform(0.0, 1.0, size=(n, n))
+        x = Z.sum(axis=0) / 0.6
+        store = ModelStore()
+        codes = [f"S{i}" for i in range(n)]
+        mv = store.register(Z=Z, x=x, sector_codes=codes, base_year=2024, source="test")
+        coeffs = SatelliteCoefficients(
+            jobs_coeff=np.full(n, 0.01), import_ratio=np.full(n, 0.2),
+            va_ratio=np.full(n, 0.4), version_id=uuid7(),
+        )
+        shocks = {year: rng.uniform(0.0, 10.0, size=n) for year in range(2025, 2030)}
+        engine = WorkshopPreviewEngine(store)
+        kwargs = {
+            "model_version_id": mv.model_version_id, "baseline_run_id": UUID(int=1),
+            "annual_shocks": shocks, "base_year": 2024, "coefficients": coeffs,
+        }
+        sliders = [SliderInput(codes[j], 10.0) for j in range(0, n, 40)]
+        engine.preview(sliders=sliders, **kwargs)  # warm baseline + columns
+
+        elapsed = min(
+            engine.preview(sliders=sliders, **kwargs).elapsed_ms for _ in range(5)
+        )
+        assert elapsed < 10.0
@@ -160,3 +160,64 @@ class TestLinkedFormulas:
         cell = ws.cell(row=2, column=5)
         # Either formula or computed value
         assert cell.value is not None
+
+
+# ===================================================================
+# Single-pass streaming export
+# ===================================================================
+
+
+class TestSinglePassExport:
+    """Write-only export hashes canonical values and stamps watermarks in-pass."""
+
+    def test_canonical_matches_openpyxl_round_trip(self) -> None:
+        from openpyxl import Workbook
+
+        from src.export.excel_export import _canonical
+
+        values = [
+            500.0, 0.1 + 0.2, 1 / 3, 12_345_678_901_234_567_890, -0.0, 7,
+            1e-12, 2.5e20, "", "line\r\nbreak", "lone\rcr", "=C2+D2", True, None,
+        ]
+        wb = Workbook()
+        for col, value in enumerate(values, 1):
+            wb.active.cell(row=1, column=col, value=value)
+        buf = io.BytesIO()
+        wb.save(buf)
+        reloaded = load_workbook(io.BytesIO(buf.getvalue())).active
+        for col, value in enumerate(values, 1):
+            assert str(_canonical(value)) == str(reloaded.cell(row=1, column=col).value), value
+
+    def test_awkward_values_verify(self) -> None:
+        pack = _make_pack_data()
+        pack["sector_impacts"][0].update(direct_impact=0.1 + 0.2, multiplier=1 / 3)
+        pack["sector_impacts"].append({
+            "sector_code": "F", "sector_name": "", "direct_impact": 1,
+            "indirect_impact": 2.5e20, "total_impact": 0.0, "multiplier": 7,
+            "domestic_share": None, "import_leakage": 0.0,
+        })
+        pack["sector_impacts"][1]["sector_name"] = "line\r\nbreak\rhere"
+        pack["scenario_name"] = ""
+        data = ExcelExporter().export(pack)
+        assert IntegrityChecker().verify(data) is True
+
+    def test_watermark_applied_in_same_pass(self) -> None:
+        from src.export.watermark import SANDBOX_WATERMARK, WatermarkService
+
+        data = ExcelExporter().export(
+            _make_pack_data(), watermark=WatermarkService.sandbox_excel_watermark(),
+        )
+        wb = load_workbook(io.BytesIO(data))
+        assert wb["_Integrity"].sheet_state == "hidden"
+        for name in wb.sheetnames:
+            if name == "_Integrity":
+                continue
+            assert wb[name].oddHeader.center.text == SANDBOX_WATERMARK
+        assert IntegrityChecker().verify(data) is True
+
+    def test_resaved_workbook_still_verifies(self) -> None:
+        """A load/save round trip (how earlier workbooks were issued) keeps the signature."""
+        from src.export.watermark import WatermarkService
+
+        data = WatermarkService().apply_sandbox_excel(ExcelExporter().export(_make_pack_data()))
+        assert IntegrityChecker().verify(data) is True
@@ -4,13 +4,21 @@ Covers: NFF gate check first, generate formats, apply watermarks,
 compute checksums, create Export record. Block governed exports failing NFF.
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
 from uuid_extensions import uuid7
 
+from src.export import orchestrator as export_orchestrator
+from src.export.artifact_storage import ExportArtifactStorage
 from src.export.orchestrator import (
     ExportOrchestrator,
     ExportRequest,
     ExportStatus,
 )
+from src.export.render_cache import RenderCache, RenderCacheCounters, get_render_cache
 from src.models.common import ClaimStatus, ClaimType, ExportMode
 from src.models.governance import Claim
 from src.quality.models import RunQualityAssessment
@@ -24,6 +32,7 @@ _CLEAN_QA = RunQualityAssessment.model_construct(used_synthetic_fallback=False)
 
 RUN_ID = uuid7()
 WORKSPACE_ID = uuid7()
+MODEL_VERSION_ID = uuid7()
 
 
 def _make_supported_claims() -> list[Claim]:
@@ -45,7 +54,7 @@ def _make_pack_data() -> dict:
         "scenario_name": "Test",
         "base_year": 2023,
         "currency": "SAR",
-        "model_version_id": str(uuid7()),
+        "model_version_id": str(MODEL_VERSION_ID),
         "scenario_version": 1,
         "executive_summary": {"headline_gdp": 4.2e9, "headline_jobs": 21200},
         "sector_impacts": [
@@ -177,3 +186,138 @@ class TestMultipleFormats:
         record = orch.execute(request=req, claims=[], quality_assessment=_CLEAN_QA)
         assert "excel" in record.checksums
         assert "pptx" in record.checksums
+
+    def test_duplicate_formats_rendered_once(self) -> None:
+        orch = ExportOrchestrator()
+        req = _make_request(formats=["excel", "excel"])
+        record = orch.execute(request=req, claims=[], quality_assessment=_CLEAN_QA)
+        assert list(record.artifacts) == ["excel"]
+
+    def test_pool_rendering_matches_inline(self) -> None:
+        req = _make_request(formats=["excel", "pptx"])
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            record = ExportOrchestrator(render_pool=pool).execute(
+                request=req, claims=[], quality_assessment=_CLEAN_QA,
+            )
+        assert set(record.artifacts) == {"excel", "pptx"}
+        assert all(record.artifacts.values())
+
+    def test_render_pool_created_once_under_concurrency(self, monkeypatch) -> None:
+        created: list[object] = []
+
+        def _slow_pool(**kwargs: object) -> object:
+            time.sleep(0.05)
+            pool = object()
+            created.append(pool)
+            return pool
+
+        monkeypatch.setattr(export_orchestrator, "_render_pool", None)
+        monkeypatch.setattr(export_orchestrator, "ProcessPoolExecutor", _slow_pool)
+        monkeypatch.setattr(
+            "src.config.settings.get_settings",
+            lambda: MagicMock(EXPORT_RENDER_PROCESSES=2),
+        )
+        results: list[object] = []
+        threads = [
+            threading.Thread(target=lambda: results.append(export_orchestrator.get_render_pool()))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(created) == 1
+        assert results == created * 4
+
+
+# ===================================================================
+# Render cache
+# ===================================================================
+
+
+def _make_cache(tmp_path, max_bytes: int = 64 * 1024 * 1024) -> RenderCache:
+    storage = ExportArtifactStorage(storage_root=str(tmp_path))
+    return RenderCache(storage, max_bytes=max_bytes, counters=RenderCacheCounters())
+
+
+class TestRenderCache:
+    """Repeat exports reuse the cached base deck."""
+
+    def test_repeat_export_hits_cache(self, tmp_path) -> None:
+        cache = _make_cache(tmp_path)
+        orch = ExportOrchestrator()
+        req = _make_request(formats=["pptx"])
+        orch.execute(request=req, claims=[], quality_assessment=_CLEAN_QA, render_cache=cache)
+        orch.execute(request=req, claims=[], quality_assessment=_CLEAN_QA, render_cache=cache)
+        stats = cache.stats()
+        assert stats.misses == 1
+        assert stats.hits == 1
+
+    def test_changed_pack_data_misses(self, tmp_path) -> None:
+        cache = _make_cache(tmp_path)
+        orch = ExportOrchestrator()
+        req = _make_request(formats=["pptx"])
+        orch.execute(request=req, claims=[], quality_assessment=_CLEAN_QA, render_cache=cache)
+        req.pack_data["scenario_name"] = "Changed"
+        orch.execute(request=req, claims=[], quality_assessment=_CLEAN_QA, render_cache=cache)
+        assert cache.stats().misses == 2
+
+    def test_cached_base_gets_mode_watermark(self, tmp_path) -> None:
+        cache = _make_cache(tmp_path)
+        orch = ExportOrchestrator()
+        sandbox = orch.execute(
+            request=_make_request(mode=ExportMode.SANDBOX, formats=["pptx"]),
+            claims=[], quality_assessment=_CLEAN_QA, render_cache=cache,
+        )
+        governed = orch.execute(
+            request=_make_request(mode=ExportMode.GOVERNED, formats=["pptx"]),
+            claims=[], quality_assessment=_CLEAN_QA, render_cache=cache,
+        )
+        assert cache.stats().hits == 1
+        assert governed.status == ExportStatus.COMPLETED
+        assert sandbox.artifacts["pptx"] != governed.artifacts["pptx"]
+
+    def test_excel_not_cached(self, tmp_path) -> None:
+        cache = _make_cache(tmp_path)
+        orch = ExportOrchestrator()
+        req = _make_request(formats=["excel"])
+        orch.execute(request=req, claims=[], quality_assessment=_CLEAN_QA, render_cache=cache)
+        assert cache.bytes_used() == 0
+
+    def test_evicts_least_recently_used(self, tmp_path) -> None:
+        cache = _make_cache(tmp_path, max_bytes=250)
+        run_id = uuid7()
+        keys = [RenderCache.build_key(run_id, "pptx", "1", str(i)) for i in range(3)]
+        for key in keys:
+            cache.put(key, b"x" * 100)
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[2]) is not None
+        assert cache.bytes_used() <= 250
+        assert cache.stats().evictions == 1
+
+    def test_put_does_not_rescan_storage(self, tmp_path, monkeypatch) -> None:
+        storage = ExportArtifactStorage(storage_root=str(tmp_path))
+        cache = RenderCache(storage, max_bytes=1000, counters=RenderCacheCounters())
+        scans = []
+        list_prefix = storage.list_prefix
+        monkeypatch.setattr(
+            storage, "list_prefix", lambda prefix: scans.append(prefix) or list_prefix(prefix),
+        )
+        run_id = uuid7()
+        for i in range(5):
+            cache.put(RenderCache.build_key(run_id, "pptx", "1", str(i)), b"x" * 100)
+        assert len(scans) == 1  # initial index scan only
+        assert cache.bytes_used() == 500
+
+    def test_shared_instance_per_storage_root(self, tmp_path) -> None:
+        a = get_render_cache(ExportArtifactStorage(str(tmp_path)), max_bytes=100)
+        b = get_render_cache(ExportArtifactStorage(str(tmp_path)), max_bytes=100)
+        other = get_render_cache(ExportArtifactStorage(str(tmp_path / "x")), max_bytes=100)
+        assert a is b
+        assert other is not a
+
+    def test_oversized_artifact_not_stored(self, tmp_path) -> None:
+        cache = _make_cache(tmp_path, max_bytes=10)
+        key = RenderCache.build_key(uuid7(), "pptx", "1", "abc")
+        cache.put(key, b"x" * 100)
+        assert cache.get(key) is None
@@ -12,6 +12,7 @@ Note: The ClaimExtractor auto-classifies claim types heuristically:
 Tests use appropriate draft text to get the desired initial status.
 """
 
+import base64
 from uuid import UUID
 
 import pytest
@@ -138,6 +139,83 @@ class TestClaimList:
         ids_b = {item["claim_id"] for item in resp_b.json()["items"]}
         assert ids_a.isdisjoint(ids_b), "Claims from different runs must not overlap"
 
+    @pytest.mark.anyio
+    async def test_list_claims_without_run_is_workspace_scoped(
+        self, client: AsyncClient, db_session,
+    ) -> None:
+        """No run_id — only claims on this workspace's runs are listed."""
+        ws_id = str(uuid7())
+        other_ws = str(uuid7())
+        run_own = str(uuid7())
+        run_other = str(uuid7())
+        await _seed_run_snapshot(db_session, run_own, ws_id)
+        await _seed_run_snapshot(db_session, run_other, other_ws)
+        own = await _extract_claims(client, _MODEL_TEXT, run_id=run_own, ws_id=ws_id)
+        await _extract_claims(client, _ASSUMPTION_TEXT, run_id=run_other, ws_id=other_ws)
+
+        resp = await client.get(f"/v1/workspaces/{ws_id}/governance/claims")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"] == own["total"]
+        assert {i["claim_id"] for i in data["items"]} == {
+            c["claim_id"] for c in own["claims"]
+        }
+
+    @pytest.mark.anyio
+    async def test_list_claims_keyset_pagination(
+        self, client: AsyncClient, db_session,
+    ) -> None:
+        """limit + X-Next-Cursor walk every claim exactly once."""
+        ws_id = str(uuid7())
+        run_id = str(uuid7())
+        await _seed_run_snapshot(db_session, run_id, ws_id)
+        extract = await _extract_claims(
+            client,
+            f"{_MODEL_TEXT} {_ASSUMPTION_TEXT} We recommend phasing. Jobs rise 5%. "
+            "Output grows.",
+            run_id=run_id,
+            ws_id=ws_id,
+        )
+        assert extract["total"] == 5
+
+        seen: list[str] = []
+        params: dict[str, str | int] = {"limit": 2}
+        for _ in range(5):
+            resp = await client.get(
+                f"/v1/workspaces/{ws_id}/governance/claims", params=params,
+            )
+            assert resp.status_code == 200
+            data = resp.json()
+            assert data["total"] == 5
+            seen.extend(i["claim_id"] for i in data["items"])
+            cursor = resp.headers.get("x-next-cursor")
+            if cursor is None:
+                break
+            params = {"limit": 2, "cursor": cursor}
+        assert sorted(seen) == sorted(c["claim_id"] for c in extract["claims"])
+        assert len(seen) == len(set(seen))
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not-base64!",
+            base64.b64encode(b"no-separator").decode(),
+            base64.b64encode(b"yesterday|" + str(uuid7()).encode()).decode(),
+            base64.b64encode(b"2026-01-01T00:00:00+00:00|not-a-uuid").decode(),
+        ],
+    )
+    async def test_list_claims_malformed_cursor_422(
+        self, client: AsyncClient, cursor: str,
+    ) -> None:
+        ws_id = str(uuid7())
+        resp = await client.get(
+            f"/v1/workspaces/{ws_id}/governance/claims",
+            params={"limit": 2, "cursor": cursor},
+        )
+        assert resp.status_code == 422
+        assert resp.json()["detail"] == "Invalid cursor."
+
 
 # ---------------------------------------------------------------------------
 # TestClaimDetail
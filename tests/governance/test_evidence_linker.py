@@ -2,12 +2,19 @@
 
 Covers: matching claims to EvidenceSnippets and ResultSet model refs,
 attaching evidence_refs to claims, transitioning claims from
-NEEDS_EVIDENCE to SUPPORTED.
+NEEDS_EVIDENCE to SUPPORTED, and indexed linking matching a linear scan.
 """
 
+import random
+
 from uuid_extensions import uuid7
 
-from src.governance.evidence_linker import EvidenceLinker
+from src.governance.evidence_linker import (
+    EvidenceLinker,
+    SnippetIndexCache,
+    _keyword_overlap,
+    _metric_tokens,
+)
 from src.models.common import ClaimStatus, ClaimType
 from src.models.governance import BoundingBox, Claim, EvidenceSnippet
 from src.models.run import ResultSet
@@ -236,3 +243,97 @@ class TestLinkResult:
             result_sets=[],
         )
         assert result.total_unlinked == 1
+
+
+# ===================================================================
+# Indexed linking
+# ===================================================================
+
+_VOCAB = [
+    "steel", "cement", "prices", "increased", "gdp", "impact", "jobs",
+    "employment", "imports", "riyadh", "tender", "q3", "2024", "15", "the",
+    "of", "construction", "labour", "sar", "billion", "output", "value",
+]
+
+
+def _brute_force_refs(claims, snippets, result_sets):
+    """Reference linear scan over every (claim, snippet) pair."""
+    refs = []
+    for claim in claims:
+        if claim.status != ClaimStatus.NEEDS_EVIDENCE:
+            refs.append((list(claim.evidence_refs), list(claim.model_refs)))
+            continue
+        evidence = list(claim.evidence_refs) + [
+            s.snippet_id for s in snippets
+            if _keyword_overlap(claim.text, s.extracted_text)
+        ]
+        models = list(claim.model_refs) + [
+            (rs.run_id, rs.metric_type) for rs in result_sets
+            if all(token in claim.text.lower() for token in _metric_tokens(rs.metric_type))
+        ]
+        refs.append((evidence, models))
+    return refs
+
+
+def _random_corpus(seed: int, n_claims: int, n_snippets: int, n_docs: int):
+    rng = random.Random(seed)
+    doc_ids = [uuid7() for _ in range(n_docs)]
+
+    def _text(k: int) -> str:
+        return " ".join(rng.choice(_VOCAB) for _ in range(k)).capitalize() + "."
+
+    snippets = [
+        _make_snippet(source_id=rng.choice(doc_ids), extracted_text=_text(rng.randint(1, 8)))
+        for _ in range(n_snippets)
+    ]
+    snippets.append(snippets[3])  # duplicates are linked twice, as before
+    claims = [_make_claim(text=_text(rng.randint(1, 6))) for _ in range(n_claims)]
+    result_sets = [
+        _make_result_set(metric_type=m)
+        for m in ("gdp_impact", "employment", "imports", "value_added")
+    ]
+    return claims, snippets, result_sets
+
+
+class TestIndexedLinking:
+    """Index probing attaches exactly the refs a linear scan would."""
+
+    def test_matches_brute_force(self) -> None:
+        claims, snippets, result_sets = _random_corpus(7, 60, 400, 5)
+        result = EvidenceLinker(index_cache=SnippetIndexCache()).link_evidence(
+            claims=claims, snippets=snippets, result_sets=result_sets,
+        )
+        expected = _brute_force_refs(claims, snippets, result_sets)
+        actual = [
+            (c.evidence_refs, [(m.run_id, m.metric) for m in c.model_refs])
+            for c in result.linked_claims
+        ]
+        assert actual == expected
+        assert any(evidence for evidence, _ in expected)
+
+    def test_cache_reused_for_same_snippets(self) -> None:
+        cache = SnippetIndexCache()
+        source = uuid7()
+        snippets = [_make_snippet(source_id=source) for _ in range(3)]
+        first = cache.put(source, snippets)
+        assert cache.get_or_build(source, snippets) is first
+
+    def test_stale_cache_entry_rebuilt(self) -> None:
+        cache = SnippetIndexCache()
+        source = uuid7()
+        cache.put(source, [_make_snippet(source_id=source, extracted_text="Cement output fell.")])
+        fresh = _make_snippet(source_id=source, extracted_text="Steel prices increased.")
+        result = EvidenceLinker(index_cache=cache).link_evidence(
+            claims=[_make_claim(text="Steel prices rose.")],
+            snippets=[fresh],
+            result_sets=[],
+        )
+        assert result.linked_claims[0].evidence_refs == [fresh.snippet_id]
+
+    def test_cache_is_bounded(self) -> None:
+        cache = SnippetIndexCache(max_documents=2)
+        docs = {s: [_make_snippet(source_id=s)] for s in (uuid7(), uuid7(), uuid7())}
+        indexes = [cache.put(s, snips) for s, snips in docs.items()]
+        oldest, newest = list(docs)[0], list(docs)[-1]
+        assert cache.get_or_build(oldest, docs[oldest]) is not indexes[0]
+        assert cache.get_or_build(newest, docs[newest]) is indexes[-1]
@@ -1,6 +1,6 @@
 """S0-1 Model Cache Fallback tests.
 
-Proves that the DB-fallback mechanism in _ensure_model_loaded() works:
+Proves that the DB-fallback mechanism in ensure_model_loaded() works:
 - Register model → clear _model_store → run succeeds (loads from DB)
 - Checksum verification catches corruption
 - Concurrency guard prevents redundant loads
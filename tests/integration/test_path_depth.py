@@ -104,12 +104,14 @@ def _make_mock_artifact_repo() -> AsyncMock:
         payload: dict
         disclosure_tier: str
         metadata_json: dict
+        cache_key: str | None = None
 
     repo = AsyncMock()
     _artifacts: list[FakeArtifactRow] = []
 
     async def mock_create(
         *, artifact_id, plan_id, step, payload, disclosure_tier="TIER0", metadata_json=None,
+        cache_key=None,
     ):
         row = FakeArtifactRow(
             artifact_id=artifact_id,
@@ -118,6 +120,7 @@ def _make_mock_artifact_repo() -> AsyncMock:
             payload=payload,
             disclosure_tier=disclosure_tier,
             metadata_json=metadata_json or {},
+            cache_key=cache_key,
         )
         _artifacts.append(row)
         return row
@@ -131,9 +134,16 @@ def _make_mock_artifact_repo() -> AsyncMock:
                 return a
         return None
 
+    async def mock_get_by_cache_key(cache_key):
+        for a in reversed(_artifacts):
+            if a.cache_key == cache_key:
+                return a
+        return None
+
     repo.create = AsyncMock(side_effect=mock_create)
     repo.get_by_plan = AsyncMock(side_effect=mock_get_by_plan)
     repo.get_by_plan_and_step = AsyncMock(side_effect=mock_get_by_plan_and_step)
+    repo.get_by_cache_key = AsyncMock(side_effect=mock_get_by_cache_key)
     repo._artifacts = _artifacts
     return repo
 
@@ -0,0 +1,195 @@
+"""Tests for hot-path instrumentation (src/observability/instrumentation.py).
+
+Covers: histogram bucketing, Prometheus text rendering, the disabled
+no-op path, engine stage timers recorded by BatchRunner, and the
+GET /metrics scrape endpoint (open and token-protected).
+"""
+
+import numpy as np
+import pytest
+from httpx import AsyncClient
+from uuid_extensions import uuid7
+
+from src.engine.batch import BatchRequest, BatchRunner, ScenarioInput
+from src.engine.model_store import ModelStore
+from src.engine.satellites import SatelliteCoefficients
+from src.observability.instrumentation import (
+    _NOOP_TIMER,
+    ENGINE_RUNS_TOTAL,
+    ENGINE_STAGE_SECONDS,
+    InstrumentationRegistry,
+    registry,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_registry():
+    registry.reset()
+    yield
+    registry.reset()
+
+
+class TestHistogram:
+    def test_observations_land_in_cumulative_buckets(self) -> None:
+        reg = InstrumentationRegistry()
+        hist = reg.histogram("t_seconds", "test", labels=("stage",), buckets=(0.1, 1.0))
+        hist.observe(0.05, stage="a")
+        hist.observe(0.5, stage="a")
+        hist.observe(5.0, stage="a")
+
+        snap = hist.snapshot(stage="a")
+        assert snap.cumulative_counts == (1, 2, 3)
+        assert snap.count == 3
+        assert snap.total == pytest.approx(5.55)
+
+    def test_timer_records_one_observation(self) -> None:
+        reg = InstrumentationRegistry()
+        hist = reg.histogram("t_seconds", "test", labels=("stage",))
+        with hist.time(stage="x"):
+            pass
+        assert hist.snapshot(stage="x").count == 1
+
+    def test_wrong_labels_rejected(self) -> None:
+        reg = InstrumentationRegistry()
+        hist = reg.histogram("t_seconds", "test", labels=("stage",))
+        with pytest.raises(ValueError):
+            hist.observe(1.0, other="x")
+
+    def test_reregistration_returns_same_metric(self) -> None:
+        reg = InstrumentationRegistry()
+        first = reg.counter("c_total", "test", labels=("a",))
+        assert reg.counter("c_total", "test", labels=("a",)) is first
+        with pytest.raises(ValueError):
+            reg.histogram("c_total", "test", labels=("a",))
+
+
+class TestDisabled:
+    def test_disabled_registry_is_noop(self) -> None:
+        reg = InstrumentationRegistry(enabled=False)
+        hist = reg.histogram("t_seconds", "test", labels=("stage",))
+        counter = reg.counter("c_total", "test")
+
+        assert hist.time(stage="x") is _NOOP_TIMER
+        hist.observe(1.0, stage="x")
+        counter.inc()
+
+        assert hist.snapshot(stage="x").count == 0
+        assert counter.value() == 0.0
+
+
+class TestPrometheusRender:
+    def test_text_format(self) -> None:
+        reg = InstrumentationRegistry()
+        hist = reg.histogram("t_seconds", "Stage time.", labels=("stage",), buckets=(1.0,))
+        counter = reg.counter("c_total", "Things.", labels=("source",))
+        hist.observe(0.5, stage="phasing")
+        counter.inc(2, source="cached")
+
+        text = reg.render_prometheus()
+        assert "# TYPE t_seconds histogram" in text
+        assert 't_seconds_bucket{stage="phasing",le="1"} 1' in text
+        assert 't_seconds_bucket{stage="phasing",le="+Inf"} 1' in text
+        assert 't_seconds_count{stage="phasing"} 1' in text
+        assert "# TYPE c_total counter" in text
+        assert 'c_total{source="cached"} 2' in text
+        assert text.endswith("\n")
+
+    def test_label_values_escaped(self) -> None:
+        reg = InstrumentationRegistry()
+        counter = reg.counter("c_total", "Things.", labels=("name",))
+        counter.inc(name='a"b')
+        assert 'c_total{name="a\\"b"} 1' in reg.render_prometheus()
+
+
+class TestEngineStageTimers:
+    def test_batch_run_records_stages(self) -> None:
+        store = ModelStore()
+        mv = store.register(
+            Z=np.array([[150.0, 500.0], [200.0, 100.0]]),
+            x=np.array([1000.0, 2000.0]),
+            sector_codes=["S1", "S2"],
+            base_year=2023,
+            source="test",
+        )
+        request = BatchRequest(
+            scenarios=[ScenarioInput(
+                scenario_spec_id=uuid7(),
+                scenario_spec_version=1,
+                name="Base",
+                annual_shocks={2026: np.array([100.0, 0.0])},
+                base_year=2023,
+            )],
+            model_version_id=mv.model_version_id,
+            satellite_coefficients=SatelliteCoefficients(
+                jobs_coeff=np.array([0.01, 0.005]),
+                import_ratio=np.array([0.30, 0.20]),
+                va_ratio=np.array([0.40, 0.55]),
+                version_id=uuid7(),
+            ),
+            version_refs={
+                "taxonomy_version_id": uuid7(),
+                "concordance_version_id": uuid7(),
+                "mapping_library_version_id": uuid7(),
+                "assumption_library_version_id": uuid7(),
+                "prompt_pack_version_id": uuid7(),
+            },
+        )
+
+        BatchRunner(model_store=store).run(request)
+
+        assert ENGINE_STAGE_SECONDS.snapshot(stage="phasing").count == 1
+        assert ENGINE_STAGE_SECONDS.snapshot(stage="result_sets").count == 1
+        # Optional stages are only timed when they run.
+        assert ENGINE_STAGE_SECONDS.snapshot(stage="monte_carlo").count == 0
+        assert (
+            ENGINE_RUNS_TOTAL.value(source="computed")
+            + ENGINE_RUNS_TOTAL.value(source="cached")
+        ) == 1
+
+
+class TestScrapeEndpoint:
+    @pytest.mark.anyio
+    async def test_metrics_endpoint(self, client: AsyncClient) -> None:
+        ENGINE_STAGE_SECONDS.observe(0.01, stage="phasing")
+        resp = await client.get("/metrics")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain")
+        assert "impactos_engine_stage_seconds_bucket" in resp.text
+        assert "impactos_cache_lookups_total" in resp.text
+
+    @pytest.mark.anyio
+    async def test_scrape_token_enforced(self, client: AsyncClient, monkeypatch) -> None:
+        from src.api import metrics as metrics_mod
+
+        original = metrics_mod.get_settings
+
+        def _settings_with_token():
+            s = original()
+            object.__setattr__(s, "METRICS_SCRAPE_TOKEN", "scrape-secret")
+            return s
+
+        monkeypatch.setattr(metrics_mod, "get_settings", _settings_with_token)
+
+        assert (await client.get("/metrics")).status_code == 401
+        resp = await client.get(
+            "/metrics", headers={"Authorization": "Bearer scrape-secret"},
+        )
+        assert resp.status_code == 200
+
+    @pytest.mark.anyio
+    async def test_empty_token_closed_outside_dev(
+        self, client: AsyncClient, monkeypatch,
+    ) -> None:
+        from src.api import metrics as metrics_mod
+
+        original = metrics_mod.get_settings
+
+        def _staging_without_token():
+            s = original()
+            object.__setattr__(s, "ENVIRONMENT", "staging")
+            object.__setattr__(s, "METRICS_SCRAPE_TOKEN", "")
+            return s
+
+        monkeypatch.setattr(metrics_mod, "get_settings", _staging_without_token)
+
+        assert (await client.get("/metrics")).status_code == 401
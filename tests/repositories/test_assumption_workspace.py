@@ -191,3 +191,28 @@ async def test_list_by_workspace_returns_total_count(db_session):
     rows, total = await repo.list_by_workspace(ws.workspace_id, limit=3, offset=0)
     assert total == 7
     assert len(rows) == 3
+
+
+# --- count_by_status tests ---
+
+
+async def test_count_by_status_groups_workspace_rows(db_session):
+    """Counts are grouped by status and scoped to the workspace."""
+    ws_a = await _create_workspace(db_session)
+    ws_b = await _create_workspace(db_session)
+    await _create_assumption(db_session, workspace_id=ws_a.workspace_id, status="DRAFT")
+    await _create_assumption(db_session, workspace_id=ws_a.workspace_id, status="APPROVED")
+    await _create_assumption(db_session, workspace_id=ws_a.workspace_id, status="APPROVED")
+    await _create_assumption(db_session, workspace_id=ws_b.workspace_id, status="APPROVED")
+    await _create_assumption(db_session, workspace_id=None, status="APPROVED")
+
+    repo = AssumptionRepository(db_session)
+    counts = await repo.count_by_status(ws_a.workspace_id)
+    assert counts == {"DRAFT": 1, "APPROVED": 2}
+
+
+async def test_count_by_status_empty_workspace(db_session):
+    """A workspace without assumptions yields an empty mapping."""
+    ws = await _create_workspace(db_session)
+    repo = AssumptionRepository(db_session)
+    assert await repo.count_by_status(ws.workspace_id) == {}
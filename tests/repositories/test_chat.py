@@ -256,3 +256,67 @@ class TestChatMessageRepository:
         assert msg.tool_calls[0]["tool_name"] == "run_scenario"
         assert msg.tool_calls[1]["tool_name"] == "get_multiplier"
         assert msg.tool_calls[1]["result"]["value"] == 1.85
+
+    async def _seed_messages(self, db_session, session_id, count):
+        repo = ChatMessageRepository(db_session)
+        rows = []
+        for i in range(count):
+            rows.append(await repo.create(
+                message_id=uuid7(),
+                session_id=session_id,
+                role="user" if i % 2 == 0 else "assistant",
+                content=f"Message {i}",
+            ))
+            await asyncio.sleep(0.001)
+        return repo, rows
+
+    async def test_list_recent_returns_last_messages_in_order(self, seeded):
+        session_id = await self._create_session(seeded)
+        repo, rows = await self._seed_messages(seeded, session_id, 6)
+
+        recent = await repo.list_recent(session_id, limit=3)
+        assert [m.content for m in recent] == ["Message 3", "Message 4", "Message 5"]
+
+    async def test_list_recent_excludes_message(self, seeded):
+        session_id = await self._create_session(seeded)
+        repo, rows = await self._seed_messages(seeded, session_id, 4)
+
+        recent = await repo.list_recent(
+            session_id, limit=2, exclude_message_id=rows[-1].message_id,
+        )
+        assert [m.content for m in recent] == ["Message 1", "Message 2"]
+
+    async def test_list_between_is_exclusive(self, seeded):
+        session_id = await self._create_session(seeded)
+        repo, rows = await self._seed_messages(seeded, session_id, 6)
+
+        between = await repo.list_between(
+            session_id,
+            after=(rows[1].created_at, rows[1].message_id),
+            before=(rows[4].created_at, rows[4].message_id),
+        )
+        assert [m.content for m in between] == ["Message 2", "Message 3"]
+
+        from_start = await repo.list_between(
+            session_id, after=None, before=(rows[2].created_at, rows[2].message_id),
+        )
+        assert [m.content for m in from_start] == ["Message 0", "Message 1"]
+
+    async def test_update_summary_round_trip(self, seeded):
+        session_id = await self._create_session(seeded)
+        _, rows = await self._seed_messages(seeded, session_id, 2)
+        session_repo = ChatSessionRepository(seeded)
+
+        await session_repo.update_summary(
+            session_id, WS_ID,
+            summary="Discussed tourism shock.",
+            through_at=rows[1].created_at,
+            through_message_id=rows[1].message_id,
+            token_usage={"input_tokens": 10, "output_tokens": 5},
+        )
+        through_id = rows[1].message_id
+        seeded.expire_all()
+        row = await session_repo.get(session_id, WS_ID)
+        assert row.context_summary == "Discussed tourism shock."
+        assert row.summary_through_message_id == through_id
+        assert row.summary_token_usage == {"input_tokens": 10, "output_tokens": 5}
@@ -8,6 +8,7 @@ from src.repositories.engine import (
     BatchRepository,
     ModelDataRepository,
     ModelVersionRepository,
+    MultiplierTableRepository,
     ResultSetRepository,
     RunSnapshotRepository,
 )
@@ -60,6 +61,49 @@ class TestModelDataRepository:
         assert fetched.sector_codes == ["S1", "S2"]
 
 
+class TestMultiplierTableRepository:
+    async def _model(self, session: AsyncSession):
+        mvid = uuid7()
+        await ModelVersionRepository(session).create(
+            model_version_id=mvid, base_year=2023, source="t", sector_count=2,
+            checksum="sha256:x", provenance_class="curated_real",
+        )
+        return mvid
+
+    def _table(self, mvid, **overrides) -> dict:
+        kwargs = {
+            "multiplier_table_id": uuid7(), "model_version_id": mvid,
+            "model_checksum": "sha256:x", "coefficients_hash": "c" * 64,
+            "table_version": "v1", "content_hash": "h" * 64, "payload": {},
+        }
+        kwargs.update(overrides)
+        return kwargs
+
+    @pytest.mark.anyio
+    async def test_duplicate_create_returns_existing(self, db_session: AsyncSession) -> None:
+        repo = MultiplierTableRepository(db_session)
+        mvid = await self._model(db_session)
+        first = await repo.create(**self._table(mvid))
+        second = await repo.create(**self._table(mvid, content_hash="other"))
+        assert second.multiplier_table_id == first.multiplier_table_id
+        # The losing insert is rolled back to its savepoint; the session stays usable
+        assert await repo.get_for_model(mvid, "c" * 64, "v1") is not None
+
+    @pytest.mark.anyio
+    async def test_get_current_by_employment_row(self, db_session: AsyncSession) -> None:
+        repo = MultiplierTableRepository(db_session)
+        mvid = await self._model(db_session)
+        plain = await repo.create(**self._table(mvid))
+        with_jobs = await repo.create(
+            **self._table(mvid, coefficients_hash="d" * 64, employment_row_id=7),
+        )
+        current = await repo.get_current(mvid, None, "v1")
+        assert current.multiplier_table_id == plain.multiplier_table_id
+        current = await repo.get_current(mvid, 7, "v1")
+        assert current.multiplier_table_id == with_jobs.multiplier_table_id
+        assert await repo.get_current(mvid, 8, "v1") is None
+
+
 class TestRunSnapshotRepository:
     @pytest.mark.anyio
     async def test_create_and_get(self, db_session: AsyncSession) -> None:
@@ -77,6 +121,23 @@ class TestRunSnapshotRepository:
         fetched = await repo.get(rid)
         assert fetched is not None
 
+    @pytest.mark.anyio
+    async def test_get_many(self, db_session: AsyncSession) -> None:
+        repo = RunSnapshotRepository(db_session)
+        ids = [uuid7(), uuid7()]
+        for rid in ids:
+            await repo.create(
+                run_id=rid, model_version_id=uuid7(),
+                taxonomy_version_id=uuid7(), concordance_version_id=uuid7(),
+                mapping_library_version_id=uuid7(),
+                assumption_library_version_id=uuid7(),
+                prompt_pack_version_id=uuid7(),
+            )
+        missing = uuid7()
+        found = await repo.get_many([*ids, missing])
+        assert set(found) == set(ids)
+        assert await repo.get_many([]) == {}
+
 
 class TestResultSetRepository:
     @pytest.mark.anyio
@@ -98,6 +159,46 @@ class TestResultSetRepository:
         types = {r.metric_type for r in rows}
         assert types == {"total_output", "employment"}
 
+    @pytest.mark.anyio
+    async def test_get_by_runs_with_metric_projection(self, db_session: AsyncSession) -> None:
+        repo = ResultSetRepository(db_session)
+        r1, r2, empty = uuid7(), uuid7(), uuid7()
+        for rid in (r1, r2):
+            for metric in ("total_output", "employment", "imports"):
+                await repo.create(
+                    result_id=uuid7(), run_id=rid, metric_type=metric, values={"S1": 1.0},
+                )
+
+        by_run = await repo.get_by_runs([r1, r2, empty])
+        assert set(by_run) == {r1, r2, empty}
+        assert len(by_run[r1]) == 3
+        assert by_run[empty] == []
+
+        projected = await repo.get_by_runs([r1, r2], metric_types=["employment", "imports"])
+        assert {r.metric_type for r in projected[r2]} == {"employment", "imports"}
+
+    @pytest.mark.anyio
+    async def test_get_by_runs_follows_cache_link(self, db_session: AsyncSession) -> None:
+        snap_repo = RunSnapshotRepository(db_session)
+        repo = ResultSetRepository(db_session)
+        source, linked = uuid7(), uuid7()
+        for rid, src in ((source, None), (linked, source)):
+            await snap_repo.create(
+                run_id=rid, model_version_id=uuid7(),
+                taxonomy_version_id=uuid7(), concordance_version_id=uuid7(),
+                mapping_library_version_id=uuid7(),
+                assumption_library_version_id=uuid7(),
+                prompt_pack_version_id=uuid7(),
+                result_source_run_id=src,
+            )
+        await repo.create(
+            result_id=uuid7(), run_id=source, metric_type="total_output", values={"S1": 5.0},
+        )
+
+        by_run = await repo.get_by_runs([linked])
+        single = await repo.get_by_run(linked)
+        assert [r.result_id for r in by_run[linked]] == [r.result_id for r in single]
+
 
 class TestBatchRepository:
     @pytest.mark.anyio
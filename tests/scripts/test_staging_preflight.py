@@ -203,6 +203,7 @@ class TestCheckConfigValidation:
             JWT_ISSUER="https://auth.example.com",
             JWT_AUDIENCE="impactos-api",
             JWKS_URL="https://auth.example.com/.well-known/jwks.json",
+            METRICS_SCRAPE_TOKEN="prometheus-scrape-token",
         )
         result = check_config_validation(settings)
         assert result.status == "PASS"
@@ -1,22 +1,23 @@
 """Tests for ChatService (Sprint 25 + Sprint 28 tool execution)."""
 
-import pytest
-import numpy as np
 from unittest.mock import AsyncMock, patch
 from uuid import UUID, uuid4
 
-pytestmark = pytest.mark.anyio
-
+import numpy as np
+import pytest
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from src.db.session import Base
 import src.db.tables  # noqa: F401
-from src.db.tables import WorkspaceRow, ModelVersionRow, ModelDataRow
-from src.models.common import new_uuid7, utc_now
+from src.agents.economist_copilot import CopilotResponse, EconomistCopilot
+from src.agents.llm_client import LLMClient, LLMProvider, ProviderUnavailableError
+from src.db.session import Base
+from src.db.tables import ModelDataRow, ModelVersionRow, WorkspaceRow
+from src.models.chat import TokenUsage, ToolCall, ToolExecutionResult, TraceMetadata
+from src.models.common import DataClassification, new_uuid7, utc_now
 from src.repositories.chat import ChatMessageRepository, ChatSessionRepository
 from src.services.chat import ChatService
-from src.agents.economist_copilot import CopilotResponse
-from src.models.chat import TokenUsage, ToolCall, ToolExecutionResult, TraceMetadata
+
+pytestmark = pytest.mark.anyio
 
 
 @pytest.fixture
@@ -965,3 +966,187 @@ class TestPostExecutionNarrative:
 
         # Content should be exactly what the mock copilot returns
         assert result.content == "I understand your question about tourism impacts."
+
+
+class TestHistoryWindow:
+    """Bounded history window with incremental summarization."""
+
+    def _svc(self, session, copilot, window=4, budget=8000):
+        return ChatService(
+            ChatSessionRepository(session),
+            ChatMessageRepository(session),
+            copilot=copilot,
+            history_window=window,
+            history_token_budget=budget,
+        )
+
+    async def _send(self, svc, ws_id, sid, count):
+        for i in range(count):
+            await svc.send_message(ws_id, sid, f"Question {i}")
+
+    async def test_history_bounded_by_window(self, db_session, mock_copilot):
+        session, ws_id = db_session
+        mock_copilot.summarize_history = AsyncMock(
+            return_value=("summary", TokenUsage(input_tokens=10, output_tokens=5)),
+        )
+        svc = self._svc(session, mock_copilot)
+        sid = UUID((await svc.create_session(ws_id)).session_id)
+
+        await self._send(svc, ws_id, sid, 6)
+
+        messages = mock_copilot.process_turn.call_args.kwargs["messages"]
+        assert len(messages) == 4
+        assert messages[-2]["content"] == "Question 4"
+
+    async def test_older_turns_folded_into_summary(self, db_session, mock_copilot):
+        session, ws_id = db_session
+        mock_copilot.summarize_history = AsyncMock(
+            return_value=("Tourism shock discussed.", TokenUsage(input_tokens=10, output_tokens=5)),
+        )
+        svc = self._svc(session, mock_copilot)
+        sid = UUID((await svc.create_session(ws_id)).session_id)
+
+        await self._send(svc, ws_id, sid, 6)
+
+        context = mock_copilot.process_turn.call_args.kwargs["context"]
+        assert context["conversation_summary"] == "Tourism shock discussed."
+        # Each fold sends only the turns that just left the window
+        for call in mock_copilot.summarize_history.call_args_list[1:]:
+            assert len(call.args[1]) <= 2
+
+        session.expire_all()
+        row = await ChatSessionRepository(session).get(sid, ws_id)
+        assert row.context_summary == "Tourism shock discussed."
+        calls = mock_copilot.summarize_history.await_count
+        assert row.summary_token_usage == {
+            "input_tokens": 10 * calls, "output_tokens": 5 * calls,
+        }
+
+    async def test_no_summary_for_short_sessions(self, db_session, mock_copilot):
+        session, ws_id = db_session
+        mock_copilot.summarize_history = AsyncMock()
+        svc = self._svc(session, mock_copilot, window=20)
+        sid = UUID((await svc.create_session(ws_id)).session_id)
+
+        await self._send(svc, ws_id, sid, 3)
+
+        mock_copilot.summarize_history.assert_not_awaited()
+        assert "conversation_summary" not in mock_copilot.process_turn.call_args.kwargs["context"]
+
+    async def test_summarization_failure_keeps_turn_working(self, db_session, mock_copilot):
+        session, ws_id = db_session
+        mock_copilot.summarize_history = AsyncMock(side_effect=RuntimeError("LLM down"))
+        svc = self._svc(session, mock_copilot)
+        sid = UUID((await svc.create_session(ws_id)).session_id)
+
+        await self._send(svc, ws_id, sid, 5)
+
+        session.expire_all()
+        row = await ChatSessionRepository(session).get(sid, ws_id)
+        assert row.context_summary is None
+        assert row.summary_through_message_id is None
+
+    async def test_token_budget_trims_oldest(self, db_session, mock_copilot):
+        session, ws_id = db_session
+        mock_copilot.summarize_history = AsyncMock(
+            return_value=("summary", TokenUsage()),
+        )
+        svc = self._svc(session, mock_copilot, window=20, budget=20)
+        sid = UUID((await svc.create_session(ws_id)).session_id)
+
+        await svc.send_message(ws_id, sid, "x" * 200)
+        await svc.send_message(ws_id, sid, "Short follow-up")
+
+        messages = mock_copilot.process_turn.call_args.kwargs["messages"]
+        assert all(m["content"] != "x" * 200 for m in messages)
+        mock_copilot.summarize_history.assert_awaited()
+
+    async def test_zero_window_sends_full_history(self, db_session, mock_copilot):
+        session, ws_id = db_session
+        svc = self._svc(session, mock_copilot, window=0)
+        sid = UUID((await svc.create_session(ws_id)).session_id)
+
+        await self._send(svc, ws_id, sid, 6)
+
+        messages = mock_copilot.process_turn.call_args.kwargs["messages"]
+        assert len(messages) == 10
+
+
+def _scripted_copilot(*replies: str) -> EconomistCopilot:
+    llm = LLMClient(
+        routing_table={c: LLMProvider.LOCAL for c in DataClassification},
+        local_responses=list(replies),
+    )
+    return EconomistCopilot(llm_client=llm)
+
+
+class TestStreamMessage:
+    """SSE turn: deltas, tool progress, then the persisted message."""
+
+    async def test_stream_emits_deltas_then_message(self, db_session):
+        session, ws_id = db_session
+        svc = ChatService(
+            ChatSessionRepository(session),
+            ChatMessageRepository(session),
+            copilot=_scripted_copilot("Tourism lifts hotel output."),
+            db_session=session,
+        )
+        sid = UUID((await svc.create_session(ws_id)).session_id)
+
+        events = [e async for e in await svc.stream_message(ws_id, sid, "Impact?")]
+
+        kinds = [e.event for e in events]
+        assert kinds[-1] == "message"
+        assert set(kinds[:-1]) == {"delta"}
+        assert "".join(e.data["text"] for e in events[:-1]) == "Tourism lifts hotel output."
+        assert events[-1].data["content"] == "Tourism lifts hotel output."
+
+        detail = await svc.get_session(ws_id, sid)
+        assert [m.role for m in detail.messages] == ["user", "assistant"]
+
+    async def test_stream_emits_tool_progress(self, db_session):
+        session, ws_id = db_session
+        reply = 'Checking. {"tool": "lookup_data", "arguments": {"dataset_id": "io_tables"}}'
+        svc = ChatService(
+            ChatSessionRepository(session),
+            ChatMessageRepository(session),
+            copilot=_scripted_copilot(reply),
+            db_session=session,
+        )
+        sid = UUID((await svc.create_session(ws_id)).session_id)
+
+        events = [e async for e in await svc.stream_message(ws_id, sid, "Data?")]
+
+        kinds = [e.event for e in events]
+        assert kinds.index("tool_start") < kinds.index("tool_end") < kinds.index("message")
+        tool_end = events[kinds.index("tool_end")]
+        assert tool_end.data["tool_name"] == "lookup_data"
+        assert tool_end.data["result"]["status"] == "success"
+        assert events[-1].data["tool_calls"][0]["tool_name"] == "lookup_data"
+
+    async def test_stream_unknown_session_raises_before_streaming(self, db_session):
+        session, ws_id = db_session
+        svc = ChatService(
+            ChatSessionRepository(session),
+            ChatMessageRepository(session),
+            copilot=_scripted_copilot("hi"),
+        )
+        with pytest.raises(ValueError, match="not found"):
+            await svc.stream_message(ws_id, uuid4(), "Hello")
+
+    async def test_stream_error_event_on_failure(self, db_session):
+        session, ws_id = db_session
+        copilot = _scripted_copilot("hi")
+        copilot._llm = LLMClient()  # no provider configured for INTERNAL
+        svc = ChatService(
+            ChatSessionRepository(session),
+            ChatMessageRepository(session),
+            copilot=copilot,
+        )
+        sid = UUID((await svc.create_session(ws_id)).session_id)
+
+        events = []
+        with pytest.raises(ProviderUnavailableError):
+            async for e in await svc.stream_message(ws_id, sid, "Hello"):
+                events.append(e)
+        assert events[-1].event == "error"
@@ -348,6 +348,23 @@ class TestChatToolExecutorBasics:
         results = await executor.execute_all([])
         assert results == []
 
+    async def test_execute_all_reports_progress(self, executor):
+        calls = [
+            ToolCall(tool_name="lookup_data", arguments={"i": i})
+            for i in range(MAX_TOOL_CALLS_PER_TURN + 1)
+        ]
+        seen = []
+
+        async def on_event(event, index, tool_call, result):
+            seen.append((event, index, result.status if result else None))
+
+        await executor.execute_all(calls, on_event=on_event)
+
+        assert seen[:2] == [("tool_start", 0, None), ("tool_end", 0, "success")]
+        # Cap-blocked calls report only their end event
+        assert seen[-1] == ("tool_end", MAX_TOOL_CALLS_PER_TURN, "blocked")
+        assert len(seen) == 2 * MAX_TOOL_CALLS_PER_TURN + 1
+
     async def test_get_handler_returns_none_for_unknown(self, executor):
         assert executor._get_handler("unknown") is None
 
@@ -378,6 +395,50 @@ class TestLookupDataHandler:
         assert "description" in ds
 
 
+class TestLookupMultipliers:
+    """lookup_data serves persisted multiplier tables without engine runs."""
+
+    async def test_multipliers_for_model(self, db_session_with_model):
+        session, ws_id, mv_id = db_session_with_model
+        executor = ChatToolExecutor(session=session, workspace_id=ws_id)
+        tc = ToolCall(
+            tool_name="lookup_data",
+            arguments={"dataset_id": "multipliers", "model_version_id": str(mv_id)},
+        )
+        result = await executor.execute(tc)
+        assert result.status == "success"
+        assert result.result["reason_code"] == "multipliers_found"
+        assert set(result.result["type_i"]["output"]) == {"A", "B", "C"}
+        assert result.result["type_ii"] is None
+
+    async def test_sector_filter_and_reuse(self, db_session_with_model):
+        from sqlalchemy import func, select
+
+        from src.db.tables import MultiplierTableRow
+
+        session, ws_id, mv_id = db_session_with_model
+        executor = ChatToolExecutor(session=session, workspace_id=ws_id)
+        args = {
+            "dataset_id": "multipliers",
+            "model_version_id": str(mv_id),
+            "sector_codes": ["B"],
+        }
+        first = await executor.execute(ToolCall(tool_name="lookup_data", arguments=args))
+        second = await executor.execute(ToolCall(tool_name="lookup_data", arguments=args))
+        assert set(first.result["type_i"]["output"]) == {"B"}
+        assert first.result["content_hash"] == second.result["content_hash"]
+        count = await session.scalar(select(func.count()).select_from(MultiplierTableRow))
+        assert count == 1
+
+    async def test_unknown_model(self, executor):
+        tc = ToolCall(
+            tool_name="lookup_data",
+            arguments={"dataset_id": "multipliers", "model_version_id": str(new_uuid7())},
+        )
+        result = await executor.execute(tc)
+        assert result.result["reason_code"] == "model_not_found"
+
+
 # ------------------------------------------------------------------
 # Handler tests: build_scenario
 # ------------------------------------------------------------------
@@ -1351,3 +1412,151 @@ class TestCreateExportRealOrchestration:
         # Definitely not an error
         assert result.status != "error"
         assert result.status != "success"
+
+
+# ------------------------------------------------------------------
+# Concurrent read-only execution
+# ------------------------------------------------------------------
+
+
+@pytest.fixture
+async def file_session_factory(tmp_path):
+    """Session factory on a file-backed SQLite DB (independent connections)."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'tools.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+class _ConcurrencyProbe:
+    """Patched execute(): sleeps, records peak concurrency and the session used."""
+
+    def __init__(self, shared_session) -> None:
+        self.shared_session = shared_session
+        self.in_flight = 0
+        self.peak = 0
+        self.sessions: dict[int, bool] = {}
+
+    async def execute(self, executor, tool_call):
+        import asyncio
+
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.02 * (3 - tool_call.arguments.get("i", 0) % 3))
+        self.in_flight -= 1
+        self.sessions[tool_call.arguments.get("i", -1)] = executor._session is self.shared_session
+        return ToolExecutionResult(
+            tool_name=tool_call.tool_name,
+            status="success",
+            result={"i": tool_call.arguments.get("i")},
+        )
+
+
+class TestConcurrentReadOnly:
+    async def _run(self, executor, calls, probe):
+        async def fake_execute(self_, tool_call):
+            return await probe.execute(self_, tool_call)
+
+        with patch.object(ChatToolExecutor, "execute", fake_execute):
+            return await executor.execute_all(calls)
+
+    async def test_read_only_calls_run_concurrently_in_order(
+        self, db_session, file_session_factory,
+    ):
+        session, ws_id = db_session
+        executor = ChatToolExecutor(session, ws_id, session_factory=file_session_factory)
+        probe = _ConcurrencyProbe(session)
+        calls = [ToolCall(tool_name="lookup_data", arguments={"i": i}) for i in range(3)]
+
+        results = await self._run(executor, calls, probe)
+
+        assert probe.peak == 3
+        assert [r.result["i"] for r in results] == [0, 1, 2]
+        assert not any(probe.sessions.values())  # each on its own session
+
+    async def test_sequential_without_session_factory(self, db_session):
+        session, ws_id = db_session
+        executor = ChatToolExecutor(session, ws_id)
+        probe = _ConcurrencyProbe(session)
+        calls = [ToolCall(tool_name="lookup_data", arguments={"i": i}) for i in range(3)]
+
+        await self._run(executor, calls, probe)
+
+        assert probe.peak == 1
+        assert all(probe.sessions.values())
+
+    async def test_reads_after_mutation_use_request_session(
+        self, db_session, file_session_factory,
+    ):
+        session, ws_id = db_session
+        executor = ChatToolExecutor(session, ws_id, session_factory=file_session_factory)
+        probe = _ConcurrencyProbe(session)
+        calls = [
+            ToolCall(tool_name="lookup_data", arguments={"i": 0}),
+            ToolCall(tool_name="lookup_data", arguments={"i": 1}),
+            ToolCall(tool_name="build_scenario", arguments={"i": 2}),
+            ToolCall(tool_name="narrate_results", arguments={"i": 3}),
+            ToolCall(tool_name="narrate_results", arguments={"i": 4}),
+        ]
+
+        results = await self._run(executor, calls, probe)
+
+        assert [r.result["i"] for r in results] == [0, 1, 2, 3, 4]
+        assert probe.sessions == {0: False, 1: False, 2: True, 3: True, 4: True}
+
+    async def test_caps_unchanged_with_concurrency(self, db_session, file_session_factory):
+        session, ws_id = db_session
+        executor = ChatToolExecutor(session, ws_id, session_factory=file_session_factory)
+        probe = _ConcurrencyProbe(session)
+        calls = [
+            ToolCall(tool_name="lookup_data", arguments={"i": i})
+            for i in range(MAX_TOOL_CALLS_PER_TURN + 2)
+        ]
+
+        results = await self._run(executor, calls, probe)
+
+        assert [r.status for r in results].count("success") == MAX_TOOL_CALLS_PER_TURN
+        assert all(
+            r.reason_code == "max_tool_calls_exceeded"
+            for r in results[MAX_TOOL_CALLS_PER_TURN:]
+        )
+
+    async def test_concurrent_multiplier_lookups_build_one_table(
+        self, db_session, file_session_factory,
+    ):
+        from sqlalchemy import func, select
+
+        from src.db.tables import MultiplierTableRow
+
+        session, ws_id = db_session
+        mv_id = new_uuid7()
+        async with file_session_factory() as seed:
+            seed.add(ModelVersionRow(
+                model_version_id=mv_id,
+                base_year=2023,
+                source="test",
+                sector_count=2,
+                checksum="sha256:" + "0" * 64,
+                provenance_class="curated_real",
+                created_at=utc_now(),
+            ))
+            seed.add(ModelDataRow(
+                model_version_id=mv_id,
+                z_matrix_json=[[0.1, 0.2], [0.0, 0.1]],
+                x_vector_json=[100.0, 200.0],
+                sector_codes=["A", "B"],
+            ))
+            await seed.commit()
+        executor = ChatToolExecutor(session, ws_id, session_factory=file_session_factory)
+        args = {"dataset_id": "multipliers", "model_version_id": str(mv_id)}
+
+        results = await executor.execute_all(
+            [ToolCall(tool_name="lookup_data", arguments=args) for _ in range(3)],
+        )
+
+        assert [r.status for r in results] == ["success"] * 3
+        assert len({r.result["content_hash"] for r in results}) == 1
+        async with file_session_factory() as check:
+            count = await check.scalar(select(func.count()).select_from(MultiplierTableRow))
+        assert count == 1
@@ -650,3 +650,140 @@ class TestExportExecutionPersistenceFailures:
         assert result.status == "FAILED"
         assert result.export_id is not None
         assert "persistence failed" in (result.error or "").lower()
+
+
+
+# ------------------------------------------------------------------
+# Export jobs: PENDING row, Celery dispatch, status transitions
+# ------------------------------------------------------------------
+
+
+async def _seed_quality(session, env) -> None:
+    from src.quality.models import QualityGrade, RunQualityAssessment
+    from src.repositories.data_quality import DataQualityRepository
+
+    payload = RunQualityAssessment(
+        assessment_id=new_uuid7(),
+        assessment_version=1,
+        run_id=env["run_id"],
+        composite_score=0.9,
+        grade=QualityGrade.A,
+        used_synthetic_fallback=False,
+    )
+    await DataQualityRepository(session).save_summary(
+        summary_id=new_uuid7(),
+        run_id=env["run_id"],
+        workspace_id=env["ws_id"],
+        overall_run_score=0.9,
+        overall_run_grade="A",
+        coverage_pct=1.0,
+        publication_gate_pass=True,
+        publication_gate_mode="SANDBOX",
+        payload=payload.model_dump(mode="json"),
+    )
+
+
+class TestExportJobs:
+    """Exports run as jobs on Celery or the local in-process worker."""
+
+    def test_worker_app_registers_export_task(self):
+        from src.ingestion import tasks as ingestion_tasks
+
+        # The worker only imports src.ingestion.tasks; the export task
+        # must be known without src.export.tasks being dispatched first.
+        with patch.object(ingestion_tasks, "_celery_app", None):
+            app = ingestion_tasks.get_celery_app()
+            assert "impactos.export" in app.tasks
+
+    async def test_broker_configured_dispatches_and_returns_pending(self, db_env):
+        from src.repositories.exports import ExportRepository
+        from src.services.export_execution import (
+            ExportExecutionInput,
+            ExportExecutionService,
+        )
+
+        env = db_env
+        repos = _make_repos(env["session"])
+        inp = ExportExecutionInput(
+            workspace_id=env["ws_id"],
+            run_id=env["run_id"],
+            mode=ExportMode.SANDBOX,
+            export_formats=["excel"],
+            pack_data={},
+        )
+        settings = MagicMock(CELERY_BROKER_URL="redis://broker:6379/0")
+        with (
+            patch("src.services.export_execution.get_settings", return_value=settings),
+            patch("src.services.export_execution.dispatch_export") as dispatch,
+        ):
+            result = await ExportExecutionService().execute(inp, repos)
+
+        assert result.status == "PENDING"
+        dispatch.assert_called_once_with(export_id=result.export_id, input=inp)
+        row = await ExportRepository(env["session"]).get(result.export_id)
+        assert row is not None
+        assert row.status == "PENDING"
+        assert row.artifact_refs_json is None
+
+    async def test_local_worker_job_passes_through_running(self, db_env):
+        from src.services.export_execution import (
+            ExportExecutionInput,
+            ExportExecutionService,
+        )
+
+        env = db_env
+        session = env["session"]
+        await _seed_quality(session, env)
+        repos = _make_repos(session)
+
+        seen: list[str] = []
+        update_status = repos.export_repo.update_status
+
+        async def _record(export_id, status, **kwargs):
+            seen.append(status)
+            return await update_status(export_id, status, **kwargs)
+
+        repos.export_repo.update_status = _record  # type: ignore[method-assign]
+        result = await ExportExecutionService().execute(
+            ExportExecutionInput(
+                workspace_id=env["ws_id"],
+                run_id=env["run_id"],
+                mode=ExportMode.SANDBOX,
+                export_formats=["excel"],
+                pack_data={"title": "Job Export"},
+            ),
+            repos,
+        )
+
+        assert result.status == "COMPLETED"
+        assert seen == ["GENERATING", "COMPLETED"]
+        row = await repos.export_repo.get(result.export_id)
+        assert row.artifact_refs_json == result.artifact_refs
+
+    async def test_artifact_failure_marks_row_failed(self, db_env):
+        from src.services.export_execution import (
+            ExportExecutionInput,
+            ExportExecutionService,
+        )
+
+        env = db_env
+        session = env["session"]
+        await _seed_quality(session, env)
+        repos = _make_repos(session)
+        repos.artifact_store = MagicMock()
+        repos.artifact_store.store.side_effect = OSError("Disk full")
+
+        result = await ExportExecutionService().execute(
+            ExportExecutionInput(
+                workspace_id=env["ws_id"],
+                run_id=env["run_id"],
+                mode=ExportMode.SANDBOX,
+                export_formats=["excel"],
+                pack_data={},
+            ),
+            repos,
+        )
+
+        assert result.status == "FAILED"
+        row = await repos.export_repo.get(result.export_id)
+        assert row.status == "FAILED"